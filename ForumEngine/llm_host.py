@@ -1,11 +1,9 @@
 """Forum moderator module
 Use the silicon-based flow Qwen3 model as a forum moderator to guide multiple agents to discuss"""
 
-from openai import OpenAI
 import sys
 import os
 from typing import List, Dict, Any, Optional
-from datetime import datetime
 import re
 
 # Add project root directory to Python path to import config
@@ -20,6 +18,7 @@ if utils_dir not in sys.path:
     sys.path.append(utils_dir)
 
 from utils.retry_helper import with_graceful_retry, SEARCH_API_RETRY_CONFIG
+from utils.llm_client import PooledLLMClient
 
 
 class ForumHost:
@@ -39,11 +38,9 @@ class ForumHost:
 
         self.base_url = base_url or settings.FORUM_HOST_BASE_URL
 
-        self.client = OpenAI(
-            api_key=self.api_key,
-            base_url=self.base_url
-        )
         self.model = model_name or settings.FORUM_HOST_MODEL_NAME  # Use configured model
+        # Requests share the process-wide LLM connection pool and response cache
+        self.llm_client = PooledLLMClient(self.api_key, self.model, self.base_url)
 
         # Track previous summaries to avoid duplicates
         self.previous_summaries = []
@@ -201,25 +198,9 @@ Please deliver a comprehensive host's speech (within 1,000 words). The content s
     def _call_qwen_api(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
         """Call Qwen API"""
         try:
-            current_time = datetime.now().strftime("%Y year %m month %d day %H hour %M minute")
-            time_prefix = f"Today's actual time is {current_time}"
-            if user_prompt:
-                user_prompt = f"{time_prefix}\n{user_prompt}"
-            else:
-                user_prompt = time_prefix
-                
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.6,
-                top_p=0.9,
-            )
-
-            if response.choices:
-                content = response.choices[0].message.content
+            # The client prefixes the user prompt with the current time
+            content = self.llm_client.invoke(system_prompt, user_prompt, temperature=0.6, top_p=0.9)
+            if content:
                 return {"success": True, "content": content}
             else:
                 return {"success": False, "error": "API return format exception"}
@@ -232,7 +213,7 @@ Please deliver a comprehensive host's speech (within 1,000 words). The content s
         speech = re.sub(r'\n{3,}', '\n\n', speech)
         
         # Remove possible quotes
-        speech = speech.strip('"\'""‘’’)
+        speech = speech.strip('"\'“”‘’')
         
         return speech.strip()
 
@@ -240,13 +221,13 @@ Please deliver a comprehensive host's speech (within 1,000 words). The content s
 #Create global instance
 _host_instance = None
 
-def get_forum_host() -> ForumHost:"> ForumHost:
-    """获取全局论坛主持人实例"""
+def get_forum_host() -> ForumHost:
+    """Get the global forum host instance"""
     global _host_instance
     if _host_instance is None:
         _host_instance = ForumHost()
     return _host_instance
 
 def generate_host_speech(forum_logs: List[str]) -> Optional[str]:
-    """生成主持人发言的便捷函数"""
+    """Convenience function to generate the host speech"""
     return get_forum_host().generate_host_speech(forum_logs)
@@ -7,8 +7,10 @@ from pathlib import Path
 from datetime import datetime
 import re
 import json
+import hashlib
 from typing import Dict, Optional, List
 from threading import Lock
+from collections import deque
 from loguru import logger
 
 # Import forum moderator module
@@ -19,6 +21,14 @@ except ImportError:
     logger.exception("ForumEngine: The forum moderator module was not found and will be run in pure monitoring mode.")
     HOST_AVAILABLE = False
 
+# Import the structured event bus (log scraping remains the fallback)
+try:
+    from utils.forum_event_bus import FALLBACK_LOG_MARKER, ForumEventSubscriber, SUMMARY_EVENT, parse_fallback_line
+    EVENT_BUS_AVAILABLE = True
+except ImportError:
+    logger.warning("ForumEngine: The event bus module was not found, engine output will only be read from logs.")
+    EVENT_BUS_AVAILABLE = False
+
 class LogMonitor:
     """Intelligent log monitor based on file changes"""
    
@@ -38,7 +48,7 @@ class LogMonitor:
         self.is_monitoring = False
         self.monitor_thread = None
         self.file_positions = {}  # Record the reading position of each file
-        self.file_line_counts = {}  # Record the number of lines in each file
+        self.file_identities = {}  # Record (device, inode) of each file to detect rotation
         self.is_searching = False  # Are you searching
         self.search_inactive_count = 0  # Search for inactive counters
         self.write_lock = Lock()  # Write lock to prevent concurrent write conflicts
@@ -47,6 +57,20 @@ class LogMonitor:
         self.agent_speeches_buffer = []  # agent speech buffer
         self.host_speech_threshold = 5  # Every 5 agent statements trigger a moderator statement.
         self.is_host_generating = False  # Whether the moderator is generating a speech
+        self.host_max_pending = 1  # Batches allowed to wait behind the one being generated; later ones are merged in
+        self.host_max_batch_speeches = 15  # Upper limit of speeches in one merged batch (the latest are kept)
+        self.host_pending_batches = []  # Bounded queue of speech batches waiting for the moderator
+        self.host_carryover = []  # Speeches of a failed generation, merged into the next batch
+        self.host_session = 0  # Incremented on every session reset so stale speeches are discarded
+        self.host_condition = threading.Condition()
+        self.host_worker_thread = None
+        self.host_worker_run = 0  # Identifies the current worker so a worker left over from a restart exits
+
+        # Event bus related status
+        self.event_subscriber = ForumEventSubscriber(log_dir) if EVENT_BUS_AVAILABLE else None
+        self.bus_engines = set()  # Engines delivering over the bus in this session, their JSON log output is not reassembled
+        self.recent_content_hashes = {}  # Hashes of recently written content per engine, drops the copy arriving on the other path
+        self.recent_content_limit = 20  # Hashes kept per engine, only summaries around the switch to the bus arrive twice
        
         # Target node identification mode
         # 1. Class name (old format may contain)
@@ -95,8 +119,9 @@ class LogMonitor:
             self.in_error_block = {}
             
             # Reset host related status
-            self.agent_speeches_buffer = []
-            self.is_host_generating = False
+            self._reset_host_state()
+
+            self.recent_content_hashes = {}
            
         except Exception as e:
             logger.exception(f"ForumEngine: Failed to clear forum.log: {e}")
@@ -372,17 +397,70 @@ class LogMonitor:
             return 0
    
     def get_file_line_count(self, file_path: Path) -> int:
-        """Get the number of file lines"""
+        """Get the number of file lines (full scan, not used by the monitor loop)"""
         try:
             if not file_path.exists():
                 return 0
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return sum(1 for _ in f)
+            count = 0
+            last_chunk = b''
+            with open(file_path, 'rb') as f:
+                while True:
+                    chunk = f.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    count += chunk.count(b'\n')
+                    last_chunk = chunk
+            # A trailing line without a newline is still a line
+            if last_chunk and not last_chunk.endswith(b'\n'):
+                count += 1
+            return count
         except:
             return 0
+
+    def get_file_identity(self, file_path: Path) -> Optional[tuple]:
+        """Get (device, inode) of the file, None if it does not exist"""
+        try:
+            stat = file_path.stat()
+            return (stat.st_dev, stat.st_ino)
+        except OSError:
+            return None
+
+    def reset_file_baseline(self, file_path: Path, app_name: str):
+        """Record the current end of file as the reading baseline"""
+        self.file_positions[app_name] = self.get_file_size(file_path)
+        self.file_identities[app_name] = self.get_file_identity(file_path)
+
+    def detect_file_change(self, file_path: Path, app_name: str) -> Optional[str]:
+        """Detect log changes from one stat call instead of re-counting lines
+        
+        Returns:
+            'growth' if bytes were appended after the recorded position,
+            'shrink' if the file was truncated, removed or replaced by a new file (different inode),
+            None if nothing changed"""
+        last_position = self.file_positions.get(app_name, 0)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return 'shrink' if last_position > 0 else None
+
+        identity = (stat.st_dev, stat.st_ino)
+        known_identity = self.file_identities.get(app_name)
+        if known_identity is not None and identity != known_identity:
+            return 'shrink'
+        # Record the identity of a file that appeared after the baseline was taken
+        self.file_identities[app_name] = identity
+
+        if stat.st_size < last_position:
+            return 'shrink'
+        if stat.st_size > last_position:
+            return 'growth'
+        return None
    
     def read_new_lines(self, file_path: Path, app_name: str) -> List[str]:
-        """Read new lines in file"""
+        """Read new lines in file
+        
+        Only the bytes appended after the recorded position are read. An incomplete last line
+        is left in the file and picked up on the next call once its newline has been written."""
         new_lines = []
        
         try:
@@ -401,16 +479,21 @@ class LogMonitor:
                 self.in_error_block[app_name] = False
            
             if current_size > last_position:
-                with open(file_path, 'r', encoding='utf-8') as f:
+                with open(file_path, 'rb') as f:
                     f.seek(last_position)
-                    new_content = f.read()
-                    new_lines = new_content.split('\n')
-                   
-                    # Update location
-                    self.file_positions[app_name] = f.tell()
-                   
-                    # Filter empty lines
-                    new_lines = [line.strip() for line in new_lines if line.strip()]
+                    new_content = f.read(current_size - last_position)
+
+                last_newline = new_content.rfind(b'\n')
+                if last_newline == -1:
+                    return new_lines
+                new_content = new_content[:last_newline + 1]
+
+                # Update location
+                self.file_positions[app_name] = last_position + len(new_content)
+
+                # Filter empty lines
+                new_lines = new_content.decode('utf-8', errors='replace').split('\n')
+                new_lines = [line.strip() for line in new_lines if line.strip()]
                    
         except Exception as e:
             logger.exception(f"ForumEngine: Failed to read {app_name} log: {e}")
@@ -516,41 +599,74 @@ class LogMonitor:
         return captured_contents
     
     def _trigger_host_speech(self):
-        """Trigger the host to speak (executed synchronously)"""
-        if not HOST_AVAILABLE or self.is_host_generating:
-            return
+        """Hand the buffered agent speeches to the moderator worker (non-blocking)
         
-        try:
-            # Set build flags
-            self.is_host_generating = True
-            
-            # Get the 5 comments in the buffer
-            recent_speeches = self.agent_speeches_buffer[:5]
-            if len(recent_speeches) < 5:
-                self.is_host_generating = False
-                return
-            
-            logger.info("ForumEngine: Generating moderator's speech...")
-            
-            # Call the moderator to generate speeches (pass in the latest 5 messages)
-            host_speech = generate_host_speech(recent_speeches)
-            
-            if host_speech:
-                # Write the moderator's remarks to forum.log
-                self.write_to_forum_log(host_speech, "HOST")
-                logger.info(f"ForumEngine: The moderator’s speech has been recorded")
-                
-                # Clear 5 processed comments
-                self.agent_speeches_buffer = self.agent_speeches_buffer[5:]
+        The monitor loop keeps reading agent output while the moderator is thinking. If a batch is
+        already waiting behind the one being generated, the new speeches are merged into it, so a slow
+        LLM produces fewer, broader host speeches instead of a growing backlog."""
+        if not HOST_AVAILABLE or not self.agent_speeches_buffer:
+            return
+
+        batch = self.agent_speeches_buffer
+        self.agent_speeches_buffer = []
+
+        with self.host_condition:
+            if len(self.host_pending_batches) >= self.host_max_pending:
+                merged = self.host_pending_batches[-1] + batch
+                self.host_pending_batches[-1] = merged[-self.host_max_batch_speeches:]
+                logger.info(f"ForumEngine: Moderator is busy, merged {len(batch)} speeches into the pending batch")
             else:
-                logger.error("ForumEngine: Moderator speech generation failed")
-            
-            # Reset build flags
-            self.is_host_generating = False
+                self.host_pending_batches.append(batch)
+            self.host_condition.notify_all()
+
+    def _host_worker(self, run_id: int):
+        """Moderator worker: generate host speeches for queued batches one at a time"""
+        while True:
+            with self.host_condition:
+                while self.is_monitoring and run_id == self.host_worker_run and not self.host_pending_batches:
+                    self.host_condition.wait(1)
+                if not self.is_monitoring or run_id != self.host_worker_run:
+                    return
+                batch = self.host_carryover + self.host_pending_batches.pop(0)
+                batch = batch[-self.host_max_batch_speeches:]
+                self.host_carryover = []
+                session = self.host_session
+                self.is_host_generating = True
+
+            try:
+                logger.info(f"ForumEngine: Generating moderator's speech from {len(batch)} speeches...")
                 
-        except Exception as e:
-            logger.exception(f"ForumEngine: Error triggering moderator to speak: {e}")
-            self.is_host_generating = False
+                # Call the moderator to generate speeches
+                host_speech = generate_host_speech(batch)
+
+                with self.host_condition:
+                    stale = session != self.host_session
+                if stale:
+                    logger.info("ForumEngine: Forum session changed during generation, moderator's speech discarded")
+                elif host_speech:
+                    # Write the moderator's remarks to forum.log
+                    self.write_to_forum_log(host_speech, "HOST")
+                    logger.info(f"ForumEngine: The moderator’s speech has been recorded")
+                else:
+                    logger.error("ForumEngine: Moderator speech generation failed")
+                    # Keep the speeches for the next batch
+                    with self.host_condition:
+                        if session == self.host_session:
+                            self.host_carryover = batch
+                    
+            except Exception as e:
+                logger.exception(f"ForumEngine: Error triggering moderator to speak: {e}")
+            finally:
+                with self.host_condition:
+                    self.is_host_generating = False
+
+    def _reset_host_state(self):
+        """Drop buffered and queued speeches; a generation in flight is discarded when it finishes"""
+        self.agent_speeches_buffer = []
+        with self.host_condition:
+            self.host_pending_batches = []
+            self.host_carryover = []
+            self.host_session += 1
     
     def _clean_content_tags(self, content: str, app_name: str) -> str:
         """Clean up duplicate tags and redundant prefixes in content"""
@@ -575,18 +691,92 @@ class LogMonitor:
         
         return content.strip()
    
+    def _record_agent_speech(self, app_name: str, content: str) -> bool:
+        """Write one agent speech to forum.log and feed the host buffer
+        
+        Until the monitor has seen an engine's first bus event, a summary can arrive both over the bus and
+        from the scraped log, in either order, so content whose hash was recently written is skipped.
+        
+        Returns:
+            Whether the content was written"""
+        content_hash = hashlib.sha1(content.encode('utf-8')).hexdigest()
+        recent = self.recent_content_hashes.setdefault(app_name, deque(maxlen=self.recent_content_limit))
+        if content_hash in recent:
+            return False
+        recent.append(content_hash)
+
+        # Convert app_name to uppercase as label (such as insight -> INSIGHT)
+        source_tag = app_name.upper()
+        self.write_to_forum_log(content, source_tag)
+        # logger.info(f"ForumEngine: Capture - {content}")
+        
+        # Add utterances to buffer (formatted as full log lines)
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        log_line = f"[{timestamp}] [{source_tag}] {content}"
+        self.agent_speeches_buffer.append(log_line)
+        
+        # Check whether the host needs to be triggered to speak
+        if len(self.agent_speeches_buffer) >= self.host_speech_threshold:
+            # Queue the speeches for the moderator worker, the monitor loop does not wait for the LLM
+            self._trigger_host_speech()
+        return True
+
+    def _process_bus_events(self, events: List[Dict]) -> bool:
+        """Handle summary events received from the event bus
+        
+        A FirstSummaryNode event starts a session just like the log trigger does. The engine is added to
+        bus_engines, after which its log is only searched for FALLBACK_LOG_MARKER lines (events the bus
+        could not carry) instead of reassembling and repairing its JSON output.
+        
+        Returns:
+            Whether any content was written to forum.log"""
+        captured_any = False
+        for event in events:
+            if event.get('type') != SUMMARY_EVENT:
+                continue
+            app_name = str(event.get('engine', '')).lower()
+            content = event.get('content')
+            if app_name not in self.monitored_logs or not content:
+                continue
+
+            if not self.is_searching:
+                if event.get('node') != 'FirstSummaryNode':
+                    continue
+                logger.info(f"ForumEngine: Detected first forum post in {app_name} (event bus)")
+                self.is_searching = True
+                self.search_inactive_count = 0
+                # Clear forum.log to start a new session
+                self.clear_forum_log()
+
+            if app_name not in self.bus_engines and self.event_subscriber is not None and self.event_subscriber.is_running:
+                self.bus_engines.add(app_name)
+                # Drop any half-captured JSON, this engine is now fed by the bus
+                self.capturing_json[app_name] = False
+                self.json_buffer[app_name] = []
+
+            if self._record_agent_speech(app_name, self._clean_content_tags(content, app_name)):
+                captured_any = True
+        return captured_any
+
+    def _process_bus_engine_lines(self, lines: List[str]) -> bool:
+        """Handle new log lines of an engine in bus_engines: only fallback events are read
+
+        Returns:
+            Whether any content was written to forum.log"""
+        events = [parse_fallback_line(line) for line in lines if FALLBACK_LOG_MARKER in line]
+        return self._process_bus_events([event for event in events if event is not None])
+   
     def monitor_logs(self):
         """Intelligent monitoring log files"""
         logger.info("ForumEngine: Forum is being created...")
        
         # Initialization file line number and position - record current status as baseline
         for app_name, log_file in self.monitored_logs.items():
-            self.file_line_counts[app_name] = self.get_file_line_count(log_file)
-            self.file_positions[app_name] = self.get_file_size(log_file)
+            self.reset_file_baseline(log_file, app_name)
             self.capturing_json[app_name] = False
             self.json_buffer[app_name] = []
             self.in_error_block[app_name] = False
-            # logger.info(f"ForumEngine: {app_name} Baseline line count: {self.file_line_counts[app_name]}")ts[app_name]}")
+            # logger.info(f"ForumEngine: {app_name} Baseline position: {self.file_positions[app_name]}")
        
         while self.is_monitoring:
             try:
@@ -595,12 +785,22 @@ class LogMonitor:
                 any_shrink = False
                 captured_any = False
                
+                # Structured summaries from the event bus come first, log parsing below picks up anything the bus dropped
+                if self.event_subscriber is not None:
+                    if self._process_bus_events(self.event_subscriber.drain()):
+                        captured_any = True
+               
                 # Process each log file independently
                 for app_name, log_file in self.monitored_logs.items():
-                    current_lines = self.get_file_line_count(log_file)
-                    previous_lines = self.file_line_counts.get(app_name, 0)
+                    change = self.detect_file_change(log_file, app_name)
                    
-                    if current_lines > previous_lines:
+                    if change == 'growth' and app_name in self.bus_engines and self.event_subscriber.is_running:
+                        any_growth = True
+                        # Summaries arrive over the bus, the log only carries the events the bus could not deliver
+                        if self._process_bus_engine_lines(self.read_new_lines(log_file, app_name)):
+                            captured_any = True
+
+                    elif change == 'growth':
                         any_growth = True
                         # Read new content now
                         new_lines = self.read_new_lines(log_file, app_name)
@@ -625,34 +825,18 @@ class LogMonitor:
                             captured_contents = self.process_lines_for_json(new_lines, app_name)
                             
                             for content in captured_contents:
-                                # Convert app_name to uppercase as label (such as insight -> INSIGHT)
-                                source_tag = app_name.upper()
-                                self.write_to_forum_log(content, source_tag)
-                                # logger.info(f"ForumEngine: Capture - {content}")nt}")
-                                captured_any = True
-                                
-                                # Add utterances to buffer (formatted as full log lines)
-                                timestamp = datetime.now().strftime('%H:%M:%S')
-                                log_line = f"[{timestamp}] [{source_tag}] {content}"
-                                self.agent_speeches_buffer.append(log_line)
-                                
-                                # Check whether the host needs to be triggered to speak
-                                if len(self.agent_speeches_buffer) >= self.host_speech_threshold and not self.is_host_generating:
-                                    # Synchronously trigger the host to speak
-                                    self._trigger_host_speech()
+                                if self._record_agent_speech(app_name, content):
+                                    captured_any = True
                    
-                    elif current_lines < previous_lines:
+                    elif change == 'shrink':
                         any_shrink = True
                         # logger.info(f"ForumEngine: {app_name} log shortening detected, baseline will be reset")etected, baseline will be reset")
                         # Reset file position to new end of file
-                        self.file_positions[app_name] = self.get_file_size(log_file)
+                        self.reset_file_baseline(log_file, app_name)
                         # Reset JSON capture status
                         self.capturing_json[app_name] = False
                         self.json_buffer[app_name] = []
                         self.in_error_block[app_name] = False
-                   
-                    # Update row count record
-                    self.file_line_counts[app_name] = current_lines
                
                 # Checks whether the current search session should be ended
                 if self.is_searching:
@@ -662,8 +846,8 @@ class LogMonitor:
                         self.is_searching = False
                         self.search_inactive_count = 0
                         # Reset host related status
-                        self.agent_speeches_buffer = []
-                        self.is_host_generating = False
+                        self._reset_host_state()
+                        self.bus_engines = set()
                         # write end tag
                         end_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                         self.write_to_forum_log(f"=== ForumEngine Forum ends - {end_time} ===", "SYSTEM")
@@ -676,16 +860,19 @@ class LogMonitor:
                             self.is_searching = False
                             self.search_inactive_count = 0
                             # Reset host related status
-                            self.agent_speeches_buffer = []
-                            self.is_host_generating = False
+                            self._reset_host_state()
+                            self.bus_engines = set()
                             # write end tag
                             end_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
                             self.write_to_forum_log(f"=== ForumEngine Forum ends - {end_time} ===", "SYSTEM")
                     else:
                         self.search_inactive_count = 0  # reset counter
                
-                # short sleep
-                time.sleep(1)
+                # Short sleep, woken up early when an event arrives on the bus
+                if self.event_subscriber is not None and self.event_subscriber.is_running:
+                    self.event_subscriber.wait(1)
+                else:
+                    time.sleep(1)
                
             except Exception as e:
                 logger.exception(f"ForumEngine: Error in forum record: {e}")
@@ -704,6 +891,12 @@ class LogMonitor:
         try:
             # Start monitoring
             self.is_monitoring = True
+            if self.event_subscriber is not None:
+                self.event_subscriber.start()
+            if HOST_AVAILABLE:
+                self.host_worker_run += 1
+                self.host_worker_thread = threading.Thread(target=self._host_worker, args=(self.host_worker_run,), daemon=True)
+                self.host_worker_thread.start()
             self.monitor_thread = threading.Thread(target=self.monitor_logs, daemon=True)
             self.monitor_thread.start()
            
@@ -726,6 +919,17 @@ class LogMonitor:
            
             if self.monitor_thread and self.monitor_thread.is_alive():
                 self.monitor_thread.join(timeout=2)
+
+            if self.event_subscriber is not None:
+                self.event_subscriber.stop()
+            self.bus_engines = set()
+
+            # Wake the moderator worker so it exits; a generation in flight is left to finish in the background
+            with self.host_condition:
+                self.host_condition.notify_all()
+            if self.host_worker_thread and self.host_worker_thread.is_alive():
+                self.host_worker_thread.join(timeout=2)
+            self.host_worker_thread = None
            
             # write end tag
             end_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -802,9 +1006,6 @@ class LogMonitor:
                                 # This is the end of the string, exit string status
                                 in_string = False
                                 fixed_text += char
-                            else:
-                                # This is a quote inside the string and needs to be escaped
-                                fixed_text += '\\"t += char
                             else:
                                 # These are quotes inside the string and need to be escaped
                                 fixed_text += '\\"'
@@ -1,16 +1,20 @@
 """Deep Search Agent main class
 Integrate all modules to achieve a complete in-depth search process"""
 
+import asyncio
 import json
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 from loguru import logger
 from sentence_transformers import SentenceTransformer
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 
 from .llms import LLMClient
 from .nodes import (
@@ -21,24 +25,45 @@ from .nodes import (
     ReportFormattingNode,
     ReportStructureNode,
 )
-from .state import State
+from .state import Paragraph, State
 from .tools import (
     DBResponse,
     MediaCrawlerDB,
+    QueryResult,
     keyword_optimizer,
     multilingual_sentiment_analyzer,
 )
 from .utils import format_search_results_for_prompt
 from .utils.config import Settings, settings
+from .utils.db import run_sync
+from .utils.embedding_cache import get_embedding_cache
 
 ENABLE_CLUSTERING: bool = True  # Whether to enable cluster sampling
 MAX_CLUSTERED_RESULTS: int = 50  # Maximum number of results returned after clustering
 RESULTS_PER_CLUSTER: int = 5  # The number of results returned for each cluster
+MINIBATCH_KMEANS_THRESHOLD: int = 1000  # Above this many results MiniBatchKMeans replaces KMeans
+CLUSTERING_MODEL_NAME: str = "paraphrase-multilingual-MiniLM-L12-v2"
+
+
+def _tag_paragraph(record):
+    """Prefix the line with the paragraph being processed, parallel paragraphs interleave in the log"""
+    paragraph = record["extra"].get("paragraph")
+    if paragraph:
+        message = record["message"]
+        body = message.lstrip("\n")
+        record["message"] = f"{message[:len(message) - len(body)]}[{paragraph}] {body}"
+
+
+logger = logger.patch(_tag_paragraph)
 
 
 class DeepSearchAgent:
     """Deep Search Agent main class"""
 
+    # The clustering model is loaded once per process and shared by all agents
+    _clustering_model = None
+    _clustering_model_lock = threading.Lock()
+
     def __init__(self, config: Optional[Settings] = None):
         """Initialize Deep Search Agent
 
@@ -52,17 +77,35 @@ class DeepSearchAgent:
         # Initialize the search toolset
         self.search_agency = MediaCrawlerDB()
 
-        # Initialize small clustering model (lazy loading)
-        self._clustering_model = None
+        # Clustering embeddings are cached by text hash, the model is loaded ahead of the first clustering
+        self._embedding_cache = get_embedding_cache(
+            self.config.CLUSTERING_EMBEDDING_CACHE_SIZE,
+            self.config.CLUSTERING_EMBEDDING_CACHE_DB,
+            self.config.CLUSTERING_EMBEDDING_CACHE_DB_MAX_MB * 1024 * 1024,
+        )
+        self._preload_clustering_model(self.config.CLUSTERING_MODEL_PRELOAD)
 
         # Initialize sentiment analyzer
         self.sentiment_analyzer = multilingual_sentiment_analyzer
+        self.sentiment_analyzer.configure_backend(
+            backend=self.config.SENTIMENT_BACKEND,
+            onnx_quantize=self.config.SENTIMENT_ONNX_QUANTIZE,
+            onnx_threads=self.config.SENTIMENT_ONNX_THREADS,
+            batch_size=self.config.SENTIMENT_BATCH_SIZE,
+        )
+        self.sentiment_analyzer.configure_cache(
+            max_entries=self.config.SENTIMENT_CACHE_SIZE,
+            db_path=self.config.SENTIMENT_CACHE_DB,
+            max_db_bytes=self.config.SENTIMENT_CACHE_DB_MAX_MB * 1024 * 1024,
+        )
 
         # Initialize node
         self._initialize_nodes()
 
         # state
         self.state = State()
+        self._checkpoint_path: Optional[str] = None
+        self._state_lock = threading.RLock()  # Guards the state shared by parallel paragraphs
 
         # Make sure the output directory exists
         os.makedirs(self.config.OUTPUT_DIR, exist_ok=True)
@@ -89,13 +132,38 @@ class DeepSearchAgent:
         self.report_formatting_node = ReportFormattingNode(self.llm_client)
 
     def _get_clustering_model(self):
-        """Lazy loading of clustering models"""
-        if self._clustering_model is None:
-            logger.info("Loading the clustering model (paraphrase-multilingual-MiniLM-L12-v2)...")
-            self._clustering_model = SentenceTransformer(
-                "paraphrase-multilingual-MiniLM-L12-v2"
-            )
-        return self._clustering_model
+        """Load the clustering model on first use, waits for a preload in progress"""
+        with DeepSearchAgent._clustering_model_lock:
+            if DeepSearchAgent._clustering_model is None:
+                logger.info(f"Loading the clustering model ({CLUSTERING_MODEL_NAME})...")
+                start = time.perf_counter()
+                DeepSearchAgent._clustering_model = SentenceTransformer(CLUSTERING_MODEL_NAME)
+                logger.info(f"Clustering model loaded in {time.perf_counter() - start:.1f}s")
+        return DeepSearchAgent._clustering_model
+
+    def _preload_clustering_model(self, mode: str):
+        """Load the clustering model now ("eager"), in a background thread ("background") or on first use ("none")"""
+        if not ENABLE_CLUSTERING or mode not in ("eager", "background"):
+            return
+
+        def load():
+            try:
+                self._get_clustering_model()
+            except Exception as e:
+                logger.warning(f"Clustering model preload failed, it is loaded on first use: {str(e)}")
+
+        if mode == "eager":
+            load()
+        else:
+            threading.Thread(target=load, name="ClusteringModelPreload", daemon=True).start()
+
+    def _encode_for_clustering(self, texts: List[str]) -> np.ndarray:
+        """Embed texts, only the texts missing from the embedding cache go through the model"""
+        return self._embedding_cache.encode(
+            CLUSTERING_MODEL_NAME,
+            texts,
+            lambda missing: self._get_clustering_model().encode(missing, show_progress_bar=False),
+        )
 
     def _validate_date_format(self, date_str: str) -> bool:
         """Verify that the date format is YYYY-MM-DD
@@ -122,36 +190,54 @@ class DeepSearchAgent:
 
     def _cluster_and_sample_results(
         self,
-        results: List,
+        results: Union[List, Iterable[List]],
         max_results: int = MAX_CLUSTERED_RESULTS,
         results_per_cluster: int = RESULTS_PER_CLUSTER,
     ) -> List:
         """Cluster and sample search results
 
         Args:
-            results: search results list
+            results: search results list, or an iterable of result chunks
+                (e.g. MediaCrawlerDB.stream_comments_for_topic) encoded as they arrive
             max_results: Maximum number of results returned
             results_per_cluster: Number of results returned per cluster
 
         Returns:
             Result list after sampling"""
-        if len(results) <= max_results:
-            return results
+        if isinstance(results, list):
+            if len(results) <= max_results:
+                return results
+            chunks, results = [results], []
+        else:
+            chunks, results = results, []
 
         try:
-            # Extract text
-            texts = [r.title_or_content[:500] for r in results]
-
-            # Get the model and code
-            model = self._get_clustering_model()
-            embeddings = model.encode(texts, show_progress_bar=False)
+            # Extract text and encode chunk by chunk once there are more results than max_results
+            embedding_chunks, encoded = [], 0
+            encode_seconds = 0.0
+            for chunk in chunks:
+                results.extend(chunk)
+                if len(results) > max_results:
+                    texts = [r.title_or_content[:500] for r in results[encoded:]]
+                    start = time.perf_counter()
+                    embedding_chunks.append(self._encode_for_clustering(texts))
+                    encode_seconds += time.perf_counter() - start
+                    encoded = len(results)
+            if len(results) <= max_results:
+                return results
+            embeddings = np.vstack(embedding_chunks)
 
             # Calculate the number of clusters
             n_clusters = min(max(2, max_results // results_per_cluster), len(results))
 
-            # KMeans clustering
-            kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
+            # KMeans clustering, mini-batches with fewer restarts for large result sets
+            start = time.perf_counter()
+            if len(results) > MINIBATCH_KMEANS_THRESHOLD:
+                kmeans = MiniBatchKMeans(n_clusters=n_clusters, random_state=42, n_init=3, batch_size=1024)
+            else:
+                kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
             labels = kmeans.fit_predict(embeddings)
+            cluster_seconds = time.perf_counter() - start
 
             # Sample from each cluster
             sampled_results = []
@@ -173,6 +259,11 @@ class DeepSearchAgent:
             logger.info(
                 f"Clustering completed: {len(results)} items -> {n_clusters} topics -> {len(sampled_results)} representative results"
             )
+            cache_stats = self._embedding_cache.stats()
+            logger.info(
+                f"Clustering timings: encode {encode_seconds:.2f}s (embedding cache hit rate {cache_stats['hit_rate']:.1%}), "
+                f"{type(kmeans).__name__} {cluster_seconds:.2f}s"
+            )
             return sampled_results
 
         except Exception as e:
@@ -189,6 +280,7 @@ class DeepSearchAgent:
                 -"search_topic_by_date": Search topics by date
                 -"get_comments_for_topic": Get topic comments
                 -"search_topic_on_platform": Platform targeted search
+                -"search_topic_overview": Topic overview from the daily rollups
                 -"analyze_sentiment": Perform sentiment analysis on query results
             query: search keywords/topics
             **kwargs: additional parameters (such as start_date, end_date, platform, limit, enable_sentiment, etc.)
@@ -218,6 +310,32 @@ class DeepSearchAgent:
 
             return response
 
+        # The overview reads the rollups keyed by the crawl keywords, so the query is used as is
+        if tool_name == "search_topic_overview":
+            response = self.search_agency.search_topic_overview(
+                topic=query,
+                start_date=kwargs.get("start_date"),
+                end_date=kwargs.get("end_date"),
+            )
+            if response.error_message:
+                logger.info(f"{response.error_message} Falling back to global search")
+                return self.execute_search_tool("search_topic_globally", query, **kwargs)
+
+            enable_sentiment = kwargs.get("enable_sentiment", True)
+            if enable_sentiment and response.results:
+                sentiment_analysis = self._perform_sentiment_analysis(response.results)
+                if sentiment_analysis:
+                    response.parameters["sentiment_analysis"] = sentiment_analysis
+
+            # The aggregates reach the LLM as the first result
+            response.results.insert(0, QueryResult(
+                platform="all",
+                content_type="overview",
+                title_or_content=response.metadata["summary"],
+            ))
+            response.results_count = len(response.results)
+            return response
+
         # Standalone Sentiment Analysis Tool
         if tool_name == "analyze_sentiment":
             texts = kwargs.get("texts", query)  # Can be passed through the texts parameter, or using query
@@ -243,95 +361,22 @@ class DeepSearchAgent:
         logger.info(f"🔍 Original query: '{query}'")
         logger.info(f"✨ Optimized keywords: {optimized_response.optimized_keywords}")
 
-        # Use optimized keywords to conduct multiple queries and consolidate the results
-        all_results = []
-        total_count = 0
-
-        for keyword in optimized_response.optimized_keywords:
-            logger.info(f"Search keyword: '{keyword}'")
-
-            try:
-                if tool_name == "search_topic_globally":
-                    # Use the default value in the configuration file and ignore the limit_per_table parameter provided by the agent
-                    limit_per_table = (
-                        self.config.DEFAULT_SEARCH_TOPIC_GLOBALLY_LIMIT_PER_TABLE
-                    )
-                    response = self.search_agency.search_topic_globally(
-                        topic=keyword, limit_per_table=limit_per_table
-                    )
-                elif tool_name == "search_topic_by_date":
-                    start_date = kwargs.get("start_date")
-                    end_date = kwargs.get("end_date")
-                    # Use the default value in the configuration file and ignore the limit_per_table parameter provided by the agent
-                    limit_per_table = (
-                        self.config.DEFAULT_SEARCH_TOPIC_BY_DATE_LIMIT_PER_TABLE
-                    )
-                    if not start_date or not end_date:
-                        raise ValueError(
-                            "The search_topic_by_date tool requires start_date and end_date parameters"
-                        )
-                    response = self.search_agency.search_topic_by_date(
-                        topic=keyword,
-                        start_date=start_date,
-                        end_date=end_date,
-                        limit_per_table=limit_per_table,
-                    )
-                elif tool_name == "get_comments_for_topic":
-                    # Use the default value in the configuration file, distribute according to the number of keywords, but ensure the minimum value
-                    limit = self.config.DEFAULT_GET_COMMENTS_FOR_TOPIC_LIMIT // len(
-                        optimized_response.optimized_keywords
-                    )
-                    limit = max(limit, 50)
-                    response = self.search_agency.get_comments_for_topic(
-                        topic=keyword, limit=limit
-                    )
-                elif tool_name == "search_topic_on_platform":
-                    platform = kwargs.get("platform")
-                    start_date = kwargs.get("start_date")
-                    end_date = kwargs.get("end_date")
-                    # Use the default value in the configuration file, distribute according to the number of keywords, but ensure the minimum value
-                    limit = self.config.DEFAULT_SEARCH_TOPIC_ON_PLATFORM_LIMIT // len(
-                        optimized_response.optimized_keywords
-                    )
-                    limit = max(limit, 30)
-                    if not platform:
-                        raise ValueError("The search_topic_on_platform tool requires the platform parameter")
-                    response = self.search_agency.search_topic_on_platform(
-                        platform=platform,
-                        topic=keyword,
-                        start_date=start_date,
-                        end_date=end_date,
-                        limit=limit,
-                    )
-                else:
-                    logger.info(f"Unknown search tool: {tool_name}, using default global search")
-                    response = self.search_agency.search_topic_globally(
-                        topic=keyword,
-                        limit_per_table=self.config.DEFAULT_SEARCH_TOPIC_GLOBALLY_LIMIT_PER_TABLE,
-                    )
-
-                # Collect results
-                if response.results:
-                    logger.info(f"Found {len(response.results)} results")
-                    all_results.extend(response.results)
-                    total_count += len(response.results)
-                else:
-                    logger.info(f"No results found")
-
-            except Exception as e:
-                logger.error(f"Error while querying '{keyword}': {str(e)}")
-                continue
-
-        # Deduplication and consolidation of results
-        unique_results = self._deduplicate_results(all_results)
-        logger.info(f"A total of {total_count} results were found, and after deduplication, {len(unique_results)} results were found.")
-
-        if ENABLE_CLUSTERING:
-            unique_results = self._cluster_and_sample_results(
-                unique_results,
-                max_results=MAX_CLUSTERED_RESULTS,
-                results_per_cluster=RESULTS_PER_CLUSTER,
+        if tool_name == "get_comments_for_topic" and ENABLE_CLUSTERING:
+            # Clustering samples from all matching comments, streamed in chunks instead of one limited list per keyword
+            unique_results = self._cluster_comment_stream(optimized_response.optimized_keywords)
+        else:
+            # Query the optimized keywords concurrently, results are deduplicated as they arrive
+            unique_results, total_count = run_sync(
+                self._asearch_keywords(tool_name, optimized_response.optimized_keywords, **kwargs)
             )
+            logger.info(f"A total of {total_count} results were found, and after deduplication, {len(unique_results)} results were found.")
+
+            if ENABLE_CLUSTERING:
+                unique_results = self._cluster_and_sample_results(
+                    unique_results,
+                    max_results=MAX_CLUSTERED_RESULTS,
+                    results_per_cluster=RESULTS_PER_CLUSTER,
+                )
 
         # Build the integrated response
         integrated_response = DBResponse(
@@ -360,11 +405,145 @@ class DeepSearchAgent:
 
         return integrated_response
 
-    def _deduplicate_results(self, results: List) -> List:
-        """Deduplication search results"""
-        seen = set()
-        unique_results = []
+    async def _asearch_keywords(self, tool_name: str, keywords: List[str], **kwargs) -> Tuple[List, int]:
+        """Run a search tool for every keyword concurrently and merge the results in keyword order
+
+        Queries finishing early are held back until every earlier keyword has been merged, so the result
+        order (and which duplicate is kept) does not depend on query timing and the prompts built from
+        the results stay reproducible.
+
+        Args:
+            tool_name: search tool name
+            keywords: optimized keywords
+            **kwargs: tool parameters passed to execute_search_tool
+
+        Returns:
+            (deduplicated results, total number of results before deduplication)"""
+        if self.config.SEARCH_FOLD_KEYWORDS and len(keywords) > 1:
+            # One query per table matching any keyword instead of one per keyword
+            logger.info(f"Search keywords (folded): {keywords}")
+            batches = [keywords]
+        else:
+            batches = keywords
+
+        semaphore = asyncio.Semaphore(max(1, self.config.SEARCH_KEYWORD_CONCURRENCY))
+
+        async def search(index: int, keyword: Union[str, List[str]]) -> Tuple[int, Optional[DBResponse]]:
+            async with semaphore:
+                try:
+                    return index, await self._asearch_keyword(tool_name, keyword, len(keywords), **kwargs)
+                except Exception as e:
+                    logger.error(f"Error while querying '{keyword}': {str(e)}")
+                    return index, None
+
+        seen, unique_results, total_count = set(), [], 0
+        finished_responses: Dict[int, Optional[DBResponse]] = {}
+        next_index = 0
+        for finished in asyncio.as_completed([search(index, keyword) for index, keyword in enumerate(batches)]):
+            index, response = await finished
+            finished_responses[index] = response
+            while next_index in finished_responses:
+                keyword, response = batches[next_index], finished_responses.pop(next_index)
+                next_index += 1
+                if response is None:
+                    continue
+                if response.results:
+                    logger.info(f"Found {len(response.results)} results for '{keyword}'")
+                    total_count += len(response.results)
+                    self._merge_unique_results(response.results, seen, unique_results)
+                else:
+                    logger.info(f"No results found for '{keyword}'")
+        return unique_results, total_count
+
+    async def _asearch_keyword(self, tool_name: str, keyword: Union[str, List[str]], keyword_count: int, **kwargs) -> DBResponse:
+        """Run one search tool call
+
+        Args:
+            tool_name: search tool name
+            keyword: a keyword, or all keywords when they are folded into one query
+            keyword_count: number of optimized keywords, the comment/platform limits are split between them
+            **kwargs: tool parameters passed to execute_search_tool"""
+        folded = isinstance(keyword, list)
+        # Per-table limits are per keyword: a folded query keeps the same total budget
+        table_scale = len(keyword) if folded else 1
+        split = 1 if folded else keyword_count
+        logger.info(f"Search keyword: '{keyword}'")
+
+        if tool_name == "search_topic_globally":
+            # Use the default value in the configuration file and ignore the limit_per_table parameter provided by the agent
+            limit_per_table = self.config.DEFAULT_SEARCH_TOPIC_GLOBALLY_LIMIT_PER_TABLE * table_scale
+            return await self.search_agency.asearch_topic_globally(topic=keyword, limit_per_table=limit_per_table)
+        if tool_name == "search_topic_by_date":
+            start_date = kwargs.get("start_date")
+            end_date = kwargs.get("end_date")
+            # Use the default value in the configuration file and ignore the limit_per_table parameter provided by the agent
+            limit_per_table = self.config.DEFAULT_SEARCH_TOPIC_BY_DATE_LIMIT_PER_TABLE * table_scale
+            if not start_date or not end_date:
+                raise ValueError(
+                    "The search_topic_by_date tool requires start_date and end_date parameters"
+                )
+            return await self.search_agency.asearch_topic_by_date(
+                topic=keyword,
+                start_date=start_date,
+                end_date=end_date,
+                limit_per_table=limit_per_table,
+            )
+        if tool_name == "get_comments_for_topic":
+            # Use the default value in the configuration file, distribute according to the number of keywords, but ensure the minimum value
+            limit = max(self.config.DEFAULT_GET_COMMENTS_FOR_TOPIC_LIMIT // split, 50)
+            return await self.search_agency.aget_comments_for_topic(topic=keyword, limit=limit)
+        if tool_name == "search_topic_on_platform":
+            platform = kwargs.get("platform")
+            # Use the default value in the configuration file, distribute according to the number of keywords, but ensure the minimum value
+            limit = max(self.config.DEFAULT_SEARCH_TOPIC_ON_PLATFORM_LIMIT // split, 30)
+            if not platform:
+                raise ValueError("The search_topic_on_platform tool requires the platform parameter")
+            return await self.search_agency.asearch_topic_on_platform(
+                platform=platform,
+                topic=keyword,
+                start_date=kwargs.get("start_date"),
+                end_date=kwargs.get("end_date"),
+                limit=limit,
+            )
+
+        logger.info(f"Unknown search tool: {tool_name}, using default global search")
+        return await self.search_agency.asearch_topic_globally(
+            topic=keyword,
+            limit_per_table=self.config.DEFAULT_SEARCH_TOPIC_GLOBALLY_LIMIT_PER_TABLE * table_scale,
+        )
+
+    def _cluster_comment_stream(self, keywords: List[str]) -> List:
+        """Stream the comments matching any keyword into clustering, deduplicated chunk by chunk
+
+        Args:
+            keywords: optimized keywords
+
+        Returns:
+            Sampled comments"""
+        seen, counts = set(), {'total': 0, 'unique': 0}
+
+        def unique_chunks() -> Iterable[List]:
+            for chunk in self.search_agency.stream_comments_for_topic(
+                topic=keywords, max_rows_per_table=self.config.DB_STREAM_COMMENTS_PER_TABLE
+            ):
+                unique = []
+                self._merge_unique_results(chunk, seen, unique)
+                counts['total'] += len(chunk)
+                counts['unique'] += len(unique)
+                if unique:
+                    yield unique
+
+        sampled = self._cluster_and_sample_results(
+            unique_chunks(),
+            max_results=MAX_CLUSTERED_RESULTS,
+            results_per_cluster=RESULTS_PER_CLUSTER,
+        )
+        logger.info(f"A total of {counts['total']} comments were streamed, and after deduplication, {counts['unique']} comments were found.")
+        return sampled
 
+    @staticmethod
+    def _merge_unique_results(results: List, seen: set, unique_results: List) -> None:
+        """Append the results whose identifier has not been seen yet"""
         for result in results:
             # Use URL or content as deduplication identifier
             identifier = result.url if result.url else result.title_or_content[:100]
@@ -372,13 +551,17 @@ class DeepSearchAgent:
                 seen.add(identifier)
                 unique_results.append(result)
 
+    def _deduplicate_results(self, results: List) -> List:
+        """Deduplication search results"""
+        unique_results = []
+        self._merge_unique_results(results, set(), unique_results)
         return unique_results
 
-    def _perform_sentiment_analysis(self, results: List) -> Optional[Dict[str, Any]]:
+    def _perform_sentiment_analysis(self, results: Union[List, Iterable[List]]) -> Optional[Dict[str, Any]]:
         """Perform sentiment analysis on search results
 
         Args:
-            results: search results list
+            results: search results list, or an iterable of result chunks analyzed one chunk at a time
 
         Returns:
             A dictionary of sentiment analysis results, returning None if failed"""
@@ -394,23 +577,27 @@ class DeepSearchAgent:
             elif self.sentiment_analyzer.is_disabled:
                 logger.info("The sentiment analysis function is disabled and the original text is directly transmitted")
 
-            # Convert query results to dictionary format
-            results_dict = []
-            for result in results:
-                result_dict = {
-                    "content": result.title_or_content,
-                    "platform": result.platform,
-                    "author": result.author_nickname,
-                    "url": result.url,
-                    "publish_time": str(result.publish_time)
-                    if result.publish_time
-                    else None,
-                }
-                results_dict.append(result_dict)
+            # Convert query results to dictionary format, chunk by chunk
+            chunks = [results] if isinstance(results, list) else results
+            result_dicts = (
+                [
+                    {
+                        "content": result.title_or_content,
+                        "platform": result.platform,
+                        "author": result.author_nickname,
+                        "url": result.url,
+                        "publish_time": str(result.publish_time)
+                        if result.publish_time
+                        else None,
+                    }
+                    for result in chunk
+                ]
+                for chunk in chunks
+            )
 
             # Perform sentiment analysis
-            sentiment_analysis = self.sentiment_analyzer.analyze_query_results(
-                query_results=results_dict, text_field="content", min_confidence=0.5
+            sentiment_analysis = self.sentiment_analyzer.analyze_query_result_chunks(
+                result_dicts, text_field="content", min_confidence=0.5
             )
 
             return sentiment_analysis.get("sentiment_analysis")
@@ -493,28 +680,48 @@ class DeepSearchAgent:
             logger.exception(f"❌ An error occurred during sentiment analysis: {str(e)}")
             return {"success": False, "error": str(e), "results": []}
 
-    def research(self, query: str, save_report: bool = True) -> str:
+    def research(self, query: str, save_report: bool = True, resume_from: Optional[str] = None) -> str:
         """Perform in-depth research
 
         Args:
             query: research query
             save_report: whether to save the report to a file
+            resume_from: checkpoint file of an interrupted run, its completed paragraphs and reflections are
+                skipped and the search of an unfinished step is replayed instead of run again
 
         Returns:
             Final report content"""
+        if resume_from:
+            self.state = State.load_from_file(resume_from)
+            if query and self.state.query and query != self.state.query:
+                logger.warning(f"Checkpoint was written for '{self.state.query}', resuming that research")
+            query = self.state.query or query
+            logger.info(f"Resuming from checkpoint: {resume_from}")
+
         logger.info(f"\n{'=' * 60}")
         logger.info(f"Start in-depth research: {query}")
         logger.info(f"{'=' * 60}")
+        self._checkpoint_path = self._checkpoint_file(query, resume_from)
+        if self._checkpoint_path:
+            logger.info(f"Checkpointing to {self._checkpoint_path}")
 
         try:
-            # Step 1: Generate report structure
-            self._generate_report_structure(query)
+            # Step 1: Generate report structure, a resumed checkpoint already has it
+            if resume_from and self.state.paragraphs:
+                logger.info(f"Report structure restored from checkpoint, {len(self.state.paragraphs)} paragraphs")
+            else:
+                self._generate_report_structure(query)
+                self._checkpoint()
 
             # Step 2: Process each paragraph
             self._process_paragraphs()
 
             # Step 3: Generate final report
-            final_report = self._generate_final_report()
+            if self.state.is_completed and self.state.final_report:
+                final_report = self.state.final_report
+            else:
+                final_report = self._generate_final_report()
+                self._checkpoint()
 
             # Step 4: Save report
             if save_report:
@@ -544,31 +751,105 @@ class DeepSearchAgent:
         logger.info(_message)
 
     def _process_paragraphs(self):
-        """process all paragraphs"""
+        """Process all paragraphs, up to MAX_PARALLEL_PARAGRAPHS of them at the same time
+
+        Paragraphs are independent until the final report: each one only mutates its own entry of
+        state.paragraphs, so the report keeps the planned paragraph order whatever finishes first.
+
+        The state object itself is shared (search history, timestamp, checkpoint serialization), so workers
+        never reassign self.state: node and search calls run unlocked and only their results are applied
+        under _state_lock."""
         total_paragraphs = len(self.state.paragraphs)
+        max_parallel = max(1, min(self.config.MAX_PARALLEL_PARAGRAPHS, total_paragraphs))
+        progress_lock = threading.Lock()
+        completed = 0
+
+        def process(i: int):
+            nonlocal completed
+            self._process_paragraph(i)
+            with progress_lock:
+                completed += 1
+                progress = completed / total_paragraphs * 100
+            logger.info(f"Paragraph processing completed ({progress:.1f}%)")
 
-        for i in range(total_paragraphs):
-            logger.info(
-                f"\n[Step 2.{i + 1}] Process paragraphs: {self.state.paragraphs[i].title}"
-            )
-            logger.info("-" * 50)
+        if max_parallel == 1:
+            for i in range(total_paragraphs):
+                process(i)
+            return
+
+        def process_tagged(i: int):
+            with logger.contextualize(paragraph=f"P{i + 1}"):
+                process(i)
+
+        logger.info(f"Processing {total_paragraphs} paragraphs, {max_parallel} at a time")
+        with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="paragraph") as executor:
+            futures = [executor.submit(process_tagged, i) for i in range(total_paragraphs)]
+            try:
+                for future in futures:
+                    future.result()
+            except Exception:
+                # Same as the sequential loop: the first failure stops the research
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _process_paragraph(self, paragraph_index: int):
+        """Research one paragraph: initial search and summary, then the reflection loop"""
+        paragraph = self.state.paragraphs[paragraph_index]
+        if paragraph.is_completed():
+            logger.info(f"\n[Step 2.{paragraph_index + 1}] Paragraph restored from checkpoint: {paragraph.title}")
+            return
 
-            # Initial search and summary
-            self._initial_search_and_summary(i)
+        logger.info(f"\n[Step 2.{paragraph_index + 1}] Process paragraphs: {paragraph.title}")
+        logger.info("-" * 50)
 
-            # reflective cycle
-            self._reflection_loop(i)
+        # Initial search and summary
+        self._initial_search_and_summary(paragraph_index)
 
-            # Mark paragraph complete
-            self.state.paragraphs[i].research.mark_completed()
+        # reflective cycle
+        self._reflection_loop(paragraph_index)
 
-            progress = (i + 1) / total_paragraphs * 100
-            logger.info(f"Paragraph processing completed ({progress:.1f}%)")
+        # Mark paragraph complete
+        with self._state_lock:
+            paragraph.research.mark_completed()
+        self._checkpoint()
 
     def _initial_search_and_summary(self, paragraph_index: int):
-        """Perform initial search and summary"""
+        """Perform initial search and summary, skipped when the checkpoint already has the summary"""
         paragraph = self.state.paragraphs[paragraph_index]
+        if paragraph.research.latest_summary:
+            logger.info("- Initial summary restored from checkpoint")
+            return
+
+        search_query, search_results = self._checkpointed_search(paragraph, self._initial_search)
 
+        # Generate initial summary
+        logger.info("- Generate initial summary...")
+        summary_input = {
+            "title": paragraph.title,
+            "content": paragraph.content,
+            "search_query": search_query,
+            "search_results": format_search_results_for_prompt(
+                search_results, self.config.MAX_CONTENT_LENGTH
+            ),
+        }
+
+        summary = self.first_summary_node.run(summary_input)
+
+        # update status
+        with self._state_lock:
+            paragraph.research.latest_summary = summary
+            paragraph.research.clear_pending_search()
+            self.state.update_timestamp()
+        self._checkpoint()
+
+        logger.info("- Initial summary completed")
+
+    def _initial_search(self, paragraph: Paragraph) -> Tuple[str, List[Dict[str, Any]]]:
+        """Generate the initial search query of a paragraph and run it
+
+        Returns:
+            (search query, search results)"""
         # Prepare search input
         search_input = {"title": paragraph.title, "content": paragraph.content}
 
@@ -592,7 +873,7 @@ class DeepSearchAgent:
         search_kwargs = {}
 
         # Tools for handling required dates
-        if search_tool in ["search_topic_by_date", "search_topic_on_platform"]:
+        if search_tool in ["search_topic_by_date", "search_topic_on_platform", "search_topic_overview"]:
             start_date = search_output.get("start_date")
             end_date = search_output.get("end_date")
 
@@ -695,187 +976,228 @@ class DeepSearchAgent:
             logger.info("- No search results found")
 
         # Update search history in status
-        paragraph.research.add_search_results(search_query, search_results)
-
-        # Generate initial summary
-        logger.info("- Generate initial summary...")
-        summary_input = {
-            "title": paragraph.title,
-            "content": paragraph.content,
-            "search_query": search_query,
-            "search_results": format_search_results_for_prompt(
-                search_results, self.config.MAX_CONTENT_LENGTH
-            ),
-        }
-
-        # update status
-        self.state = self.first_summary_node.mutate_state(
-            summary_input, self.state, paragraph_index
-        )
+        with self._state_lock:
+            paragraph.research.add_search_results(search_query, search_results)
 
-        logger.info("- Initial summary completed")
+        return search_query, search_results
 
     def _reflection_loop(self, paragraph_index: int):
-        """Execute a reflective cycle"""
+        """Execute a reflective cycle, continuing after the reflections already in the checkpoint"""
         paragraph = self.state.paragraphs[paragraph_index]
 
-        for reflection_i in range(self.config.MAX_REFLECTIONS):
+        for reflection_i in range(paragraph.research.reflection_iteration, self.config.MAX_REFLECTIONS):
             logger.info(f"- reflection {reflection_i + 1}/{self.config.MAX_REFLECTIONS}...")
 
-            # Prepare reflective input
-            reflection_input = {
+            search_query, search_results = self._checkpointed_search(paragraph, self._reflection_search)
+
+            # Generate reflection summaries
+            reflection_summary_input = {
                 "title": paragraph.title,
                 "content": paragraph.content,
+                "search_query": search_query,
+                "search_results": format_search_results_for_prompt(
+                    search_results, self.config.MAX_CONTENT_LENGTH
+                ),
                 "paragraph_latest_state": paragraph.research.latest_summary,
             }
 
-            # Generate reflective search queries
-            reflection_output = self.reflection_node.run(reflection_input)
-            search_query = reflection_output["search_query"]
-            search_tool = reflection_output.get(
-                "search_tool", "search_topic_globally"
-            )  # Default tool
-            reasoning = reflection_output["reasoning"]
-
-            logger.info(f"Reflection query: {search_query}")
-            logger.info(f"Selected tool: {search_tool}")
-            logger.info(f"reflective reasoning: {reasoning}")
-
-            # Perform a reflective search
-            # Handle special parameters
-            search_kwargs = {}
-
-            # Tools for handling required dates
-            if search_tool in ["search_topic_by_date", "search_topic_on_platform"]:
-                start_date = reflection_output.get("start_date")
-                end_date = reflection_output.get("end_date")
-
-                if start_date and end_date:
-                    # Validate date format
-                    if self._validate_date_format(
-                        start_date
-                    ) and self._validate_date_format(end_date):
-                        search_kwargs["start_date"] = start_date
-                        search_kwargs["end_date"] = end_date
-                        logger.info(f"Time range: {start_date} to {end_date}")
-                    else:
-                        logger.info(
-                            f"Wrong date format (should be YYYY-MM-DD), use global search instead"
-                        )
-                        logger.info(
-                            f"Dates provided: start_date={start_date}, end_date={end_date}"
-                        )
-                        search_tool = "search_topic_globally"
-                elif search_tool == "search_topic_by_date":
-                    logger.warning(
-                        f"The search_topic_by_date tool lacks time parameters, use global search instead"
-                    )
-                    search_tool = "search_topic_globally"
+            updated_summary = self.reflection_summary_node.run(reflection_summary_input)
 
-            # Handles tools that require platform parameters
-            if search_tool == "search_topic_on_platform":
-                platform = reflection_output.get("platform")
-                if platform:
-                    search_kwargs["platform"] = platform
-                    logger.info(f"Specify platform: {platform}")
+            # update status
+            with self._state_lock:
+                paragraph.research.latest_summary = updated_summary
+                paragraph.research.increment_reflection()
+                paragraph.research.clear_pending_search()
+                self.state.update_timestamp()
+            self._checkpoint()
+
+            logger.info(f"Reflection {reflection_i + 1} completed")
+
+    def _reflection_search(self, paragraph: Paragraph) -> Tuple[str, List[Dict[str, Any]]]:
+        """Generate a reflective search query from the latest summary of a paragraph and run it
+
+        Returns:
+            (search query, search results)"""
+        # Prepare reflective input
+        reflection_input = {
+            "title": paragraph.title,
+            "content": paragraph.content,
+            "paragraph_latest_state": paragraph.research.latest_summary,
+        }
+
+        # Generate reflective search queries
+        reflection_output = self.reflection_node.run(reflection_input)
+        search_query = reflection_output["search_query"]
+        search_tool = reflection_output.get(
+            "search_tool", "search_topic_globally"
+        )  # Default tool
+        reasoning = reflection_output["reasoning"]
+
+        logger.info(f"Reflection query: {search_query}")
+        logger.info(f"Selected tool: {search_tool}")
+        logger.info(f"reflective reasoning: {reasoning}")
+
+        # Perform a reflective search
+        # Handle special parameters
+        search_kwargs = {}
+
+        # Tools for handling required dates
+        if search_tool in ["search_topic_by_date", "search_topic_on_platform", "search_topic_overview"]:
+            start_date = reflection_output.get("start_date")
+            end_date = reflection_output.get("end_date")
+
+            if start_date and end_date:
+                # Validate date format
+                if self._validate_date_format(
+                    start_date
+                ) and self._validate_date_format(end_date):
+                    search_kwargs["start_date"] = start_date
+                    search_kwargs["end_date"] = end_date
+                    logger.info(f"Time range: {start_date} to {end_date}")
                 else:
-                    logger.warning(
-                        f"The search_topic_on_platform tool lacks platform parameters, use global search instead"
+                    logger.info(
+                        f"Wrong date format (should be YYYY-MM-DD), use global search instead"
+                    )
+                    logger.info(
+                        f"Dates provided: start_date={start_date}, end_date={end_date}"
                     )
                     search_tool = "search_topic_globally"
+            elif search_tool == "search_topic_by_date":
+                logger.warning(
+                    f"The search_topic_by_date tool lacks time parameters, use global search instead"
+                )
+                search_tool = "search_topic_globally"
 
-            # Processing restriction parameters
-            if search_tool == "search_hot_content":
-                time_period = reflection_output.get("time_period", "week")
-                # Use the default value in the configuration file and do not allow the agent to control the limit parameter
-                limit = self.config.DEFAULT_SEARCH_HOT_CONTENT_LIMIT
-                search_kwargs["time_period"] = time_period
-                search_kwargs["limit"] = limit
-            elif search_tool in ["search_topic_globally", "search_topic_by_date"]:
-                # Use the default value in the configuration file and do not allow the agent to control the limit_per_table parameter
-                if search_tool == "search_topic_globally":
-                    limit_per_table = (
-                        self.config.DEFAULT_SEARCH_TOPIC_GLOBALLY_LIMIT_PER_TABLE
-                    )
-                else:  # search_topic_by_date
-                    limit_per_table = (
-                        self.config.DEFAULT_SEARCH_TOPIC_BY_DATE_LIMIT_PER_TABLE
-                    )
-                search_kwargs["limit_per_table"] = limit_per_table
-            elif search_tool in ["get_comments_for_topic", "search_topic_on_platform"]:
-                # Use the default value in the configuration file and do not allow the agent to control the limit parameter
-                if search_tool == "get_comments_for_topic":
-                    limit = self.config.DEFAULT_GET_COMMENTS_FOR_TOPIC_LIMIT
-                else:  # search_topic_on_platform
-                    limit = self.config.DEFAULT_SEARCH_TOPIC_ON_PLATFORM_LIMIT
-                search_kwargs["limit"] = limit
-
-            search_response = self.execute_search_tool(
-                search_tool, search_query, **search_kwargs
-            )
+        # Handles tools that require platform parameters
+        if search_tool == "search_topic_on_platform":
+            platform = reflection_output.get("platform")
+            if platform:
+                search_kwargs["platform"] = platform
+                logger.info(f"Specify platform: {platform}")
+            else:
+                logger.warning(
+                    f"The search_topic_on_platform tool lacks platform parameters, use global search instead"
+                )
+                search_tool = "search_topic_globally"
 
-            # Convert to compatible format
-            search_results = []
-            if search_response and search_response.results:
-                # Use the configuration file to control the number of results passed to LLM, 0 means no limit
-                if self.config.MAX_SEARCH_RESULTS_FOR_LLM > 0:
-                    max_results = min(
-                        len(search_response.results),
-                        self.config.MAX_SEARCH_RESULTS_FOR_LLM,
-                    )
-                else:
-                    max_results = len(search_response.results)  # No limit, pass all results
-                for result in search_response.results[:max_results]:
-                    search_results.append(
-                        {
-                            "title": result.title_or_content,
-                            "url": result.url or "",
-                            "content": result.title_or_content,
-                            "score": result.hotness_score,
-                            "raw_content": result.title_or_content,
-                            "published_date": result.publish_time.isoformat()
-                            if result.publish_time
-                            else None,
-                            "platform": result.platform,
-                            "content_type": result.content_type,
-                            "author": result.author_nickname,
-                            "engagement": result.engagement,
-                        }
-                    )
+        # Processing restriction parameters
+        if search_tool == "search_hot_content":
+            time_period = reflection_output.get("time_period", "week")
+            # Use the default value in the configuration file and do not allow the agent to control the limit parameter
+            limit = self.config.DEFAULT_SEARCH_HOT_CONTENT_LIMIT
+            search_kwargs["time_period"] = time_period
+            search_kwargs["limit"] = limit
+        elif search_tool in ["search_topic_globally", "search_topic_by_date"]:
+            # Use the default value in the configuration file and do not allow the agent to control the limit_per_table parameter
+            if search_tool == "search_topic_globally":
+                limit_per_table = (
+                    self.config.DEFAULT_SEARCH_TOPIC_GLOBALLY_LIMIT_PER_TABLE
+                )
+            else:  # search_topic_by_date
+                limit_per_table = (
+                    self.config.DEFAULT_SEARCH_TOPIC_BY_DATE_LIMIT_PER_TABLE
+                )
+            search_kwargs["limit_per_table"] = limit_per_table
+        elif search_tool in ["get_comments_for_topic", "search_topic_on_platform"]:
+            # Use the default value in the configuration file and do not allow the agent to control the limit parameter
+            if search_tool == "get_comments_for_topic":
+                limit = self.config.DEFAULT_GET_COMMENTS_FOR_TOPIC_LIMIT
+            else:  # search_topic_on_platform
+                limit = self.config.DEFAULT_SEARCH_TOPIC_ON_PLATFORM_LIMIT
+            search_kwargs["limit"] = limit
 
-            if search_results:
-                _message = f"Found {len(search_results)} reflection search results"
-                for j, result in enumerate(search_results, 1):
-                    date_info = (
-                        f"(Published in: {result.get('published_date', 'N/A')})"
-                        if result.get("published_date")
-                        else ""
-                    )
-                    _message += f"\n      {j}. {result['title'][:50]}...{date_info}"
-                logger.info(_message)
+        search_response = self.execute_search_tool(
+            search_tool, search_query, **search_kwargs
+        )
+
+        # Convert to compatible format
+        search_results = []
+        if search_response and search_response.results:
+            # Use the configuration file to control the number of results passed to LLM, 0 means no limit
+            if self.config.MAX_SEARCH_RESULTS_FOR_LLM > 0:
+                max_results = min(
+                    len(search_response.results),
+                    self.config.MAX_SEARCH_RESULTS_FOR_LLM,
+                )
             else:
-                logger.info("No reflection search results found")
+                max_results = len(search_response.results)  # No limit, pass all results
+            for result in search_response.results[:max_results]:
+                search_results.append(
+                    {
+                        "title": result.title_or_content,
+                        "url": result.url or "",
+                        "content": result.title_or_content,
+                        "score": result.hotness_score,
+                        "raw_content": result.title_or_content,
+                        "published_date": result.publish_time.isoformat()
+                        if result.publish_time
+                        else None,
+                        "platform": result.platform,
+                        "content_type": result.content_type,
+                        "author": result.author_nickname,
+                        "engagement": result.engagement,
+                    }
+                )
 
-            # Update search history
+        if search_results:
+            _message = f"Found {len(search_results)} reflection search results"
+            for j, result in enumerate(search_results, 1):
+                date_info = (
+                    f"(Published in: {result.get('published_date', 'N/A')})"
+                    if result.get("published_date")
+                    else ""
+                )
+                _message += f"\n      {j}. {result['title'][:50]}...{date_info}"
+            logger.info(_message)
+        else:
+            logger.info("No reflection search results found")
+
+        # Update search history
+        with self._state_lock:
             paragraph.research.add_search_results(search_query, search_results)
 
-            # Generate reflection summaries
-            reflection_summary_input = {
-                "title": paragraph.title,
-                "content": paragraph.content,
-                "search_query": search_query,
-                "search_results": format_search_results_for_prompt(
-                    search_results, self.config.MAX_CONTENT_LENGTH
-                ),
-                "paragraph_latest_state": paragraph.research.latest_summary,
-            }
+        return search_query, search_results
 
-            # update status
-            self.state = self.reflection_summary_node.mutate_state(
-                reflection_summary_input, self.state, paragraph_index
-            )
+    def _checkpointed_search(
+        self, paragraph: Paragraph, search_fn: Callable[[Paragraph], Tuple[str, List[Dict[str, Any]]]]
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Run the search of a research step, or replay it if the checkpoint recorded it before the step's summary
 
-            logger.info(f"Reflection {reflection_i + 1} completed")
+        Returns:
+            (search query, search results)"""
+        pending = paragraph.research.pending_search
+        if pending is not None:
+            logger.info(f"- Replaying checkpointed search: {pending['query']} ({len(pending['results'])} results)")
+            return pending["query"], pending["results"]
+
+        search_query, search_results = search_fn(paragraph)
+        with self._state_lock:
+            paragraph.research.set_pending_search(search_query, search_results)
+        self._checkpoint()
+        return search_query, search_results
+
+    def _checkpoint_file(self, query: str, resume_from: Optional[str] = None) -> Optional[str]:
+        """Checkpoint path of a research run, None when checkpointing is disabled"""
+        if not self.config.SAVE_CHECKPOINTS:
+            return None
+        if resume_from:
+            return resume_from
+        checkpoint_dir = os.path.join(self.config.OUTPUT_DIR, "checkpoints")
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        query_safe = "".join(c for c in query if c.isalnum() or c in (" ", "-", "_")).rstrip()
+        query_safe = query_safe.replace(" ", "_")[:30]
+        return os.path.join(checkpoint_dir, f"checkpoint_{query_safe}_{timestamp}.json")
+
+    def _checkpoint(self):
+        """Write the research state to the checkpoint file, paragraphs researched in parallel share one file"""
+        if not self._checkpoint_path:
+            return
+        with self._state_lock:
+            try:
+                self.state.save_to_file(self._checkpoint_path)
+            except Exception as e:
+                logger.warning(f"Checkpoint write failed, the research continues: {str(e)}")
 
     def _generate_final_report(self) -> str:
         """Generate final report"""
@@ -1,163 +1,30 @@
 """
 Unified OpenAI-compatible LLM client for the Insight Engine, with retry support.
+
+Requests go through the process-wide connection pool of utils/llm_client.py.
 """
 
 import os
 import sys
-from datetime import datetime
-from typing import Any, Dict, Optional, Iterator, Generator
-from loguru import logger
-
-from openai import OpenAI
+from typing import Optional
 
+# Ensure the project-level utils package is importable
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(current_dir))
-utils_dir = os.path.join(project_root, "utils")
-if utils_dir not in sys.path:
-    sys.path.append(utils_dir)
-
-try:
-    from retry_helper import with_retry, LLM_RETRY_CONFIG
-except ImportError:
-    def with_retry(config=None):
-        def decorator(func):
-            return func
-        return decorator
+if project_root not in sys.path:
+    sys.path.append(project_root)
 
-    LLM_RETRY_CONFIG = None
+from utils.llm_client import BaseLLMClient
 
 
-class LLMClient:
+class LLMClient(BaseLLMClient):
     """Minimal wrapper around the OpenAI-compatible chat completion API."""
 
+    timeout_env = "INSIGHT_ENGINE_REQUEST_TIMEOUT"
+
     def __init__(self, api_key: str, model_name: str, base_url: Optional[str] = None):
         if not api_key:
             raise ValueError("Insight Engine INSIGHT_ENGINE_API_KEY is required.")
         if not model_name:
             raise ValueError("Insight Engine INSIGHT_ENGINE_MODEL_NAME is required.")
-
-        self.api_key = api_key
-        self.base_url = base_url
-        self.model_name = model_name
-        self.provider = model_name
-        timeout_fallback = os.getenv("LLM_REQUEST_TIMEOUT") or os.getenv("INSIGHT_ENGINE_REQUEST_TIMEOUT") or "1800"
-        try:
-            self.timeout = float(timeout_fallback)
-        except ValueError:
-            self.timeout = 1800.0
-
-        client_kwargs: Dict[str, Any] = {
-            "api_key": api_key,
-            "max_retries": 0,
-        }
-        if base_url:
-            client_kwargs["base_url"] = base_url
-        self.client = OpenAI(**client_kwargs)
-
-    @with_retry(LLM_RETRY_CONFIG)
-    def invoke(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
-        current_time = datetime.now().strftime("%Y year %m month %d day %H hour %M minute")
-        time_prefix = f"Today's actual time is {current_time}"
-        if user_prompt:
-            user_prompt = f"{time_prefix}\n{user_prompt}"
-        else:
-            user_prompt = time_prefix
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ]
-
-        allowed_keys = {"temperature", "top_p", "presence_penalty", "frequency_penalty", "stream"}
-        extra_params = {key: value for key, value in kwargs.items() if key in allowed_keys and value is not None}
-
-        timeout = kwargs.pop("timeout", self.timeout)
-
-        response = self.client.chat.completions.create(
-            model=self.model_name,
-            messages=messages,
-            timeout=timeout,
-            **extra_params,
-        )
-
-        if response.choices and response.choices[0].message:
-            return self.validate_response(response.choices[0].message.content)
-        return ""
-
-    def stream_invoke(self, system_prompt: str, user_prompt: str, **kwargs) -> Generator[str, None, None]:
-        """Streaming call to LLM, gradually returning the response content
-        
-        Args:
-            system_prompt: system prompt word
-            user_prompt: user prompt word
-            **kwargs: additional parameters (temperature, top_p, etc.)
-            
-        Yields:
-            response text block (str)"""
-        current_time = datetime.now().strftime("%Y year %m month %d day %H hour %M minute")
-        time_prefix = f"Today's actual time is {current_time}"
-        if user_prompt:
-            user_prompt = f"{time_prefix}\n{user_prompt}"
-        else:
-            user_prompt = time_prefix
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ]
-
-        allowed_keys = {"temperature", "top_p", "presence_penalty", "frequency_penalty"}
-        extra_params = {key: value for key, value in kwargs.items() if key in allowed_keys and value is not None}
-        # Force streaming
-        extra_params["stream"] = True
-
-        timeout = kwargs.pop("timeout", self.timeout)
-
-        try:
-            stream = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-                timeout=timeout,
-                **extra_params,
-            )
-            
-            for chunk in stream:
-                if chunk.choices and len(chunk.choices) > 0:
-                    delta = chunk.choices[0].delta
-                    if delta and delta.content:
-                        yield delta.content
-        except Exception as e:
-            logger.error(f"Streaming request failed: {str(e)}")
-            raise e
-    
-    @with_retry(LLM_RETRY_CONFIG)
-    def stream_invoke_to_string(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
-        """Streaming calls to LLM and safely concatenating into complete strings (avoiding UTF-8 multibyte character truncation)
-        
-        Args:
-            system_prompt: system prompt word
-            user_prompt: user prompt word
-            **kwargs: additional parameters (temperature, top_p, etc.)
-            
-        Returns:
-            Complete response string"""
-        # Collect all blocks in bytes
-        byte_chunks = []
-        for chunk in self.stream_invoke(system_prompt, user_prompt, **kwargs):
-            byte_chunks.append(chunk.encode('utf-8'))
-        
-        # Concatenate all bytes and decode them in one go
-        if byte_chunks:
-            return b''.join(byte_chunks).decode('utf-8', errors='replace')
-        return ""
-
-    @staticmethod
-    def validate_response(response: Optional[str]) -> str:
-        if response is None:
-            return ""
-        return response.strip()
-
-    def get_model_info(self) -> Dict[str, Any]:
-        return {
-            "provider": self.provider,
-            "model": self.model_name,
-            "api_base": self.base_url or "default",
-        }
+        super().__init__(api_key, model_name, base_url)
@@ -33,8 +33,8 @@ output_schema_first_search = {
         "search_query": {"type": "string"},
         "search_tool": {"type": "string"},
         "reasoning": {"type": "string"},
-        "start_date": {"type": "string", "description": "start date, format YYYY-MM-DD, search_topic_by_date and search_topic_on_platform tools may require"},
-        "end_date": {"type": "string", "description": "end date, format YYYY-MM-DD, search_topic_by_date and search_topic_on_platform tools may require"},
+        "start_date": {"type": "string", "description": "start date, format YYYY-MM-DD, search_topic_by_date and search_topic_on_platform tools may require, optional for search_topic_overview"},
+        "end_date": {"type": "string", "description": "end date, format YYYY-MM-DD, search_topic_by_date and search_topic_on_platform tools may require, optional for search_topic_overview"},
         "platform": {"type": "string", "description": "Platform name, required by search_topic_on_platform tool, optional values: bilibili, weibo, douyin, kuaishou, xhs, zhihu, tieba"},
         "time_period": {"type": "string", "description": "Time period, search_hot_content tool is optional, optional values: 24h, week, year"},
         "enable_sentiment": {"type": "boolean", "description": "Whether to enable automatic sentiment analysis, the default is true, applicable to all search tools except analyze_sentiment"},
@@ -82,8 +82,8 @@ output_schema_reflection = {
         "search_query": {"type": "string"},
         "search_tool": {"type": "string"},
         "reasoning": {"type": "string"},
-        "start_date": {"type": "string", "description": "start date, format YYYY-MM-DD, search_topic_by_date and search_topic_on_platform tools may require"},
-        "end_date": {"type": "string", "description": "end date, format YYYY-MM-DD, search_topic_by_date and search_topic_on_platform tools may require"},
+        "start_date": {"type": "string", "description": "start date, format YYYY-MM-DD, search_topic_by_date and search_topic_on_platform tools may require, optional for search_topic_overview"},
+        "end_date": {"type": "string", "description": "end date, format YYYY-MM-DD, search_topic_by_date and search_topic_on_platform tools may require, optional for search_topic_overview"},
         "platform": {"type": "string", "description": "Platform name, required by search_topic_on_platform tool, optional values: bilibili, weibo, douyin, kuaishou, xhs, zhihu, tieba"},
         "time_period": {"type": "string", "description": "Time period, search_hot_content tool is optional, optional values: 24h, week, year"},
         "enable_sentiment": {"type": "boolean", "description": "Whether to enable automatic sentiment analysis, the default is true, applicable to all search tools except analyze_sentiment"},
@@ -169,7 +169,7 @@ SYSTEM_PROMPT_FIRST_SEARCH = f"""You are a professional public opinion analyst.
 {json.dumps(input_schema_first_search, indent=2, ensure_ascii=False)}
 </INPUT JSON SCHEMA>
 
-You can use the following 6 professional local public opinion database query tools to mine real public opinion and public opinions:
+You can use the following 7 professional local public opinion database query tools to mine real public opinion and public opinions:
 
 1. **search_hot_content** - Tool for finding hot content
    - Applicable to: mining the most popular public opinion events and topics currently
@@ -198,7 +198,12 @@ You can use the following 6 professional local public opinion database query too
    - Special requirements: platform parameters need to be provided, optional start_date and end_date
    - Parameters: platform (required), start_date, end_date (optional), limit (quantity limit), enable_sentiment (whether to enable sentiment analysis, default True)
 
-6. **analyze_sentiment** - Multilingual sentiment analysis tool
+6. **search_topic_overview** - Topic overview tool
+   - Suitable for: quickly sizing a topic: how much it is discussed on each platform, its engagement, daily trend and hottest posts
+   - Features: Reads precomputed daily statistics instead of scanning all posts, returns a summary line followed by the hottest posts, and automatically performs sentiment analysis
+   - Parameters: start_date, end_date (optional, format 'YYYY-MM-DD'), enable_sentiment (whether to enable sentiment analysis, default True)
+
+7. **analyze_sentiment** - Multilingual sentiment analysis tool
    - Suitable for: specialized emotional tendency analysis of text content
    - Features: Supports sentiment analysis in 22 languages including Chinese, English, Spanish, Arabic, Japanese, and Korean, and outputs 5-level sentiment levels (very negative, negative, neutral, positive, and very positive)
    - Parameter: texts (text or text list), query can also be used as a single text input
@@ -335,14 +340,15 @@ SYSTEM_PROMPT_REFLECTION = f"""You are a senior public opinion analyst. You are
 {json.dumps(input_schema_reflection, indent=2, ensure_ascii=False)}
 </INPUT JSON SCHEMA>
 
-You can use the following 6 professional local public opinion database query tools to dig deeper into public opinion:
+You can use the following 7 professional local public opinion database query tools to dig deeper into public opinion:
 
 1. **search_hot_content** - Tool for finding hot content (automatic sentiment analysis)
 2. **search_topic_globally** - Global topic search tool (automatic sentiment analysis)
 3. **search_topic_by_date** - Search topic tool by date (automatic sentiment analysis)
 4. **get_comments_for_topic** - Get topic comments tool (automatic sentiment analysis)
 5. **search_topic_on_platform** - Platform-oriented search tool (automatic sentiment analysis)
-6. **analyze_sentiment** - Multilingual sentiment analysis tool (specialized sentiment analysis)
+6. **search_topic_overview** - Topic overview tool: per-platform volume, engagement, daily trend and hottest posts (automatic sentiment analysis)
+7. **analyze_sentiment** - Multilingual sentiment analysis tool (specialized sentiment analysis)
 
 **Core goal of reflection: Make the report more humane and real**
 
@@ -1,7 +1,6 @@
 """Keyword optimization middleware
 Use Qwen AI to optimize the search terms generated by the Agent into keywords more suitable for public opinion database queries"""
 
-from openai import OpenAI
 import json
 import sys
 import os
@@ -21,6 +20,7 @@ if utils_dir not in sys.path:
     sys.path.append(utils_dir)
 
 from retry_helper import with_graceful_retry, SEARCH_API_RETRY_CONFIG
+from utils.llm_client import PooledLLMClient
 
 @dataclass
 class KeywordOptimizationResponse:
@@ -48,11 +48,9 @@ class KeywordOptimizer:
 
         self.base_url = base_url or settings.KEYWORD_OPTIMIZER_BASE_URL
 
-        self.client = OpenAI(
-            api_key=self.api_key,
-            base_url=self.base_url
-        )
         self.model = model_name or settings.KEYWORD_OPTIMIZER_MODEL_NAME
+        # Requests share the process-wide LLM connection pool and response cache
+        self.llm_client = PooledLLMClient(self.api_key, self.model, self.base_url, add_time_prefix=False)
     
     def optimize_keywords(self, original_query: str, context: str = "") -> KeywordOptimizationResponse:
         """Optimize search keywords
@@ -180,17 +178,8 @@ Input:"武汉大学舆情管理 未来展望 发展趋势"Output:
     def _call_qwen_api(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
         """Call Qwen API"""
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.7,
-            )
-
-            if response.choices:
-                content = response.choices[0].message.content
+            content = self.llm_client.invoke(system_prompt, user_prompt, temperature=0.7)
+            if content:
                 return {"success": True, "content": content}
             else:
                 return {"success": False, "error": "API return format exception"}
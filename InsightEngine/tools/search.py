@@ -19,15 +19,20 @@ Main tools:
 - search_topic_globally: Search the entire database globally for all content and comments related to a specific topic.
 - search_topic_by_date: Search for content related to a specific topic within a specified historical date range.
 - get_comments_for_topic: specifically extracts public comment data on a specific topic.
-- search_topic_on_platform: Search for a specific topic on a specified single social media platform."""
+- search_topic_on_platform: Search for a specific topic on a specified single social media platform.
+- search_topic_overview: Per-platform volume, engagement, daily trend and hottest posts of a topic from precomputed daily rollups."""
 
 import os
 import json
+import time
+import inspect
+import functools
 from loguru import logger
 import asyncio
-from typing import List, Dict, Any, Optional, Literal
+from typing import List, Dict, Any, Optional, Literal, Tuple, Callable, Union, AsyncIterator, Iterator
 from dataclasses import dataclass, field
-from ..utils.db import fetch_all
+from ..utils.db import fetch_all, stream_all, run_sync, iter_sync
+from ..utils.query_cache import get_query_cache, make_cache_key
 from datetime import datetime, timedelta, date
 from InsightEngine.utils.config import settings
 
@@ -55,9 +60,56 @@ class DBResponse:
     results: List[QueryResult] = field(default_factory=list)
     results_count: int = 0
     error_message: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 # --- 2. Core client and dedicated toolset ---
 
+# Tables read by each tool, their data versions validate cached results
+HOT_CONTENT_TABLES = ['bilibili_video', 'douyin_aweme', 'weibo_note', 'xhs_note', 'kuaishou_video', 'zhihu_content']
+COMMENT_TABLES = ['bilibili_video_comment', 'douyin_aweme_comment', 'kuaishou_video_comment', 'weibo_note_comment', 'xhs_note_comment', 'zhihu_comment', 'tieba_comment']
+TOPIC_CONTENT_TABLES = HOT_CONTENT_TABLES + ['tieba_note', 'daily_news']
+PLATFORM_TABLES = {
+    'bilibili': ['bilibili_video', 'bilibili_video_comment'], 'douyin': ['douyin_aweme', 'douyin_aweme_comment'],
+    'kuaishou': ['kuaishou_video', 'kuaishou_video_comment'], 'weibo': ['weibo_note', 'weibo_note_comment'],
+    'xhs': ['xhs_note', 'xhs_note_comment'], 'zhihu': ['zhihu_content', 'zhihu_comment'], 'tieba': ['tieba_note', 'tieba_comment'],
+}
+
+
+def _cached_tool(tables: Union[List[str], Callable[[Dict[str, Any]], List[str]]]):
+    """Serve an async tool from the result cache while the tables it reads are unchanged
+
+    Args:
+        tables: tables read by the tool, or a function of the bound tool parameters returning them"""
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if not settings.DB_QUERY_CACHE_ENABLED:
+                return await func(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = {name: value for name, value in bound.arguments.items() if name != 'self'}
+            tool_tables = tables(params) if callable(tables) else tables
+
+            versions = await self._atable_versions(tool_tables)
+            if not any(version is not None for version in versions.values()):
+                # Versions unavailable (database unreachable or unknown tables): do not risk caching an empty result
+                return await func(self, *args, **kwargs)
+
+            cache = get_query_cache()
+            key = make_cache_key(f"{settings.DB_DIALECT}:{settings.DB_NAME}", func.__name__, params)
+            response = cache.get(key, versions)
+            if response is not None:
+                logger.info(f"--- TOOL: {response.tool_name} served from cache (params: {response.parameters}) ---")
+                return response
+            response = await func(self, *args, **kwargs)
+            if not response.error_message:
+                cache.set(key, versions, response)
+            return response
+        return wrapper
+    return decorator
+
 class MediaCrawlerDB:
     """A client that includes a variety of dedicated public opinion database query tools"""
     # Weight definition
@@ -67,29 +119,69 @@ class MediaCrawlerDB:
     W_VIEW = 0.1
     W_DANMAKU = 0.5
 
-    def __init__(self):
-        """Initialize the client."""
-        pass
-        
-    def _execute_query(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
-        try:
-            # Get or create event loop
+    def __init__(self, max_concurrency: Optional[int] = None, load_schema: bool = True):
+        """Initialize the client.
+
+        Args:
+            max_concurrency (Optional[int]): Maximum number of queries one tool call runs at the same time,
+                defaults to settings.DB_QUERY_CONCURRENCY.
+            load_schema (bool): Take the schema snapshot now instead of on the first tool call."""
+        self.max_concurrency = max_concurrency or settings.DB_QUERY_CONCURRENCY
+        if load_schema and MediaCrawlerDB._schema_snapshot is None:
             try:
-                loop = asyncio.get_event_loop()
-                if loop.is_closed():
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
+                run_sync(self._aget_schema())
             except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            # Run the coroutine directly
-            return loop.run_until_complete(fetch_all(query, params))
-        
+                pass  # Created on the database loop itself, the snapshot is taken on first use
+
+    async def _aexecute_query(self, query: str, params: Any = None) -> List[Dict[str, Any]]:
+        try:
+            return await fetch_all(query, params)
         except Exception as e:
             logger.exception(f"An error occurred during database query: {e}")
             return []
 
+    async def _aexecute_queries(self, queries: List[Tuple[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Run (query, params) pairs concurrently over the connection pool, results keep the input order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(query: str, params: Any) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._aexecute_query(query, params)
+
+        return list(await asyncio.gather(*(run(query, params) for query, params in queries)))
+
+    # Auto-increment primary key of the crawled tables: MAX over it is a single index lookup, while
+    # add_ts/last_modify_ts have no index and MAX over them scans the table
+    VERSION_COLUMN = 'id'
+
+    _table_versions: Dict[str, Tuple[float, Any]] = {}
+    async def _atable_versions(self, tables: List[str]) -> Dict[str, Any]:
+        """Data version of each table: the latest primary key, rechecked every DB_QUERY_CACHE_VERSION_INTERVAL seconds
+
+        New rows change the version; rows updated in place (recrawled engagement counts) are picked up
+        when the cached result reaches DB_QUERY_CACHE_TTL.
+
+        Returns:
+            table -> version, None for tables that do not exist or have no id column"""
+        now = time.monotonic()
+        stale = [table for table in tables
+                 if now - MediaCrawlerDB._table_versions.get(table, (float('-inf'), None))[0] > settings.DB_QUERY_CACHE_VERSION_INTERVAL]
+        if stale:
+            table_columns = await asyncio.gather(*(self._aget_table_columns(table) for table in stale))
+            queries, queried = [], []
+            for table, columns in zip(stale, table_columns):
+                if self.VERSION_COLUMN not in columns:
+                    MediaCrawlerDB._table_versions[table] = (now, None)
+                    continue
+                queries.append((f"SELECT MAX({self._wrap_query_field_with_dialect(self.VERSION_COLUMN)}) AS v FROM {self._wrap_query_field_with_dialect(table)}", None))
+                queried.append(table)
+            for table, rows in zip(queried, await self._aexecute_queries(queries)):
+                MediaCrawlerDB._table_versions[table] = (now, rows[0]['v'] if rows else None)
+        return {table: MediaCrawlerDB._table_versions[table][1] for table in tables}
+
+    def _execute_query(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
+        return run_sync(self._aexecute_query(query, params))
+
     @staticmethod
     def _to_datetime(ts: Any) -> Optional[datetime]:
         if not ts: return None
@@ -103,13 +195,72 @@ class MediaCrawlerDB:
                 return datetime.fromisoformat(ts.split('+')[0].strip())
         except (ValueError, TypeError): return None
 
-    _table_columns_cache = {}
+    # Columns read by _row_to_query_result, _extract_engagement and the platform time filter; topic queries
+    # select the ones a table has instead of SELECT *, which would also ship avatars, image lists and the like
+    RESULT_COLUMNS = (
+        'title', 'content', 'desc', 'content_text',
+        'create_time', 'time', 'created_time', 'create_date_time', 'publish_time', 'crawl_date',
+        'nickname', 'user_nickname', 'user_name',
+        'video_url', 'note_url', 'content_url', 'url', 'aweme_url', 'source_keyword',
+        'liked_count', 'like_count', 'voteup_count', 'comment_like_count',
+        'video_comment', 'comments_count', 'comment_count', 'total_replay_num', 'sub_comment_count',
+        'video_share_count', 'shared_count', 'share_count', 'total_forwards',
+        'video_play_count', 'viewd_count', 'video_favorite_count', 'collected_count', 'video_coin_count', 'video_danmaku',
+    )
+
+    _schema_snapshot: Optional[Dict[str, List[str]]] = None
+    async def _aget_schema(self) -> Dict[str, List[str]]:
+        """Columns of every table in the current schema, read once from information_schema (MySQL and PostgreSQL)"""
+        if MediaCrawlerDB._schema_snapshot is None:
+            schema_filter = "current_schema()" if settings.DB_DIALECT == 'postgresql' else "DATABASE()"
+            rows = await self._aexecute_query(
+                "SELECT table_name AS table_name, column_name AS column_name FROM information_schema.columns "
+                f"WHERE table_schema = {schema_filter} ORDER BY table_name, ordinal_position"
+            )
+            schema: Dict[str, List[str]] = {}
+            for row in rows:
+                schema.setdefault(row['table_name'], []).append(row['column_name'])
+            if not schema:
+                # Database unreachable: keep the snapshot unset so the next tool call retries
+                return schema
+            MediaCrawlerDB._schema_snapshot = schema
+            logger.info(f"Schema snapshot taken: {len(schema)} tables")
+        return MediaCrawlerDB._schema_snapshot
+
+    SCHEMA_RECHECK_INTERVAL = 60  # Minimum seconds between snapshots retaken because an expected table is missing
+
+    _schema_checked_at: float = float('-inf')
+    async def _ahas_table(self, table_name: str) -> bool:
+        """Whether a table exists; a missing table retakes the snapshot at most every SCHEMA_RECHECK_INTERVAL seconds
+
+        Tables such as topic_daily_rollup are created by MindSpider jobs after InsightEngine has started."""
+        if table_name in await self._aget_schema():
+            return True
+        now = time.monotonic()
+        if now - MediaCrawlerDB._schema_checked_at < self.SCHEMA_RECHECK_INTERVAL:
+            return False
+        MediaCrawlerDB._schema_checked_at = now
+        MediaCrawlerDB._schema_snapshot = None
+        MediaCrawlerDB._fulltext_tables_cache = None
+        MediaCrawlerDB._table_versions.pop(table_name, None)
+        return table_name in await self._aget_schema()
+
+    def refresh_schema(self) -> Dict[str, List[str]]:
+        """Take a new schema snapshot, e.g. after running the MindSpider schema migrations"""
+        MediaCrawlerDB._schema_snapshot = None
+        MediaCrawlerDB._fulltext_tables_cache = None
+        return run_sync(self._aget_schema())
+
+    async def _aget_table_columns(self, table_name: str) -> List[str]:
+        return (await self._aget_schema()).get(table_name, [])
+
     def _get_table_columns(self, table_name: str) -> List[str]:
-        if table_name in self._table_columns_cache: return self._table_columns_cache[table_name]
-        results = self._execute_query(f"SHOW COLUMNS FROM `{table_name}`")
-        columns = [row['Field'] for row in results] if results else []
-        self._table_columns_cache[table_name] = columns
-        return columns
+        return run_sync(self._aget_table_columns(table_name))
+
+    def _projection(self, table: str, schema: Dict[str, List[str]]) -> str:
+        """Select list of a topic query: the result columns the table has, * when the table is not in the snapshot"""
+        columns = [column for column in schema.get(table, []) if column in self.RESULT_COLUMNS]
+        return ", ".join(self._wrap_query_field_with_dialect(column) for column in columns) if columns else "*"
 
     def _extract_engagement(self, row: Dict[str, Any]) -> Dict[str, int]:
         """Extract and unify interaction metrics from rows of data"""
@@ -136,6 +287,15 @@ class MediaCrawlerDB:
 
         Returns:
             DBResponse: Contains a content list sorted by overall popularity."""
+        return run_sync(self.asearch_hot_content(time_period, limit))
+
+    @_cached_tool(HOT_CONTENT_TABLES)
+    async def asearch_hot_content(
+        self,
+        time_period: Literal['24h', 'week', 'year'] = 'week',
+        limit: int = 50
+    ) -> DBResponse:
+        """Asynchronous version of search_hot_content."""
         params_for_log = {'time_period': time_period, 'limit': limit}
         logger.info(f"--- TOOL: Find hot content (params: {params_for_log}) ---")
         
@@ -152,13 +312,15 @@ class MediaCrawlerDB:
             'zhihu_content':  f"(COALESCE(CAST(voteup_count AS UNSIGNED), 0) * {self.W_LIKE} + COALESCE(CAST(comment_count AS UNSIGNED), 0) * {self.W_COMMENT})",
         }
 
-        all_queries, params = [], []
-        for table, formula in hotness_formulas.items():
+        precomputed_tables = await self._aget_hotness_tables()
+        all_queries, params = [], {'limit': limit}
+        for idx, (table, formula) in enumerate(hotness_formulas.items()):
+            pname = f"start_{idx}"
             time_filter_sql, time_filter_param = "", None
-            if table == 'weibo_note': time_filter_sql, time_filter_param = "`create_date_time` >= %s", start_time.strftime('%Y-%m-%d %H:%M:%S')
-            elif table in ['kuaishou_video', 'xhs_note', 'douyin_aweme']: time_col = 'time' if table == 'xhs_note' else 'create_time'; time_filter_sql, time_filter_param = f"`{time_col}` >= %s", str(int(start_time.timestamp() * 1000))
-            elif table == 'zhihu_content': time_filter_sql, time_filter_param = "CAST(`created_time` AS UNSIGNED) >= %s", str(int(start_time.timestamp()))
-            else: time_filter_sql, time_filter_param = "`create_time` >= %s", str(int(start_time.timestamp()))
+            if table == 'weibo_note': time_filter_sql, time_filter_param = f"`create_date_time` >= :{pname}", start_time.strftime('%Y-%m-%d %H:%M:%S')
+            elif table in ['kuaishou_video', 'xhs_note', 'douyin_aweme']: time_col = 'time' if table == 'xhs_note' else 'create_time'; time_filter_sql, time_filter_param = f"`{time_col}` >= :{pname}", str(int(start_time.timestamp() * 1000))
+            elif table == 'zhihu_content': time_filter_sql, time_filter_param = f"CAST(`created_time` AS UNSIGNED) >= :{pname}", str(int(start_time.timestamp()))
+            else: time_filter_sql, time_filter_param = f"`create_time` >= :{pname}", str(int(start_time.timestamp()))
 
             content_type = 'note' if table in ['weibo_note', 'xhs_note'] else 'content' if table == 'zhihu_content' else 'video'
             query_template = "SELECT '{platform}' as p, '{type}' as t, {title} as title, {author} as author, {url} as url, {ts} as ts, {formula} as hotness_score, source_keyword, '{tbl}' as tbl FROM `{tbl}` WHERE {time_filter}"
@@ -169,21 +331,125 @@ class MediaCrawlerDB:
             elif table == 'zhihu_content': field_subs.update({'author': 'user_nickname', 'url': 'content_url', 'ts': 'created_time'})
             elif table == 'douyin_aweme': field_subs.update({'url': 'aweme_url'})
 
-            all_queries.append(query_template.format(**field_subs))
-            params.append(time_filter_param)
+            if table in precomputed_tables:
+                # Maintained at write time and indexed with the publish time: index range scan plus a per-table top-K.
+                # Rows written before the column existed and not yet backfilled are NULL and are scored on the fly
+                field_subs['formula'] = f"COALESCE(hotness_score, {formula})"
+                query = query_template.format(**field_subs) + " ORDER BY hotness_score DESC LIMIT :limit"
+            else:
+                query = query_template.format(**field_subs)
+            all_queries.append(query)
+            params[pname] = time_filter_param
         
-        final_query = f"({' ) UNION ALL ( '.join(all_queries)}) ORDER BY hotness_score DESC LIMIT %s"
-        raw_results = self._execute_query(final_query, tuple(params) + (limit,))
+        final_query = f"({' ) UNION ALL ( '.join(all_queries)}) ORDER BY hotness_score DESC LIMIT :limit"
+        raw_results = await self._aexecute_query(final_query, params)
 
-        formatted_results = [QueryResult(platform=r['p'], content_type=r['t'], title_or_content=r['title'], author_nickname=r.get('author'), url=r['url'], publish_time=self._to_datetime(r['ts']), engagement=self._extract_engagement(r), hotness_score=r.get('hotness_score', 0.0), source_keyword=r.get('source_keyword'), source_table=r['tbl']) for r in raw_results]
+        formatted_results = [QueryResult(platform=r['p'], content_type=r['t'], title_or_content=r['title'], author_nickname=r.get('author'), url=r['url'], publish_time=self._to_datetime(r['ts']), engagement=self._extract_engagement(r), hotness_score=float(r.get('hotness_score') or 0.0), source_keyword=r.get('source_keyword'), source_table=r['tbl']) for r in raw_results]
         return DBResponse("search_hot_content", params_for_log, results=formatted_results, results_count=len(formatted_results))    
 
+    async def _aget_hotness_tables(self) -> List[str]:
+        """Tables with the precomputed hotness_score column (MindSpider/schema/engagement_columns.py)"""
+        return [table for table, columns in (await self._aget_schema()).items() if 'hotness_score' in columns]
+
     def _wrap_query_field_with_dialect(self, field: str) -> str:
         """Wrapping SQL queries according to database dialect"""
         if settings.DB_DIALECT == 'postgresql':
             return f'"{field}"'
         return f'`{field}`'
 
+    # Full-text objects created by MindSpider/schema/fulltext_index.py
+    FULLTEXT_PG_CONFIG = "mindspider_fts"
+    FULLTEXT_PG_COLUMN = "search_vector"
+    FULLTEXT_MIN_TERM_LENGTH = 2  # MySQL ngram_token_size, shorter terms cannot use the index
+
+    _fulltext_tables_cache: Optional[Dict[str, List[str]]] = None
+    async def _aget_fulltext_tables(self) -> Dict[str, List[str]]:
+        """Detect the tables that have a full-text index (table -> indexed columns, empty on PostgreSQL)"""
+        if not settings.DB_FULLTEXT_SEARCH:
+            return {}
+        if MediaCrawlerDB._fulltext_tables_cache is not None:
+            return MediaCrawlerDB._fulltext_tables_cache
+        fulltext_tables: Dict[str, List[str]] = {}
+        if settings.DB_DIALECT == 'postgresql':
+            # Only a zhparser configuration segments Chinese; with 'simple' a tsquery would miss substring matches LIKE finds
+            rows = await self._aexecute_query(
+                "SELECT p.prsname AS parser FROM pg_ts_config c JOIN pg_ts_parser p ON p.oid = c.cfgparser WHERE c.cfgname = :name",
+                {"name": self.FULLTEXT_PG_CONFIG}
+            )
+            if rows and rows[0]['parser'] == 'zhparser':
+                for table, columns in (await self._aget_schema()).items():
+                    if self.FULLTEXT_PG_COLUMN in columns:
+                        fulltext_tables[table] = []
+            elif any(self.FULLTEXT_PG_COLUMN in columns for columns in (await self._aget_schema()).values()):
+                logger.warning(f"{self.FULLTEXT_PG_CONFIG} is not built on zhparser, topic search keeps using LIKE")
+        else:
+            rows = await self._aexecute_query(
+                "SELECT TABLE_NAME AS table_name, COLUMN_NAME AS column_name FROM information_schema.STATISTICS "
+                "WHERE TABLE_SCHEMA = DATABASE() AND INDEX_TYPE = 'FULLTEXT' AND INDEX_NAME = CONCAT('ft_', TABLE_NAME) "
+                "ORDER BY TABLE_NAME, SEQ_IN_INDEX"
+            )
+            for row in rows:
+                fulltext_tables.setdefault(row['table_name'], []).append(row['column_name'])
+        if fulltext_tables:
+            logger.info(f"Full-text search enabled for {len(fulltext_tables)} tables")
+        MediaCrawlerDB._fulltext_tables_cache = fulltext_tables
+        return fulltext_tables
+
+    def _topic_condition(self, table: str, fields: List[str], topic: Union[str, List[str]], fulltext_tables: Dict[str, List[str]], prefix: str = "") -> Tuple[str, Dict[str, Any], Optional[str]]:
+        """Build the topic match condition of one table
+
+        Uses the table's full-text index when it has one covering the searched fields, otherwise a LIKE OR-chain.
+        A list of topics matches rows containing any of them, so several keywords cost a single scan.
+
+        Returns:
+            (where clause, bind parameters, relevance expression or None)"""
+        terms = [term.strip() for term in ([topic] if isinstance(topic, str) else topic) if term and term.strip()] or ['']
+        if table in fulltext_tables and all(len(term) >= self.FULLTEXT_MIN_TERM_LENGTH for term in terms):
+            pname = f"{prefix}ft_query"
+            if settings.DB_DIALECT == 'postgresql':
+                column = self._wrap_query_field_with_dialect(self.FULLTEXT_PG_COLUMN)
+                tsquery = " || ".join(f"plainto_tsquery('{self.FULLTEXT_PG_CONFIG}', :{pname}_{idx})" for idx in range(len(terms)))
+                tsquery = f"({tsquery})" if len(terms) > 1 else tsquery
+                return f"{column} @@ {tsquery}", {f"{pname}_{idx}": term for idx, term in enumerate(terms)}, f"ts_rank({column}, {tsquery})"
+            if set(fulltext_tables[table]) == set(fields):
+                # A quoted phrase in boolean mode matches the consecutive ngrams of a term, phrases without operators are OR'd
+                columns = ", ".join(self._wrap_query_field_with_dialect(field) for field in fulltext_tables[table])
+                match = f"MATCH({columns}) AGAINST (:{pname} IN BOOLEAN MODE)"
+                return match, {pname: " ".join('"' + term.replace('"', ' ') + '"' for term in terms)}, match
+
+        param_dict = {}
+        where_clauses = []
+        for idx, (field, term) in enumerate((field, term) for field in fields for term in terms):
+            pname = f"{prefix}term_{idx}"
+            where_clauses.append(f'{self._wrap_query_field_with_dialect(field)} LIKE :{pname}')
+            param_dict[pname] = f"%{term}%"
+        return " OR ".join(where_clauses), param_dict, None
+
+    def _build_topic_query(self, table: str, fields: List[str], topic: Union[str, List[str]], limit: int, fulltext_tables: Dict[str, List[str]], schema: Dict[str, List[str]]) -> Tuple[str, Dict[str, Any]]:
+        """Build the per-table query used by the topic search tools, ranked by relevance when full-text search is used"""
+        where_clause, param_dict, score = self._topic_condition(table, fields, topic, fulltext_tables)
+        param_dict['limit'] = limit
+        projection = self._projection(table, schema)
+        select = f"{projection}, {score} AS ft_score" if score else projection
+        order = "ft_score DESC, id DESC" if score else "id DESC"
+        query = f'SELECT {select} FROM {self._wrap_query_field_with_dialect(table)} WHERE {where_clause} ORDER BY {order} LIMIT :limit'
+        return query, param_dict
+
+    def _row_to_query_result(self, row: Dict[str, Any], table: str, content_type: str) -> QueryResult:
+        """Convert a raw row of a topic search into a QueryResult"""
+        content = (row.get('title') or row.get('content') or row.get('desc') or row.get('content_text', ''))
+        time_key = row.get('create_time') or row.get('time') or row.get('created_time') or row.get('publish_time') or row.get('crawl_date')
+        return QueryResult(
+            platform=table.split('_')[0], content_type=content_type,
+            title_or_content=content if content else '',
+            author_nickname=row.get('nickname') or row.get('user_nickname') or row.get('user_name'),
+            url=row.get('video_url') or row.get('note_url') or row.get('content_url') or row.get('url') or row.get('aweme_url'),
+            publish_time=self._to_datetime(time_key),
+            engagement=self._extract_engagement(row),
+            source_keyword=row.get('source_keyword'),
+            source_table=table
+        )
+
     def search_topic_globally(self, topic: str, limit_per_table: int = 100) -> DBResponse:
         """[Tool] Global topic search: Comprehensive search for specified topics in the database (content, comments, tags, source keywords).
 
@@ -193,36 +459,23 @@ class MediaCrawlerDB:
 
         Returns:
             DBResponse: An aggregated list containing all matching results."""
+        return run_sync(self.asearch_topic_globally(topic, limit_per_table))
+
+    @_cached_tool(TOPIC_CONTENT_TABLES + COMMENT_TABLES)
+    async def asearch_topic_globally(self, topic: Union[str, List[str]], limit_per_table: int = 100) -> DBResponse:
+        """Asynchronous version of search_topic_globally, the per-table queries run concurrently.
+        A list of topics matches any of them in one query per table."""
         params_for_log = {'topic': topic, 'limit_per_table': limit_per_table}
         logger.info(f"--- TOOL: Global topic search (params: {params_for_log}) ---")
         
-        search_term, all_results = f"%{topic}%", []
+        all_results = []
         search_configs = { 'bilibili_video': {'fields': ['title', 'desc', 'source_keyword'], 'type': 'video'}, 'bilibili_video_comment': {'fields': ['content'], 'type': 'comment'}, 'douyin_aweme': {'fields': ['title', 'desc', 'source_keyword'], 'type': 'video'}, 'douyin_aweme_comment': {'fields': ['content'], 'type': 'comment'}, 'kuaishou_video': {'fields': ['title', 'desc', 'source_keyword'], 'type': 'video'}, 'kuaishou_video_comment': {'fields': ['content'], 'type': 'comment'}, 'weibo_note': {'fields': ['content', 'source_keyword'], 'type': 'note'}, 'weibo_note_comment': {'fields': ['content'], 'type': 'comment'}, 'xhs_note': {'fields': ['title', 'desc', 'tag_list', 'source_keyword'], 'type': 'note'}, 'xhs_note_comment': {'fields': ['content'], 'type': 'comment'}, 'zhihu_content': {'fields': ['title', 'desc', 'content_text', 'source_keyword'], 'type': 'content'}, 'zhihu_comment': {'fields': ['content'], 'type': 'comment'}, 'tieba_note': {'fields': ['title', 'desc', 'source_keyword'], 'type': 'note'}, 'tieba_comment': {'fields': ['content'], 'type': 'comment'}, 'daily_news': {'fields': ['title'], 'type': 'news'}, }
         
-        for table, config in search_configs.items():
-            param_dict = {}
-            where_clauses = []
-            for idx, field in enumerate(config['fields']):
-                pname = f"term_{idx}"
-                where_clauses.append(f'{self._wrap_query_field_with_dialect(field)} LIKE :{pname}')
-                param_dict[pname] = search_term
-            param_dict['limit'] = limit_per_table
-            where_clause = " OR ".join(where_clauses)
-            query = f'SELECT * FROM {self._wrap_query_field_with_dialect(table)} WHERE {where_clause} ORDER BY id DESC LIMIT :limit'
-            raw_results = self._execute_query(query, param_dict)
-            for row in raw_results:
-                content = (row.get('title') or row.get('content') or row.get('desc') or row.get('content_text', ''))
-                time_key = row.get('create_time') or row.get('time') or row.get('created_time') or row.get('publish_time') or row.get('crawl_date')
-                all_results.append(QueryResult(
-                    platform=table.split('_')[0], content_type=config['type'],
-                    title_or_content=content if content else '',
-                    author_nickname=row.get('nickname') or row.get('user_nickname') or row.get('user_name'),
-                    url=row.get('video_url') or row.get('note_url') or row.get('content_url') or row.get('url') or row.get('aweme_url'),
-                    publish_time=self._to_datetime(time_key),
-                    engagement=self._extract_engagement(row),
-                    source_keyword=row.get('source_keyword'),
-                    source_table=table
-                ))
+        fulltext_tables, schema = await asyncio.gather(self._aget_fulltext_tables(), self._aget_schema())
+        queries = [self._build_topic_query(table, config['fields'], topic, limit_per_table, fulltext_tables, schema) for table, config in search_configs.items()]
+        results_per_table = await self._aexecute_queries(queries)
+        for (table, config), raw_results in zip(search_configs.items(), results_per_table):
+            all_results.extend(self._row_to_query_result(row, table, config['type']) for row in raw_results)
         return DBResponse("search_topic_globally", params_for_log, results=all_results, results_count=len(all_results))
 
     def search_topic_by_date(self, topic: str, start_date: str, end_date: str, limit_per_table: int = 100) -> DBResponse:
@@ -236,6 +489,12 @@ class MediaCrawlerDB:
 
         Returns:
             DBResponse: Contains an aggregated list of results found within the specified date range."""
+        return run_sync(self.asearch_topic_by_date(topic, start_date, end_date, limit_per_table))
+
+    @_cached_tool(TOPIC_CONTENT_TABLES)
+    async def asearch_topic_by_date(self, topic: Union[str, List[str]], start_date: str, end_date: str, limit_per_table: int = 100) -> DBResponse:
+        """Asynchronous version of search_topic_by_date, the per-table queries run concurrently.
+        A list of topics matches any of them in one query per table."""
         params_for_log = {'topic': topic, 'start_date': start_date, 'end_date': end_date, 'limit_per_table': limit_per_table}
         logger.info(f"--- TOOL: Search topics by date (params: {params_for_log}) ---")
         
@@ -244,7 +503,7 @@ class MediaCrawlerDB:
         except ValueError:
             return DBResponse("search_topic_by_date", params_for_log, error_message="Date format error, please use 'YYYY-MM-DD' format.")
         
-        search_term, all_results = f"%{topic}%", []
+        all_results = []
         search_configs = {
             'bilibili_video': {'fields': ['title', 'desc', 'source_keyword'], 'type': 'video', 'time_col': 'create_time', 'time_type': 'sec'}, 'douyin_aweme': {'fields': ['title', 'desc', 'source_keyword'], 'type': 'video', 'time_col': 'create_time', 'time_type': 'ms'},
             'kuaishou_video': {'fields': ['title', 'desc', 'source_keyword'], 'type': 'video', 'time_col': 'create_time', 'time_type': 'ms'}, 'weibo_note': {'fields': ['content', 'source_keyword'], 'type': 'note', 'time_col': 'create_date_time', 'time_type': 'str'},
@@ -252,30 +511,11 @@ class MediaCrawlerDB:
             'tieba_note': {'fields': ['title', 'desc', 'source_keyword'], 'type': 'note', 'time_col': 'publish_time', 'time_type': 'str'}, 'daily_news': {'fields': ['title'], 'type': 'news', 'time_col': 'crawl_date', 'time_type': 'date_str'},
         }
 
-        for table, config in search_configs.items():
-            param_dict = {}
-            where_clauses = []
-            for idx, field in enumerate(config['fields']):
-                pname = f"term_{idx}"
-                where_clauses.append(f'{self._wrap_query_field_with_dialect(field)} LIKE :{pname}')
-                param_dict[pname] = search_term
-            param_dict['limit'] = limit_per_table
-            where_clause = ' OR '.join(where_clauses)
-            query = f'SELECT * FROM {self._wrap_query_field_with_dialect(table)} WHERE {where_clause} ORDER BY id DESC LIMIT :limit'
-            raw_results = self._execute_query(query, param_dict)
-            for row in raw_results:
-                content = (row.get('title') or row.get('content') or row.get('desc') or row.get('content_text', ''))
-                time_key = row.get('create_time') or row.get('time') or row.get('created_time') or row.get('publish_time') or row.get('crawl_date')
-                all_results.append(QueryResult(
-                    platform=table.split('_')[0], content_type=config['type'],
-                    title_or_content=content if content else '',
-                    author_nickname=row.get('nickname') or row.get('user_nickname') or row.get('user_name'),
-                    url=row.get('video_url') or row.get('note_url') or row.get('content_url') or row.get('url') or row.get('aweme_url'),
-                    publish_time=self._to_datetime(time_key),
-                    engagement=self._extract_engagement(row),
-                    source_keyword=row.get('source_keyword'),
-                    source_table=table
-                ))
+        fulltext_tables, schema = await asyncio.gather(self._aget_fulltext_tables(), self._aget_schema())
+        queries = [self._build_topic_query(table, config['fields'], topic, limit_per_table, fulltext_tables, schema) for table, config in search_configs.items()]
+        results_per_table = await self._aexecute_queries(queries)
+        for (table, config), raw_results in zip(search_configs.items(), results_per_table):
+            all_results.extend(self._row_to_query_result(row, table, config['type']) for row in raw_results)
         return DBResponse("search_topic_by_date", params_for_log, results=all_results, results_count=len(all_results))
         
     def get_comments_for_topic(self, topic: str, limit: int = 500) -> DBResponse:
@@ -287,32 +527,104 @@ class MediaCrawlerDB:
 
         Returns:
             DBResponse: Contains a list of matching comments."""
+        return run_sync(self.aget_comments_for_topic(topic, limit))
+
+    @_cached_tool(COMMENT_TABLES)
+    async def aget_comments_for_topic(self, topic: Union[str, List[str]], limit: int = 500) -> DBResponse:
+        """Asynchronous version of get_comments_for_topic, a list of topics matches any of them."""
         params_for_log = {'topic': topic, 'limit': limit}
         logger.info(f"--- TOOL: Get topic comments (params: {params_for_log}) ---")
         
-        search_term = f"%{topic}%"
-        comment_tables = ['bilibili_video_comment', 'douyin_aweme_comment', 'kuaishou_video_comment', 'weibo_note_comment', 'xhs_note_comment', 'zhihu_comment', 'tieba_comment']
-        
-        all_queries = []
-        for table in comment_tables:
-            cols = self._get_table_columns(table)
-            author_col = 'user_nickname' if 'user_nickname' in cols else 'nickname'
-            like_col = 'comment_like_count' if 'comment_like_count' in cols else 'like_count' if 'like_count' in cols else None
-            time_col = 'publish_time' if 'publish_time' in cols else 'create_date_time' if 'create_date_time' in cols else 'create_time'
-            like_select = f"`{like_col}` as likes" if like_col else "'0' as likes"
-            
-            query = (f"SELECT '{table.split('_')[0]}' as platform, `content`, `{author_col}` as author, "
-                     f"`{time_col}` as ts, {like_select}, '{table}' as source_table "
-                     f"FROM `{table}` WHERE `content` LIKE %s")
-            all_queries.append(query)
-
-        final_query = f"({' ) UNION ALL ( '.join(all_queries)}) ORDER BY ts DESC LIMIT %s"
-        params = (search_term,) * len(comment_tables) + (limit,)
-        raw_results = self._execute_query(final_query, params)
+        all_queries, params = [], {'limit': limit}
+        fulltext_tables = await self._aget_fulltext_tables()
+        table_columns = await asyncio.gather(*(self._aget_table_columns(table) for table in COMMENT_TABLES))
+        for idx, (table, cols) in enumerate(zip(COMMENT_TABLES, table_columns)):
+            select, _ = self._comment_select(table, cols)
+            topic_clause, topic_params, _ = self._topic_condition(table, ['content'], topic, fulltext_tables, prefix=f"t{idx}_")
+            params.update(topic_params)
+            all_queries.append(f"SELECT {select} FROM `{table}` WHERE {topic_clause}")
+
+        final_query = f"({' ) UNION ALL ( '.join(all_queries)}) ORDER BY ts DESC LIMIT :limit"
+        raw_results = await self._aexecute_query(final_query, params)
         
-        formatted = [QueryResult(platform=r['platform'], content_type='comment', title_or_content=r['content'], author_nickname=r['author'], publish_time=self._to_datetime(r['ts']), engagement={'likes': int(r['likes']) if str(r['likes']).isdigit() else 0}, source_table=r['source_table']) for r in raw_results]
+        formatted = [self._comment_row_to_query_result(r) for r in raw_results]
         return DBResponse("get_comments_for_topic", params_for_log, results=formatted, results_count=len(formatted))
 
+    @staticmethod
+    def _comment_select(table: str, cols: List[str]) -> Tuple[str, str]:
+        """Select list of a comment table normalized to platform/content/author/ts/likes/source_table, and its time column"""
+        author_col = 'user_nickname' if 'user_nickname' in cols else 'nickname'
+        like_col = 'comment_like_count' if 'comment_like_count' in cols else 'like_count' if 'like_count' in cols else None
+        time_col = 'publish_time' if 'publish_time' in cols else 'create_date_time' if 'create_date_time' in cols else 'create_time'
+        like_select = f"`{like_col}` as likes" if like_col else "'0' as likes"
+        select = (f"'{table.split('_')[0]}' as platform, `content`, `{author_col}` as author, "
+                  f"`{time_col}` as ts, {like_select}, '{table}' as source_table")
+        return select, time_col
+
+    def _comment_row_to_query_result(self, r: Dict[str, Any]) -> QueryResult:
+        return QueryResult(platform=r['platform'], content_type='comment', title_or_content=r['content'], author_nickname=r['author'], publish_time=self._to_datetime(r['ts']), engagement={'likes': int(r['likes']) if str(r['likes']).isdigit() else 0}, source_table=r['source_table'])
+
+    def stream_comments_for_topic(self, topic: Union[str, List[str]], max_rows: Optional[int] = None, chunk_size: Optional[int] = None, max_rows_per_table: Optional[int] = None) -> Iterator[List[QueryResult]]:
+        """Stream all comments on a topic in chunks, for consumers that process thousands of rows (clustering, sentiment analysis).
+
+        Args:
+            topic (Union[str, List[str]]): Topic keyword, or keywords matched with OR.
+            max_rows (Optional[int]): Stop after this many comments, default is all matches.
+            chunk_size (Optional[int]): Comments per chunk, defaults to settings.DB_STREAM_CHUNK_SIZE.
+            max_rows_per_table (Optional[int]): Move on to the next table after this many comments, default is all matches.
+
+        Returns:
+            Iterator[List[QueryResult]]: Chunks of comments, table by table, newest first within a table."""
+        return iter_sync(self.astream_comments_for_topic(topic, max_rows, chunk_size, max_rows_per_table))
+
+    async def astream_comments_for_topic(self, topic: Union[str, List[str]], max_rows: Optional[int] = None, chunk_size: Optional[int] = None, max_rows_per_table: Optional[int] = None) -> AsyncIterator[List[QueryResult]]:
+        """Asynchronous version of stream_comments_for_topic.
+
+        Each table is read with keyset pagination on (time column, id): every page is a bounded query that continues
+        after the last row of the previous page and is fetched through a server-side cursor, so neither side
+        materializes the whole match set. Comments without a timestamp cannot be positioned and are skipped."""
+        chunk_size = chunk_size or settings.DB_STREAM_CHUNK_SIZE
+        page_size = max(settings.DB_STREAM_PAGE_SIZE, chunk_size)
+        logger.info(f"--- TOOL: Stream topic comments (params: {{'topic': {topic!r}, 'max_rows': {max_rows}, 'max_rows_per_table': {max_rows_per_table}}}) ---")
+
+        remaining = max_rows
+        fulltext_tables = await self._aget_fulltext_tables()
+        for table in COMMENT_TABLES:
+            if remaining is not None and remaining <= 0:
+                break
+            cols = await self._aget_table_columns(table)
+            if not cols:
+                continue
+            select, time_col = self._comment_select(table, cols)
+            topic_clause, params, _ = self._topic_condition(table, ['content'], topic, fulltext_tables)
+            base_query = f"SELECT {select}, `id` as k_id FROM `{table}` WHERE ({topic_clause}) AND `{time_col}` IS NOT NULL"
+
+            table_remaining = min((limit for limit in (remaining, max_rows_per_table) if limit is not None), default=None)
+            last_key = None
+            while table_remaining is None or table_remaining > 0:
+                query = base_query
+                page_params = dict(params, page_size=page_size if table_remaining is None else min(page_size, table_remaining))
+                if last_key is not None:
+                    query += f" AND (`{time_col}` < :k_ts OR (`{time_col}` = :k_ts AND `id` < :k_id))"
+                    page_params.update(k_ts=last_key[0], k_id=last_key[1])
+                query += f" ORDER BY `{time_col}` DESC, `id` DESC LIMIT :page_size"
+
+                page_rows = 0
+                try:
+                    async for rows in stream_all(query, page_params, chunk_size):
+                        page_rows += len(rows)
+                        last_key = (rows[-1]['ts'], rows[-1]['k_id'])
+                        yield [self._comment_row_to_query_result(row) for row in rows]
+                except Exception as e:
+                    logger.exception(f"An error occurred while streaming {table}: {e}")
+                    break
+                if remaining is not None:
+                    remaining -= page_rows
+                if table_remaining is not None:
+                    table_remaining -= page_rows
+                if page_rows < page_params['page_size']:
+                    break
+
     def search_topic_on_platform(
         self,
         platform: Literal['bilibili', 'weibo', 'douyin', 'kuaishou', 'xhs', 'zhihu', 'tieba'],
@@ -332,6 +644,19 @@ class MediaCrawlerDB:
 
         Returns:
             DBResponse: Contains a list of results found on this platform."""
+        return run_sync(self.asearch_topic_on_platform(platform, topic, start_date, end_date, limit))
+
+    @_cached_tool(lambda params: PLATFORM_TABLES.get(params['platform'], []))
+    async def asearch_topic_on_platform(
+        self,
+        platform: Literal['bilibili', 'weibo', 'douyin', 'kuaishou', 'xhs', 'zhihu', 'tieba'],
+        topic: Union[str, List[str]],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 20
+    ) -> DBResponse:
+        """Asynchronous version of search_topic_on_platform, the content and comment tables are queried concurrently.
+        A list of topics matches any of them in one query per table."""
         params_for_log = {'platform': platform, 'topic': topic, 'start_date': start_date, 'end_date': end_date, 'limit': limit}
         logger.info(f"--- TOOL: Platform directed search (params: {params_for_log}) ---")
 
@@ -340,10 +665,9 @@ class MediaCrawlerDB:
         if platform not in all_configs:
             return DBResponse("search_topic_on_platform", params_for_log, error_message=f"Unsupported platforms: {platform}")
 
-        search_term, all_results = f"%{topic}%", []
+        all_results = []
         platform_configs = all_configs[platform]
 
-        time_clause, time_params_tuple = "", ()
         if start_date and end_date:
             try:
                 start_dt, end_dt = datetime.strptime(start_date, '%Y-%m-%d'), datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
@@ -352,11 +676,14 @@ class MediaCrawlerDB:
         else:
             start_dt, end_dt = None, None
 
+        queries = []
+        fulltext_tables, schema = await asyncio.gather(self._aget_fulltext_tables(), self._aget_schema())
         for config in platform_configs:
             table = config['table']
-            topic_clause = " OR ".join([f"`{field}` LIKE %s" for field in config['fields']])
-            query = f"SELECT * FROM `{table}` WHERE {topic_clause}"
-            params = [search_term] * len(config['fields'])
+            topic_clause, params, score = self._topic_condition(table, config['fields'], topic, fulltext_tables)
+            projection = self._projection(table, schema)
+            select = f"{projection}, {score} AS ft_score" if score else projection
+            query = f"SELECT {select} FROM `{table}` WHERE ({topic_clause})"
 
             if start_dt and end_dt and 'time_col' in config:
                 time_col, time_type = config['time_col'], config['time_type']
@@ -365,16 +692,19 @@ class MediaCrawlerDB:
                 elif time_type in ['str', 'date_str']: t_params = (start_dt.strftime('%Y-%m-%d'), end_dt.strftime('%Y-%m-%d'))
                 else: t_params = (str(int(start_dt.timestamp())), str(int(end_dt.timestamp())))
                 
-                t_clause = f"`{time_col}` >= %s AND `{time_col}` < %s"
-                if table == 'zhihu_content': t_clause = f"CAST(`{time_col}` AS UNSIGNED) >= %s AND CAST(`{time_col}` AS UNSIGNED) < %s"
+                t_clause = f"`{time_col}` >= :t_start AND `{time_col}` < :t_end"
+                if table == 'zhihu_content': t_clause = f"CAST(`{time_col}` AS UNSIGNED) >= :t_start AND CAST(`{time_col}` AS UNSIGNED) < :t_end"
                 
                 query += f" AND ({t_clause})"
-                params.extend(t_params)
+                params.update({'t_start': t_params[0], 't_end': t_params[1]})
 
-            query += f" ORDER BY id DESC LIMIT %s"
-            params.append(limit)
+            query += f" ORDER BY {'ft_score DESC, ' if score else ''}id DESC LIMIT :limit"
+            params['limit'] = limit
+            queries.append((query, params))
 
-            raw_results = self._execute_query(query, tuple(params))
+        results_per_table = await self._aexecute_queries(queries)
+        for config, raw_results in zip(platform_configs, results_per_table):
+            table = config['table']
             for row in raw_results:
                 content = (row.get('title') or row.get('content') or row.get('desc') or row.get('content_text', ''))
                 time_key = config.get('time_col') and row.get(config.get('time_col'))
@@ -382,6 +712,92 @@ class MediaCrawlerDB:
         
         return DBResponse("search_topic_on_platform", params_for_log, results=all_results, results_count=len(all_results))
 
+    def search_topic_overview(self, topic: str, start_date: Optional[str] = None, end_date: Optional[str] = None, top_n: int = 10) -> DBResponse:
+        """[Tool] Topic overview: Summarize how much a topic is discussed on each platform, its engagement, daily trend and hottest posts.
+
+        Reads the daily rollups built by MindSpider/schema/topic_rollup.py instead of scanning the content tables.
+
+        Args:
+            topic (str): Topic keyword (matched against the crawl source keywords).
+            start_date (Optional[str]): Start date, format 'YYYY-MM-DD'. Default is None.
+            end_date (Optional[str]): end date, format 'YYYY-MM-DD'. Default is None.
+            top_n (int): Number of hottest posts returned, default is 10.
+
+        Returns:
+            DBResponse: The hottest posts as results, the aggregates in metadata (totals, platforms, daily, sentiment_distribution, summary)."""
+        return run_sync(self.asearch_topic_overview(topic, start_date, end_date, top_n))
+
+    @_cached_tool(['topic_daily_rollup'])
+    async def asearch_topic_overview(self, topic: str, start_date: Optional[str] = None, end_date: Optional[str] = None, top_n: int = 10) -> DBResponse:
+        """Asynchronous version of search_topic_overview."""
+        params_for_log = {'topic': topic, 'start_date': start_date, 'end_date': end_date, 'top_n': top_n}
+        logger.info(f"--- TOOL: Topic overview (params: {params_for_log}) ---")
+
+        if not await self._ahas_table('topic_daily_rollup'):
+            return DBResponse("search_topic_overview", params_for_log, error_message="Topic rollups are not available, run MindSpider/schema/topic_rollup.py first.")
+
+        query = ("SELECT platform, stat_date, content_count, liked_total, comment_total, share_total, view_total, hotness_total, "
+                 "sentiment_distribution, top_posts FROM topic_daily_rollup WHERE source_keyword LIKE :pattern")
+        params: Dict[str, Any] = {'pattern': f"%{topic.strip()}%"}
+        try:
+            if start_date:
+                query += " AND stat_date >= :start_date"
+                params['start_date'] = datetime.strptime(start_date, '%Y-%m-%d').date()
+            if end_date:
+                query += " AND stat_date <= :end_date"
+                params['end_date'] = datetime.strptime(end_date, '%Y-%m-%d').date()
+        except ValueError:
+            return DBResponse("search_topic_overview", params_for_log, error_message="Date format error, please use 'YYYY-MM-DD' format.")
+        rows = await self._aexecute_query(query + " ORDER BY stat_date", params)
+        if not rows:
+            return DBResponse("search_topic_overview", params_for_log, error_message="No rollup data for this topic, try search_topic_globally.")
+
+        total_keys = ['content_count', 'liked_total', 'comment_total', 'share_total', 'view_total', 'hotness_total']
+        totals = dict.fromkeys(total_keys, 0)
+        platforms: Dict[str, Dict[str, Any]] = {}
+        daily: Dict[str, Dict[str, Any]] = {}
+        sentiment: Dict[str, int] = {}
+        top_posts: List[Dict[str, Any]] = []
+        for row in rows:
+            day = str(row['stat_date'])
+            for bucket in (totals, platforms.setdefault(row['platform'], dict.fromkeys(total_keys, 0)), daily.setdefault(day, dict.fromkeys(total_keys, 0))):
+                for key in total_keys:
+                    bucket[key] += row[key] or 0
+            for label, count in json.loads(row['sentiment_distribution'] or '{}').items():
+                sentiment[label] = sentiment.get(label, 0) + count
+            top_posts.extend(json.loads(row['top_posts'] or '[]'))
+
+        # Resolve the hottest posts by primary key, one indexed lookup per table
+        top_posts = sorted(top_posts, key=lambda post: post['hotness'], reverse=True)[:top_n]
+        by_table: Dict[str, List[Dict[str, Any]]] = {}
+        for post in top_posts:
+            by_table.setdefault(post['table'], []).append(post)
+        schema = await self._aget_schema()
+        queries = []
+        for table, posts in by_table.items():
+            id_params = {f"id_{idx}": post['id'] for idx, post in enumerate(posts)}
+            queries.append((f"SELECT {self._projection(table, schema)}, id AS k_id FROM {self._wrap_query_field_with_dialect(table)} "
+                            f"WHERE id IN ({', '.join(':' + name for name in id_params)})", id_params))
+        found = {}
+        for (table, posts), table_rows in zip(by_table.items(), await self._aexecute_queries(queries)):
+            content_type = 'note' if table in ['weibo_note', 'xhs_note', 'tieba_note'] else 'content' if table == 'zhihu_content' else 'video'
+            for row in table_rows:
+                found[(table, row['k_id'])] = self._row_to_query_result(row, table, content_type)
+        results = []
+        for post in top_posts:
+            result = found.get((post['table'], post['id']))
+            if result is not None:
+                result.hotness_score = post['hotness']
+                results.append(result)
+
+        platform_summary = ", ".join(f"{platform}: {stats['content_count']} posts" for platform, stats in sorted(platforms.items(), key=lambda item: -item[1]['content_count']))
+        summary = (f"'{topic}' overview ({min(daily)} ~ {max(daily)}): {totals['content_count']} posts ({platform_summary}); "
+                   f"likes {totals['liked_total']}, comments {totals['comment_total']}, shares {totals['share_total']}, views {totals['view_total']}")
+        if sentiment:
+            summary += "; sentiment of the hottest posts: " + ", ".join(f"{label} {count}" for label, count in sentiment.items())
+        metadata = {'totals': totals, 'platforms': platforms, 'daily': daily, 'sentiment_distribution': sentiment, 'summary': summary}
+        return DBResponse("search_topic_overview", params_for_log, results=results, results_count=len(results), metadata=metadata)
+
 # --- 3. Testing and usage examples ---
 def print_response_summary(response: DBResponse):
     """Simplified printing function for displaying test results"""
@@ -401,7 +817,7 @@ def print_response_summary(response: DBResponse):
             content_preview = (res.title_or_content.replace('\n', ' ')[:70] + '...') if res.title_or_content and len(res.title_or_content) > 70 else (res.title_or_content or '')
             author_str = res.author_nickname or "N/A"
             publish_time_str = res.publish_time.strftime('%Y-%m-%d %H:%M') if res.publish_time else "N/A"
-            hotness_str = f", hotness: {res.hotness_score:.2f}" if getattr(res, "hotness_score", 0) > 0 else ""
+            hotness_str = f", hotness: {res.hotness_score:.2f}" if (getattr(res, "hotness_score", 0) or 0) > 0 else ""
             engagement_dict = getattr(res, "engagement", {}) or {}
             engagement_str = ", ".join(f"{k}: {v}" for k, v in engagement_dict.items() if v)
             output_lines.append(
@@ -3,10 +3,17 @@ Provide sentiment analysis function for InsightEngine based on WeiboMultilingual
 
 import os
 import sys
-from typing import List, Dict, Any, Optional, Union
-from dataclasses import dataclass
+import json
+import time
+import hashlib
+import threading
+import contextlib
+from typing import Iterable, List, Dict, Any, Optional, Tuple, Union
+from dataclasses import dataclass, replace
 import re
 
+from ..utils.tiered_cache import TieredCache
+
 try:
     import torch
 
@@ -25,14 +32,37 @@ except ImportError:
     AutoModelForSequenceClassification = None  # type: ignore
     TRANSFORMERS_AVAILABLE = False
 
+try:
+    import numpy as np
+    import onnxruntime as ort
+
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore
+    ort = None  # type: ignore
+    ONNXRUNTIME_AVAILABLE = False
+
 
 # INFO: If you want to skip sentiment analysis, you can manually switch this switch to False
 SENTIMENT_ANALYSIS_ENABLED = True
 
+MODEL_NAME = "tabularisai/multilingual-sentiment-analysis"
 
-def _describe_missing_dependencies() -> str:
+# Texts per forward pass in analyze_batch, texts of similar token length are batched together
+DEFAULT_BATCH_SIZE = 32
+MAX_SEQUENCE_LENGTH = 512
+
+# Inference backends: "torch" runs the HuggingFace model, "onnx" serves a one-time ONNX export with onnxruntime
+SENTIMENT_BACKENDS = ("torch", "onnx")
+ONNX_OPSET_VERSION = 14
+
+
+def _describe_missing_dependencies(backend: str = "torch") -> str:
     missing = []
-    if not TORCH_AVAILABLE:
+    if backend == "onnx":
+        if not ONNXRUNTIME_AVAILABLE:
+            missing.append("ONNX Runtime")
+    elif not TORCH_AVAILABLE:
         missing.append("PyTorch")
     if not TRANSFORMERS_AVAILABLE:
         missing.append("Transformers")
@@ -49,6 +79,79 @@ weibo_sentiment_path = os.path.join(
 sys.path.append(weibo_sentiment_path)
 
 
+def export_onnx_model(model, input_names: List[str], output_path: str) -> str:
+    """Export a sequence classification model to ONNX with dynamic batch and sequence axes
+
+    Args:
+        model: HuggingFace PyTorch model
+        input_names: tokenizer.model_input_names, the graph inputs
+        output_path: .onnx file to write
+
+    Returns:
+        output_path"""
+    assert torch is not None
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    model = model.to("cpu").eval()
+    dummy = tuple(torch.ones((1, 8), dtype=torch.long) for _ in input_names)
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    class _LogitsOnly(torch.nn.Module):
+        def __init__(self, wrapped):
+            super().__init__()
+            self.wrapped = wrapped
+
+        def forward(self, *inputs):
+            return self.wrapped(**dict(zip(input_names, inputs))).logits
+
+    tmp_path = f"{output_path}.tmp"
+    with torch.no_grad():
+        torch.onnx.export(
+            _LogitsOnly(model),
+            dummy,
+            tmp_path,
+            input_names=list(input_names),
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=ONNX_OPSET_VERSION,
+        )
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def quantize_onnx_model(input_path: str, output_path: str) -> str:
+    """Dynamic int8 quantization of the weights of an exported model
+
+    Returns:
+        output_path"""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    tmp_path = f"{output_path}.tmp"
+    quantize_dynamic(input_path, tmp_path, weight_type=QuantType.QInt8)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def create_onnx_session(model_path: str, num_threads: int = 0):
+    """Create a CPU onnxruntime session
+
+    Args:
+        model_path: .onnx file
+        num_threads: intra-op threads, 0 lets onnxruntime use one per physical core
+
+    Returns:
+        onnxruntime.InferenceSession"""
+    assert ort is not None
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    # Batches run one at a time, parallelism comes from the operators
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.inter_op_num_threads = 1
+    if num_threads > 0:
+        options.intra_op_num_threads = num_threads
+    return ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+
+
 @dataclass
 class SentimentResult:
     """Sentiment analysis result data class"""
@@ -74,18 +177,65 @@ class BatchSentimentResult:
     analysis_performed: bool = True
 
 
+class SentimentCache(TieredCache):
+    """Sentiment results keyed by (model id, sha1 of the preprocessed text)
+
+    The same posts and comments come back across keywords, paragraphs and reflection rounds.
+    Values are (label, confidence, probability distribution) tuples."""
+
+    def __init__(self, max_entries: int = 10000, db_path: Optional[str] = None, max_db_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            max_entries: entries kept in memory
+            db_path: SQLite file of the persistent tier, None keeps the cache in memory
+            max_db_bytes: size of the persistent tier above which the least recently used results are evicted"""
+        super().__init__(
+            "sentiment_results", max_entries, db_path,
+            dumps=lambda entry: json.dumps(entry, ensure_ascii=False).encode("utf-8"),
+            loads=lambda blob: tuple(json.loads(blob)),
+            max_db_bytes=max_db_bytes,
+        )
+
+    @staticmethod
+    def make_key(model_id: str, processed_text: str) -> str:
+        return f"{model_id}:{hashlib.sha1(processed_text.encode('utf-8')).hexdigest()}"
+
+
 class WeiboMultilingualSentimentAnalyzer:
     """Multilingual Sentiment Analyzer
     Encapsulate the WeiboMultilingualSentiment model to provide sentiment analysis functions for AI Agents"""
 
-    def __init__(self):
-        """Initialize sentiment analyzer"""
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        backend: str = "torch",
+        onnx_quantize: bool = True,
+        onnx_threads: int = 0,
+        cache: Optional[SentimentCache] = None,
+    ):
+        """Initialize sentiment analyzer
+
+        Args:
+            batch_size: default number of texts per forward pass in analyze_batch
+            backend: "torch" or "onnx" (CPU onnxruntime session of a one-time export)
+            onnx_quantize: serve the dynamically int8-quantized export with the onnx backend
+            onnx_threads: onnxruntime intra-op threads, 0 means one per physical core
+            cache: result cache, defaults to an in-memory SentimentCache"""
+        self.cache = cache if cache is not None else SentimentCache()
+        self.batch_size = batch_size
+        self.backend = backend if backend in SENTIMENT_BACKENDS else "torch"
+        self.onnx_quantize = onnx_quantize
+        self.onnx_threads = onnx_threads
+        self.onnx_dir = os.path.join(weibo_sentiment_path, "onnx")
+        self.session = None
         self.model = None
         self.tokenizer = None
         self.device = None
         self.is_initialized = False
         self.is_disabled = False
         self.disable_reason: Optional[str] = None
+        # Paragraphs researched in parallel may trigger the first load at the same time
+        self._init_lock = threading.Lock()
 
         # Sentiment label mapping (5-level classification)
         self.sentiment_map = {
@@ -98,8 +248,8 @@ class WeiboMultilingualSentimentAnalyzer:
 
         if not SENTIMENT_ANALYSIS_ENABLED:
             self.disable("Sentiment analysis functionality has been turned off in the configuration.")
-        elif not (TORCH_AVAILABLE and TRANSFORMERS_AVAILABLE):
-            missing = _describe_missing_dependencies() or "unknown dependencies"
+        elif _describe_missing_dependencies(self.backend):
+            missing = _describe_missing_dependencies(self.backend)
             self.disable(f"Missing dependency: {missing}, sentiment analysis is disabled.")
 
         if self.is_disabled:
@@ -118,6 +268,7 @@ class WeiboMultilingualSentimentAnalyzer:
         self.disable_reason = reason or "Sentiment analysis disabled."
         if drop_state:
             self.model = None
+            self.session = None
             self.tokenizer = None
             self.device = None
             self.is_initialized = False
@@ -127,14 +278,50 @@ class WeiboMultilingualSentimentAnalyzer:
         if not SENTIMENT_ANALYSIS_ENABLED:
             self.disable("Sentiment analysis functionality has been turned off in the configuration.")
             return False
-        if not (TORCH_AVAILABLE and TRANSFORMERS_AVAILABLE):
-            missing = _describe_missing_dependencies() or "unknown dependencies"
+        missing = _describe_missing_dependencies(self.backend)
+        if missing:
             self.disable(f"Missing dependency: {missing}, sentiment analysis is disabled.")
             return False
         self.is_disabled = False
         self.disable_reason = None
         return True
 
+    def configure_backend(
+        self,
+        backend: str = "torch",
+        onnx_quantize: bool = True,
+        onnx_threads: int = 0,
+        batch_size: Optional[int] = None,
+    ) -> None:
+        """Select the inference backend, a loaded model of another backend is released and reloaded by initialize()"""
+        backend = backend if backend in SENTIMENT_BACKENDS else "torch"
+        changed = (backend, onnx_quantize, onnx_threads) != (self.backend, self.onnx_quantize, self.onnx_threads)
+        self.backend = backend
+        self.onnx_quantize = onnx_quantize
+        self.onnx_threads = onnx_threads
+        if batch_size:
+            self.batch_size = batch_size
+        if changed and self.is_initialized:
+            self.model = None
+            self.session = None
+            self.is_initialized = False
+        # Re-evaluate the dependencies of the selected backend unless disabled on purpose
+        if not self.is_initialized and (not self.is_disabled or (self.disable_reason or "").startswith("Missing dependency")):
+            self.enable()
+
+    def configure_cache(self, max_entries: int = 10000, db_path: Optional[str] = None, max_db_bytes: int = 64 * 1024 * 1024) -> None:
+        """Replace the result cache, max_entries=0 disables caching"""
+        if self.cache is not None and (self.cache.max_entries, self.cache.db_path, self.cache.max_db_bytes) == (max_entries, db_path, max_db_bytes):
+            return
+        self.cache = SentimentCache(max_entries, db_path, max_db_bytes) if max_entries > 0 else None
+
+    @property
+    def model_id(self) -> str:
+        """Identifies the outputs in the result cache, the int8 model scores slightly differently"""
+        if self.backend == "onnx" and self.onnx_quantize:
+            return f"{MODEL_NAME}:onnx-int8"
+        return MODEL_NAME
+
     def _select_device(self):
         """Select the best available torch device."""
         if not TORCH_AVAILABLE:
@@ -156,13 +343,17 @@ class WeiboMultilingualSentimentAnalyzer:
 
         Returns:
             Is initialization successful?"""
+        with self._init_lock:
+            return self._initialize()
+
+    def _initialize(self) -> bool:
         if self.is_disabled:
             reason = self.disable_reason or "Sentiment analysis feature is disabled"
             print(f"Sentiment analysis feature disabled, skipping model loading: {reason}")
             return False
 
-        if not (TORCH_AVAILABLE and TRANSFORMERS_AVAILABLE):
-            missing = _describe_missing_dependencies() or "unknown dependencies"
+        missing = _describe_missing_dependencies(self.backend)
+        if missing:
             self.disable(f"Missing dependency: {missing}, sentiment analysis is disabled.", drop_state=True)
             print(f"Missing dependency: {missing}, unable to load sentiment analysis model.")
             return False
@@ -173,54 +364,14 @@ class WeiboMultilingualSentimentAnalyzer:
 
         try:
             print("Loading multilingual sentiment analysis model...")
-            assert AutoTokenizer is not None
-            assert AutoModelForSequenceClassification is not None
-
-            # Use multilingual sentiment analysis models
-            model_name = "tabularisai/multilingual-sentiment-analysis"
-            local_model_path = os.path.join(weibo_sentiment_path, "model")
-
-            # Check if the model already exists locally
-            if os.path.exists(local_model_path):
-                print("Load model from local...")
-                self.tokenizer = AutoTokenizer.from_pretrained(local_model_path)
-                self.model = AutoModelForSequenceClassification.from_pretrained(
-                    local_model_path
-                )
+            if self.backend == "onnx":
+                self._initialize_onnx()
             else:
-                print("First time use, downloading model to local...")
-                # Download and save locally
-                self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-                self.model = AutoModelForSequenceClassification.from_pretrained(
-                    model_name
-                )
-
-                # Save to local
-                os.makedirs(local_model_path, exist_ok=True)
-                self.tokenizer.save_pretrained(local_model_path)
-                self.model.save_pretrained(local_model_path)
-                print(f"Model saved to: {local_model_path}")
-
-            # Set up the device
-            device = self._select_device()
-            if device is None:
-                raise RuntimeError("No available computing device detected")
-
-            self.device = device
-            self.model.to(self.device)
-            self.model.eval()
+                self._initialize_torch()
             self.is_initialized = True
             self.enable()
 
-            device_type = getattr(self.device, "type", str(self.device))
-            if device_type == "cuda":
-                print("Available GPU detected, CUDA has been prioritized for inference.")
-            elif device_type == "mps":
-                print("Apple MPS device detected, MPS used for inference.")
-            else:
-                print("GPU not detected, automatically uses CPU for inference.")
-
-            print(f"Model loaded successfully! Device used: {self.device}")
+            print(f"Model loaded successfully! Backend: {self.backend}, device used: {self.device}")
             print("Supported languages: 22 languages ​​including Chinese, English, Spanish, Arabic, Japanese, and Korean")
             print("Sentiment scale: very negative, negative, neutral, positive, very positive")
 
@@ -233,6 +384,83 @@ class WeiboMultilingualSentimentAnalyzer:
             self.disable(error_message, drop_state=True)
             return False
 
+    def _load_pretrained(self, load_model: bool = True):
+        """Load the tokenizer (and the PyTorch model) from the local copy, downloading it on first use
+
+        Returns:
+            The PyTorch model, or None when load_model is False and the local copy exists"""
+        assert AutoTokenizer is not None
+        assert AutoModelForSequenceClassification is not None
+
+        # Use multilingual sentiment analysis models
+        model_name = MODEL_NAME
+        local_model_path = os.path.join(weibo_sentiment_path, "model")
+
+        # Check if the model already exists locally
+        if os.path.exists(local_model_path):
+            print("Load model from local...")
+            self.tokenizer = AutoTokenizer.from_pretrained(local_model_path)
+            if not load_model:
+                return None
+            return AutoModelForSequenceClassification.from_pretrained(local_model_path)
+
+        print("First time use, downloading model to local...")
+        # Download and save locally
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(model_name)
+
+        # Save to local
+        os.makedirs(local_model_path, exist_ok=True)
+        self.tokenizer.save_pretrained(local_model_path)
+        model.save_pretrained(local_model_path)
+        print(f"Model saved to: {local_model_path}")
+        return model
+
+    def _initialize_torch(self) -> None:
+        self.model = self._load_pretrained()
+
+        # Set up the device
+        device = self._select_device()
+        if device is None:
+            raise RuntimeError("No available computing device detected")
+
+        self.device = device
+        self.model.to(self.device)
+        self.model.eval()
+
+        device_type = getattr(self.device, "type", str(self.device))
+        if device_type == "cuda":
+            print("Available GPU detected, CUDA has been prioritized for inference.")
+        elif device_type == "mps":
+            print("Apple MPS device detected, MPS used for inference.")
+        else:
+            print("GPU not detected, automatically uses CPU for inference.")
+
+    def _initialize_onnx(self) -> None:
+        """Serve the ONNX export, exporting (and quantizing) the PyTorch model the first time"""
+        fp32_path = os.path.join(self.onnx_dir, "model.onnx")
+        int8_path = os.path.join(self.onnx_dir, "model.int8.onnx")
+        model_path = int8_path if self.onnx_quantize else fp32_path
+
+        if os.path.exists(model_path):
+            self._load_pretrained(load_model=False)
+        else:
+            if not os.path.exists(fp32_path):
+                if not TORCH_AVAILABLE:
+                    raise RuntimeError("PyTorch is required once to export the ONNX model")
+                print(f"Exporting the model to ONNX: {fp32_path}")
+                model = self._load_pretrained()
+                export_onnx_model(model, list(self.tokenizer.model_input_names), fp32_path)
+                del model
+            else:
+                self._load_pretrained(load_model=False)
+            if self.onnx_quantize:
+                print(f"Quantizing the ONNX model to int8: {int8_path}")
+                quantize_onnx_model(fp32_path, int8_path)
+
+        self.session = create_onnx_session(model_path, self.onnx_threads)
+        self.device = "cpu"
+
     def _preprocess_text(self, text: str) -> str:
         """Text preprocessing
 
@@ -250,6 +478,167 @@ class WeiboMultilingualSentimentAnalyzer:
 
         return text
 
+    def _input_error_result(self, text: str) -> SentimentResult:
+        return SentimentResult(
+            text=text,
+            sentiment_label="Input error",
+            confidence=0.0,
+            probability_distribution={},
+            success=False,
+            error_message="The input text is empty or has invalid content",
+            analysis_performed=False,
+        )
+
+    def _inference_context(self):
+        """inference_mode where available (torch >= 1.9), otherwise no_grad"""
+        if self.backend == "onnx":
+            return contextlib.nullcontext()
+        assert torch is not None
+        inference_mode = getattr(torch, "inference_mode", None)
+        return inference_mode() if inference_mode is not None else torch.no_grad()
+
+    def _forward(self, encodings: Dict[str, Any]) -> Tuple[List[List[float]], List[float], List[int]]:
+        """Run one padded batch
+
+        Returns:
+            (probability rows, confidences, predicted label ids)"""
+        if self.backend == "onnx":
+            assert self.session is not None
+            batch = self.tokenizer.pad(encodings, padding=True, return_tensors="np")
+            graph_inputs = {graph_input.name for graph_input in self.session.get_inputs()}
+            feed = {key: value.astype(np.int64) for key, value in batch.items() if key in graph_inputs}
+            logits = self.session.run(["logits"], feed)[0]
+            exp_logits = np.exp(logits - logits.max(axis=-1, keepdims=True))
+            probabilities = exp_logits / exp_logits.sum(axis=-1, keepdims=True)
+            predictions = probabilities.argmax(axis=-1)
+            confidences = probabilities[np.arange(len(predictions)), predictions]
+            return probabilities.tolist(), confidences.tolist(), predictions.tolist()
+
+        assert torch is not None
+        assert self.model is not None
+        batch = self.tokenizer.pad(encodings, padding=True, return_tensors="pt")
+        batch = {key: value.to(self.device) for key, value in batch.items()}
+        probabilities = torch.softmax(self.model(**batch).logits, dim=-1)
+        confidences, predictions = probabilities.max(dim=-1)
+        return probabilities.cpu().tolist(), confidences.cpu().tolist(), predictions.cpu().tolist()
+
+    def _predict(
+        self,
+        texts: List[str],
+        processed_texts: List[str],
+        batch_size: Optional[int] = None,
+        show_progress: bool = False,
+    ) -> List[SentimentResult]:
+        """Classify non-empty preprocessed texts with batched forward passes
+
+        The texts are tokenized once and sorted by token length, each batch is padded only to its longest
+        member. Softmax and argmax run on the whole batch.
+
+        Args:
+            texts: original texts, reported back in the results
+            processed_texts: preprocessed texts fed to the model
+            batch_size: texts per forward pass, defaults to self.batch_size
+            show_progress: whether to print progress after each batch
+
+        Returns:
+            SentimentResult list in input order"""
+        assert self.tokenizer is not None
+        batch_size = max(1, batch_size or self.batch_size)
+        labels = list(self.sentiment_map.values())
+        results: List[Optional[SentimentResult]] = [None] * len(texts)
+
+        def failed(index: int, error: Exception) -> SentimentResult:
+            return SentimentResult(
+                text=texts[index],
+                sentiment_label="Analysis failed",
+                confidence=0.0,
+                probability_distribution={},
+                success=False,
+                error_message=f"An error occurred while predicting: {str(error)}",
+                analysis_performed=False,
+            )
+
+        try:
+            # word segmentation coding, padding is applied per batch
+            encodings = self.tokenizer(
+                processed_texts, max_length=MAX_SEQUENCE_LENGTH, truncation=True
+            )
+        except Exception as e:
+            return [failed(index, e) for index in range(len(texts))]
+        order = sorted(range(len(texts)), key=lambda index: len(encodings["input_ids"][index]))
+
+        with self._inference_context():
+            for start in range(0, len(order), batch_size):
+                indices = order[start:start + batch_size]
+                try:
+                    rows, confidences, predictions = self._forward(
+                        {key: [encodings[key][index] for index in indices] for key in encodings.keys()}
+                    )
+                    for index, row, confidence, prediction in zip(indices, rows, confidences, predictions):
+                        results[index] = SentimentResult(
+                            text=texts[index],
+                            sentiment_label=self.sentiment_map[prediction],
+                            confidence=confidence,
+                            probability_distribution=dict(zip(labels, row)),
+                            success=True,
+                        )
+                except Exception as e:
+                    for index in indices:
+                        results[index] = failed(index, e)
+
+                if show_progress and len(texts) > 1:
+                    print(f"Processing progress: {min(start + batch_size, len(texts))}/{len(texts)}")
+
+        return results
+
+    def _predict_cached(
+        self,
+        texts: List[str],
+        processed_texts: List[str],
+        batch_size: Optional[int] = None,
+        show_progress: bool = False,
+    ) -> List[SentimentResult]:
+        """_predict for the texts missing from the result cache, each distinct text is classified once"""
+        if self.cache is None:
+            return self._predict(texts, processed_texts, batch_size, show_progress)
+
+        keys = [self.cache.make_key(self.model_id, processed_text) for processed_text in processed_texts]
+        cached = self.cache.get_many(keys)
+        misses: Dict[str, int] = {}
+        for i, key in enumerate(keys):
+            if key not in cached:
+                misses.setdefault(key, i)
+        if show_progress and len(texts) > 1:
+            print(f"Sentiment cache: {len(texts) - sum(key not in cached for key in keys)}/{len(texts)} texts already scored")
+
+        fresh: Dict[str, SentimentResult] = {}
+        if misses:
+            indices = list(misses.values())
+            predictions = self._predict(
+                [texts[i] for i in indices], [processed_texts[i] for i in indices], batch_size, show_progress
+            )
+            fresh = dict(zip(misses, predictions))
+            self.cache.set_many({
+                key: (result.sentiment_label, result.confidence, result.probability_distribution)
+                for key, result in fresh.items()
+                if result.success
+            })
+
+        results = []
+        for text, key in zip(texts, keys):
+            if key in cached:
+                label, confidence, probabilities = cached[key]
+                results.append(SentimentResult(
+                    text=text,
+                    sentiment_label=label,
+                    confidence=confidence,
+                    probability_distribution=dict(probabilities),
+                    success=True,
+                ))
+            else:
+                results.append(replace(fresh[key], text=text, probability_distribution=dict(fresh[key].probability_distribution)))
+        return results
+
     def analyze_single_text(self, text: str) -> SentimentResult:
         """Perform sentiment analysis on individual texts
 
@@ -285,53 +674,8 @@ class WeiboMultilingualSentimentAnalyzer:
             processed_text = self._preprocess_text(text)
 
             if not processed_text:
-                return SentimentResult(
-                    text=text,
-                    sentiment_label="Input error",
-                    confidence=0.0,
-                    probability_distribution={},
-                    success=False,
-                    error_message="The input text is empty or has invalid content",
-                    analysis_performed=False,
-                )
-            assert self.tokenizer is not None
-            # word segmentation coding
-            inputs = self.tokenizer(
-                processed_text,
-                max_length=512,
-                padding=True,
-                truncation=True,
-                return_tensors="pt",
-            )
-
-            # Transfer to device
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-
-            # predict
-            assert torch is not None
-            assert self.model is not None
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                logits = outputs.logits
-                probabilities = torch.softmax(logits, dim=1)
-                prediction = int(torch.argmax(probabilities, dim=1).item())
-
-            # Build results
-            confidence = probabilities[0][prediction].item()
-            label = self.sentiment_map[prediction]
-
-            # Build probability distribution dictionary
-            prob_dist = {}
-            for label_name, prob in zip(self.sentiment_map.values(), probabilities[0]):
-                prob_dist[label_name] = prob.item()
-
-            return SentimentResult(
-                text=text,
-                sentiment_label=label,
-                confidence=confidence,
-                probability_distribution=prob_dist,
-                success=True,
-            )
+                return self._input_error_result(text)
+            return self._predict_cached([text], [processed_text])[0]
 
         except Exception as e:
             return SentimentResult(
@@ -345,13 +689,14 @@ class WeiboMultilingualSentimentAnalyzer:
             )
 
     def analyze_batch(
-        self, texts: List[str], show_progress: bool = True
+        self, texts: List[str], show_progress: bool = True, batch_size: Optional[int] = None
     ) -> BatchSentimentResult:
         """Batch sentiment analysis
 
         Args:
             texts: text list
             show_progress: whether to show progress
+            batch_size: texts per forward pass, defaults to the analyzer's batch_size
 
         Returns:
             BatchSentimentResult object"""
@@ -387,20 +732,26 @@ class WeiboMultilingualSentimentAnalyzer:
                 analysis_performed=False,
             )
 
-        results = []
-        success_count = 0
-        total_confidence = 0.0
-
+        results: List[Optional[SentimentResult]] = [None] * len(texts)
+        pending = []
+        processed_texts = []
         for i, text in enumerate(texts):
-            if show_progress and len(texts) > 1:
-                print(f"Processing progress: {i + 1}/{len(texts)}")
+            processed_text = self._preprocess_text(text) if isinstance(text, str) else ""
+            if processed_text:
+                pending.append(i)
+                processed_texts.append(processed_text)
+            else:
+                results[i] = self._input_error_result(text)
 
-            result = self.analyze_single_text(text)
-            results.append(result)
+        if pending:
+            predictions = self._predict_cached(
+                [texts[i] for i in pending], processed_texts, batch_size, show_progress
+            )
+            for i, result in zip(pending, predictions):
+                results[i] = result
 
-            if result.success:
-                success_count += 1
-                total_confidence += result.confidence
+        success_count = sum(1 for result in results if result.success)
+        total_confidence = sum(result.confidence for result in results if result.success)
 
         average_confidence = (
             total_confidence / success_count if success_count > 0 else 0.0
@@ -465,17 +816,14 @@ class WeiboMultilingualSentimentAnalyzer:
 
         Returns:
             Dictionary containing sentiment analysis results"""
-        if not query_results:
-            return {
-                "sentiment_analysis": {
-                    "total_analyzed": 0,
-                    "sentiment_distribution": {},
-                    "high_confidence_results": [],
-                    "summary": "There is no content to analyze",
-                }
-            }
+        return self.analyze_query_result_chunks(
+            [query_results], text_field=text_field, min_confidence=min_confidence
+        )
 
-        # Extract text content
+    def _extract_texts(
+        self, query_results: List[Dict[str, Any]], text_field: str
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Pick the analyzable text of each query result, skipping items without text"""
         texts_to_analyze = []
         original_data = []
 
@@ -491,81 +839,136 @@ class WeiboMultilingualSentimentAnalyzer:
                 texts_to_analyze.append(text_content)
                 original_data.append(item)
 
-        if not texts_to_analyze:
+        return texts_to_analyze, original_data
+
+    def analyze_query_result_chunks(
+        self,
+        chunks: Iterable[List[Dict[str, Any]]],
+        text_field: str = "content",
+        min_confidence: float = 0.5,
+    ) -> Dict[str, Any]:
+        """Perform sentiment analysis on query results delivered in chunks
+        (e.g. MediaCrawlerDB.stream_comments_for_topic). Each chunk is analyzed as it arrives, so tokenized and
+        padded model inputs are bounded by the chunk size. The returned high-confidence results (and, while
+        analysis is unavailable, the pass-through texts) still reference every qualifying row, so the retained
+        output grows with the input.
+
+        Args:
+            chunks: iterable of query result lists
+            text_field: text content field name, default is "content"
+            min_confidence: minimum confidence threshold
+
+        Returns:
+            Dictionary containing sentiment analysis results, same format as analyze_query_results"""
+        sentiment_distribution: Dict[str, int] = {}
+        high_confidence_results = []
+        received_items = False
+        total_processed = 0
+        success_count = 0
+        total_confidence = 0.0
+        # Filled only while analysis is unavailable, the pass-through result returns the original texts
+        passthrough_reason = None
+        passthrough_data: List[Dict[str, Any]] = []
+        passthrough_texts: List[str] = []
+        passthrough_results: List[SentimentResult] = []
+
+        for chunk in chunks:
+            received_items = received_items or bool(chunk)
+            texts_to_analyze, original_data = self._extract_texts(chunk, text_field)
+            if not texts_to_analyze:
+                continue
+
+            if self.is_disabled:
+                passthrough_reason = self.disable_reason or "Sentiment analysis model is not available"
+                passthrough_data.extend(original_data)
+                passthrough_texts.extend(texts_to_analyze)
+                continue
+
+            # Perform batch sentiment analysis
+            print(f"Sentiment analysis is being performed on {len(texts_to_analyze)} pieces of content...")
+            batch_result = self.analyze_batch(texts_to_analyze, show_progress=True)
+
+            if not batch_result.analysis_performed:
+                reason = self.disable_reason or "Sentiment analysis function is not available"
+                if batch_result.results:
+                    candidate_error = next(
+                        (r.error_message for r in batch_result.results if r.error_message),
+                        None,
+                    )
+                    if candidate_error:
+                        reason = candidate_error
+                passthrough_reason = reason
+                passthrough_data.extend(original_data)
+                passthrough_texts.extend(texts_to_analyze)
+                passthrough_results.extend(batch_result.results)
+                continue
+
+            total_processed += batch_result.total_processed
+            success_count += batch_result.success_count
+            total_confidence += batch_result.average_confidence * batch_result.success_count
+
+            for result, original_item in zip(batch_result.results, original_data):
+                if result.success:
+                    # Statistical sentiment distribution
+                    sentiment = result.sentiment_label
+                    if sentiment not in sentiment_distribution:
+                        sentiment_distribution[sentiment] = 0
+                    sentiment_distribution[sentiment] += 1
+
+                    # Collect high-confidence results
+                    if result.confidence >= min_confidence:
+                        high_confidence_results.append(
+                            {
+                                "original_data": original_item,
+                                "sentiment": result.sentiment_label,
+                                "confidence": result.confidence,
+                                "text_preview": result.text[:100] + "..."
+                                if len(result.text) > 100
+                                else result.text,
+                            }
+                        )
+
+        if not received_items:
             return {
                 "sentiment_analysis": {
                     "total_analyzed": 0,
                     "sentiment_distribution": {},
                     "high_confidence_results": [],
-                    "summary": "No analyzable text content was found in the query results.",
+                    "summary": "There is no content to analyze",
                 }
             }
 
-        if self.is_disabled:
-            return self._build_passthrough_analysis(
-                original_data=original_data,
-                reason=self.disable_reason or "Sentiment analysis model is not available",
-                texts=texts_to_analyze,
-            )
-
-        # Perform batch sentiment analysis
-        print(f"Sentiment analysis is being performed on {len(texts_to_analyze)} pieces of content...")
-        batch_result = self.analyze_batch(texts_to_analyze, show_progress=True)
-
-        if not batch_result.analysis_performed:
-            reason = self.disable_reason or "Sentiment analysis function is not available"
-            if batch_result.results:
-                candidate_error = next(
-                    (r.error_message for r in batch_result.results if r.error_message),
-                    None,
+        if total_processed == 0:
+            if passthrough_texts:
+                return self._build_passthrough_analysis(
+                    original_data=passthrough_data,
+                    reason=passthrough_reason,
+                    texts=passthrough_texts,
+                    results=passthrough_results or None,
                 )
-                if candidate_error:
-                    reason = candidate_error
-            return self._build_passthrough_analysis(
-                original_data=original_data,
-                reason=reason,
-                texts=texts_to_analyze,
-                results=batch_result.results,
-            )
-
-        # Statistical sentiment distribution
-        sentiment_distribution = {}
-        high_confidence_results = []
-
-        for result, original_item in zip(batch_result.results, original_data):
-            if result.success:
-                # Statistical sentiment distribution
-                sentiment = result.sentiment_label
-                if sentiment not in sentiment_distribution:
-                    sentiment_distribution[sentiment] = 0
-                sentiment_distribution[sentiment] += 1
-
-                # Collect high-confidence results
-                if result.confidence >= min_confidence:
-                    high_confidence_results.append(
-                        {
-                            "original_data": original_item,
-                            "sentiment": result.sentiment_label,
-                            "confidence": result.confidence,
-                            "text_preview": result.text[:100] + "..."
-                            if len(result.text) > 100
-                            else result.text,
-                        }
-                    )
+            return {
+                "sentiment_analysis": {
+                    "total_analyzed": 0,
+                    "sentiment_distribution": {},
+                    "high_confidence_results": [],
+                    "summary": "No analyzable text content was found in the query results.",
+                }
+            }
 
         # Generate sentiment analysis summaries
-        total_analyzed = batch_result.success_count
+        total_analyzed = success_count
         if total_analyzed > 0:
             dominant_sentiment = max(sentiment_distribution.items(), key=lambda x: x[1])
             sentiment_summary = f"A total of {total_analyzed} pieces of content were analyzed, and the main emotional tendency is '{dominant_sentiment[0]}' ({dominant_sentiment[1]}, accounting for {dominant_sentiment[1] / total_analyzed * 100:.1f}%)"
         else:
             sentiment_summary = "Sentiment analysis failed"
 
+        average_confidence = total_confidence / success_count if success_count > 0 else 0.0
         return {
             "sentiment_analysis": {
                 "total_analyzed": total_analyzed,
-                "success_rate": f"{batch_result.success_count}/{batch_result.total_processed}",
-                "average_confidence": round(batch_result.average_confidence, 4),
+                "success_rate": f"{success_count}/{total_processed}",
+                "average_confidence": round(average_confidence, 4),
                 "sentiment_distribution": sentiment_distribution,
                 "high_confidence_results": high_confidence_results,  # Return all high-confidence results without restrictions
                 "summary": sentiment_summary,
@@ -578,7 +981,7 @@ class WeiboMultilingualSentimentAnalyzer:
         Returns:
             Model information dictionary"""
         return {
-            "model_name": "tabularisai/multilingual-sentiment-analysis",
+            "model_name": MODEL_NAME,
             "supported_languages": [
                 "Chinese",
                 "English",
@@ -605,6 +1008,7 @@ class WeiboMultilingualSentimentAnalyzer:
             ],
             "sentiment_levels": list(self.sentiment_map.values()),
             "is_initialized": self.is_initialized,
+            "backend": self.backend,
             "device": str(self.device) if self.device else "not set",
         }
 
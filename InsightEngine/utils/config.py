@@ -22,8 +22,35 @@ class Settings(BaseSettings):
     DB_PORT: int = Field(3306, description="Database port")
     DB_CHARSET: str = Field("utf8mb4", description="Database character set")
     DB_DIALECT: Optional[str] = Field("mysql", description="Database dialect, such as mysql, postgresql, etc., SQLAlchemy backend selection")
+    DB_POOL_SIZE: int = Field(10, description="Database connection pool size")
+    DB_POOL_MAX_OVERFLOW: int = Field(5, description="Extra connections allowed above the pool size")
+    DB_QUERY_CONCURRENCY: int = Field(8, description="Maximum number of concurrent per-table queries of one tool call")
+    DB_FULLTEXT_SEARCH: bool = Field(True, description="Use full-text indexes (MindSpider/schema/fulltext_index.py) for topic search when present")
+    DB_QUERY_CACHE_ENABLED: bool = Field(True, description="Cache search tool results until the queried tables change")
+    DB_QUERY_CACHE_SIZE: int = Field(256, description="Maximum number of tool results kept in the in-process cache")
+    DB_QUERY_CACHE_TTL: int = Field(600, description="Maximum age of a cached tool result in seconds")
+    DB_QUERY_CACHE_VERSION_INTERVAL: int = Field(30, description="Seconds between checks of the tables' latest primary key")
+    DB_QUERY_CACHE_DIR: Optional[str] = Field(None, description="Directory of the optional on-disk cache tier shared between processes")
+    DB_QUERY_CACHE_REDIS_URL: Optional[str] = Field(None, description="Redis URL of the optional shared cache tier, takes precedence over DB_QUERY_CACHE_DIR")
+    DB_STREAM_PAGE_SIZE: int = Field(2000, description="Rows per keyset page when streaming large topic scans")
+    DB_STREAM_CHUNK_SIZE: int = Field(500, description="Rows per chunk handed to consumers of streamed topic scans")
+    DB_STREAM_COMMENTS_PER_TABLE: int = Field(1000, description="Comments read per table when get_comments_for_topic streams its matches into clustering")
+    SEARCH_KEYWORD_CONCURRENCY: int = Field(4, description="Maximum number of optimized keywords searched at the same time")
+    SEARCH_FOLD_KEYWORDS: bool = Field(False, description="Search all optimized keywords in one OR query per table instead of one query per keyword")
+    SENTIMENT_BACKEND: str = Field("torch", description="Sentiment analysis backend: torch, or onnx (CPU onnxruntime session of a one-time ONNX export)")
+    SENTIMENT_ONNX_QUANTIZE: bool = Field(True, description="Serve the dynamically int8-quantized ONNX model with the onnx backend")
+    SENTIMENT_ONNX_THREADS: int = Field(0, description="onnxruntime intra-op threads, 0 means one per physical core")
+    SENTIMENT_BATCH_SIZE: int = Field(32, description="Texts per forward pass of batched sentiment analysis")
+    SENTIMENT_CACHE_SIZE: int = Field(10000, description="Sentiment results kept in memory by text hash, 0 disables the cache")
+    SENTIMENT_CACHE_DB: Optional[str] = Field(None, description="SQLite file persisting sentiment results across runs, optional")
+    SENTIMENT_CACHE_DB_MAX_MB: int = Field(64, description="Size of SENTIMENT_CACHE_DB above which the least recently used results are evicted")
+    CLUSTERING_MODEL_PRELOAD: str = Field("background", description="Load the clustering model at agent construction: eager, background or none (on first use)")
+    CLUSTERING_EMBEDDING_CACHE_SIZE: int = Field(20000, description="Clustering embeddings kept in memory by text hash")
+    CLUSTERING_EMBEDDING_CACHE_DB: Optional[str] = Field(None, description="SQLite file persisting clustering embeddings across runs, optional")
+    CLUSTERING_EMBEDDING_CACHE_DB_MAX_MB: int = Field(256, description="Size of CLUSTERING_EMBEDDING_CACHE_DB above which the least recently used embeddings are evicted")
     MAX_REFLECTIONS: int = Field(3, description="Maximum number of reflections")
     MAX_PARAGRAPHS: int = Field(6, description="Maximum number of paragraphs")
+    MAX_PARALLEL_PARAGRAPHS: int = Field(1, description="Paragraphs researched at the same time, raise it within the LLM rate limits")
     SEARCH_TIMEOUT: int = Field(240, description="Single search request timeout")
     MAX_CONTENT_LENGTH: int = Field(500000, description="Search maximum content length")
     DEFAULT_SEARCH_HOT_CONTENT_LIMIT: int = Field(100, description="Default maximum number of hot list contents")
@@ -35,6 +62,7 @@ class Settings(BaseSettings):
     MAX_HIGH_CONFIDENCE_SENTIMENT_RESULTS: int = Field(0, description="High Confidence Sentiment Analysis Maximum Number")
     OUTPUT_DIR: str = Field("reports", description="Output path")
     SAVE_INTERMEDIATE_STATES: bool = Field(True, description="Whether to save the intermediate state")
+    SAVE_CHECKPOINTS: bool = Field(True, description="Checkpoint the research state after every search and summary so research(query, resume_from=...) can continue an interrupted run")
 
     class Config:
         env_file = ".env"
@@ -8,7 +8,9 @@ from __future__ import annotations
 from urllib.parse import quote_plus
 import asyncio
 import os
-from typing import Any, Dict, Iterable, List, Optional, Union
+import threading
+import weakref
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, Iterator, List, Optional, TypeVar, Union
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy import text
@@ -17,10 +19,21 @@ from InsightEngine.utils.config import settings
 __all__ = [
     "get_async_engine",
     "fetch_all",
+    "stream_all",
+    "run_sync",
+    "iter_sync",
 ]
 
+T = TypeVar("T")
 
-_engine: Optional[AsyncEngine] = None
+# Driver connections belong to the event loop that opened them, so every loop gets its own pooled engine
+_engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncEngine]" = weakref.WeakKeyDictionary()
+_engines_lock = threading.Lock()
+
+# Shared background loop used by the synchronous wrappers
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_thread: Optional[threading.Thread] = None
+_sync_loop_lock = threading.Lock()
 
 
 def _build_database_url() -> str:
@@ -45,15 +58,42 @@ def _build_database_url() -> str:
 
 
 def get_async_engine() -> AsyncEngine:
-    global _engine
-    if _engine is None:
-        database_url: str = _build_database_url()
-        _engine = create_async_engine(
-            database_url,
-            pool_pre_ping=True,
-            pool_recycle=1800,
-        )
-    return _engine
+    """Get the pooled engine of the running event loop (created on first use)."""
+    loop = asyncio.get_running_loop()
+    with _engines_lock:
+        engine = _engines.get(loop)
+        if engine is None:
+            database_url: str = _build_database_url()
+            engine = create_async_engine(
+                database_url,
+                pool_pre_ping=True,
+                pool_recycle=1800,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+            )
+            _engines[loop] = engine
+    return engine
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    global _sync_loop, _sync_loop_thread
+    with _sync_loop_lock:
+        if _sync_loop is None or _sync_loop.is_closed():
+            _sync_loop = asyncio.new_event_loop()
+            _sync_loop_thread = threading.Thread(target=_sync_loop.run_forever, name="InsightDBLoop", daemon=True)
+            _sync_loop_thread.start()
+        return _sync_loop
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """Run a coroutine from synchronous code and wait for its result.
+
+    All synchronous callers share one long-lived background loop, so its connection pool is reused
+    across calls instead of being rebuilt on a fresh loop per statement."""
+    loop = _get_sync_loop()
+    if threading.current_thread() is _sync_loop_thread:
+        raise RuntimeError("run_sync() cannot be called from the database loop itself, await the coroutine instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
 
 
 async def fetch_all(query: str, params: Optional[Union[Iterable[Any], Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
@@ -66,3 +106,27 @@ async def fetch_all(query: str, params: Optional[Union[Iterable[Any], Dict[str,
         return [dict(row) for row in rows]
 
 
+
+
+async def stream_all(query: str, params: Optional[Union[Iterable[Any], Dict[str, Any]]] = None, chunk_size: int = 500) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Execute a read-only query through a server-side cursor and yield the rows in chunks of dictionaries.
+
+    Rows are fetched from the database as the chunks are consumed, so at most one chunk is held in memory.
+    The connection stays checked out until the generator is exhausted or closed."""
+    engine: AsyncEngine = get_async_engine()
+    async with engine.connect() as conn:
+        result = await conn.stream(text(query), params or {})
+        async for partition in result.mappings().partitions(chunk_size):
+            yield [dict(row) for row in partition]
+
+
+def iter_sync(agen: AsyncIterator[T]) -> Iterator[T]:
+    """Consume an async generator from synchronous code, one item at a time on the shared background loop."""
+    try:
+        while True:
+            try:
+                yield run_sync(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        run_sync(agen.aclose())
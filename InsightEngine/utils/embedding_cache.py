@@ -0,0 +1,77 @@
+"""Sentence embedding cache for result clustering
+
+The same posts and comments are clustered again for every keyword, paragraph and reflection round.
+Embeddings are cached by (model name, sha1 of the text) in a TieredCache."""
+
+import hashlib
+import threading
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from .tiered_cache import TieredCache
+
+__all__ = [
+    "EmbeddingCache",
+    "get_embedding_cache",
+]
+
+
+class EmbeddingCache(TieredCache):
+    """float32 embeddings keyed by model name and text hash"""
+
+    def __init__(self, max_entries: int = 20000, db_path: Optional[str] = None, max_db_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            max_entries: embeddings kept in memory
+            db_path: SQLite file of the persistent tier, None keeps the cache in memory
+            max_db_bytes: size of the persistent tier above which the least recently used embeddings are evicted"""
+        super().__init__(
+            "embeddings", max_entries, db_path,
+            dumps=lambda embedding: embedding.tobytes(),
+            loads=lambda blob: np.frombuffer(blob, dtype=np.float32),
+            max_db_bytes=max_db_bytes,
+        )
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> str:
+        return f"{model_name}:{hashlib.sha1(text.encode('utf-8')).hexdigest()}"
+
+    def set_many(self, entries: Dict[str, np.ndarray]):
+        super().set_many({key: np.asarray(embedding, dtype=np.float32) for key, embedding in entries.items()})
+
+    def encode(self, model_name: str, texts: List[str], encode_fn: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        """Embed texts, running encode_fn only on the distinct texts missing from the cache
+
+        Args:
+            model_name: part of the key, embeddings of different models never mix
+            texts: texts to embed
+            encode_fn: model call returning one row per text
+
+        Returns:
+            (len(texts), dim) float32 array in input order"""
+        keys = [self.make_key(model_name, text) for text in texts]
+        found = self.get_many(keys)
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                missing.setdefault(key, text)
+        if missing:
+            fresh = dict(zip(missing, np.asarray(encode_fn(list(missing.values())), dtype=np.float32)))
+            self.set_many(fresh)
+            found.update(fresh)
+        return np.vstack([found[key] for key in keys])
+
+
+_embedding_caches: Dict[tuple, EmbeddingCache] = {}
+_embedding_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(max_entries: int = 20000, db_path: Optional[str] = None, max_db_bytes: int = 256 * 1024 * 1024) -> EmbeddingCache:
+    """Get the process-wide cache for these settings, shared by all agents"""
+    settings_key = (max_entries, db_path, max_db_bytes)
+    with _embedding_caches_lock:
+        cache = _embedding_caches.get(settings_key)
+        if cache is None:
+            cache = _embedding_caches[settings_key] = EmbeddingCache(*settings_key)
+        return cache
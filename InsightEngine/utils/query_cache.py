@@ -0,0 +1,251 @@
+"""Search tool result cache
+
+A research run calls the same MediaCrawlerDB tool with the same parameters many times (per keyword, per
+paragraph, per reflection). Results are cached under the tool name plus its normalized parameters:
+
+- an in-process LRU (always on)
+- an optional shared second tier: a directory of pickle files or a Redis server
+
+Every entry remembers the data version of the tables it was read from (see MediaCrawlerDB._atable_versions).
+An entry is served only while those versions are unchanged and it is younger than the TTL, so a new crawl
+invalidates the results that could have changed."""
+
+import os
+import json
+import time
+import pickle
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from loguru import logger
+
+from .tiered_cache import LRUCache
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+__all__ = [
+    "QueryResultCache",
+    "get_query_cache",
+    "make_cache_key",
+]
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    return value
+
+
+def make_cache_key(namespace: str, tool_name: str, params: Dict[str, Any]) -> str:
+    """Build the cache key of a tool call
+
+    Args:
+        namespace: separates databases sharing a second tier (e.g. the database name)
+        tool_name: tool name
+        params: tool parameters, whitespace in string values is normalized
+
+    Returns:
+        Hex digest key"""
+    payload = json.dumps([namespace, tool_name, _normalize(params)], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class _DiskTier:
+    """One pickle file per entry under a directory
+
+    Stale entries are deleted when they are read; files older than the TTL (and temporary files left by
+    an interrupted write) are swept at startup and then at most once per TTL from set()."""
+
+    def __init__(self, directory: str, ttl: int):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._last_sweep = 0.0
+        self.sweep()
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return (self.directory / f"{key}.pkl").read_bytes()
+        except OSError:
+            return None
+
+    def set(self, key: str, data: bytes, ttl: int):
+        # Write then rename so concurrent readers never see a partial file
+        path = self.directory / f"{key}.pkl"
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        if time.time() - self._last_sweep > self.ttl:
+            self.sweep()
+
+    def delete(self, key: str):
+        try:
+            (self.directory / f"{key}.pkl").unlink()
+        except OSError:
+            pass
+
+    def sweep(self) -> int:
+        """Delete the files older than the TTL
+
+        Returns:
+            Number of files deleted"""
+        self._last_sweep = time.time()
+        expire_before = self._last_sweep - self.ttl
+        removed = 0
+        for path in self.directory.iterdir():
+            if path.suffix not in ('.pkl', '.tmp'):
+                continue
+            try:
+                if path.stat().st_mtime < expire_before:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                pass  # Replaced or deleted by another process meanwhile
+        if removed:
+            logger.info(f"Search result cache: removed {removed} expired files from {self.directory}")
+        return removed
+
+
+class _RedisTier:
+    """Entries stored as Redis strings that expire with the TTL"""
+
+    KEY_PREFIX = "insight:query_cache:"
+
+    def __init__(self, url: str):
+        self.client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.KEY_PREFIX + key)
+
+    def set(self, key: str, data: bytes, ttl: int):
+        self.client.set(self.KEY_PREFIX + key, data, ex=ttl)
+
+    def delete(self, key: str):
+        self.client.delete(self.KEY_PREFIX + key)
+
+
+class QueryResultCache:
+    """Two-tier result cache validated by TTL and table data versions"""
+
+    def __init__(self, max_entries: int = 256, ttl: int = 600, disk_dir: Optional[str] = None,
+                 redis_url: Optional[str] = None, log_every: int = 50):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.log_every = log_every
+        self._memory = LRUCache(max_entries)
+        self._lock = threading.Lock()  # Guards the counters
+        self._stats = {'hits': 0, 'shared_hits': 0, 'misses': 0, 'stale': 0}
+        self._shared = None
+        if redis_url:
+            if REDIS_AVAILABLE:
+                self._shared = _RedisTier(redis_url)
+            else:
+                logger.warning("redis is not installed, the search result cache stays in process")
+        elif disk_dir:
+            self._shared = _DiskTier(disk_dir, ttl)
+
+    def _load(self, data: Optional[bytes], versions: Dict[str, Any]) -> Tuple[Any, bool]:
+        """Unpickle an entry
+
+        Returns:
+            (value or None, whether the entry exists but expired or was built from older data)"""
+        if data is None:
+            return None, False
+        created_at, entry_versions, value = pickle.loads(data)
+        if time.time() - created_at > self.ttl or entry_versions != versions:
+            return None, True
+        return value, False
+
+    def get(self, key: str, versions: Dict[str, Any]) -> Any:
+        """Look up an entry
+
+        Args:
+            key: key from make_cache_key
+            versions: current data versions of the tables the entry was read from
+
+        Returns:
+            A fresh copy of the cached value, or None on a miss"""
+        data = self._memory.get(key)
+        value, stale = self._load(data, versions)
+        tier = 'hits'
+
+        if value is None and self._shared is not None:
+            try:
+                data = self._shared.get(key)
+                value, shared_stale = self._load(data, versions)
+                if shared_stale:
+                    self._shared.delete(key)
+                stale = stale or shared_stale
+            except Exception as e:
+                logger.warning(f"Search result cache second tier unavailable, disabled: {e}")
+                self._shared = None
+            if value is not None:
+                self._memory.set(key, data)
+                tier = 'shared_hits'
+
+        self._count(tier if value is not None else 'misses', stale)
+        return value
+
+    def set(self, key: str, versions: Dict[str, Any], value: Any):
+        """Store an entry in every tier"""
+        data = pickle.dumps((time.time(), versions, value), protocol=pickle.HIGHEST_PROTOCOL)
+        self._memory.set(key, data)
+        if self._shared is not None:
+            try:
+                self._shared.set(key, data, self.ttl)
+            except Exception as e:
+                logger.warning(f"Search result cache second tier unavailable, disabled: {e}")
+                self._shared = None
+
+    def clear(self):
+        self._memory.clear()
+
+    def _count(self, outcome: str, stale: bool = False):
+        with self._lock:
+            self._stats[outcome] += 1
+            self._stats['stale'] += stale
+            lookups = self._stats['hits'] + self._stats['shared_hits'] + self._stats['misses']
+            should_log = self.log_every and lookups % self.log_every == 0
+        if should_log:
+            stats = self.stats()
+            logger.info(
+                f"Search result cache: {stats['hit_rate']:.1%} hit rate over {stats['lookups']} lookups "
+                f"({stats['hits']} memory, {stats['shared_hits']} shared, {stats['stale']} invalidated, {stats['entries']} entries)"
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and hit rate"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['entries'] = len(self._memory)
+        stats['lookups'] = stats['hits'] + stats['shared_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['hits'] + stats['shared_hits']) / stats['lookups'] if stats['lookups'] else 0.0
+        return stats
+
+
+_query_cache: Optional[QueryResultCache] = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_cache() -> QueryResultCache:
+    """Get the process-wide cache configured from settings"""
+    global _query_cache
+    with _query_cache_lock:
+        if _query_cache is None:
+            from InsightEngine.utils.config import settings
+            _query_cache = QueryResultCache(
+                max_entries=settings.DB_QUERY_CACHE_SIZE,
+                ttl=settings.DB_QUERY_CACHE_TTL,
+                disk_dir=settings.DB_QUERY_CACHE_DIR,
+                redis_url=settings.DB_QUERY_CACHE_REDIS_URL,
+            )
+        return _query_cache
@@ -0,0 +1,222 @@
+"""Shared cache tiers for InsightEngine
+
+- LRUCache: thread-safe in-memory LRU
+- TieredCache: an LRUCache optionally backed by a SQLite file (WAL mode), so entries survive restarts
+  and are shared between processes. Values are stored as blobs through the caller's dumps/loads; above
+  max_db_bytes the entries least recently read from or written to the file are evicted.
+
+The sentiment result cache and the clustering embedding cache are TieredCache instances; the search
+result cache uses LRUCache as its in-process tier."""
+
+import os
+import time
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+__all__ = [
+    "LRUCache",
+    "TieredCache",
+]
+
+SQLITE_BATCH_SIZE = 500  # Keys per SELECT ... IN (...), below SQLite's bound parameter limit
+DEFAULT_MAX_DB_BYTES = 256 * 1024 * 1024
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU mapping"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """Value of a key (marked as recently used), None when missing"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """key -> value for the keys found"""
+        found = {}
+        with self._lock:
+            for key in keys:
+                value = self._entries.get(key)
+                if value is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = value
+        return found
+
+    def set(self, key: str, value: Any):
+        self.set_many({key: value})
+
+    def set_many(self, entries: Dict[str, Any]):
+        with self._lock:
+            for key, value in entries.items():
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class TieredCache:
+    """In-memory LRU in front of an optional SQLite table"""
+
+    def __init__(self, table: str, max_entries: int, db_path: Optional[str] = None,
+                 dumps: Callable[[Any], bytes] = pickle.dumps, loads: Callable[[bytes], Any] = pickle.loads,
+                 max_db_bytes: int = DEFAULT_MAX_DB_BYTES):
+        """
+        Args:
+            table: SQLite table name, one per kind of entry
+            max_entries: entries kept in memory
+            db_path: SQLite file of the persistent tier, None keeps the cache in memory
+            dumps: value -> bytes for the SQLite tier
+            loads: bytes -> value for the SQLite tier
+            max_db_bytes: size of the stored values above which the SQLite tier evicts its least recently used entries"""
+        self.table = table
+        self.db_path = db_path
+        self.max_db_bytes = max_db_bytes
+        self.memory = LRUCache(max_entries)
+        self._dumps = dumps
+        self._loads = loads
+        self._lock = threading.Lock()  # Guards the SQLite connection and the counters
+        self._stats = {'hits': 0, 'db_hits': 0, 'misses': 0, 'evicted': 0}
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_bytes = 0  # Running total of the stored value sizes, recounted when it crosses max_db_bytes
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+                self._db = sqlite3.connect(db_path, timeout=5, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{table}" ('
+                    "cache_key TEXT PRIMARY KEY, value BLOB NOT NULL, add_ts INTEGER NOT NULL, "
+                    "last_used_ts REAL NOT NULL DEFAULT 0)"
+                )
+                columns = {row[1] for row in self._db.execute(f'PRAGMA table_info("{table}")')}
+                if 'last_used_ts' not in columns:
+                    # Files written before eviction existed
+                    self._db.execute(f'ALTER TABLE "{table}" ADD COLUMN last_used_ts REAL NOT NULL DEFAULT 0')
+                self._db.execute(f'CREATE INDEX IF NOT EXISTS "idx_{table}_last_used" ON "{table}" (last_used_ts)')
+                self._db.commit()
+                self._db_bytes = self._stored_bytes()
+            except sqlite3.Error as e:
+                logger.warning(f"Cache database {db_path} unavailable, {table} stays in memory: {e}")
+                self._db = None
+
+    @property
+    def max_entries(self) -> int:
+        return self.memory.max_entries
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Look up keys in memory, then the missing ones in SQLite
+
+        Returns:
+            key -> value for the keys found"""
+        found = self.memory.get_many(keys)
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        from_db = {}
+        with self._lock:
+            self._stats['hits'] += len(found)
+            if missing and self._db is not None:
+                try:
+                    for start in range(0, len(missing), SQLITE_BATCH_SIZE):
+                        part = missing[start:start + SQLITE_BATCH_SIZE]
+                        rows = self._db.execute(
+                            f'SELECT cache_key, value FROM "{self.table}" WHERE cache_key IN ({", ".join("?" for _ in part)})',
+                            part,
+                        ).fetchall()
+                        for key, blob in rows:
+                            from_db[key] = self._loads(blob)
+                    if from_db:
+                        now = time.time()
+                        self._db.executemany(
+                            f'UPDATE "{self.table}" SET last_used_ts = ? WHERE cache_key = ?',
+                            [(now, key) for key in from_db],
+                        )
+                        self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Cache database {self.db_path} unavailable, disabled: {e}")
+                    self._db = None
+            self._stats['db_hits'] += len(from_db)
+            self._stats['misses'] += len(missing) - len(from_db)
+        if from_db:
+            self.memory.set_many(from_db)
+            found.update(from_db)
+        return found
+
+    def set_many(self, entries: Dict[str, Any]):
+        """Store entries in memory and in the SQLite tier, then evict down to max_db_bytes"""
+        if not entries:
+            return
+        self.memory.set_many(entries)
+        with self._lock:
+            if self._db is None:
+                return
+            now = time.time()
+            rows = [(key, self._dumps(value), int(now), now) for key, value in entries.items()]
+            try:
+                self._db.executemany(
+                    f'INSERT OR REPLACE INTO "{self.table}" (cache_key, value, add_ts, last_used_ts) VALUES (?, ?, ?, ?)',
+                    rows,
+                )
+                self._db_bytes += sum(len(blob) for _, blob, _, _ in rows)
+                if self._db_bytes > self.max_db_bytes:
+                    self._evict()
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Cache database {self.db_path} unavailable, disabled: {e}")
+                self._db = None
+
+    def _stored_bytes(self) -> int:
+        return self._db.execute(f'SELECT COALESCE(SUM(LENGTH(value)), 0) FROM "{self.table}"').fetchone()[0]
+
+    def _evict(self):
+        # Caller holds the lock. The running total overcounts replaced entries and misses other processes'
+        # writes, so the exact size is recounted first; trims to 90% of the limit so this does not run on every write
+        total = self._stored_bytes()
+        if total <= self.max_db_bytes:
+            self._db_bytes = total
+            return
+        target = total - int(self.max_db_bytes * 0.9)
+        freed = 0
+        keys = []
+        for cache_key, size in self._db.execute(
+            f'SELECT cache_key, LENGTH(value) FROM "{self.table}" ORDER BY last_used_ts, add_ts'
+        ):
+            keys.append(cache_key)
+            freed += size
+            if freed >= target:
+                break
+        self._db.executemany(f'DELETE FROM "{self.table}" WHERE cache_key = ?', [(cache_key,) for cache_key in keys])
+        self._db_bytes = total - freed
+        self._stats['evicted'] += len(keys)
+        logger.info(f"Cache database {self.db_path}: evicted {len(keys)} {self.table} entries ({freed / 1024 / 1024:.1f} MB)")
+
+    def clear(self):
+        """Drop the in-memory entries, the SQLite tier is kept"""
+        self.memory.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and hit rate"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['entries'] = len(self.memory)
+        lookups = stats['hits'] + stats['db_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['hits'] + stats['db_hits']) / lookups if lookups else 0.0
+        return stats
@@ -4,8 +4,10 @@ Integrate all modules to achieve a complete in-depth search process"""
 import json
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, List, Tuple
 from loguru import logger
 from .llms import LLMClient
 from .nodes import (
@@ -16,11 +18,23 @@ from .nodes import (
     ReflectionSummaryNode,
     ReportFormattingNode
 )
-from .state import State
+from .state import Paragraph, State
 from .tools import BochaMultimodalSearch, BochaResponse, AnspireAISearch, AnspireResponse
 from .utils import settings, Settings, format_search_results_for_prompt
 
 
+def _tag_paragraph(record):
+    """Prefix the line with the paragraph being processed, parallel paragraphs interleave in the log"""
+    paragraph = record["extra"].get("paragraph")
+    if paragraph:
+        message = record["message"]
+        body = message.lstrip("\n")
+        record["message"] = f"{message[:len(message) - len(body)]}[{paragraph}] {body}"
+
+
+logger = logger.patch(_tag_paragraph)
+
+
 class DeepSearchAgent:
     """Deep Search Agent main class"""
     
@@ -42,6 +56,8 @@ class DeepSearchAgent:
         
         # state
         self.state = State()
+        self._checkpoint_path: Optional[str] = None
+        self._state_lock = threading.RLock()  # Guards the state shared by parallel paragraphs
         
         # Make sure the output directory exists
         os.makedirs(self.config.OUTPUT_DIR, exist_ok=True)
@@ -122,28 +138,48 @@ class DeepSearchAgent:
             logger.info(f"⚠️ Unknown search tool: {tool_name}, use the default comprehensive search")
             return self.search_agency.comprehensive_search(query)
     
-    def research(self, query: str, save_report: bool = True) -> str:
+    def research(self, query: str, save_report: bool = True, resume_from: Optional[str] = None) -> str:
         """Perform in-depth research
         
         Args:
             query: research query
             save_report: whether to save the report to a file
+            resume_from: checkpoint file of an interrupted run, its completed paragraphs and reflections are
+                skipped and the search of an unfinished step is replayed instead of run again
             
         Returns:
             Final report content"""
+        if resume_from:
+            self.state = State.load_from_file(resume_from)
+            if query and self.state.query and query != self.state.query:
+                logger.warning(f"Checkpoint was written for '{self.state.query}', resuming that research")
+            query = self.state.query or query
+            logger.info(f"Resuming from checkpoint: {resume_from}")
+
         logger.info(f"\n{'='*60}")
         logger.info(f"Start in-depth research: {query}")
         logger.info(f"{'='*60}")
+        self._checkpoint_path = self._checkpoint_file(query, resume_from)
+        if self._checkpoint_path:
+            logger.info(f"Checkpointing to {self._checkpoint_path}")
         
         try:
-            # Step 1: Generate report structure
-            self._generate_report_structure(query)
+            # Step 1: Generate report structure, a resumed checkpoint already has it
+            if resume_from and self.state.paragraphs:
+                logger.info(f"Report structure restored from checkpoint, {len(self.state.paragraphs)} paragraphs")
+            else:
+                self._generate_report_structure(query)
+                self._checkpoint()
             
             # Step 2: Process each paragraph
             self._process_paragraphs()
             
             # Step 3: Generate final report
-            final_report = self._generate_final_report()
+            if self.state.is_completed and self.state.final_report:
+                final_report = self.state.final_report
+            else:
+                final_report = self._generate_final_report()
+                self._checkpoint()
             
             # Step 4: Save report
             if save_report:
@@ -177,29 +213,105 @@ class DeepSearchAgent:
         logger.info(_message)
     
     def _process_paragraphs(self):
-        """process all paragraphs"""
+        """Process all paragraphs, up to MAX_PARALLEL_PARAGRAPHS of them at the same time
+
+        Paragraphs are independent until the final report: each one only mutates its own entry of
+        state.paragraphs, so the report keeps the planned paragraph order whatever finishes first.
+
+        The state object itself is shared (search history, timestamp, checkpoint serialization), so workers
+        never reassign self.state: node and search calls run unlocked and only their results are applied
+        under _state_lock."""
         total_paragraphs = len(self.state.paragraphs)
-        
-        for i in range(total_paragraphs):
-            logger.info(f"\n[Step 2.{i+1}] Process paragraphs: {self.state.paragraphs[i].title}")
-            logger.info("-" * 50)
-            
-            # Initial search and summary
-            self._initial_search_and_summary(i)
-            
-            # reflective cycle
-            self._reflection_loop(i)
-            
-            # Mark paragraph complete
-            self.state.paragraphs[i].research.mark_completed()
-            
-            progress = (i + 1) / total_paragraphs * 100
+        max_parallel = max(1, min(self.config.MAX_PARALLEL_PARAGRAPHS, total_paragraphs))
+        progress_lock = threading.Lock()
+        completed = 0
+
+        def process(i: int):
+            nonlocal completed
+            self._process_paragraph(i)
+            with progress_lock:
+                completed += 1
+                progress = completed / total_paragraphs * 100
             logger.info(f"Paragraph processing completed ({progress:.1f}%)")
+
+        if max_parallel == 1:
+            for i in range(total_paragraphs):
+                process(i)
+            return
+
+        def process_tagged(i: int):
+            with logger.contextualize(paragraph=f"P{i + 1}"):
+                process(i)
+
+        logger.info(f"Processing {total_paragraphs} paragraphs, {max_parallel} at a time")
+        with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="paragraph") as executor:
+            futures = [executor.submit(process_tagged, i) for i in range(total_paragraphs)]
+            try:
+                for future in futures:
+                    future.result()
+            except Exception:
+                # Same as the sequential loop: the first failure stops the research
+                for future in futures:
+                    future.cancel()
+                raise
+    
+    def _process_paragraph(self, paragraph_index: int):
+        """Research one paragraph: initial search and summary, then the reflection loop"""
+        paragraph = self.state.paragraphs[paragraph_index]
+        if paragraph.is_completed():
+            logger.info(f"\n[Step 2.{paragraph_index + 1}] Paragraph restored from checkpoint: {paragraph.title}")
+            return
+
+        logger.info(f"\n[Step 2.{paragraph_index + 1}] Process paragraphs: {paragraph.title}")
+        logger.info("-" * 50)
+
+        # Initial search and summary
+        self._initial_search_and_summary(paragraph_index)
+
+        # reflective cycle
+        self._reflection_loop(paragraph_index)
+
+        # Mark paragraph complete
+        with self._state_lock:
+            paragraph.research.mark_completed()
+        self._checkpoint()
     
     def _initial_search_and_summary(self, paragraph_index: int):
-        """Perform initial search and summary"""
+        """Perform initial search and summary, skipped when the checkpoint already has the summary"""
         paragraph = self.state.paragraphs[paragraph_index]
+        if paragraph.research.latest_summary:
+            logger.info("- Initial summary restored from checkpoint")
+            return
+
+        search_query, search_results = self._checkpointed_search(paragraph, self._initial_search)
+
+        # Generate initial summary
+        logger.info("- Generate initial summary...")
+        summary_input = {
+            "title": paragraph.title,
+            "content": paragraph.content,
+            "search_query": search_query,
+            "search_results": format_search_results_for_prompt(
+                search_results, self.config.SEARCH_CONTENT_MAX_LENGTH
+            )
+        }
         
+        summary = self.first_summary_node.run(summary_input)
+
+        # update status
+        with self._state_lock:
+            paragraph.research.latest_summary = summary
+            paragraph.research.clear_pending_search()
+            self.state.update_timestamp()
+        self._checkpoint()
+        
+        logger.info("- Initial summary completed")
+
+    def _initial_search(self, paragraph: Paragraph) -> Tuple[str, List[Dict[str, Any]]]:
+        """Generate the initial search query of a paragraph and run it
+
+        Returns:
+            (search query, search results)"""
         # Prepare search input
         search_input = {
             "title": paragraph.title,
@@ -253,96 +365,25 @@ class DeepSearchAgent:
             logger.info("- No search results found")
         
         # Update search history in status
-        paragraph.research.add_search_results(
-            search_query,
-            search_results,
-            search_tool=search_tool,
-            paragraph_title=paragraph.title,
-        )
-        
-        # Generate initial summary
-        logger.info("- Generate initial summary...")
-        summary_input = {
-            "title": paragraph.title,
-            "content": paragraph.content,
-            "search_query": search_query,
-            "search_results": format_search_results_for_prompt(
-                search_results, self.config.SEARCH_CONTENT_MAX_LENGTH
-            )
-        }
-        
-        # update status
-        self.state = self.first_summary_node.mutate_state(
-            summary_input, self.state, paragraph_index
-        )
-        
-        logger.info("- Initial summary completed")
-    
-    def _reflection_loop(self, paragraph_index: int):
-        """Execute a reflective cycle"""
-        paragraph = self.state.paragraphs[paragraph_index]
-        
-        for reflection_i in range(self.config.MAX_REFLECTIONS):
-            logger.info(f"- reflection {reflection_i + 1}/{self.config.MAX_REFLECTIONS}...")
-            
-            # Prepare reflective input
-            reflection_input = {
-                "title": paragraph.title,
-                "content": paragraph.content,
-                "paragraph_latest_state": paragraph.research.latest_summary
-            }
-            
-            # Generate reflective search queries
-            reflection_output = self.reflection_node.run(reflection_input)
-            search_query = reflection_output["search_query"]
-            search_tool = reflection_output.get("search_tool", "comprehensive_search")  # Default tool
-            reasoning = reflection_output["reasoning"]
-            
-            logger.info(f"Reflection query: {search_query}")
-            logger.info(f"Selected tool: {search_tool}")
-            logger.info(f"reflective reasoning: {reasoning}")
-            
-            # Perform a reflective search
-            # Handle special parameters
-            search_kwargs = {}
-            if search_tool in ["comprehensive_search", "web_search_only"]:
-                # These tools support the max_results parameter
-                search_kwargs["max_results"] = 10
-            
-            search_response = self.execute_search_tool(search_tool, search_query, **search_kwargs)
-            
-            # Convert to compatible format
-            search_results = []
-            if search_response and search_response.webpages:
-                # Each search tool has its specific number of results, here we take the top 10 as the upper limit
-                max_results = min(len(search_response.webpages), 10)
-                for result in search_response.webpages[:max_results]:
-                    search_results.append({
-                        'title': result.name,
-                        'url': result.url,
-                        'content': result.snippet,
-                        'score': None,  # Bocha API does not provide score
-                        'raw_content': result.snippet,
-                        'published_date': result.date_last_crawled
-                    })
-            
-            if search_results:
-                _message = f"Found {len(search_results)} reflection search results"
-                for j, result in enumerate(search_results, 1):
-                    date_info = f"(Published in: {result.get('published_date', 'N/A')})" if result.get('published_date') else ""
-                    _message += f"\n      {j}. {result['title'][:50]}...{date_info}"
-                logger.info(_message)
-            else:
-                logger.info("No reflection search results found")
-            
-            # Update search history
+        with self._state_lock:
             paragraph.research.add_search_results(
                 search_query,
                 search_results,
                 search_tool=search_tool,
                 paragraph_title=paragraph.title,
             )
-            
+
+        return search_query, search_results
+    
+    def _reflection_loop(self, paragraph_index: int):
+        """Execute a reflective cycle, continuing after the reflections already in the checkpoint"""
+        paragraph = self.state.paragraphs[paragraph_index]
+        
+        for reflection_i in range(paragraph.research.reflection_iteration, self.config.MAX_REFLECTIONS):
+            logger.info(f"- reflection {reflection_i + 1}/{self.config.MAX_REFLECTIONS}...")
+
+            search_query, search_results = self._checkpointed_search(paragraph, self._reflection_search)
+
             # Generate reflection summaries
             reflection_summary_input = {
                 "title": paragraph.title,
@@ -354,12 +395,124 @@ class DeepSearchAgent:
                 "paragraph_latest_state": paragraph.research.latest_summary
             }
             
+            updated_summary = self.reflection_summary_node.run(reflection_summary_input)
+
             # update status
-            self.state = self.reflection_summary_node.mutate_state(
-                reflection_summary_input, self.state, paragraph_index
-            )
+            with self._state_lock:
+                paragraph.research.latest_summary = updated_summary
+                paragraph.research.increment_reflection()
+                paragraph.research.clear_pending_search()
+                self.state.update_timestamp()
+            self._checkpoint()
             
             logger.info(f"Reflection {reflection_i + 1} completed")
+
+    def _reflection_search(self, paragraph: Paragraph) -> Tuple[str, List[Dict[str, Any]]]:
+        """Generate a reflective search query from the latest summary of a paragraph and run it
+
+        Returns:
+            (search query, search results)"""
+        # Prepare reflective input
+        reflection_input = {
+            "title": paragraph.title,
+            "content": paragraph.content,
+            "paragraph_latest_state": paragraph.research.latest_summary
+        }
+        
+        # Generate reflective search queries
+        reflection_output = self.reflection_node.run(reflection_input)
+        search_query = reflection_output["search_query"]
+        search_tool = reflection_output.get("search_tool", "comprehensive_search")  # Default tool
+        reasoning = reflection_output["reasoning"]
+        
+        logger.info(f"Reflection query: {search_query}")
+        logger.info(f"Selected tool: {search_tool}")
+        logger.info(f"reflective reasoning: {reasoning}")
+        
+        # Perform a reflective search
+        # Handle special parameters
+        search_kwargs = {}
+        if search_tool in ["comprehensive_search", "web_search_only"]:
+            # These tools support the max_results parameter
+            search_kwargs["max_results"] = 10
+        
+        search_response = self.execute_search_tool(search_tool, search_query, **search_kwargs)
+        
+        # Convert to compatible format
+        search_results = []
+        if search_response and search_response.webpages:
+            # Each search tool has its specific number of results, here we take the top 10 as the upper limit
+            max_results = min(len(search_response.webpages), 10)
+            for result in search_response.webpages[:max_results]:
+                search_results.append({
+                    'title': result.name,
+                    'url': result.url,
+                    'content': result.snippet,
+                    'score': None,  # Bocha API does not provide score
+                    'raw_content': result.snippet,
+                    'published_date': result.date_last_crawled
+                })
+        
+        if search_results:
+            _message = f"Found {len(search_results)} reflection search results"
+            for j, result in enumerate(search_results, 1):
+                date_info = f"(Published in: {result.get('published_date', 'N/A')})" if result.get('published_date') else ""
+                _message += f"\n      {j}. {result['title'][:50]}...{date_info}"
+            logger.info(_message)
+        else:
+            logger.info("No reflection search results found")
+        
+        # Update search history
+        with self._state_lock:
+            paragraph.research.add_search_results(
+                search_query,
+                search_results,
+                search_tool=search_tool,
+                paragraph_title=paragraph.title,
+            )
+
+        return search_query, search_results
+
+    def _checkpointed_search(
+        self, paragraph: Paragraph, search_fn: Callable[[Paragraph], Tuple[str, List[Dict[str, Any]]]]
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Run the search of a research step, or replay it if the checkpoint recorded it before the step's summary
+
+        Returns:
+            (search query, search results)"""
+        pending = paragraph.research.pending_search
+        if pending is not None:
+            logger.info(f"- Replaying checkpointed search: {pending['query']} ({len(pending['results'])} results)")
+            return pending["query"], pending["results"]
+
+        search_query, search_results = search_fn(paragraph)
+        with self._state_lock:
+            paragraph.research.set_pending_search(search_query, search_results)
+        self._checkpoint()
+        return search_query, search_results
+
+    def _checkpoint_file(self, query: str, resume_from: Optional[str] = None) -> Optional[str]:
+        """Checkpoint path of a research run, None when checkpointing is disabled"""
+        if not self.config.SAVE_CHECKPOINTS:
+            return None
+        if resume_from:
+            return resume_from
+        checkpoint_dir = os.path.join(self.config.OUTPUT_DIR, "checkpoints")
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        query_safe = "".join(c for c in query if c.isalnum() or c in (" ", "-", "_")).rstrip()
+        query_safe = query_safe.replace(" ", "_")[:30]
+        return os.path.join(checkpoint_dir, f"checkpoint_{query_safe}_{timestamp}.json")
+
+    def _checkpoint(self):
+        """Write the research state to the checkpoint file, paragraphs researched in parallel share one file"""
+        if not self._checkpoint_path:
+            return
+        with self._state_lock:
+            try:
+                self.state.save_to_file(self._checkpoint_path)
+            except Exception as e:
+                logger.warning(f"Checkpoint write failed, the research continues: {str(e)}")
     
     def _generate_final_report(self) -> str:
         """Generate final report"""
@@ -443,6 +596,8 @@ class AnspireSearchAgent(DeepSearchAgent):
         
         # state
         self.state = State()
+        self._checkpoint_path: Optional[str] = None
+        self._state_lock = threading.RLock()  # Guards the state shared by parallel paragraphs
         
         # Make sure the output directory exists
         os.makedirs(self.config.OUTPUT_DIR, exist_ok=True)
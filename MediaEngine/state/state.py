@@ -3,7 +3,9 @@ Define all state data structures and operation methods"""
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
+import os
 import json
+import tempfile
 from datetime import datetime
 
 
@@ -57,6 +59,7 @@ class Research:
     latest_summary: str = ""                                       # The latest summary of the current paragraph
     reflection_iteration: int = 0                                  # Reflection iterations
     is_completed: bool = False                                     # Whether research is completed
+    pending_search: Optional[Dict[str, Any]] = None                # Search of the step whose summary is not written yet
     
     def add_search(self, search: Search):
         """Add search history"""
@@ -103,6 +106,14 @@ class Research:
         """Get the number of searches"""
         return len(self.search_history)
     
+    def set_pending_search(self, query: str, results: List[Dict[str, Any]]):
+        """Keep the results of a search until its summary is written, a resumed run replays them"""
+        self.pending_search = {"query": query, "results": results}
+    
+    def clear_pending_search(self):
+        """The summary of the pending search has been written"""
+        self.pending_search = None
+    
     def increment_reflection(self):
         """Increase the number of reflections"""
         self.reflection_iteration += 1
@@ -117,7 +128,8 @@ class Research:
             "search_history": [search.to_dict() for search in self.search_history],
             "latest_summary": self.latest_summary,
             "reflection_iteration": self.reflection_iteration,
-            "is_completed": self.is_completed
+            "is_completed": self.is_completed,
+            "pending_search": self.pending_search
         }
     
     @classmethod
@@ -128,7 +140,8 @@ class Research:
             search_history=search_history,
             latest_summary=data.get("latest_summary", ""),
             reflection_iteration=data.get("reflection_iteration", 0),
-            is_completed=data.get("is_completed", False)
+            is_completed=data.get("is_completed", False),
+            pending_search=data.get("pending_search")
         )
 
 
@@ -276,9 +289,24 @@ class State:
         return cls.from_dict(data)
     
     def save_to_file(self, filepath: str):
-        """Save state to file"""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(self.to_json())
+        """Save state to file
+        
+        The JSON goes to a temporary file in the same directory that then replaces filepath, so an
+        interrupted write never leaves a truncated state file behind"""
+        json_str = self.to_json()
+        fd, tmp_path = tempfile.mkstemp(prefix=".state_", suffix=".tmp", dir=os.path.dirname(os.path.abspath(filepath)))
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(json_str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
     
     @classmethod
     def load_from_file(cls, filepath: str) -> "State":
@@ -41,6 +41,7 @@ class Settings(BaseSettings):
     SEARCH_CONTENT_MAX_LENGTH: int = Field(20000, description="Maximum content length to use for prompts")
     MAX_REFLECTIONS: int = Field(2, description="Maximum number of reflection rounds")
     MAX_PARAGRAPHS: int = Field(5, description="Maximum number of paragraphs")
+    MAX_PARALLEL_PARAGRAPHS: int = Field(1, description="Paragraphs researched at the same time, raise it within the LLM rate limits")
     
     MINDSPIDER_API_KEY: Optional[str] = Field(None, description="MindSpider API key")
     MINDSPIDER_BASE_URL: Optional[str] = Field("https://api.deepseek.com", description="MindSpider LLM interface BaseUrl")
@@ -48,6 +49,7 @@ class Settings(BaseSettings):
     
     OUTPUT_DIR: str = Field("reports", description="output directory")
     SAVE_INTERMEDIATE_STATES: bool = Field(True, description="Whether to save the intermediate state")
+    SAVE_CHECKPOINTS: bool = Field(True, description="Checkpoint the research state after every search and summary so research(query, resume_from=...) can continue an interrupted run")
 
     
     QUERY_ENGINE_API_KEY: str = Field(None, description="Query Agent (DeepSeek recommended, https://www.deepseek.com/) API key")
@@ -12,7 +12,7 @@ if str(project_root) not in sys.path:
     sys.path.append(str(project_root))
 
 from tools import utils
-from database.db_session import create_tables
+from database.db_session import create_tables, upgrade_tables
 
 async def init_table_schema(db_type: str):
     """
@@ -28,6 +28,16 @@ async def init_table_schema(db_type: str):
 async def init_db(db_type: str = None):
     await init_table_schema(db_type)
 
+async def upgrade_table_schema(db_type: str = None):
+    """
+    Brings existing tables up to date with the ORM models (columns added after the tables were created).
+    Args:
+        db_type: The type of database, defaults to config.SAVE_DATA_OPTION.
+    """
+    added = await upgrade_tables(db_type)
+    if added:
+        utils.logger.info(f"[upgrade_table_schema] added columns: {', '.join(added)}")
+
 async def close():
     """
     Placeholder for closing database connections if needed in the future.
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from contextlib import asynccontextmanager
 from .models import Base
+from .engagement import ensure_engagement_columns
 import config
 from config.db_config import mysql_db_config, sqlite_db_config, postgresql_db_config
 
@@ -67,6 +68,20 @@ async def create_tables(db_type: str = None):
     if engine:
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            # create_all does not alter existing tables, add the engagement columns introduced later
+            await conn.run_sync(ensure_engagement_columns, Base.metadata)
+
+
+async def upgrade_tables(db_type: str = None):
+    """Add columns introduced after a table was created, run before crawling into an existing database"""
+    if db_type is None:
+        db_type = config.SAVE_DATA_OPTION
+    engine = get_async_engine(db_type)
+    if engine:
+        async with engine.begin() as conn:
+            added = await conn.run_sync(ensure_engagement_columns, Base.metadata)
+        return added
+    return []
 
 
 @asynccontextmanager
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# @Desc: Engagement count normalisation and hotness scoring
+"""
+Platforms report engagement counts as text ("1.2万", "10万+", "3,456", "1.5w"). The store layer keeps those raw
+values and additionally writes integer shadow columns (<column>_num) and a weighted hotness_score, so hot-content
+queries can filter and sort on indexed numeric columns instead of casting every row.
+
+The weights mirror MediaCrawlerDB.search_hot_content in InsightEngine/tools/search.py.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional
+
+from sqlalchemy import MetaData, inspect, text
+from sqlalchemy.engine import Connection
+
+W_LIKE = 1.0
+W_COMMENT = 5.0
+W_SHARE = 10.0  # High-value interactions such as sharing/forwarding/favorites/coins
+W_VIEW = 0.1
+W_DANMAKU = 0.5
+
+NUMERIC_SUFFIX = "_num"
+HOTNESS_COLUMN = "hotness_score"
+
+# Column weights of the hotness score per content table
+HOTNESS_WEIGHTS: Dict[str, Dict[str, float]] = {
+    "bilibili_video": {
+        "liked_count": W_LIKE, "video_comment": W_COMMENT, "video_share_count": W_SHARE,
+        "video_favorite_count": W_SHARE, "video_coin_count": W_SHARE, "video_danmaku": W_DANMAKU,
+        "video_play_count": W_VIEW,
+    },
+    "douyin_aweme": {"liked_count": W_LIKE, "comment_count": W_COMMENT, "share_count": W_SHARE, "collected_count": W_SHARE},
+    "weibo_note": {"liked_count": W_LIKE, "comments_count": W_COMMENT, "shared_count": W_SHARE},
+    "xhs_note": {"liked_count": W_LIKE, "comment_count": W_COMMENT, "share_count": W_SHARE, "collected_count": W_SHARE},
+    "kuaishou_video": {"liked_count": W_LIKE, "viewd_count": W_VIEW},
+    "zhihu_content": {"voteup_count": W_LIKE, "comment_count": W_COMMENT},
+}
+
+# Text count columns that get an integer <column>_num shadow column (integer columns are used as they are)
+NUMERIC_SHADOW_COLUMNS: Dict[str, list] = {
+    "bilibili_video": ["video_comment", "video_share_count", "video_favorite_count", "video_coin_count", "video_danmaku", "video_play_count"],
+    "douyin_aweme": ["liked_count", "comment_count", "share_count", "collected_count"],
+    "weibo_note": ["liked_count", "comments_count", "shared_count"],
+    "xhs_note": ["liked_count", "comment_count", "share_count", "collected_count"],
+    "kuaishou_video": ["liked_count", "viewd_count"],
+    "zhihu_content": [],
+}
+
+# Publish time column used by the "hot in the last 24h/week" filter, indexed together with hotness_score
+HOTNESS_TIME_COLUMNS: Dict[str, str] = {
+    "bilibili_video": "create_time",
+    "douyin_aweme": "create_time",
+    "weibo_note": "create_date_time",
+    "xhs_note": "time",
+    "kuaishou_video": "create_time",
+    "zhihu_content": "created_time",
+}
+
+_UNIT_MULTIPLIERS = {"万": 10_000, "w": 10_000, "W": 10_000, "亿": 100_000_000, "千": 1_000, "k": 1_000, "K": 1_000}
+
+
+def parse_count(value: Any) -> int:
+    """
+    Convert a platform count into an integer
+    Args:
+        value: raw count, e.g. 123, "1,234", "1.2万", "10万+", "3亿", None
+
+    Returns:
+        non-negative integer, 0 when the value cannot be parsed
+    """
+    if value is None or isinstance(value, bool):
+        return 0
+    if isinstance(value, (int, float)):
+        return max(int(value), 0)
+    text = str(value).strip().replace(",", "").replace("+", "").replace(" ", "")
+    multiplier = 1
+    while text and text[-1] in _UNIT_MULTIPLIERS:
+        multiplier *= _UNIT_MULTIPLIERS[text[-1]]
+        text = text[:-1]
+    try:
+        return max(int(float(text) * multiplier), 0)
+    except ValueError:
+        return 0
+
+
+def shadow_column(column: str) -> str:
+    """Name of the integer shadow column of a text count column"""
+    return f"{column}{NUMERIC_SUFFIX}"
+
+
+def engagement_fields(table: str, values: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Compute the shadow columns and hotness score of one row
+    Args:
+        table: content table name
+        values: raw column values of the row
+
+    Returns:
+        {shadow column: int, "hotness_score": float}, empty for tables without a hotness score
+    """
+    weights = HOTNESS_WEIGHTS.get(table)
+    if not weights:
+        return {}
+    counts = {column: parse_count(values.get(column)) for column in weights}
+    fields: Dict[str, Any] = {shadow_column(column): counts[column] for column in NUMERIC_SHADOW_COLUMNS[table]}
+    fields[HOTNESS_COLUMN] = float(sum(counts[column] * weight for column, weight in weights.items()))
+    return fields
+
+
+def apply_engagement_fields(table: str, row: Any) -> None:
+    """
+    Refresh the shadow columns and hotness score of an ORM object from its raw count attributes
+    Args:
+        table: content table name
+        row: ORM instance of the table
+    """
+    weights = HOTNESS_WEIGHTS.get(table, {})
+    values = {column: getattr(row, column, None) for column in weights}
+    for key, value in engagement_fields(table, values).items():
+        setattr(row, key, value)
+
+
+def ensure_engagement_columns(conn: Connection, metadata: MetaData, tables: Optional[List[str]] = None) -> List[str]:
+    """
+    Add the shadow columns, hotness_score and hotness indexes declared in metadata to existing tables
+    create_all never alters a table that already exists, so this runs on every schema init; it is a no-op once
+    the columns are present.
+    Args:
+        conn: synchronous connection (use AsyncConnection.run_sync from async code)
+        metadata: ORM metadata declaring the columns (MediaCrawler models or MindSpider models_bigdata)
+        tables: content tables to migrate, defaults to all tables with a hotness score
+
+    Returns:
+        "table.column" of every column that was added
+    """
+    inspector = inspect(conn)
+    existing_tables = set(inspector.get_table_names())
+    quote = conn.dialect.identifier_preparer.quote
+    added = []
+    for table_name in tables or list(HOTNESS_WEIGHTS):
+        table = metadata.tables.get(table_name)
+        if table is None or table_name not in existing_tables:
+            continue
+        existing_columns = {column["name"] for column in inspector.get_columns(table_name)}
+        wanted = [shadow_column(column) for column in NUMERIC_SHADOW_COLUMNS[table_name]] + [HOTNESS_COLUMN]
+        for column_name in wanted:
+            if column_name in existing_columns or column_name not in table.columns:
+                continue
+            column_type = table.columns[column_name].type.compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {quote(table_name)} ADD COLUMN {quote(column_name)} {column_type}"))
+            added.append(f"{table_name}.{column_name}")
+
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table_name)}
+        for index in table.indexes:
+            if HOTNESS_COLUMN in index.columns and index.name not in existing_indexes:
+                index.create(bind=conn)
+    return added
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, Text, String, BigInteger
+from sqlalchemy import create_engine, Column, Integer, Text, String, BigInteger, Float
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -28,6 +28,13 @@ class BilibiliVideo(Base):
     video_comment = Column(Text)
     video_cover_url = Column(Text)
     source_keyword = Column(Text, default='')
+    video_comment_num = Column(BigInteger)
+    video_share_count_num = Column(BigInteger)
+    video_favorite_count_num = Column(BigInteger)
+    video_coin_count_num = Column(BigInteger)
+    video_danmaku_num = Column(BigInteger)
+    video_play_count_num = Column(BigInteger)
+    hotness_score = Column(Float)
 
 class BilibiliVideoComment(Base):
     __tablename__ = 'bilibili_video_comment'
@@ -119,6 +126,11 @@ class DouyinAweme(Base):
     music_download_url = Column(Text)
     note_download_url = Column(Text)
     source_keyword = Column(Text, default='')
+    liked_count_num = Column(BigInteger)
+    comment_count_num = Column(BigInteger)
+    share_count_num = Column(BigInteger)
+    collected_count_num = Column(BigInteger)
+    hotness_score = Column(Float)
 
 class DouyinAwemeComment(Base):
     __tablename__ = 'douyin_aweme_comment'
@@ -177,6 +189,9 @@ class KuaishouVideo(Base):
     video_cover_url = Column(Text)
     video_play_url = Column(Text)
     source_keyword = Column(Text, default='')
+    liked_count_num = Column(BigInteger)
+    viewd_count_num = Column(BigInteger)
+    hotness_score = Column(Float)
 
 class KuaishouVideoComment(Base):
     __tablename__ = 'kuaishou_video_comment'
@@ -212,6 +227,10 @@ class WeiboNote(Base):
     shared_count = Column(Text)
     note_url = Column(Text)
     source_keyword = Column(Text, default='')
+    liked_count_num = Column(BigInteger)
+    comments_count_num = Column(BigInteger)
+    shared_count_num = Column(BigInteger)
+    hotness_score = Column(Float)
 
 class WeiboNoteComment(Base):
     __tablename__ = 'weibo_note_comment'
@@ -289,6 +308,11 @@ class XhsNote(Base):
     note_url = Column(Text)
     source_keyword = Column(Text, default='')
     xsec_token = Column(Text)
+    liked_count_num = Column(BigInteger)
+    comment_count_num = Column(BigInteger)
+    share_count_num = Column(BigInteger)
+    collected_count_num = Column(BigInteger)
+    hotness_score = Column(Float)
 
 class XhsNoteComment(Base):
     __tablename__ = 'xhs_note_comment'
@@ -386,6 +410,7 @@ class ZhihuContent(Base):
     user_url_token = Column(Text)
     add_ts = Column(BigInteger)
     last_modify_ts = Column(BigInteger)
+    hotness_score = Column(Float)
 
     # persist-1<persist1@126.com>
     # Reason: Fix the ORM model definition error and ensure it is consistent with the database table structure.
@@ -69,7 +69,9 @@ async def main():
         print(f"Database {args.init_db} initialized successfully.")
         return  # Exit the main function cleanly
 
-
+    # Existing databases may predate columns the store layer writes
+    if config.SAVE_DATA_OPTION in ["db", "sqlite", "postgresql"]:
+        await db.upgrade_table_schema(config.SAVE_DATA_OPTION)
 
     crawler = CrawlerFactory.create_crawler(platform=config.PLATFORM)
     await crawler.start()
@@ -588,3 +588,11 @@ alter table douyin_aweme_comment add column `like_count` varchar(255) NOT NULL D
 alter table xhs_note add column xsec_token varchar(50) default null comment '签名算法';
 alter table douyin_aweme_comment add column `pictures` varchar(500) NOT NULL DEFAULT '' COMMENT '评论图片列表';
 alter table bilibili_video_comment add column `like_count` varchar(255) NOT NULL DEFAULT '0' COMMENT '点赞数';
+
+-- add numeric engagement shadow columns and hotness_score (see database/engagement.py)
+alter table bilibili_video add column `video_comment_num` bigint DEFAULT NULL COMMENT 'video_comment 数值', add column `video_share_count_num` bigint DEFAULT NULL COMMENT 'video_share_count 数值', add column `video_favorite_count_num` bigint DEFAULT NULL COMMENT 'video_favorite_count 数值', add column `video_coin_count_num` bigint DEFAULT NULL COMMENT 'video_coin_count 数值', add column `video_danmaku_num` bigint DEFAULT NULL COMMENT 'video_danmaku 数值', add column `video_play_count_num` bigint DEFAULT NULL COMMENT 'video_play_count 数值', add column `hotness_score` double DEFAULT NULL COMMENT '热度分';
+alter table douyin_aweme add column `liked_count_num` bigint DEFAULT NULL COMMENT 'liked_count 数值', add column `comment_count_num` bigint DEFAULT NULL COMMENT 'comment_count 数值', add column `share_count_num` bigint DEFAULT NULL COMMENT 'share_count 数值', add column `collected_count_num` bigint DEFAULT NULL COMMENT 'collected_count 数值', add column `hotness_score` double DEFAULT NULL COMMENT '热度分';
+alter table weibo_note add column `liked_count_num` bigint DEFAULT NULL COMMENT 'liked_count 数值', add column `comments_count_num` bigint DEFAULT NULL COMMENT 'comments_count 数值', add column `shared_count_num` bigint DEFAULT NULL COMMENT 'shared_count 数值', add column `hotness_score` double DEFAULT NULL COMMENT '热度分';
+alter table xhs_note add column `liked_count_num` bigint DEFAULT NULL COMMENT 'liked_count 数值', add column `comment_count_num` bigint DEFAULT NULL COMMENT 'comment_count 数值', add column `share_count_num` bigint DEFAULT NULL COMMENT 'share_count 数值', add column `collected_count_num` bigint DEFAULT NULL COMMENT 'collected_count 数值', add column `hotness_score` double DEFAULT NULL COMMENT '热度分';
+alter table kuaishou_video add column `liked_count_num` bigint DEFAULT NULL COMMENT 'liked_count 数值', add column `viewd_count_num` bigint DEFAULT NULL COMMENT 'viewd_count 数值', add column `hotness_score` double DEFAULT NULL COMMENT '热度分';
+alter table zhihu_content add column `hotness_score` double DEFAULT NULL COMMENT '热度分';
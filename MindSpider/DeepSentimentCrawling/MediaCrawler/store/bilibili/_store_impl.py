@@ -27,6 +27,7 @@ from sqlalchemy.orm import sessionmaker
 import config
 from base.base_crawler import AbstractStore
 from database.db_session import get_session
+from database.engagement import apply_engagement_fields
 from database.models import BilibiliVideoComment, BilibiliVideo, BilibiliUpInfo, BilibiliUpDynamic, BilibiliContactInfo
 from tools.async_file_writer import AsyncFileWriter
 from tools import utils, words
@@ -128,11 +129,12 @@ class BiliDbStoreImplement(AbstractStore):
 
             if not video_detail:
                 content_item["add_ts"] = utils.get_current_timestamp()
-                new_content = BilibiliVideo(**content_item)
-                session.add(new_content)
+                video_detail = BilibiliVideo(**content_item)
+                session.add(video_detail)
             else:
                 for key, value in content_item.items():
                     setattr(video_detail, key, value)
+            apply_engagement_fields("bilibili_video", video_detail)
             await session.commit()
 
     async def store_comment(self, comment_item: Dict):
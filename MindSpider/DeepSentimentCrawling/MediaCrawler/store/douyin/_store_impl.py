@@ -24,6 +24,7 @@ from sqlalchemy import select
 import config
 from base.base_crawler import AbstractStore
 from database.db_session import get_session
+from database.engagement import apply_engagement_fields
 from database.models import DouyinAweme, DouyinAwemeComment, DyCreator
 from tools import utils, words
 from tools.async_file_writer import AsyncFileWriter
@@ -95,11 +96,13 @@ class DouyinDbStoreImplement(AbstractStore):
             if not aweme_detail:
                 content_item["add_ts"] = utils.get_current_timestamp()
                 if content_item.get("title"):
-                    new_content = DouyinAweme(**content_item)
-                    session.add(new_content)
+                    aweme_detail = DouyinAweme(**content_item)
+                    session.add(aweme_detail)
             else:
                 for key, value in content_item.items():
                     setattr(aweme_detail, key, value)
+            if aweme_detail is not None:
+                apply_engagement_fields("douyin_aweme", aweme_detail)
             await session.commit()
 
     async def store_comment(self, comment_item: Dict):
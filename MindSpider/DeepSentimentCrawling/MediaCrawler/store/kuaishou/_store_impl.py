@@ -27,6 +27,7 @@ from sqlalchemy import select
 import config
 from base.base_crawler import AbstractStore
 from database.db_session import get_session
+from database.engagement import apply_engagement_fields
 from database.models import KuaishouVideo, KuaishouVideoComment
 from tools import utils, words
 from var import crawler_type_var
@@ -94,11 +95,12 @@ class KuaishouDbStoreImplement(AbstractStore):
 
             if not video_detail:
                 content_item["add_ts"] = utils.get_current_timestamp()
-                new_content = KuaishouVideo(**content_item)
-                session.add(new_content)
+                video_detail = KuaishouVideo(**content_item)
+                session.add(video_detail)
             else:
                 for key, value in content_item.items():
                     setattr(video_detail, key, value)
+            apply_engagement_fields("kuaishou_video", video_detail)
             await session.commit()
 
     async def store_comment(self, comment_item: Dict):
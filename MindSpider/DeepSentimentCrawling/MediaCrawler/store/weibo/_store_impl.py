@@ -30,6 +30,7 @@ from database.models import WeiboCreator, WeiboNote, WeiboNoteComment
 from tools import utils, words
 from tools.async_file_writer import AsyncFileWriter
 from database.db_session import get_session
+from database.engagement import apply_engagement_fields
 from var import crawler_type_var
 
 
@@ -112,6 +113,7 @@ class WeiboDbStoreImplement(AbstractStore):
                 content_item["last_modify_ts"] = utils.get_current_timestamp()
                 db_note = WeiboNote(**content_item)
                 session.add(db_note)
+            apply_engagement_fields("weibo_note", db_note)
             await session.commit()
 
     async def store_comment(self, comment_item: Dict):
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 
 from base.base_crawler import AbstractStore
 from database.db_session import get_session
+from database.engagement import apply_engagement_fields, engagement_fields
 from database.models import XhsNote, XhsNoteComment, XhsCreator
 
 from tools.async_file_writer import AsyncFileWriter
@@ -122,6 +123,7 @@ class XhsDbStoreImplement(AbstractStore):
             source_keyword=content_item.get("source_keyword", ""),
             xsec_token=content_item.get("xsec_token", "")
         )
+        apply_engagement_fields("xhs_note", note)
         session.add(note)
 
     async def update_content(self, session: AsyncSession, content_item: Dict):
@@ -135,6 +137,7 @@ class XhsDbStoreImplement(AbstractStore):
             "share_count": str(content_item.get("share_count")),
             "last_update_time": content_item.get("last_update_time"),
         }
+        update_data.update(engagement_fields("xhs_note", update_data))
         stmt = update(XhsNote).where(XhsNote.note_id == note_id).values(**update_data)
         await session.execute(stmt)
 
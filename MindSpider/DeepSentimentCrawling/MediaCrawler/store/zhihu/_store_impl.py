@@ -27,6 +27,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import config
 from base.base_crawler import AbstractStore
 from database.db_session import get_session
+from database.engagement import apply_engagement_fields
 from database.models import ZhihuContent, ZhihuComment, ZhihuCreator
 from tools import utils, words
 from var import crawler_type_var
@@ -101,8 +102,9 @@ class ZhihuDbStoreImplement(AbstractStore):
                 for key, value in content_item.items():
                     setattr(existing_content, key, value)
             else:
-                new_content = ZhihuContent(**content_item)
-                session.add(new_content)
+                existing_content = ZhihuContent(**content_item)
+                session.add(existing_content)
+            apply_engagement_fields("zhihu_content", existing_content)
             await session.commit()
 
     async def store_comment(self, comment_item: Dict):
@@ -0,0 +1,58 @@
+# Disclaimer: This code is for learning and research purposes only. Users should abide by the following principles:
+# 1. Not for any commercial purposes.
+# 2. When using, you should comply with the terms of use and robots.txt rules of the target platform.
+# 3. Do not conduct large-scale crawling or cause operational interference to the platform.
+# 4. The request frequency should be reasonably controlled to avoid unnecessary burden on the target platform.
+# 5. May not be used for any illegal or inappropriate purposes.
+#   
+# For detailed license terms, please refer to the LICENSE file in the project root directory.
+# By using this code, you agree to abide by the above principles and all terms in LICENSE.
+
+
+# -*- coding: utf-8 -*-
+# -*- coding: utf-8 -*-
+
+from sqlalchemy import create_engine, inspect, text
+
+from database.engagement import apply_engagement_fields, engagement_fields, ensure_engagement_columns, parse_count
+from database.models import Base
+
+
+def test_parse_count():
+    assert parse_count("1.2万") == 12000
+    assert parse_count("10万+") == 100000
+    assert parse_count("3亿") == 300000000
+    assert parse_count("1,234") == 1234
+    assert parse_count("1.5w") == 15000
+    assert parse_count(56) == 56
+    assert parse_count(None) == 0
+    assert parse_count("None") == 0
+    assert parse_count("") == 0
+
+
+def test_engagement_fields():
+    fields = engagement_fields("weibo_note", {"liked_count": "1万", "comments_count": "20", "shared_count": None})
+    assert fields == {"liked_count_num": 10000, "comments_count_num": 20, "shared_count_num": 0, "hotness_score": 10100.0}
+    assert engagement_fields("weibo_note_comment", {"like_count": "3"}) == {}
+
+
+def test_apply_engagement_fields():
+    class Row:
+        voteup_count = 3
+        comment_count = 2
+
+    row = Row()
+    apply_engagement_fields("zhihu_content", row)
+    assert row.hotness_score == 13.0
+
+
+def test_ensure_engagement_columns_upgrades_existing_table():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE weibo_note (id INTEGER PRIMARY KEY, liked_count TEXT)"))
+        added = ensure_engagement_columns(conn, Base.metadata)
+        assert added == ["weibo_note.liked_count_num", "weibo_note.comments_count_num",
+                         "weibo_note.shared_count_num", "weibo_note.hotness_score"]
+        assert ensure_engagement_columns(conn, Base.metadata) == []
+        columns = {column["name"] for column in inspect(conn).get_columns("weibo_note")}
+    assert {"liked_count_num", "hotness_score"} <= columns
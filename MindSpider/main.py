@@ -163,6 +163,29 @@ class MindSpider:
             logger.exception(f"Database initialization exception: {e}")
             return False
     
+    def migrate_database(self) -> bool:
+        """Add columns introduced after the tables were created (create_all never alters existing tables)"""
+        logger.info("Migrate database tables...")
+        
+        try:
+            result = subprocess.run(
+                [sys.executable, "engagement_columns.py", "--migrate"],
+                cwd=self.schema_path,
+                capture_output=True,
+                text=True
+            )
+            
+            if result.returncode == 0:
+                logger.info("Database migration successful")
+                return True
+            else:
+                logger.error(f"Database migration failed: {result.stderr}")
+                return False
+                
+        except Exception as e:
+            logger.exception(f"Database migration exception: {e}")
+            return False
+    
     def check_dependencies(self) -> bool:
         """Check dependency environment"""
         logger.info("Check dependencies...")
@@ -235,6 +258,10 @@ class MindSpider:
         if not target_date:
             target_date = date.today()
         
+        # The store layer writes the engagement columns, add them to tables created by an older version
+        if not self.migrate_database():
+            logger.warning("Database migration failed, MediaCrawler retries it when it starts")
+        
         try:
             cmd = [sys.executable, "main.py"]
             
@@ -274,6 +301,42 @@ class MindSpider:
             logger.exception(f"DeepSentimentCrawling module execution exception: {e}")
             return False
     
+    def run_topic_rollup(self, target_date: date = None, days: int = 7) -> bool:
+        """Rebuild the daily topic rollups read by InsightEngine's search_topic_overview"""
+        logger.info("Run the daily topic rollup...")
+        
+        if not target_date:
+            target_date = date.today()
+        
+        try:
+            cmd = [
+                sys.executable, "topic_rollup.py",
+                "--date", target_date.strftime("%Y-%m-%d"),
+                "--days", str(days)
+            ]
+            
+            logger.info(f"Execute command: {' '.join(cmd)}")
+            
+            result = subprocess.run(
+                cmd,
+                cwd=self.schema_path,
+                timeout=1800  # 30 minutes timeout
+            )
+            
+            if result.returncode == 0:
+                logger.info("Daily topic rollup was executed successfully")
+                return True
+            else:
+                logger.error(f"Daily topic rollup failed to execute, return code: {result.returncode}")
+                return False
+                
+        except subprocess.TimeoutExpired:
+            logger.error("Daily topic rollup execution timeout")
+            return False
+        except Exception as e:
+            logger.exception(f"Daily topic rollup execution exception: {e}")
+            return False
+    
     def run_complete_workflow(self, target_date: date = None, platforms: list = None,
                              keywords_count: int = 100, max_keywords: int = 50,
                              max_notes: int = 50, test_mode: bool = False) -> bool:
@@ -299,6 +362,11 @@ class MindSpider:
             logger.error("Sentiment crawling failed, but topic extraction was completed")
             return False
         
+        # Step 3: Refresh the rollups of the last week, the crawled posts may be older than the target date
+        logger.info("=== Step 3: Daily topic rollup ===")
+        if not self.run_topic_rollup(target_date):
+            logger.warning("Daily topic rollup failed, InsightEngine falls back to scanning the content tables")
+        
         logger.info("The complete workflow was executed successfully!")
         return True
     
@@ -351,6 +419,8 @@ class MindSpider:
             logger.info("Need to initialize database tables...")
             if not self.initialize_database():
                 return False
+        elif not self.migrate_database():
+            return False
         
         logger.info("MindSpider project initialization completed!")
         return True
@@ -368,6 +438,7 @@ def main():
     parser.add_argument("--broad-topic", action="store_true", help="Only run the topic extraction module")
     parser.add_argument("--deep-sentiment", action="store_true", help="Only run the sentiment crawler module")
     parser.add_argument("--complete", action="store_true", help="Run the complete workflow")
+    parser.add_argument("--rollup", action="store_true", help="Only rebuild the daily topic rollups")
     
     # Parameter configuration
     parser.add_argument("--date", type=str, help="Target date (YYYY-MM-DD), defaults to today")
@@ -377,6 +448,7 @@ def main():
     parser.add_argument("--keywords-count", type=int, default=100, help="The number of keywords extracted from the topic")
     parser.add_argument("--max-keywords", type=int, default=50, help="Maximum number of keywords per platform")
     parser.add_argument("--max-notes", type=int, default=50, help="Maximum number of crawled content per keyword")
+    parser.add_argument("--rollup-days", type=int, default=7, help="Number of publish days rebuilt by --rollup, ending at the target date")
     parser.add_argument("--test", action="store_true", help="Test mode (small amount of data)")
     
     args = parser.parse_args()
@@ -422,6 +494,8 @@ def main():
             spider.run_deep_sentiment_crawling(
                 target_date, args.platforms, args.max_keywords, args.max_notes, args.test
             )
+        elif args.rollup:
+            spider.run_topic_rollup(target_date, args.rollup_days)
         elif args.complete:
             spider.run_complete_workflow(
                 target_date, args.platforms, args.keywords_count, 
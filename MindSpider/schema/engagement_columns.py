@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""MindSpider numeric engagement migration tool
+Adds the integer engagement shadow columns, hotness_score and the (publish time, hotness_score) indexes declared in
+models_bigdata.py to existing tables, and backfills rows written before the MediaCrawler store layer maintained them.
+
+Usage:
+    python engagement_columns.py --migrate
+    python engagement_columns.py --backfill [--recompute] [--batch-size 2000]"""
+
+import sys
+import argparse
+from pathlib import Path
+from typing import List, Optional
+from loguru import logger
+from urllib.parse import quote_plus
+from sqlalchemy import create_engine, text, inspect
+from sqlalchemy.engine import Connection, Engine
+
+from models_sa import Base
+import models_bigdata  # noqa: F401 # Import to register all table classes
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+# The parsing and weights are shared with the MediaCrawler store layer
+sys.path.append(str(project_root / "DeepSentimentCrawling" / "MediaCrawler"))
+
+from database.engagement import HOTNESS_COLUMN, HOTNESS_WEIGHTS, NUMERIC_SHADOW_COLUMNS, engagement_fields, shadow_column
+from database.engagement import ensure_engagement_columns as add_engagement_columns
+
+
+def ensure_engagement_columns(conn: Connection, tables: Optional[List[str]] = None) -> None:
+    """Add missing shadow columns, hotness_score and hotness indexes (safe to run repeatedly)
+
+    Args:
+        conn: synchronous connection (use AsyncConnection.run_sync from async code)
+        tables: content tables to migrate, defaults to all tables with a hotness score"""
+    for column in add_engagement_columns(conn, Base.metadata, tables):
+        logger.info(f"Added column {column}")
+
+
+def backfill_engagement(engine: Engine, tables: Optional[List[str]] = None, batch_size: int = 2000, recompute: bool = False) -> None:
+    """Compute shadow columns and hotness_score for existing rows, batch by batch in primary key order
+
+    Args:
+        engine: database engine
+        tables: content tables to backfill, defaults to all tables with a hotness score
+        batch_size: rows per batch (one transaction each)
+        recompute: also recompute rows that already have a hotness score"""
+    existing_tables = set(inspect(engine).get_table_names())
+    for table_name in tables or list(HOTNESS_WEIGHTS):
+        if table_name not in existing_tables:
+            continue
+        quote = engine.dialect.identifier_preparer.quote
+        raw_columns = list(HOTNESS_WEIGHTS[table_name])
+        select_sql = (
+            f"SELECT id, {', '.join(quote(column) for column in raw_columns)} FROM {quote(table_name)} "
+            f"WHERE id > :last_id{'' if recompute else f' AND {HOTNESS_COLUMN} IS NULL'} ORDER BY id LIMIT :batch_size"
+        )
+        target_columns = [shadow_column(column) for column in NUMERIC_SHADOW_COLUMNS[table_name]] + [HOTNESS_COLUMN]
+        update_sql = (
+            f"UPDATE {quote(table_name)} SET {', '.join(f'{quote(column)} = :{column}' for column in target_columns)} "
+            f"WHERE id = :id"
+        )
+
+        last_id, updated = 0, 0
+        while True:
+            with engine.begin() as conn:
+                rows = conn.execute(text(select_sql), {"last_id": last_id, "batch_size": batch_size}).mappings().all()
+                if not rows:
+                    break
+                params = [dict(engagement_fields(table_name, row), id=row["id"]) for row in rows]
+                conn.execute(text(update_sql), params)
+            last_id = rows[-1]["id"]
+            updated += len(rows)
+            logger.info(f"{table_name}: {updated} rows backfilled (last id {last_id})")
+        logger.info(f"{table_name}: backfill finished, {updated} rows updated")
+
+
+def _build_engine() -> Engine:
+    from config import settings
+
+    dialect = (settings.DB_DIALECT or "mysql").lower()
+    if dialect in ("postgresql", "postgres"):
+        url = f"postgresql+psycopg://{settings.DB_USER}:{quote_plus(settings.DB_PASSWORD)}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
+    else:
+        url = f"mysql+pymysql://{settings.DB_USER}:{quote_plus(settings.DB_PASSWORD)}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}?charset={settings.DB_CHARSET}"
+    return create_engine(url, future=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MindSpider numeric engagement migration tool")
+    parser.add_argument("--migrate", action="store_true", help="Add missing engagement columns and hotness indexes")
+    parser.add_argument("--backfill", action="store_true", help="Compute engagement columns for existing rows")
+    parser.add_argument("--recompute", action="store_true", help="Recompute rows that already have a hotness score")
+    parser.add_argument("--batch-size", type=int, default=2000, help="Rows per backfill batch")
+    parser.add_argument("--tables", nargs="+", help="Only process these tables")
+
+    args = parser.parse_args()
+    if not (args.migrate or args.backfill):
+        args.migrate = args.backfill = True
+
+    engine = _build_engine()
+    try:
+        if args.migrate:
+            with engine.begin() as conn:
+                ensure_engagement_columns(conn, args.tables)
+        if args.backfill:
+            backfill_engagement(engine, args.tables, args.batch_size, args.recompute)
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
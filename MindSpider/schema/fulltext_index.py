@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""MindSpider full-text index management tool
+Creates, backfills and removes the full-text indexes used by the InsightEngine topic search tools.
+
+- MySQL: one FULLTEXT index per table (ft_<table>) over the searched columns, using the ngram parser
+  so that Chinese text is split into bigrams; rows are indexed on creation and maintained by MySQL.
+- PostgreSQL: a stored generated tsvector column (search_vector) plus a GIN index, using the text
+  search configuration mindspider_fts built on zhparser. Without zhparser no index is created: the
+  'simple' parser does not split Chinese into words, so the tables keep their LIKE scans.
+
+MediaCrawlerDB detects these objects at runtime and switches from LIKE scans to ranked full-text matching
+for the tables that have them.
+
+Usage:
+    python fulltext_index.py --status
+    python fulltext_index.py --create [--tables weibo_note weibo_note_comment]
+    python fulltext_index.py --drop"""
+
+import sys
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional
+from loguru import logger
+from urllib.parse import quote_plus
+from sqlalchemy import create_engine, text, inspect
+from sqlalchemy.engine import Engine
+
+from models_sa import Base
+import models_bigdata  # noqa: F401 # Import to register all table classes
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from config import settings
+
+# Columns searched by the InsightEngine topic tools, per table (must match InsightEngine/tools/search.py)
+FULLTEXT_FIELDS: Dict[str, List[str]] = {
+    'bilibili_video': ['title', 'desc', 'source_keyword'],
+    'bilibili_video_comment': ['content'],
+    'douyin_aweme': ['title', 'desc', 'source_keyword'],
+    'douyin_aweme_comment': ['content'],
+    'kuaishou_video': ['title', 'desc', 'source_keyword'],
+    'kuaishou_video_comment': ['content'],
+    'weibo_note': ['content', 'source_keyword'],
+    'weibo_note_comment': ['content'],
+    'xhs_note': ['title', 'desc', 'tag_list', 'source_keyword'],
+    'xhs_note_comment': ['content'],
+    'zhihu_content': ['title', 'desc', 'content_text', 'source_keyword'],
+    'zhihu_comment': ['content'],
+    'tieba_note': ['title', 'desc', 'source_keyword'],
+    'tieba_comment': ['content'],
+    'daily_news': ['title'],
+}
+
+PG_TS_CONFIG = "mindspider_fts"
+PG_VECTOR_COLUMN = "search_vector"
+
+
+def fulltext_index_name(table: str) -> str:
+    """Name of the MySQL FULLTEXT index / PostgreSQL GIN index of a table"""
+    return f"ft_{table}"
+
+
+def get_fulltext_fields(table: str) -> List[str]:
+    """Searched columns of a table that exist in the MindSpider schema"""
+    model_table = Base.metadata.tables.get(table)
+    fields = FULLTEXT_FIELDS.get(table, [])
+    if model_table is None:
+        return []
+    return [field for field in fields if field in model_table.columns]
+
+
+class FulltextIndexManager:
+    def __init__(self):
+        self.engine: Engine = None
+        self.dialect = (settings.DB_DIALECT or "mysql").lower()
+        self.connect()
+
+    def connect(self):
+        """Connect to database"""
+        try:
+            if self.dialect in ("postgresql", "postgres"):
+                url = f"postgresql+psycopg://{settings.DB_USER}:{quote_plus(settings.DB_PASSWORD)}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
+            else:
+                url = f"mysql+pymysql://{settings.DB_USER}:{quote_plus(settings.DB_PASSWORD)}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}?charset={settings.DB_CHARSET}"
+            self.engine = create_engine(url, future=True)
+            logger.info(f"Successfully connected to database: {settings.DB_NAME}")
+        except Exception as e:
+            logger.error(f"Database connection failed: {e}")
+            sys.exit(1)
+
+    def close(self):
+        """Close database connection"""
+        if self.engine:
+            self.engine.dispose()
+
+    @property
+    def is_postgres(self) -> bool:
+        return self.dialect in ("postgresql", "postgres")
+
+    def _existing_tables(self, tables: Optional[List[str]]) -> List[str]:
+        present = set(inspect(self.engine).get_table_names())
+        selected = tables or list(FULLTEXT_FIELDS)
+        for table in selected:
+            if table not in FULLTEXT_FIELDS:
+                logger.warning(f"{table}: not a searched table, skipped")
+        return [table for table in selected if table in FULLTEXT_FIELDS and table in present]
+
+    def has_index(self, table: str) -> bool:
+        """Whether the full-text index of a table exists"""
+        with self.engine.connect() as conn:
+            if self.is_postgres:
+                query = ("SELECT 1 FROM information_schema.columns "
+                         "WHERE table_schema = current_schema() AND table_name = :table AND column_name = :column")
+                return conn.execute(text(query), {"table": table, "column": PG_VECTOR_COLUMN}).first() is not None
+            query = ("SELECT 1 FROM information_schema.STATISTICS "
+                     "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND INDEX_NAME = :index")
+            return conn.execute(text(query), {"table": table, "index": fulltext_index_name(table)}).first() is not None
+
+    def get_pg_parser(self) -> Optional[str]:
+        """Parser of the mindspider_fts configuration, None when it does not exist"""
+        with self.engine.connect() as conn:
+            return conn.execute(text(
+                "SELECT p.prsname FROM pg_ts_config c JOIN pg_ts_parser p ON p.oid = c.cfgparser WHERE c.cfgname = :name"
+            ), {"name": PG_TS_CONFIG}).scalar()
+
+    def _ensure_pg_config(self) -> bool:
+        """Create the mindspider_fts text search configuration on zhparser
+
+        Returns:
+            Whether a zhparser based configuration is available"""
+        parser = self.get_pg_parser()
+        if parser == "zhparser":
+            return True
+        if parser is not None:
+            logger.warning(f"{PG_TS_CONFIG} uses the '{parser}' parser, which does not segment Chinese; run --drop and install zhparser")
+            return False
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS zhparser"))
+                conn.execute(text(f"CREATE TEXT SEARCH CONFIGURATION {PG_TS_CONFIG} (PARSER = zhparser)"))
+                conn.execute(text(f"ALTER TEXT SEARCH CONFIGURATION {PG_TS_CONFIG} ADD MAPPING FOR n,v,a,i,e,l,j WITH simple"))
+            logger.info(f"Text search configuration {PG_TS_CONFIG} created with zhparser")
+            return True
+        except Exception as e:
+            logger.warning(f"zhparser is not available ({e}), no full-text index is created and topic search keeps using LIKE")
+            return False
+
+    def create(self, tables: Optional[List[str]] = None):
+        """Create missing indexes; existing rows are indexed (backfilled) while the index is built"""
+        if self.is_postgres and not self._ensure_pg_config():
+            return
+        for table in self._existing_tables(tables):
+            fields = get_fulltext_fields(table)
+            if not fields:
+                continue
+            if self.has_index(table):
+                logger.info(f"{table}: full-text index already exists")
+                continue
+            logger.info(f"{table}: building full-text index over {', '.join(fields)} (existing rows are backfilled, this may take a while)")
+            with self.engine.begin() as conn:
+                if self.is_postgres:
+                    document = " || ' ' || ".join(f'coalesce("{field}", \'\')' for field in fields)
+                    conn.execute(text(
+                        f'ALTER TABLE "{table}" ADD COLUMN "{PG_VECTOR_COLUMN}" tsvector '
+                        f"GENERATED ALWAYS AS (to_tsvector('{PG_TS_CONFIG}', {document})) STORED"
+                    ))
+                    conn.execute(text(f'CREATE INDEX "{fulltext_index_name(table)}" ON "{table}" USING GIN ("{PG_VECTOR_COLUMN}")'))
+                else:
+                    columns = ", ".join(f"`{field}`" for field in fields)
+                    conn.execute(text(f"CREATE FULLTEXT INDEX `{fulltext_index_name(table)}` ON `{table}` ({columns}) WITH PARSER ngram"))
+            logger.info(f"{table}: full-text index created")
+
+    def drop(self, tables: Optional[List[str]] = None):
+        """Remove the indexes (topic search falls back to LIKE scans)"""
+        for table in self._existing_tables(tables):
+            if not self.has_index(table):
+                continue
+            with self.engine.begin() as conn:
+                if self.is_postgres:
+                    conn.execute(text(f'ALTER TABLE "{table}" DROP COLUMN "{PG_VECTOR_COLUMN}"'))
+                else:
+                    conn.execute(text(f"DROP INDEX `{fulltext_index_name(table)}` ON `{table}`"))
+            logger.info(f"{table}: full-text index dropped")
+        if self.is_postgres and tables is None and self.get_pg_parser() not in (None, "zhparser"):
+            with self.engine.begin() as conn:
+                conn.execute(text(f"DROP TEXT SEARCH CONFIGURATION IF EXISTS {PG_TS_CONFIG}"))
+            logger.info(f"Text search configuration {PG_TS_CONFIG} dropped")
+
+    def show_status(self, tables: Optional[List[str]] = None):
+        """Show which tables have a full-text index"""
+        status_message = "\n" + "=" * 60 + "Full-text index status" + "=" * 60 + "\n"
+        if self.is_postgres:
+            parser = self.get_pg_parser()
+            status_message += f"Text search configuration {PG_TS_CONFIG}: {parser or 'missing'}"
+            status_message += " (used)\n" if parser == "zhparser" else " (not used, topic search uses LIKE)\n"
+        for table in self._existing_tables(tables):
+            state = "indexed" if self.has_index(table) else "LIKE scan"
+            status_message += f"- {table:<25} {state:<10} ({', '.join(get_fulltext_fields(table))})\n"
+        logger.info(status_message)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MindSpider full-text index management tool")
+    parser.add_argument("--status", action="store_true", help="Show full-text index status")
+    parser.add_argument("--create", action="store_true", help="Create and backfill missing full-text indexes")
+    parser.add_argument("--drop", action="store_true", help="Drop the full-text indexes")
+    parser.add_argument("--tables", nargs="+", help="Only process these tables (default: all searched tables)")
+
+    args = parser.parse_args()
+
+    manager = FulltextIndexManager()
+    try:
+        if args.drop:
+            manager.drop(args.tables)
+        if args.create:
+            manager.create(args.tables)
+        if args.status or not (args.create or args.drop):
+            manager.show_status(args.tables)
+    finally:
+        manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,7 @@ project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
 from config import settings
+from engagement_columns import ensure_engagement_columns
 
 def _env(key: str, default: Optional[str] = None) -> Optional[str]:
     v = os.getenv(key)
@@ -103,6 +104,8 @@ async def main() -> None:
     # Create it once and SQLAlchemy automatically handles dependencies between tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all does not alter existing tables; add the numeric engagement columns added later
+        await conn.run_sync(ensure_engagement_columns)
 
     # Keep the original view creation and release logic
     dialect_name = engine.url.get_backend_name()
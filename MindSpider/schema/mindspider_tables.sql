@@ -105,6 +105,33 @@ CREATE TABLE `crawling_tasks` (
     FOREIGN KEY (`topic_id`) REFERENCES `daily_topics`(`topic_id`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT='爬取任务表';
 
+-- ----------------------------
+-- Table structure for topic_daily_rollup
+-- 话题每日汇总表：schema/topic_rollup.py按(关键词, 平台, 发布日期)预聚合，供InsightEngine概览查询
+-- ----------------------------
+DROP TABLE IF EXISTS `topic_daily_rollup`;
+CREATE TABLE `topic_daily_rollup` (
+    `id` int NOT NULL AUTO_INCREMENT COMMENT '自增ID',
+    `source_keyword` varchar(255) NOT NULL COMMENT '搜索关键词',
+    `topic_id` varchar(64) DEFAULT NULL COMMENT '关联的话题ID',
+    `platform` varchar(32) NOT NULL COMMENT '平台',
+    `stat_date` date NOT NULL COMMENT '发布日期',
+    `content_count` int DEFAULT 0 COMMENT '内容数量',
+    `liked_total` bigint DEFAULT 0 COMMENT '点赞总数',
+    `comment_total` bigint DEFAULT 0 COMMENT '评论总数',
+    `share_total` bigint DEFAULT 0 COMMENT '分享总数',
+    `view_total` bigint DEFAULT 0 COMMENT '播放/浏览总数',
+    `hotness_total` double DEFAULT 0 COMMENT '热度总分',
+    `sentiment_distribution` text COMMENT '情感分布(JSON格式)',
+    `top_posts` text COMMENT '热度最高的内容(JSON格式)',
+    `add_ts` bigint NOT NULL COMMENT '记录添加时间戳',
+    `last_modify_ts` bigint NOT NULL COMMENT '记录最后修改时间戳',
+    PRIMARY KEY (`id`),
+    UNIQUE KEY `uq_topic_rollup_unique` (`source_keyword`, `platform`, `stat_date`),
+    KEY `idx_topic_rollup_date` (`stat_date`),
+    KEY `idx_topic_rollup_topic` (`topic_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci COMMENT='话题每日汇总表';
+
 -- ===============================
 -- MediaCrawler表结构扩展字段
 -- ===============================
@@ -9,7 +9,7 @@ This module is based on MindSpider\DeepSentimentCrawling\MediaCrawler\database\m
 """
 
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import Integer, String, BigInteger, Text, ForeignKey
+from sqlalchemy import Integer, String, BigInteger, Text, ForeignKey, Float, Index
 
 # Use Base in models_sa to ensure all tables are in the same metadata and foreign key references work properly
 from models_sa import Base
@@ -40,6 +40,16 @@ class BilibiliVideo(Base):
     source_keyword: Mapped[str | None] = mapped_column(Text, default='', nullable=True)
     topic_id: Mapped[str | None] = mapped_column(String(64), ForeignKey("daily_topics.topic_id", ondelete="SET NULL"), nullable=True)
     crawling_task_id: Mapped[str | None] = mapped_column(String(64), ForeignKey("crawling_tasks.task_id", ondelete="SET NULL"), nullable=True)
+    # Numeric engagement maintained by the MediaCrawler store layer (see MediaCrawler/database/engagement.py)
+    video_comment_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    video_share_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    video_favorite_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    video_coin_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    video_danmaku_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    video_play_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    hotness_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    __table_args__ = (Index("idx_bilibili_video_time_hotness", "create_time", "hotness_score"),)
 
 class BilibiliVideoComment(Base):
     __tablename__ = "bilibili_video_comment"
@@ -137,6 +147,14 @@ class DouyinAweme(Base):
     source_keyword: Mapped[str | None] = mapped_column(Text, default='', nullable=True)
     topic_id: Mapped[str | None] = mapped_column(String(64), ForeignKey("daily_topics.topic_id", ondelete="SET NULL"), nullable=True)
     crawling_task_id: Mapped[str | None] = mapped_column(String(64), ForeignKey("crawling_tasks.task_id", ondelete="SET NULL"), nullable=True)
+    # Numeric engagement maintained by the MediaCrawler store layer (see MediaCrawler/database/engagement.py)
+    liked_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    comment_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    share_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    collected_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    hotness_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    __table_args__ = (Index("idx_douyin_aweme_time_hotness", "create_time", "hotness_score"),)
 
 class DouyinAwemeComment(Base):
     __tablename__ = "douyin_aweme_comment"
@@ -199,6 +217,12 @@ class KuaishouVideo(Base):
     source_keyword: Mapped[str | None] = mapped_column(Text, default='', nullable=True)
     topic_id: Mapped[str | None] = mapped_column(String(64), ForeignKey("daily_topics.topic_id", ondelete="SET NULL"), nullable=True)
     crawling_task_id: Mapped[str | None] = mapped_column(String(64), ForeignKey("crawling_tasks.task_id", ondelete="SET NULL"), nullable=True)
+    # Numeric engagement maintained by the MediaCrawler store layer (see MediaCrawler/database/engagement.py)
+    liked_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    viewd_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    hotness_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    __table_args__ = (Index("idx_kuaishou_video_time_hotness", "create_time", "hotness_score"),)
 
 class KuaishouVideoComment(Base):
     __tablename__ = "kuaishou_video_comment"
@@ -236,6 +260,13 @@ class WeiboNote(Base):
     source_keyword: Mapped[str | None] = mapped_column(Text, default='', nullable=True)
     topic_id: Mapped[str | None] = mapped_column(String(64), ForeignKey("daily_topics.topic_id", ondelete="SET NULL"), nullable=True)
     crawling_task_id: Mapped[str | None] = mapped_column(String(64), ForeignKey("crawling_tasks.task_id", ondelete="SET NULL"), nullable=True)
+    # Numeric engagement maintained by the MediaCrawler store layer (see MediaCrawler/database/engagement.py)
+    liked_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    comments_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    shared_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    hotness_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    __table_args__ = (Index("idx_weibo_note_time_hotness", "create_date_time", "hotness_score"),)
 
 class WeiboNoteComment(Base):
     __tablename__ = "weibo_note_comment"
@@ -318,6 +349,14 @@ class XhsNote(Base):
     xsec_token: Mapped[str | None] = mapped_column(Text, nullable=True)
     topic_id: Mapped[str | None] = mapped_column(String(64), ForeignKey("daily_topics.topic_id", ondelete="SET NULL"), nullable=True)
     crawling_task_id: Mapped[str | None] = mapped_column(String(64), ForeignKey("crawling_tasks.task_id", ondelete="SET NULL"), nullable=True)
+    # Numeric engagement maintained by the MediaCrawler store layer (see MediaCrawler/database/engagement.py)
+    liked_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    comment_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    share_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    collected_count_num: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    hotness_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    __table_args__ = (Index("idx_xhs_note_time_hotness", "time", "hotness_score"),)
 
 
 class XhsNoteComment(Base):
@@ -422,6 +461,10 @@ class ZhihuContent(Base):
     last_modify_ts: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     topic_id: Mapped[str | None] = mapped_column(String(64), ForeignKey("daily_topics.topic_id", ondelete="SET NULL"), nullable=True)
     crawling_task_id: Mapped[str | None] = mapped_column(String(64), ForeignKey("crawling_tasks.task_id", ondelete="SET NULL"), nullable=True)
+    # Numeric engagement maintained by the MediaCrawler store layer (see MediaCrawler/database/engagement.py)
+    hotness_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    __table_args__ = (Index("idx_zhihu_content_time_hotness", "created_time", "hotness_score"),)
 
 class ZhihuComment(Base):
     __tablename__ = "zhihu_comment"
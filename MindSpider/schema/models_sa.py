@@ -19,6 +19,7 @@ __all__ = [
     "DailyTopic",
     "TopicNewsRelation",
     "CrawlingTask",
+    "TopicDailyRollup",
 ]
 
 
@@ -122,3 +123,27 @@ class CrawlingTask(Base):
     last_modify_ts: Mapped[int] = mapped_column(BigInteger, nullable=False)
 
 
+class TopicDailyRollup(Base):
+    """Per (source keyword, platform, publish day) aggregates of the crawled content, built by schema/topic_rollup.py"""
+    __tablename__ = "topic_daily_rollup"
+    __table_args__ = (
+        UniqueConstraint("source_keyword", "platform", "stat_date", name="uq_topic_rollup_unique"),
+        Index("idx_topic_rollup_date", "stat_date"),
+        Index("idx_topic_rollup_topic", "topic_id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    source_keyword: Mapped[str] = mapped_column(String(255), nullable=False)
+    topic_id: Mapped[Optional[str]] = mapped_column(String(64))
+    platform: Mapped[str] = mapped_column(String(32), nullable=False)
+    stat_date: Mapped[date] = mapped_column(Date, nullable=False)
+    content_count: Mapped[int] = mapped_column(Integer, default=0)
+    liked_total: Mapped[int] = mapped_column(BigInteger, default=0)
+    comment_total: Mapped[int] = mapped_column(BigInteger, default=0)
+    share_total: Mapped[int] = mapped_column(BigInteger, default=0)
+    view_total: Mapped[int] = mapped_column(BigInteger, default=0)
+    hotness_total: Mapped[float] = mapped_column(Float, default=0.0)
+    sentiment_distribution: Mapped[Optional[str]] = mapped_column(Text)  # JSON {label: count}, filled with --sentiment
+    top_posts: Mapped[Optional[str]] = mapped_column(Text)  # JSON [{"table", "id", "hotness"}], hottest first
+    add_ts: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    last_modify_ts: Mapped[int] = mapped_column(BigInteger, nullable=False)
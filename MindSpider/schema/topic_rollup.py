@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""MindSpider daily topic rollup job
+Aggregates the crawled content per (source keyword, platform, publish day) into topic_daily_rollup: content count,
+engagement totals, hotness, the hottest posts and optionally the sentiment distribution of the hottest posts.
+InsightEngine's search_topic_overview tool reads these rows instead of scanning the raw tables.
+
+Rebuilding a day replaces its rows, so the job can be re-run after every crawl.
+
+Usage:
+    python topic_rollup.py                          # today
+    python topic_rollup.py --date 2025-08-22 --days 7 [--sentiment] [--top-n 10]"""
+
+import sys
+import json
+import time
+import heapq
+import types
+import argparse
+import importlib
+import unicodedata
+from collections import Counter
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from loguru import logger
+from urllib.parse import quote_plus
+from sqlalchemy import create_engine, text, inspect
+from sqlalchemy.engine import Engine
+
+from models_sa import Base
+import models_bigdata  # noqa: F401 # Import to register all table classes
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+# The count parsing and hotness weights are shared with the MediaCrawler store layer
+sys.path.append(str(project_root / "DeepSentimentCrawling" / "MediaCrawler"))
+
+from database.engagement import HOTNESS_COLUMN, HOTNESS_WEIGHTS, engagement_fields, parse_count
+
+ROLLUP_TABLE = "topic_daily_rollup"
+
+# Content table -> (platform, publish time column, time column format, text column)
+ROLLUP_SOURCES: Dict[str, tuple] = {
+    'bilibili_video': ('bilibili', 'create_time', 'sec', 'title'),
+    'douyin_aweme': ('douyin', 'create_time', 'ms', 'title'),
+    'kuaishou_video': ('kuaishou', 'create_time', 'ms', 'title'),
+    'weibo_note': ('weibo', 'create_date_time', 'str', 'content'),
+    'xhs_note': ('xhs', 'time', 'ms', 'title'),
+    'zhihu_content': ('zhihu', 'created_time', 'sec_str', 'title'),
+    'tieba_note': ('tieba', 'publish_time', 'str', 'title'),
+}
+
+# Rollup total -> raw count columns, the first one a table has is used
+ENGAGEMENT_TOTALS: Dict[str, tuple] = {
+    'liked_total': ('liked_count', 'voteup_count'),
+    'comment_total': ('video_comment', 'comment_count', 'comments_count', 'total_replay_num'),
+    'share_total': ('video_share_count', 'share_count', 'shared_count'),
+    'view_total': ('video_play_count', 'viewd_count'),
+}
+
+
+def _time_range(time_type: str, day: date) -> tuple:
+    """Bounds of one publish day in the format of the table's time column"""
+    start = datetime.combine(day, datetime.min.time())
+    end = start + timedelta(days=1)
+    if time_type == 'sec':
+        return int(start.timestamp()), int(end.timestamp())
+    if time_type == 'ms':
+        return int(start.timestamp() * 1000), int(end.timestamp() * 1000)
+    if time_type == 'sec_str':
+        return int(start.timestamp()), int(end.timestamp())
+    return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+
+def _keyword_key(keyword: str) -> str:
+    """Grouping key of a source keyword: spellings that the case- and accent-insensitive collation of
+    uq_topic_rollup_unique (utf8mb4_0900_ai_ci) treats as equal, e.g. "iPhone" and "iphone", share a key"""
+    decomposed = unicodedata.normalize('NFKD', keyword)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def _import_sentiment_module():
+    """Import InsightEngine.tools.sentiment_analyzer without running InsightEngine/__init__.py (it pulls in the whole agent)
+
+    The packages on the way are registered as bare modules over their directories unless already imported, so the
+    analyzer's relative imports (..utils.tiered_cache) still resolve. Returns None when the import fails."""
+    insight_root = project_root.parent / "InsightEngine"
+    for name, path in (("InsightEngine", insight_root), ("InsightEngine.utils", insight_root / "utils"),
+                       ("InsightEngine.tools", insight_root / "tools")):
+        if name not in sys.modules:
+            package = types.ModuleType(name)
+            package.__path__ = [str(path)]
+            sys.modules[name] = package
+    try:
+        return importlib.import_module("InsightEngine.tools.sentiment_analyzer")
+    except ImportError as e:
+        logger.warning(f"Sentiment analyzer cannot be imported, rollups are built without sentiment distribution: {e}")
+        return None
+
+
+def _load_sentiment_analyzer():
+    """The initialized InsightEngine sentiment analyzer, None when it is unavailable"""
+    module = _import_sentiment_module()
+    if module is None:
+        return None
+    analyzer = module.multilingual_sentiment_analyzer
+    if not analyzer.initialize():
+        logger.warning("Sentiment model unavailable, rollups are built without sentiment distribution")
+        return None
+    return analyzer
+
+
+class TopicRollupBuilder:
+    def __init__(self, engine: Engine, top_n: int = 10, sentiment_sample: int = 0):
+        """
+        Args:
+            engine: database engine
+            top_n: hottest posts kept per rollup row
+            sentiment_sample: hottest posts per rollup row classified for the sentiment distribution, 0 disables it
+        """
+        self.engine = engine
+        self.top_n = top_n
+        self.sentiment_sample = sentiment_sample
+        self.analyzer = _load_sentiment_analyzer() if sentiment_sample > 0 else None
+        self.quote = engine.dialect.identifier_preparer.quote
+        self.is_postgres = engine.dialect.name == 'postgresql'
+
+    def _select_sql(self, table: str, columns: List[str]) -> str:
+        _, time_col, time_type, text_col = ROLLUP_SOURCES[table]
+        wanted = ['id', 'source_keyword', 'topic_id', text_col]
+        for raw_columns in ENGAGEMENT_TOTALS.values():
+            wanted.extend(raw_columns)
+        wanted.extend(HOTNESS_WEIGHTS.get(table, {}))
+        selected = list(dict.fromkeys(column for column in wanted if column in columns))
+        time_expr = self.quote(time_col)
+        if time_type == 'sec_str':
+            time_expr = f"CAST({time_expr} AS {'BIGINT' if self.is_postgres else 'UNSIGNED'})"
+        return (f"SELECT {', '.join(self.quote(column) for column in selected)} FROM {self.quote(table)} "
+                f"WHERE {time_expr} >= :start AND {time_expr} < :end")
+
+    def _aggregate(self, table: str, rows: List[Dict[str, Any]], day: date) -> List[Dict[str, Any]]:
+        """Fold the rows of one table and day into rollup rows, one per source keyword
+
+        Keywords differing only in case or accents form one row (the unique key would reject the second one),
+        stored under their most frequent spelling."""
+        platform, _, _, text_col = ROLLUP_SOURCES[table]
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        spellings: Dict[str, Counter] = {}
+        for row in rows:
+            keyword = (row.get('source_keyword') or '').strip()[:255]
+            if keyword:
+                key = _keyword_key(keyword)
+                groups.setdefault(key, []).append(row)
+                spellings.setdefault(key, Counter())[keyword] += 1
+
+        now_ts = int(time.time() * 1000)
+        rollups = []
+        for key, group in groups.items():
+            keyword = spellings[key].most_common(1)[0][0]
+            totals = {name: 0 for name in ENGAGEMENT_TOTALS}
+            scored = []
+            for row in group:
+                for name, raw_columns in ENGAGEMENT_TOTALS.items():
+                    column = next((column for column in raw_columns if column in row), None)
+                    if column:
+                        totals[name] += parse_count(row[column])
+                scored.append((engagement_fields(table, row).get(HOTNESS_COLUMN, 0.0), row))
+
+            hottest = heapq.nlargest(max(self.top_n, self.sentiment_sample), scored, key=lambda item: item[0])
+            topic_ids = [row['topic_id'] for row in group if row.get('topic_id')]
+            rollups.append({
+                'source_keyword': keyword,
+                'topic_id': max(set(topic_ids), key=topic_ids.count) if topic_ids else None,
+                'platform': platform,
+                'stat_date': day,
+                'content_count': len(group),
+                **totals,
+                'hotness_total': float(sum(score for score, _ in scored)),
+                'sentiment_distribution': self._sentiment_distribution([row.get(text_col) for _, row in hottest[:self.sentiment_sample]]),
+                'top_posts': json.dumps([{'table': table, 'id': row['id'], 'hotness': score} for score, row in hottest[:self.top_n]]),
+                'add_ts': now_ts,
+                'last_modify_ts': now_ts,
+            })
+        return rollups
+
+    def _sentiment_distribution(self, texts: List[Optional[str]]) -> Optional[str]:
+        texts = [text_value for text_value in texts if text_value and text_value.strip()]
+        if self.analyzer is None or not texts:
+            return None
+        distribution: Dict[str, int] = {}
+        for result in self.analyzer.analyze_batch(texts, show_progress=False).results:
+            if result.success:
+                distribution[result.sentiment_label] = distribution.get(result.sentiment_label, 0) + 1
+        return json.dumps(distribution, ensure_ascii=False)
+
+    def build(self, days: List[date], tables: Optional[List[str]] = None):
+        """Rebuild the rollup rows of the given publish days"""
+        rollup_table = Base.metadata.tables[ROLLUP_TABLE]
+        rollup_table.create(bind=self.engine, checkfirst=True)
+        inspector = inspect(self.engine)
+        existing_tables = set(inspector.get_table_names())
+
+        for table in tables or list(ROLLUP_SOURCES):
+            if table not in ROLLUP_SOURCES or table not in existing_tables:
+                continue
+            columns = {column['name'] for column in inspector.get_columns(table)}
+            select_sql = self._select_sql(table, columns)
+            platform = ROLLUP_SOURCES[table][0]
+            for day in days:
+                start, end = _time_range(ROLLUP_SOURCES[table][2], day)
+                with self.engine.begin() as conn:
+                    rows = [dict(row) for row in conn.execute(text(select_sql), {'start': start, 'end': end}).mappings()]
+                    rollups = self._aggregate(table, rows, day)
+                    conn.execute(rollup_table.delete().where(rollup_table.c.platform == platform, rollup_table.c.stat_date == day))
+                    if rollups:
+                        conn.execute(rollup_table.insert(), rollups)
+                logger.info(f"{table} {day}: {len(rows)} rows -> {len(rollups)} rollup rows")
+
+
+def _build_engine() -> Engine:
+    from config import settings
+
+    dialect = (settings.DB_DIALECT or "mysql").lower()
+    if dialect in ("postgresql", "postgres"):
+        url = f"postgresql+psycopg://{settings.DB_USER}:{quote_plus(settings.DB_PASSWORD)}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
+    else:
+        url = f"mysql+pymysql://{settings.DB_USER}:{quote_plus(settings.DB_PASSWORD)}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}?charset={settings.DB_CHARSET}"
+    return create_engine(url, future=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MindSpider daily topic rollup job")
+    parser.add_argument("--date", type=str, help="Last publish day to rebuild (YYYY-MM-DD), defaults to today")
+    parser.add_argument("--days", type=int, default=1, help="Number of publish days to rebuild, ending at --date")
+    parser.add_argument("--top-n", type=int, default=10, help="Hottest posts kept per keyword, platform and day")
+    parser.add_argument("--sentiment", action="store_true", help="Classify the hottest posts for the sentiment distribution")
+    parser.add_argument("--sentiment-sample", type=int, default=50, help="Posts classified per keyword, platform and day")
+    parser.add_argument("--tables", nargs="+", help="Only process these content tables")
+
+    args = parser.parse_args()
+    try:
+        last_day = datetime.strptime(args.date, "%Y-%m-%d").date() if args.date else date.today()
+    except ValueError:
+        logger.error("Error: Date format is incorrect, please use YYYY-MM-DD format")
+        sys.exit(1)
+    days = [last_day - timedelta(days=offset) for offset in range(max(args.days, 1))]
+
+    engine = _build_engine()
+    try:
+        builder = TopicRollupBuilder(engine, args.top_n, args.sentiment_sample if args.sentiment else 0)
+        builder.build(days, args.tables)
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
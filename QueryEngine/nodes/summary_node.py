@@ -2,7 +2,7 @@
 Responsible for generating and updating paragraph content based on search results"""
 
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from json.decoder import JSONDecodeError
 from loguru import logger
 
@@ -28,6 +28,13 @@ except ImportError:
     FORUM_READER_AVAILABLE = False
     logger.warning("Warning: The forum_reader module cannot be imported and the HOST forum reading function will be skipped.")
 
+# Import forum event bus (ForumEngine falls back to reading the logs when unavailable)
+try:
+    from utils.forum_event_bus import publish_summary_event
+    FORUM_EVENT_BUS_AVAILABLE = True
+except ImportError:
+    FORUM_EVENT_BUS_AVAILABLE = False
+
 
 class FirstSummaryNode(StateMutationNode):
     """Generate the node for the first summary of the paragraph based on the search results."""
@@ -100,9 +107,13 @@ class FirstSummaryNode(StateMutationNode):
             )
             
             # Handle response
-            processed_response = self.process_output(response)
+            processed_response, extracted = self._parse_output(response)
             
             logger.info("Successfully generated the first paragraph summary")
+            
+            # Publish the summary to ForumEngine, fallback texts never reached the forum from the log either
+            if FORUM_EVENT_BUS_AVAILABLE and extracted:
+                publish_summary_event("query", self.node_name, processed_response)
             return processed_response
             
         except Exception as e:
@@ -117,6 +128,13 @@ class FirstSummaryNode(StateMutationNode):
             
         Returns:
             Paragraph content"""
+        return self._parse_output(output)[0]
+
+    def _parse_output(self, output: str) -> Tuple[str, bool]:
+        """Parse LLM output
+
+        Returns:
+            (paragraph content, whether it was extracted from the JSON output rather than a fallback text)"""
         try:
             # Clean response text
             cleaned_output = remove_reasoning_from_output(output)
@@ -140,24 +158,24 @@ class FirstSummaryNode(StateMutationNode):
                     except JSONDecodeError:
                         logger.error("JSON repair failed, use the cleaned text directly")
                         # If it is not in JSON format, return the cleaned text directly.
-                        return cleaned_output
+                        return cleaned_output, False
                 else:
                     logger.error("Unable to repair JSON, use cleaned text directly")
                     # If it is not in JSON format, return the cleaned text directly.
-                    return cleaned_output
+                    return cleaned_output, False
             
             # Extract paragraph content
             if isinstance(result, dict):
                 paragraph_content = result.get("paragraph_latest_state", "")
                 if paragraph_content:
-                    return paragraph_content
+                    return paragraph_content, True
             
             # If extraction fails, return the original cleaned text
-            return cleaned_output
+            return cleaned_output, False
             
         except Exception as e:
             logger.exception(f"Failed to process output: {str(e)}")
-            return "Paragraph summary generation failed"
+            return "Paragraph summary generation failed", False
     
     def mutate_state(self, input_data: Any, state: State, paragraph_index: int, **kwargs) -> State:
         """Update the latest summary of the paragraph to the status
@@ -260,9 +278,13 @@ class ReflectionSummaryNode(StateMutationNode):
             )
             
             # Handle response
-            processed_response = self.process_output(response)
+            processed_response, extracted = self._parse_output(response)
             
             logger.info("Successfully generated reflection summary")
+            
+            # Publish the summary to ForumEngine, fallback texts never reached the forum from the log either
+            if FORUM_EVENT_BUS_AVAILABLE and extracted:
+                publish_summary_event("query", self.node_name, processed_response)
             return processed_response
             
         except Exception as e:
@@ -277,6 +299,13 @@ class ReflectionSummaryNode(StateMutationNode):
             
         Returns:
             Updated paragraph content"""
+        return self._parse_output(output)[0]
+
+    def _parse_output(self, output: str) -> Tuple[str, bool]:
+        """Parse LLM output
+
+        Returns:
+            (updated paragraph content, whether it was extracted from the JSON output rather than a fallback text)"""
         try:
             # Clean response text
             cleaned_output = remove_reasoning_from_output(output)
@@ -300,24 +329,24 @@ class ReflectionSummaryNode(StateMutationNode):
                     except JSONDecodeError:
                         logger.error("JSON repair failed, use the cleaned text directly")
                         # If it is not in JSON format, return the cleaned text directly.
-                        return cleaned_output
+                        return cleaned_output, False
                 else:
                     logger.error("Unable to repair JSON, use cleaned text directly")
                     # If it is not in JSON format, return the cleaned text directly.
-                    return cleaned_output
+                    return cleaned_output, False
             
             # Extract updated paragraph content
             if isinstance(result, dict):
                 updated_content = result.get("updated_paragraph_latest_state", "")
                 if updated_content:
-                    return updated_content
+                    return updated_content, True
             
             # If extraction fails, return the original cleaned text
-            return cleaned_output
+            return cleaned_output, False
             
         except Exception as e:
             logger.exception(f"Failed to process output: {str(e)}")
-            return "Reflection summary generation failed"
+            return "Reflection summary generation failed", False
     
     def mutate_state(self, input_data: Any, state: State, paragraph_index: int, **kwargs) -> State:
         """Write updated summary to status
@@ -35,11 +35,13 @@ class Settings(BaseSettings):
     SEARCH_CONTENT_MAX_LENGTH: int = Field(20000, description="Maximum content length to use for prompts")
     MAX_REFLECTIONS: int = Field(2, description="Maximum number of reflection rounds")
     MAX_PARAGRAPHS: int = Field(5, description="Maximum number of paragraphs")
+    MAX_PARALLEL_PARAGRAPHS: int = Field(1, description="Paragraphs researched at the same time, raise it within the LLM rate limits")
     MAX_SEARCH_RESULTS: int = Field(20, description="Maximum number of search results")
     
     # ================== Output configuration ====================
     OUTPUT_DIR: str = Field("reports", description="output directory")
     SAVE_INTERMEDIATE_STATES: bool = Field(True, description="Whether to save the intermediate state")
+    SAVE_CHECKPOINTS: bool = Field(True, description="Checkpoint the research state after every search and summary so research(query, resume_from=...) can continue an interrupted run")
     
     class Config:
         env_file = ENV_FILE
@@ -68,6 +70,7 @@ def print_config(config: Settings):
     message += f"Maximum number of search results: {config.MAX_SEARCH_RESULTS}\n"
     message += f"Output directory: {config.OUTPUT_DIR}\n"
     message += f"Save intermediate states: {config.SAVE_INTERMEDIATE_STATES}\n"
+    message += f"Save checkpoints: {config.SAVE_CHECKPOINTS}\n"
     message += f"LLM API Key: {'configured' if config.QUERY_ENGINE_API_KEY else 'not configured'}\n"
     message += "========================\n"
     logger.info(message)
@@ -8,12 +8,16 @@ os.environ['PYTHONIOENCODING'] = 'utf-8'
 os.environ['PYTHONUTF8'] = '1'
 os.environ['PYTHONUNBUFFERED'] = '1'  # Disable Python output buffering to ensure real-time log output
 
+import gzip
+import json
 import subprocess
 import time
 import threading
 from datetime import datetime
 from queue import Queue
-from flask import Flask, render_template, request, jsonify, Response
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 from flask_socketio import SocketIO, emit
 import atexit
 import requests
@@ -21,6 +25,8 @@ from loguru import logger
 import importlib
 from pathlib import Path
 from MindSpider.main import MindSpider
+from utils.log_tailer import LogTailer, read_tail_lines
+from utils.forum_reader import get_forum_log_index
 
 # ImportReportEngine
 try:
@@ -427,71 +433,41 @@ def parse_forum_log_line(line):
 # Store the historical log sending location of each client
 forum_log_positions = {}
 
-def monitor_forum_log():
-    """Monitor changes in the forum.log file and push them to the front end"""
-    import time
-    from pathlib import Path
-
-    forum_log_file = LOG_DIR / "forum.log"
-    last_position = 0
-    processed_lines = set()  # Used to track processed rows to avoid duplication
+def _emit_forum_lines(lines):
+    """Push a batch of new forum.log lines to the front end"""
+    timestamp = datetime.now().strftime('%H:%M:%S')
+    console_lines = []
+    for line in lines:
+        if not line.strip():
+            continue
+
+        # Parse log lines and send forum messages
+        parsed_message = parse_forum_log_line(line)
+        if parsed_message:
+            socketio.emit('forum_message', parsed_message)
+
+        console_lines.append(f"[{timestamp}] {line}")
+
+    if console_lines:
+        # One frame per batch; 'line' keeps the joined text for clients that only read a single line
+        socketio.emit('console_output', {
+            'app': 'forum',
+            'line': '\n'.join(console_lines),
+            'lines': console_lines
+        })
 
-    # If the file exists, get the initial position but don't skip the content
-    if forum_log_file.exists():
-        with open(forum_log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            # Log file size but don't add to processed_lines
-            # This way users can get the history when they open the forum tag.
-            f.seek(0, 2)  # Move to end of file
-            last_position = f.tell()
+def monitor_forum_log():
+    """Monitor changes in the forum.log file and push them to the front end
 
-    while True:
-        try:
-            if forum_log_file.exists():
-                with open(forum_log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    f.seek(last_position)
-                    new_lines = f.readlines()
-
-                    if new_lines:
-                        for line in new_lines:
-                            line = line.rstrip('\n\r')
-                            if line.strip():
-                                line_hash = hash(line.strip())
-
-                                # Avoid processing the same row twice
-                                if line_hash in processed_lines:
-                                    continue
-
-                                processed_lines.add(line_hash)
-
-                                # Parse log lines and send forum messages
-                                parsed_message = parse_forum_log_line(line)
-                                if parsed_message:
-                                    socketio.emit('forum_message', parsed_message)
-
-                                # Only send console messages when the console displays the forum
-                                timestamp = datetime.now().strftime('%H:%M:%S')
-                                formatted_line = f"[{timestamp}] {line}"
-                                socketio.emit('console_output', {
-                                    'app': 'forum',
-                                    'line': formatted_line
-                                })
-
-                        last_position = f.tell()
-
-                        # Clean the processed_lines collection to avoid memory leaks (keep hashes of the last 1000 lines)
-                        if len(processed_lines) > 1000:
-                            # Keep hashes of the last 500 rows
-                            recent_hashes = list(processed_lines)[-500:]
-                            processed_lines = set(recent_hashes)
-
-            time.sleep(1)  # Check every second
-        except Exception as e:
-            logger.error(f"Forum log monitoring error: {e}")
-            time.sleep(5)
+    The tailer follows forum.log by byte offset and inode, so truncation by init_forum_log and
+    the unlink+recreate done by ForumEngine are both picked up without re-reading old lines.
+    Existing content is skipped; clients fetch history through /api/forum/log."""
+    tailer = LogTailer(LOG_DIR / "forum.log", _emit_forum_lines, start_at_end=True)
+    tailer.start()
+    return tailer
 
-# Start the Forum log listening thread
-forum_monitor_thread = threading.Thread(target=monitor_forum_log, daemon=True)
-forum_monitor_thread.start()
+# Start the Forum log listener
+forum_log_tailer = monitor_forum_log()
 
 # Global variables store process information
 processes = {
@@ -530,104 +506,164 @@ output_queues = {
     'forum': Queue()
 }
 
+# Engine output pipelines (one per started Streamlit app)
+OUTPUT_RING_SIZE = 5000  # Lines kept in memory per engine for /api/output
+OUTPUT_FLUSH_INTERVAL = 0.1  # Seconds between batched console_output frames and log flushes
+output_pipelines = {}
+
+
+class EngineOutputPipeline:
+    """Output pipeline of one engine process
+
+    Lines are appended to a persistent buffered log handle and to an in-memory ring buffer, and
+    are pushed to the front end as one console_output frame per flush interval instead of one
+    event (and one file open) per line."""
+
+    def __init__(self, app_name, max_lines=OUTPUT_RING_SIZE, flush_interval=OUTPUT_FLUSH_INTERVAL):
+        self.app_name = app_name
+        self.flush_interval = flush_interval
+        self.lines = deque(maxlen=max_lines)
+        self._pending = []
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._log_file = open(LOG_DIR / f"{app_name}.log", 'a', encoding='utf-8', buffering=64 * 1024)
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+
+    @property
+    def closed(self):
+        return self._closed.is_set()
+
+    def write(self, line, emit_line=True):
+        """Record one formatted line; it is written and emitted on the next flush
+
+        After close() lines only go to the ring buffer: the log file may already belong to the
+        next run of the engine."""
+        with self._lock:
+            self.lines.append(line)
+            if self._log_file.closed:
+                return
+            self._log_file.write(line + '\n')
+            if emit_line:
+                self._pending.append(line)
+
+    def flush(self):
+        """Flush the log handle and emit pending lines as one frame"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if not self._log_file.closed:
+                self._log_file.flush()
+        if pending:
+            socketio.emit('console_output', {
+                'app': self.app_name,
+                'line': '\n'.join(pending),
+                'lines': pending
+            })
+
+    def tail(self, count=None):
+        """Latest lines held in memory"""
+        with self._lock:
+            lines = list(self.lines)
+        return lines[-count:] if count else lines
+
+    def close(self):
+        """Flush remaining output and release the log handle (the ring buffer stays readable)"""
+        self._closed.set()
+        self.flush()
+        with self._lock:
+            if not self._log_file.closed:
+                self._log_file.close()
+
+    def _flush_loop(self):
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing output for {self.app_name}: {e}")
+
+
+def _append_log_line(app_name, line):
+    log_file_path = LOG_DIR / f"{app_name}.log"
+    with open(log_file_path, 'a', encoding='utf-8') as f:
+        f.write(line + '\n')
+        f.flush()
+
+
 def write_log_to_file(app_name, line):
     """Write log to file"""
     try:
-        log_file_path = LOG_DIR / f"{app_name}.log"
-        with open(log_file_path, 'a', encoding='utf-8') as f:
-            f.write(line + '\n')
-            f.flush()
+        pipeline = output_pipelines.get(app_name)
+        if pipeline is not None and not pipeline.closed:
+            pipeline.write(line, emit_line=False)
+        else:
+            _append_log_line(app_name, line)
     except Exception as e:
         logger.error(f"Error writing log for {app_name}: {e}")
 
 def read_log_from_file(app_name, tail_lines=None):
-    """Read logs from file"""
+    """Read logs from file
+
+    With tail_lines only the end of the file is read (backwards, chunk by chunk), so the cost does
+    not grow with the log size."""
     try:
         log_file_path = LOG_DIR / f"{app_name}.log"
         if not log_file_path.exists():
             return []
         
+        if tail_lines:
+            return read_tail_lines(log_file_path, tail_lines)
+        
         with open(log_file_path, 'r', encoding='utf-8') as f:
             lines = f.readlines()
-            lines = [line.rstrip('\n\r') for line in lines if line.strip()]
-            
-            if tail_lines:
-                return lines[-tail_lines:]
-            return lines
+            return [line.rstrip('\n\r') for line in lines if line.strip()]
     except Exception as e:
         logger.exception(f"Error reading log for {app_name}: {e}")
         return []
 
 def read_process_output(process, app_name):
-    """Read process output and write to file"""
+    """Read process output and write to file
+
+    Output is read in chunks and split into lines here; writing and emitting is batched by the
+    engine's EngineOutputPipeline."""
     import select
-    import sys
     
-    while True:
-        try:
-            if process.poll() is not None:
-                # The process ends and the remaining output is read
-                remaining_output = process.stdout.read()
-                if remaining_output:
-                    lines = remaining_output.decode('utf-8', errors='replace').split('\n')
-                    for line in lines:
-                        line = line.strip()
-                        if line:
-                            timestamp = datetime.now().strftime('%H:%M:%S')
-                            formatted_line = f"[{timestamp}] {line}"
-                            write_log_to_file(app_name, formatted_line)
-                            socketio.emit('console_output', {
-                                'app': app_name,
-                                'line': formatted_line
-                            })
-                break
-            
-            # Use non-blocking reads
-            if sys.platform == 'win32':
-                # Use different methods under Windows
-                output = process.stdout.readline()
-                if output:
-                    line = output.decode('utf-8', errors='replace').strip()
-                    if line:
-                        timestamp = datetime.now().strftime('%H:%M:%S')
-                        formatted_line = f"[{timestamp}] {line}"
-                        
-                        # Write to log file
-                        write_log_to_file(app_name, formatted_line)
-                        
-                        # Send to frontend
-                        socketio.emit('console_output', {
-                            'app': app_name,
-                            'line': formatted_line
-                        })
-                else:
-                    # Sleep briefly when there is no output
-                    time.sleep(0.1)
-            else:
-                # Unix system uses select
-                ready, _, _ = select.select([process.stdout], [], [], 0.1)
+    pipeline = output_pipelines[app_name]
+    partial = b''
+
+    def consume(data):
+        nonlocal partial
+        *complete, partial = (partial + data).split(b'\n')
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        for raw_line in complete:
+            line = raw_line.decode('utf-8', errors='replace').strip()
+            if line:
+                pipeline.write(f"[{timestamp}] {line}")
+
+    try:
+        if sys.platform == 'win32':
+            # select does not support pipes under Windows, block on readline until EOF
+            for output in iter(process.stdout.readline, b''):
+                consume(output)
+        else:
+            fd = process.stdout.fileno()
+            while True:
+                ready, _, _ = select.select([fd], [], [], OUTPUT_FLUSH_INTERVAL)
                 if ready:
-                    output = process.stdout.readline()
-                    if output:
-                        line = output.decode('utf-8', errors='replace').strip()
-                        if line:
-                            timestamp = datetime.now().strftime('%H:%M:%S')
-                            formatted_line = f"[{timestamp}] {line}"
-                            
-                            # Write to log file
-                            write_log_to_file(app_name, formatted_line)
-                            
-                            # Send to frontend
-                            socketio.emit('console_output', {
-                                'app': app_name,
-                                'line': formatted_line
-                            })
-                            
-        except Exception as e:
-            error_msg = f"Error reading output for {app_name}: {e}"
-            logger.exception(error_msg)
-            write_log_to_file(app_name, f"[{datetime.now().strftime('%H:%M:%S')}] {error_msg}")
-            break
+                    data = os.read(fd, 64 * 1024)
+                    if not data:
+                        break  # EOF, the process closed its output
+                    consume(data)
+                elif process.poll() is not None:
+                    # The process has ended and nothing is left to read
+                    break
+        if partial:
+            consume(b'\n')
+    except Exception as e:
+        error_msg = f"Error reading output for {app_name}: {e}"
+        logger.exception(error_msg)
+        pipeline.write(f"[{datetime.now().strftime('%H:%M:%S')}] {error_msg}", emit_line=False)
+    finally:
+        pipeline.close()
 
 def start_streamlit_app(app_name, script_path, port):
     """Launch the Streamlit app"""
@@ -641,9 +677,16 @@ def start_streamlit_app(app_name, script_path, port):
         
         # Clear previous log files
         log_file_path = LOG_DIR / f"{app_name}.log"
+        previous_pipeline = output_pipelines.pop(app_name, None)
+        if previous_pipeline is not None:
+            previous_pipeline.close()
         if log_file_path.exists():
             log_file_path.unlink()
         
+        # New output pipeline (log handle + ring buffer) for this run
+        pipeline = EngineOutputPipeline(app_name)
+        output_pipelines[app_name] = pipeline
+        
         # Create startup log
         start_msg = f"[{datetime.now().strftime('%H:%M:%S')}] Start {app_name} application..."
         write_log_to_file(app_name, start_msg)
@@ -685,7 +728,7 @@ def start_streamlit_app(app_name, script_path, port):
         
         processes[app_name]['process'] = process
         processes[app_name]['status'] = 'starting'
-        processes[app_name]['output'] = []
+        processes[app_name]['output'] = pipeline.lines
         
         # Start the output reading thread
         output_thread = threading.Thread(
@@ -981,10 +1024,12 @@ def get_output(app_name):
     if app_name not in processes:
         return jsonify({'success': False, 'message': '未知应用'})
     
+    tail_lines = request.args.get('lines', type=int)
+    
     # Special processing Forum Engine
     if app_name == 'forum':
         try:
-            forum_log_content = read_log_from_file('forum')
+            forum_log_content = read_log_from_file('forum', tail_lines)
             return jsonify({
                 'success': True,
                 'output': forum_log_content,
@@ -993,8 +1038,13 @@ def get_output(app_name):
         except Exception as e:
             return jsonify({'success': False, 'message': f'读取forum日志失败: {str(e)}'})
     
-    # Read full log from file
-    output_lines = read_log_from_file(app_name)
+    # Serve the latest lines from the in-memory ring buffer; only a tail longer than the ring
+    # holds goes to the log file
+    pipeline = output_pipelines.get(app_name)
+    if pipeline is not None and (not tail_lines or tail_lines <= pipeline.lines.maxlen):
+        output_lines = pipeline.tail(tail_lines)
+    else:
+        output_lines = read_log_from_file(app_name, tail_lines)
     
     return jsonify({
         'success': True,
@@ -1045,80 +1095,146 @@ def stop_forum_monitoring_api():
     except Exception as e:
         return jsonify({'success': False, 'message': f'停止论坛失败: {str(e)}'})
 
+FORUM_LOG_PAGE_LIMIT = 200
+FORUM_LOG_MAX_PAGE_LIMIT = 2000
+GZIP_MIN_SIZE = 1024
+
+
+def _build_json_response(payload, etag=None):
+    """Build a JSON response with optional ETag revalidation and gzip compression"""
+    response = jsonify(payload)
+    if etag:
+        response.set_etag(etag)
+        response = response.make_conditional(request)
+    if (response.status_code == 200
+            and 'gzip' in request.headers.get('Accept-Encoding', '').lower()
+            and request.args.get('gzip', '1') != '0'):
+        body = response.get_data()
+        if len(body) >= GZIP_MIN_SIZE:
+            response.set_data(gzip.compress(body, compresslevel=5))
+            response.headers['Content-Encoding'] = 'gzip'
+            response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+
+def _forum_log_id(signature):
+    """Identify one forum.log file; it is recreated for every forum session, so cursors are only valid per id"""
+    if not signature:
+        return ''
+    return f"{signature[0]:x}-{signature[1]:x}"
+
+
+def _parse_forum_lines(lines):
+    """Parse forum.log lines into conversation messages"""
+    parsed_messages = []
+    for line in lines:
+        parsed_message = parse_forum_log_line(line)
+        if parsed_message:
+            parsed_messages.append(parsed_message)
+    return parsed_messages
+
+
 @app.route('/api/forum/log')
 def get_forum_log():
-    """Get the forum.log content of ForumEngine"""
+    """Get the forum.log content of ForumEngine
+
+    Without query parameters the whole log is returned (original behaviour). Pagination is cursor based,
+    the cursor being a line number in the forum.log index:
+    - limit: number of lines per page (latest page when no cursor is given)
+    - cursor + direction=after|before: lines after (inclusive) or before (exclusive) the cursor
+    - log_id: id returned by a previous page; if forum.log was recreated since, paging restarts
+    Responses carry an ETag so unchanged logs are answered with 304, and are gzipped when accepted."""
     try:
-        forum_log_file = LOG_DIR / "forum.log"
-        if not forum_log_file.exists():
-            return jsonify({
-                'success': True,
-                'log_lines': [],
-                'parsed_messages': [],
-                'total_lines': 0
-            })
-        
-        with open(forum_log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-            lines = [line.rstrip('\n\r') for line in lines if line.strip()]
-        
-        # Parse each line of logs and extract conversation information
-        parsed_messages = []
-        for line in lines:
-            parsed_message = parse_forum_log_line(line)
-            if parsed_message:
-                parsed_messages.append(parsed_message)
-        
-        return jsonify({
+        index = get_forum_log_index(str(LOG_DIR))
+        with index.lock:
+            if not index.refresh():
+                return _build_json_response({
+                    'success': True,
+                    'log_lines': [],
+                    'parsed_messages': [],
+                    'total_lines': 0
+                })
+
+            total_lines = len(index.entries)
+            log_id = _forum_log_id(index.signature)
+            paginate = 'limit' in request.args or 'cursor' in request.args
+
+            if not paginate:
+                start, end = 0, total_lines
+            else:
+                limit = request.args.get('limit', FORUM_LOG_PAGE_LIMIT, type=int)
+                limit = max(1, min(limit, FORUM_LOG_MAX_PAGE_LIMIT))
+                cursor = request.args.get('cursor', type=int)
+                direction = request.args.get('direction', 'after')
+                if cursor is not None and request.args.get('log_id') not in (None, log_id):
+                    # Stale cursor from a previous forum session
+                    cursor = 0 if direction == 'after' else None
+
+                if cursor is None:
+                    end = total_lines
+                    start = max(0, end - limit)
+                elif direction == 'before':
+                    end = max(0, min(cursor, total_lines))
+                    start = max(0, end - limit)
+                else:
+                    start = max(0, min(cursor, total_lines))
+                    end = min(total_lines, start + limit)
+
+            etag = f"{log_id}-{index.signature[2]}-{start}-{end}-{int(paginate)}"
+            lines = index.read_lines(start, end)
+
+        payload = {
             'success': True,
             'log_lines': lines,
-            'parsed_messages': parsed_messages,
-            'total_lines': len(lines)
-        })
+            'parsed_messages': _parse_forum_lines(lines),
+            'total_lines': total_lines
+        }
+        if paginate:
+            payload.update({
+                'log_id': log_id,
+                'cursor_start': start,
+                'cursor_end': end,
+                'has_more_before': start > 0,
+                'has_more_after': end < total_lines
+            })
+        return _build_json_response(payload, etag=etag)
     except Exception as e:
         return jsonify({'success': False, 'message': f'读取forum.log失败: {str(e)}'})
 
 @app.route('/api/forum/log/history', methods=['POST'])
 def get_forum_log_history():
-    """Get the Forum history log (supports starting from the specified location)"""
+    """Get the Forum history log (supports starting from the specified location)
+
+    position is the byte offset returned by the previous call. Each line is prefixed with the
+    time recorded in the line itself rather than the time of the request."""
     try:
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
         start_position = data.get('position', 0)  # The last location received by the client
         max_lines = data.get('max_lines', 1000)   # Maximum number of rows returned
 
-        forum_log_file = LOG_DIR / "forum.log"
-        if not forum_log_file.exists():
-            return jsonify({
-                'success': True,
-                'log_lines': [],
-                'position': 0,
-                'has_more': False
-            })
-
-        with open(forum_log_file, 'r', encoding='utf-8', errors='ignore') as f:
-            # Start reading from the specified position
-            f.seek(start_position)
-            lines = []
-            line_count = 0
-
-            for line in f:
-                if line_count >= max_lines:
-                    break
-                line = line.rstrip('\n\r')
-                if line.strip():
-                    # Add timestamp
-                    timestamp = datetime.now().strftime('%H:%M:%S')
-                    formatted_line = f"[{timestamp}] {line}"
-                    lines.append(formatted_line)
-                    line_count += 1
-
-            # Record current location
-            current_position = f.tell()
-
-            # Check if there is more
-            f.seek(0, 2)  # Move to end of file
-            end_position = f.tell()
-            has_more = current_position < end_position
+        index = get_forum_log_index(str(LOG_DIR))
+        with index.lock:
+            if not index.refresh():
+                return jsonify({
+                    'success': True,
+                    'log_lines': [],
+                    'position': 0,
+                    'has_more': False
+                })
+
+            start = index.line_at_offset(int(start_position))
+            end = min(len(index.entries), start + max(0, int(max_lines)))
+            raw_lines = index.read_lines(start, end)
+            timestamps = [entry[2] for entry in index.entries[start:end]]
+            current_position = index.end_offset(end - 1) if end > start else max(int(start_position), 0)
+            has_more = end < len(index.entries)
+
+        lines = []
+        last_timestamp = None
+        for line, timestamp in zip(raw_lines, timestamps):
+            # Lines without their own time (e.g. the initialization banner) reuse the previous one
+            last_timestamp = timestamp or last_timestamp
+            lines.append(f"[{last_timestamp}] {line}" if last_timestamp else line)
 
         return jsonify({
             'success': True,
@@ -1129,10 +1245,57 @@ def get_forum_log_history():
     except Exception as e:
         return jsonify({'success': False, 'message': f'读取forum历史失败: {str(e)}'})
 
+# Search fan-out to the engine APIs
+SEARCH_API_PORTS = {'insight': 8601, 'media': 8602, 'query': 8603}
+SEARCH_CONNECT_TIMEOUT = 2  # Seconds to connect to an engine API
+SEARCH_ENGINE_TIMEOUT = 10  # Per-engine deadline in seconds
+search_session = requests.Session()
+search_session.mount('http://', requests.adapters.HTTPAdapter(pool_connections=len(SEARCH_API_PORTS), pool_maxsize=8))
+search_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='search')
+
+
+def _search_engine(app_name, query):
+    """Send the query to one engine API and normalise the result"""
+    try:
+        response = search_session.post(
+            f"http://localhost:{SEARCH_API_PORTS[app_name]}/api/search",
+            json={'query': query},
+            timeout=(SEARCH_CONNECT_TIMEOUT, SEARCH_ENGINE_TIMEOUT)
+        )
+        if response.status_code == 200:
+            return response.json()
+        return {'success': False, 'message': 'API调用失败'}
+    except Exception as e:
+        return {'success': False, 'message': str(e)}
+
+
+def _iter_search_results(running_apps, query):
+    """Dispatch the query to all engines at once and yield (app_name, result) as each one answers
+
+    Engines still pending when the deadline passes are reported as timed out, so the total latency
+    is that of the slowest engine (bounded by SEARCH_ENGINE_TIMEOUT) rather than the sum."""
+    futures = {search_executor.submit(_search_engine, app_name, query): app_name for app_name in running_apps}
+    pending = set(futures.values())
+    try:
+        for future in as_completed(futures, timeout=SEARCH_CONNECT_TIMEOUT + SEARCH_ENGINE_TIMEOUT):
+            app_name = futures[future]
+            pending.discard(app_name)
+            yield app_name, future.result()
+    except FuturesTimeoutError:
+        for future, app_name in futures.items():
+            if app_name in pending:
+                future.cancel()
+                yield app_name, {'success': False, 'message': '搜索超时', 'timeout': True}
+
+
 @app.route('/api/search', methods=['POST'])
 def search():
-    """Unified search interface"""
-    data = request.get_json()
+    """Unified search interface
+
+    The query is sent to all running engines concurrently. With "stream": true (or ?stream=1)
+    the response is an SSE stream with one "result" event per engine as soon as it answers,
+    followed by a "done" event; otherwise all results are returned together."""
+    data = request.get_json(silent=True) or {}
     query = data.get('query', '').strip()
     
     if not query:
@@ -1143,30 +1306,26 @@ def search():
     
     # Check which apps are running
     check_app_status()
-    running_apps = [name for name, info in processes.items() if info['status'] == 'running']
+    running_apps = [name for name, info in processes.items() if info['status'] == 'running' and name in SEARCH_API_PORTS]
     
     if not running_apps:
         return jsonify({'success': False, 'message': '没有运行中的应用'})
     
-    # Send a search request to a running application
-    results = {}
-    api_ports = {'insight': 8601, 'media': 8602, 'query': 8603}
+    stream = data.get('stream') or request.args.get('stream') in ('1', 'true')
+    if stream:
+        def event_generator():
+            for app_name, result in _iter_search_results(running_apps, query):
+                payload = {'app': app_name, 'query': query, 'result': result}
+                yield f"event: result\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+            yield f"event: done\ndata: {json.dumps({'query': query, 'apps': running_apps}, ensure_ascii=False)}\n\n"
+
+        response = Response(stream_with_context(event_generator()), mimetype='text/event-stream')
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Accel-Buffering'] = 'no'
+        return response
     
-    for app_name in running_apps:
-        try:
-            api_port = api_ports[app_name]
-            # Call the API endpoint of the Streamlit application
-            response = requests.post(
-                f"http://localhost:{api_port}/api/search",
-                json={'query': query},
-                timeout=10
-            )
-            if response.status_code == 200:
-                results[app_name] = response.json()
-            else:
-                results[app_name] = {'success': False, 'message': 'API调用失败'}
-        except Exception as e:
-            results[app_name] = {'success': False, 'message': str(e)}
+    # Send a search request to all running applications at once
+    results = dict(_iter_search_results(running_apps, query))
     
     # You can choose to stop monitoring after the search is complete, or let it continue running to capture subsequent processing logs
     # Here we let the monitoring continue to run, and the user can manually stop it through other interfaces
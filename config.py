@@ -96,6 +96,7 @@ class Settings(BaseSettings):
     MAX_HIGH_CONFIDENCE_SENTIMENT_RESULTS: int = Field(0, description="High Confidence Sentiment Analysis Maximum Number")
     MAX_REFLECTIONS: int = Field(3, description="Maximum number of reflections")
     MAX_PARAGRAPHS: int = Field(6, description="Maximum number of paragraphs")
+    MAX_PARALLEL_PARAGRAPHS: int = Field(1, description="Paragraphs researched at the same time, raise it within the LLM rate limits")
     SEARCH_TIMEOUT: int = Field(240, description="Single search request timeout")
     MAX_CONTENT_LENGTH: int = Field(500000, description="Search maximum content length")
     
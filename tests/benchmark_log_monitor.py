@@ -0,0 +1,76 @@
+"""LogMonitor per-tick cost benchmark
+
+Appends a few lines to engine logs of increasing size and measures one monitoring tick
+(change detection + reading the appended lines). The tick cost should stay flat as the
+log grows, while a full line count grows linearly with the file size.
+
+Run directly:
+    python tests/benchmark_log_monitor.py"""
+
+import sys
+import time
+import shutil
+from pathlib import Path
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from ForumEngine.monitor import LogMonitor
+
+LOG_LINE = "2025-11-05 17:42:31.289 | INFO     | InsightEngine.nodes.search_node:run:133 - " + "x" * 120 + "\n"
+SIZES_MB = [1, 10, 100]
+TICKS = 50
+
+
+def grow_to(log_file: Path, size_mb: int):
+    """Append filler lines until the file reaches size_mb"""
+    target = size_mb * 1024 * 1024
+    block = LOG_LINE * 1000
+    with open(log_file, 'a', encoding='utf-8') as f:
+        while f.tell() < target:
+            f.write(block)
+
+
+def measure_tick(monitor: LogMonitor, log_file: Path) -> float:
+    """Average seconds for one tick that sees a 3-line append"""
+    total = 0.0
+    for _ in range(TICKS):
+        with open(log_file, 'a', encoding='utf-8') as f:
+            f.write(LOG_LINE * 3)
+        start = time.perf_counter()
+        if monitor.detect_file_change(log_file, 'insight') == 'growth':
+            monitor.read_new_lines(log_file, 'insight')
+        total += time.perf_counter() - start
+    return total / TICKS
+
+
+def measure_full_count(monitor: LogMonitor, log_file: Path) -> float:
+    """Seconds for one full line count (the previous per-tick cost)"""
+    start = time.perf_counter()
+    monitor.get_file_line_count(log_file)
+    return time.perf_counter() - start
+
+
+def main():
+    bench_dir = project_root / "tests" / "bench_logs"
+    bench_dir.mkdir(parents=True, exist_ok=True)
+    log_file = bench_dir / "insight.log"
+    log_file.write_text("", encoding='utf-8')
+
+    try:
+        monitor = LogMonitor(log_dir=str(bench_dir))
+        print(f"{'size':>8} | {'tick (ms)':>10} | {'full count (ms)':>16}")
+        print("-" * 42)
+        for size_mb in SIZES_MB:
+            grow_to(log_file, size_mb)
+            monitor.reset_file_baseline(log_file, 'insight')
+            tick = measure_tick(monitor, log_file)
+            full = measure_full_count(monitor, log_file)
+            print(f"{size_mb:>6}MB | {tick * 1000:>10.3f} | {full * 1000:>16.1f}")
+    finally:
+        shutil.rmtree(bench_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
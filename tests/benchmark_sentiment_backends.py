@@ -0,0 +1,76 @@
+"""Sentiment analyzer backend benchmark
+
+Loads WeiboMultilingualSentimentAnalyzer with each backend (torch fp32, onnx fp32, onnx int8) and
+measures model load time, batched throughput on comment-sized texts and single-text latency. The first
+onnx run includes the one-time export/quantization, run the script twice to see the steady-state load time.
+
+Run directly:
+    python tests/benchmark_sentiment_backends.py [--texts 500] [--threads 0]"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from InsightEngine.tools.sentiment_analyzer import WeiboMultilingualSentimentAnalyzer
+
+SAMPLE_TEXTS = [
+    "今天天气真好，心情特别棒！",
+    "服务态度太差了，非常失望，再也不会来了",
+    "这个产品还行吧，没有想象中那么好",
+    "I absolutely love this product!",
+    "The customer service was disappointing.",
+    "物流很快，包装完好，给个好评",
+    "说实话这次的更新真的让人看不懂，到底在想什么",
+    "一般般，价格有点贵",
+]
+BACKENDS = [("torch", False), ("onnx", False), ("onnx", True)]
+SINGLE_RUNS = 20
+
+
+def make_texts(count: int):
+    """Comment-like texts of varied length"""
+    rng = random.Random(0)
+    return [" ".join(rng.choice(SAMPLE_TEXTS) for _ in range(rng.randint(1, 6))) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sentiment analyzer backend benchmark")
+    parser.add_argument("--texts", type=int, default=500, help="Number of texts in the batch")
+    parser.add_argument("--batch-size", type=int, default=32, help="Texts per forward pass")
+    parser.add_argument("--threads", type=int, default=0, help="onnxruntime intra-op threads, 0 = one per physical core")
+    args = parser.parse_args()
+
+    texts = make_texts(args.texts)
+    print(f"{'backend':<12}{'load s':>10}{'batch s':>10}{'texts/s':>10}{'single ms':>12}")
+    for backend, quantize in BACKENDS:
+        analyzer = WeiboMultilingualSentimentAnalyzer(
+            batch_size=args.batch_size, backend=backend, onnx_quantize=quantize, onnx_threads=args.threads
+        )
+        start = time.perf_counter()
+        if not analyzer.initialize():
+            print(f"{backend}: unavailable ({analyzer.disable_reason})")
+            continue
+        load_seconds = time.perf_counter() - start
+
+        analyzer.analyze_batch(texts[:args.batch_size], show_progress=False)  # warm-up
+        start = time.perf_counter()
+        analyzer.analyze_batch(texts, show_progress=False)
+        batch_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for text in texts[:SINGLE_RUNS]:
+            analyzer.analyze_single_text(text)
+        single_ms = (time.perf_counter() - start) / SINGLE_RUNS * 1000
+
+        name = f"{backend}{'-int8' if quantize else ''}"
+        print(f"{name:<12}{load_seconds:>10.2f}{batch_seconds:>10.2f}{len(texts) / batch_seconds:>10.1f}{single_ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""Character tokenizer shared by the sentiment analyzer tests, so no tokenizer download is needed"""
+
+
+class CharTokenizer:
+    """One token per character, pads with 0 to torch or numpy"""
+
+    model_input_names = ["input_ids", "attention_mask"]
+
+    def __call__(self, texts, max_length=512, truncation=True):
+        input_ids = [[ord(char) % 1000 + 1 for char in text][:max_length] for text in texts]
+        return {"input_ids": input_ids, "attention_mask": [[1] * len(ids) for ids in input_ids]}
+
+    def pad(self, encodings, padding=True, return_tensors="pt"):
+        width = max(len(ids) for ids in encodings["input_ids"])
+        padded = {key: [values + [0] * (width - len(values)) for values in encodings[key]] for key in encodings}
+        if return_tensors == "np":
+            import numpy as np
+            return {key: np.array(value, dtype=np.int64) for key, value in padded.items()}
+        import torch
+        return {key: torch.tensor(value) for key, value in padded.items()}
@@ -0,0 +1,156 @@
+"""Test DeepSearchAgent.research (QueryEngine/agent.py) with stubbed nodes and search tools
+
+Covers paragraphs researched in parallel sharing one state and one checkpoint file, and resuming an
+interrupted run from its checkpoint."""
+
+import os
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+# QueryEngine.utils.config builds its settings at import time, these keys have no default
+for key in ("QUERY_ENGINE_API_KEY", "QUERY_ENGINE_MODEL_NAME", "TAVILY_API_KEY"):
+    os.environ.setdefault(key, "test")
+
+from QueryEngine import agent as agent_module
+from QueryEngine.agent import DeepSearchAgent
+from QueryEngine.state import State
+
+PARAGRAPHS = [("背景", "活动概况"), ("舆情", "网友评价")]
+
+
+class StubNode:
+    """Node answering with a function of its input and recording every input"""
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.calls = []
+
+    def run(self, input_data, **kwargs):
+        self.calls.append(input_data)
+        return self.answer(input_data)
+
+
+class StubReportStructureNode:
+    def __init__(self, llm_client, query):
+        self.query = query
+
+    def mutate_state(self, state):
+        state.query = self.query
+        for title, content in PARAGRAPHS:
+            state.add_paragraph(title, content)
+        return state
+
+
+class StubSearchAgency:
+    def __init__(self):
+        self.queries = []
+
+    def basic_search_news(self, query, max_results=7):
+        self.queries.append(query)
+        return SimpleNamespace(results=[SimpleNamespace(
+            title=f"{query} 新闻", url="https://example.com", content=query, score=1.0,
+            raw_content=None, published_date=None,
+        )])
+
+
+def search_output(prefix):
+    return lambda input_data: {"search_query": f"{input_data['title']} {prefix}", "reasoning": "-"}
+
+
+class TestResearch:
+    """Test research() end to end with every LLM and search call stubbed"""
+
+    @pytest.fixture(autouse=True)
+    def agent(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(agent_module, "LLMClient", lambda **kwargs: SimpleNamespace(get_model_info=lambda: "stub"))
+        monkeypatch.setattr(agent_module, "TavilyNewsAgency", lambda api_key: StubSearchAgency())
+        monkeypatch.setattr(agent_module, "ReportStructureNode", StubReportStructureNode)
+        config = SimpleNamespace(
+            QUERY_ENGINE_API_KEY="-", QUERY_ENGINE_MODEL_NAME="-", QUERY_ENGINE_BASE_URL=None, TAVILY_API_KEY="-",
+            OUTPUT_DIR=str(tmp_path), SAVE_CHECKPOINTS=True, SAVE_INTERMEDIATE_STATES=False,
+            SEARCH_CONTENT_MAX_LENGTH=1000, MAX_REFLECTIONS=1, MAX_PARALLEL_PARAGRAPHS=2,
+        )
+        self.agent = DeepSearchAgent(config)
+        self.search_agency = self.agent.search_agency
+        self.agent.first_summary_node = StubNode(lambda input_data: f"{input_data['title']} 初始总结")
+        self.agent.first_search_node = StubNode(search_output("初搜"))
+        self.agent.reflection_node = StubNode(search_output("反思"))
+        self.agent.reflection_summary_node = StubNode(lambda input_data: f"{input_data['title']} 反思总结")
+        self.agent.report_formatting_node = StubNode(
+            lambda report_data: "\n".join(item["paragraph_latest_state"] for item in report_data)
+        )
+        self.checkpoint_dir = tmp_path / "checkpoints"
+        self.checkpoint_path = str(tmp_path / "checkpoint.json")
+
+    def test_paragraph_order_and_checkpoint(self):
+        # The first paragraph waits for the second one's summary, so it finishes last
+        second_summarized = threading.Event()
+        waited = []
+
+        def first_summary(input_data):
+            if input_data["title"] == "背景":
+                waited.append(second_summarized.wait(timeout=5))
+            else:
+                second_summarized.set()
+            return f"{input_data['title']} 初始总结"
+
+        self.agent.first_summary_node = StubNode(first_summary)
+
+        report = self.agent.research("武汉大学樱花季", save_report=False)
+
+        assert waited == [True]
+        assert report.splitlines() == ["背景 反思总结", "舆情 反思总结"]
+
+        checkpoints = list(self.checkpoint_dir.iterdir())
+        assert len(checkpoints) == 1
+        state = State.load_from_file(str(checkpoints[0]))
+        assert state.is_completed and state.final_report == report
+        for paragraph, (title, _) in zip(state.paragraphs, PARAGRAPHS):
+            research = paragraph.research
+            assert paragraph.title == title
+            assert research.is_completed and research.pending_search is None
+            assert research.reflection_iteration == 1
+            assert research.latest_summary == f"{title} 反思总结"
+            assert [search.query for search in research.search_history] == [f"{title} 初搜", f"{title} 反思"]
+
+    def test_resume_continues_where_the_checkpoint_stopped(self):
+        # Interrupted after the search of the second paragraph's second reflection, before its summary
+        state = State(query="武汉大学樱花季")
+        for title, content in PARAGRAPHS:
+            state.add_paragraph(title, content)
+        done, unfinished = (paragraph.research for paragraph in state.paragraphs)
+        done.latest_summary = "背景 已完成"
+        done.reflection_iteration = 2
+        done.mark_completed()
+        unfinished.latest_summary = "舆情 第一次反思"
+        unfinished.reflection_iteration = 1
+        pending_results = [{'title': '舆情 新闻', 'url': 'u', 'content': 'c', 'score': 1.0, 'published_date': None}]
+        unfinished.add_search_results("舆情 第二次反思", pending_results)
+        unfinished.set_pending_search("舆情 第二次反思", pending_results)
+        state.save_to_file(self.checkpoint_path)
+        self.agent.config.MAX_REFLECTIONS = 2
+
+        report = self.agent.research("", save_report=False, resume_from=self.checkpoint_path)
+
+        # Only the summary of the unfinished reflection runs, on the replayed search
+        assert self.search_agency.queries == []
+        for node in (self.agent.first_search_node, self.agent.first_summary_node, self.agent.reflection_node):
+            assert node.calls == []
+        [summary_input] = self.agent.reflection_summary_node.calls
+        assert summary_input["search_query"] == "舆情 第二次反思"
+        assert summary_input["paragraph_latest_state"] == "舆情 第一次反思"
+        assert report.splitlines() == ["背景 已完成", "舆情 反思总结"]
+
+        restored = State.load_from_file(self.checkpoint_path)
+        assert restored.is_completed and restored.final_report == report
+        research = restored.paragraphs[1].research
+        assert research.is_completed and research.pending_search is None
+        assert research.reflection_iteration == 2
+        assert research.get_search_count() == 1
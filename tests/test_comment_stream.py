@@ -0,0 +1,84 @@
+"""Test streamed topic comments (MediaCrawlerDB.stream_comments_for_topic) against a SQLite database
+
+Covers stream_all/iter_sync chunking, keyset pagination across pages whose boundary falls inside a run
+of equal timestamps, and the max_rows limits."""
+
+import sys
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("greenlet")
+pytest.importorskip("aiosqlite")
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from InsightEngine.tools import search
+from InsightEngine.tools.search import MediaCrawlerDB
+from InsightEngine.utils import db
+from InsightEngine.utils.db import iter_sync, run_sync, stream_all
+
+COLUMNS = ['id', 'content', 'nickname', 'create_time', 'comment_like_count']
+ROWS = [
+    (1, '樱花 好看', 'a', 100, '1'),
+    (2, '樱花 人多', 'b', 200, '2'),
+    (3, '樱花 预约', 'c', 200, '3'),
+    (4, '樱花 门票', 'd', 200, '4'),
+    (5, '天气 晴', 'e', 300, '5'),
+    (6, '樱花 拍照', 'f', 300, '6'),
+    (7, '樱花 排队', 'g', 100, '7'),
+]
+# Matches of '樱花' ordered by (create_time, id) descending
+NEWEST_FIRST = ['f', 'd', 'c', 'b', 'g', 'a']
+
+
+class TestCommentStream:
+    """Test chunked reads and keyset pagination of topic comments"""
+
+    @pytest.fixture(autouse=True)
+    def database(self, tmp_path, monkeypatch):
+        path = tmp_path / "comments.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE weibo_note_comment (id INTEGER PRIMARY KEY, content TEXT, nickname TEXT, "
+                "create_time INTEGER, comment_like_count TEXT)"
+            )
+            conn.executemany("INSERT INTO weibo_note_comment VALUES (?, ?, ?, ?, ?)", ROWS)
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        monkeypatch.setattr(db, "get_async_engine", lambda: engine)
+        # Two rows per page: the boundaries fall between ids 4 and 3 (both at 200) and after id 2
+        monkeypatch.setattr(search.settings, "DB_STREAM_PAGE_SIZE", 2)
+        monkeypatch.setattr(search.settings, "DB_FULLTEXT_SEARCH", False)
+        monkeypatch.setattr(MediaCrawlerDB, "_schema_snapshot", {'weibo_note_comment': COLUMNS})
+        self.db = MediaCrawlerDB(load_schema=False)
+        yield
+        run_sync(engine.dispose())
+
+    def _authors(self, chunks):
+        return [result.author_nickname for chunk in chunks for result in chunk]
+
+    def test_stream_all_yields_chunks(self):
+        chunks = list(iter_sync(stream_all("SELECT id FROM weibo_note_comment ORDER BY id", chunk_size=3)))
+        assert [[row['id'] for row in chunk] for chunk in chunks] == [[1, 2, 3], [4, 5, 6], [7]]
+
+    def test_pages_continue_after_equal_timestamps(self):
+        chunks = list(self.db.stream_comments_for_topic("樱花", chunk_size=2))
+        assert self._authors(chunks) == NEWEST_FIRST
+        assert all(len(chunk) <= 2 for chunk in chunks)
+
+    def test_keyword_list_matches_any(self):
+        chunks = self.db.stream_comments_for_topic(["预约", "天气"], chunk_size=2)
+        assert self._authors(chunks) == ['e', 'c']
+
+    def test_max_rows(self):
+        assert self._authors(self.db.stream_comments_for_topic("樱花", max_rows=3, chunk_size=2)) == NEWEST_FIRST[:3]
+        assert self._authors(self.db.stream_comments_for_topic("樱花", max_rows=0)) == []
+
+    def test_max_rows_per_table(self):
+        chunks = self.db.stream_comments_for_topic("樱花", chunk_size=2, max_rows_per_table=5)
+        assert self._authors(chunks) == NEWEST_FIRST[:5]
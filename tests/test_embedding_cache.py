@@ -0,0 +1,53 @@
+"""Test the clustering embedding cache in InsightEngine/utils/embedding_cache.py"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from InsightEngine.utils.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """Test encode() reuse, LRU eviction and the SQLite tier"""
+
+    @pytest.fixture(autouse=True)
+    def use_tmp_path(self, tmp_path):
+        self.cache_dir = tmp_path
+        self.encoded = []
+
+    def fake_encode(self, texts):
+        self.encoded.extend(texts)
+        return np.array([[len(text), ord(text[0])] for text in texts], dtype=np.float32)
+
+    def test_only_new_texts_are_encoded(self):
+        cache = EmbeddingCache()
+        first = cache.encode("model", ["好评", "差评"], self.fake_encode)
+        second = cache.encode("model", ["差评", "一般", "一般", "好评"], self.fake_encode)
+        assert self.encoded == ["好评", "差评", "一般"]
+        assert second.shape == (4, 2)
+        np.testing.assert_array_equal(second[0], first[1])
+        np.testing.assert_array_equal(second[3], first[0])
+
+    def test_models_do_not_share_entries(self):
+        cache = EmbeddingCache()
+        cache.encode("model-a", ["好评"], self.fake_encode)
+        cache.encode("model-b", ["好评"], self.fake_encode)
+        assert self.encoded == ["好评", "好评"]
+
+    def test_lru_and_sqlite_tier(self):
+        db_path = str(self.cache_dir / "embeddings.db")
+        cache = EmbeddingCache(max_entries=1, db_path=db_path)
+        cache.encode("model", ["a", "b"], self.fake_encode)
+        assert cache.stats()['entries'] == 1
+
+        other = EmbeddingCache(db_path=db_path)
+        np.testing.assert_array_equal(other.encode("model", ["a"], self.fake_encode)[0], [1, ord("a")])
+        assert self.encoded == ["a", "b"]
+        assert other.stats()['db_hits'] == 1
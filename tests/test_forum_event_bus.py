@@ -0,0 +1,114 @@
+"""Test the forum event bus in utils/forum_event_bus.py"""
+
+import sys
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from ForumEngine.monitor import LogMonitor
+from utils.forum_event_bus import (
+    BUS_SUPPORTED,
+    FALLBACK_LOG_MARKER,
+    ForumEventPublisher,
+    ForumEventSubscriber,
+    SUMMARY_EVENT,
+    parse_fallback_line,
+)
+
+
+@pytest.mark.skipif(not BUS_SUPPORTED, reason="AF_UNIX datagram sockets are not available")
+class TestForumEventBus:
+    """Test publishing and receiving summary events"""
+
+    def setup_method(self):
+        self.log_dir = project_root / "tests" / "test_logs" / "bus"
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.subscriber = ForumEventSubscriber(str(self.log_dir))
+        self.publisher = ForumEventPublisher(str(self.log_dir))
+
+    def teardown_method(self):
+        self.subscriber.stop()
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def test_publish_without_subscriber_returns_false(self):
+        assert self.publisher.publish({'type': SUMMARY_EVENT}) is False
+
+    def test_events_arrive_in_order(self):
+        assert self.subscriber.start() is True
+        for i in range(3):
+            assert self.publisher.publish({'type': SUMMARY_EVENT, 'engine': 'insight', 'content': f"paragraph {i}"})
+        assert self.subscriber.wait(2)
+        events = []
+        while len(events) < 3 and self.subscriber.wait(1):
+            events.extend(self.subscriber.drain())
+        assert [event['content'] for event in events] == ["paragraph 0", "paragraph 1", "paragraph 2"]
+
+    def test_stop_removes_socket(self):
+        self.subscriber.start()
+        self.subscriber.stop()
+        assert not (self.log_dir / "forum_events.sock").exists()
+        assert self.publisher.publish({'type': SUMMARY_EVENT}) is False
+
+
+@pytest.mark.skipif(not BUS_SUPPORTED, reason="AF_UNIX datagram sockets are not available")
+class TestBusAndLogDeduplication:
+    """Test that an engine delivering over the bus is no longer scraped from its log"""
+
+    def setup_method(self):
+        self.log_dir = project_root / "tests" / "test_logs" / "bus_dedup"
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.monitor = LogMonitor(log_dir=str(self.log_dir))
+        self.monitor.host_speech_threshold = 1000
+        self.monitor.is_searching = True
+        assert self.monitor.event_subscriber.start()
+
+    def teardown_method(self):
+        self.monitor.event_subscriber.stop()
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def _summary_line(self, content: str) -> str:
+        return ("2025-11-05 17:42:31.289 | INFO | InsightEngine.nodes.summary_node:process_output:131 - "
+                f"Cleaned output: {{\"paragraph_latest_state\": \"{content}\"}}")
+
+    def _fallback_line(self, event) -> str:
+        return ("2025-11-05 17:42:31.290 | INFO | utils.forum_event_bus:publish_summary_event:220 - "
+                f"{FALLBACK_LOG_MARKER} {json.dumps(event, ensure_ascii=False)}")
+
+    def _event(self, content: str, node: str = 'FirstSummaryNode'):
+        return {'type': SUMMARY_EVENT, 'engine': 'insight', 'node': node, 'content': content}
+
+    def _forum_lines(self):
+        return [line for line in self.monitor.get_forum_log_content() if "[INSIGHT]" in line]
+
+    def test_log_copy_before_first_bus_event_is_dropped(self):
+        for content in self.monitor.process_lines_for_json([self._summary_line("Bus summary")], 'insight'):
+            self.monitor._record_agent_speech('insight', content)
+        assert self.monitor._process_bus_events([self._event("Bus summary")]) is False
+        assert len(self._forum_lines()) == 1
+
+    def test_bus_engine_log_json_is_not_scraped(self):
+        self.monitor._process_bus_events([self._event("Bus summary")])
+        assert 'insight' in self.monitor.bus_engines
+        assert self.monitor._process_bus_engine_lines([self._summary_line("Scraped summary")]) is False
+        assert len(self._forum_lines()) == 1
+
+    def test_bus_engine_fallback_line_is_recorded(self):
+        self.monitor._process_bus_events([self._event("Bus summary")])
+        # A summary the bus could not carry (e.g. too large) is written to the log as an event
+        line = self._fallback_line(self._event("Oversized summary", 'ReflectionSummaryNode'))
+        assert self.monitor._process_bus_engine_lines([self._summary_line("Oversized summary"), line]) is True
+        lines = self._forum_lines()
+        assert len(lines) == 2
+        assert "Oversized summary" in lines[1]
+
+    def test_parse_fallback_line(self):
+        event = self._event("摘要 with \"quotes\"\nand a newline")
+        assert parse_fallback_line(self._fallback_line(event)) == event
+        assert parse_fallback_line(self._summary_line("No marker")) is None
+        assert parse_fallback_line(f"{FALLBACK_LOG_MARKER} {{broken") is None
@@ -0,0 +1,70 @@
+"""Test the incremental forum.log index in utils/forum_reader.py"""
+
+import os
+import sys
+import shutil
+from pathlib import Path
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.forum_reader import (
+    get_all_host_speeches,
+    get_forum_log_index,
+    get_latest_host_speech,
+    get_recent_agent_speeches,
+)
+
+
+class TestForumReader:
+    """Test reading speeches through ForumLogIndex"""
+
+    def setup_method(self):
+        self.log_dir = project_root / "tests" / "test_logs" / "forum_reader"
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.forum_log = self.log_dir / "forum.log"
+        self.forum_log.write_text(
+            "[10:00:00] [SYSTEM] === ForumEngine monitoring starts ===\n"
+            "[10:00:01] [INSIGHT] first\\nsecond\n"
+            "[10:00:02] [HOST] host one\n"
+            "[10:00:03] [MEDIA] media view\n",
+            encoding='utf-8'
+        )
+
+    def teardown_method(self):
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def _append(self, text):
+        with open(self.forum_log, 'a', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_latest_host_speech(self):
+        assert get_latest_host_speech(str(self.log_dir)) == "host one"
+        self._append("[10:00:04] [HOST] host two\\nline\n")
+        assert get_latest_host_speech(str(self.log_dir)) == "host two\nline"
+
+    def test_empty_host_line_is_ignored(self):
+        self._append("[10:00:04] [HOST]\n")
+        assert get_latest_host_speech(str(self.log_dir)) == "host one"
+        assert len(get_all_host_speeches(str(self.log_dir))) == 1
+
+    def test_recent_agent_speeches_in_order(self):
+        speeches = get_recent_agent_speeches(str(self.log_dir), limit=5)
+        assert [s['agent'] for s in speeches] == ['INSIGHT', 'MEDIA']
+        assert speeches[0]['content'] == "first\nsecond"
+        assert [s['agent'] for s in get_recent_agent_speeches(str(self.log_dir), limit=1)] == ['MEDIA']
+
+    def test_partial_line_not_indexed(self):
+        self._append("[10:00:05] [HOST] half written")
+        assert get_latest_host_speech(str(self.log_dir)) == "host one"
+        self._append("\n")
+        assert get_latest_host_speech(str(self.log_dir)) == "half written"
+
+    def test_recreated_log_is_reindexed(self):
+        assert len(get_all_host_speeches(str(self.log_dir))) == 1
+        os.unlink(self.forum_log)
+        self.forum_log.write_text("[11:00:00] [QUERY] new session\n", encoding='utf-8')
+        assert get_latest_host_speech(str(self.log_dir)) is None
+        assert get_all_host_speeches(str(self.log_dir)) == []
+        assert len(get_forum_log_index(str(self.log_dir)).entries) == 1
@@ -0,0 +1,124 @@
+"""Test the LLM response cache in utils/llm_cache.py
+
+Covers the cache key, record/replay modes, chunk-by-chunk stream replay and size-bounded eviction."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.llm_cache import LLMCacheMiss, LLMResponseCache, make_llm_cache_key
+from utils.llm_client import BaseLLMClient, PooledLLMClient
+
+
+class FakePool:
+    """Connection pool stand-in counting the requests that reach the provider"""
+
+    def __init__(self, fail: bool = False):
+        self.requests = []
+        self.fail = fail
+
+    def create(self, api_key, base_url, **params):
+        self.requests.append(params)
+        if self.fail:
+            raise ConnectionError("provider unavailable")
+        message = type("Message", (), {"content": " 回答 "})()
+        return type("Response", (), {"choices": [type("Choice", (), {"message": message})()]})()
+
+    def stream(self, api_key, base_url, **params):
+        self.requests.append(params)
+        yield from ["舆情", "分析", "报告"]
+
+
+class TestLLMResponseCache:
+    """Test recording and replaying LLM responses"""
+
+    @pytest.fixture(autouse=True)
+    def use_tmp_path(self, tmp_path):
+        self.cache_dir = tmp_path / "llm_cache"
+
+    def _client(self, mode: str, client_class=BaseLLMClient, **kwargs) -> BaseLLMClient:
+        client = client_class("key", "model", "https://llm.example.com/v1", **kwargs)
+        client.pool = FakePool()
+        client.cache = LLMResponseCache(mode=mode, cache_dir=str(self.cache_dir))
+        return client
+
+    def test_key_covers_model_prompts_and_params(self):
+        key = make_llm_cache_key("m", "sys", "user", {"temperature": 0.7})
+        assert key == make_llm_cache_key("m", "sys", "user", {"temperature": 0.7})
+        assert key != make_llm_cache_key("m", "sys", "user", {"temperature": 0.2})
+        assert key != make_llm_cache_key("other", "sys", "user", {"temperature": 0.7})
+        assert key != make_llm_cache_key("m", "sys", "user 2", {"temperature": 0.7})
+
+    def test_record_then_replay(self):
+        recorder = self._client("record")
+        assert recorder.invoke("sys", "user", temperature=0.3) == "回答"
+        assert recorder.invoke("sys", "user", temperature=0.3) == "回答"
+        assert len(recorder.pool.requests) == 1
+
+        replayer = self._client("replay")
+        assert replayer.invoke("sys", "user", temperature=0.3) == "回答"
+        assert replayer.pool.requests == []
+        with pytest.raises(LLMCacheMiss):
+            replayer.invoke("sys", "another prompt")
+
+    def test_stream_replayed_chunk_by_chunk(self):
+        recorder = self._client("record")
+        assert list(recorder.stream_invoke("sys", "user")) == ["舆情", "分析", "报告"]
+
+        replayer = self._client("replay")
+        assert list(replayer.stream_invoke("sys", "user")) == ["舆情", "分析", "报告"]
+        assert replayer.stream_invoke_to_string("sys", "user") == "舆情分析报告"
+        assert replayer.pool.requests == []
+
+    def test_partial_stream_not_recorded(self):
+        recorder = self._client("record")
+        stream = recorder.stream_invoke("sys", "user")
+        assert next(stream) == "舆情"
+        stream.close()
+        assert recorder.cache.stats()['stored'] == 0
+
+    def test_off_mode_always_calls_provider(self):
+        client = self._client("off")
+        client.invoke("sys", "user")
+        client.invoke("sys", "user")
+        assert len(client.pool.requests) == 2
+        assert not self.cache_dir.exists()
+
+    def test_eviction_keeps_recent_responses(self):
+        cache = LLMResponseCache(mode="record", cache_dir=str(self.cache_dir), max_bytes=1000)
+        for i in range(10):
+            cache.store(f"k{i}", "m", ["x" * 200])
+        assert cache.stats()['evicted'] > 0
+        assert cache.lookup("k9") == ["x" * 200]
+        assert cache.lookup("k0") is None
+
+    def test_running_total_recounts_only_over_the_limit(self, monkeypatch):
+        cache = LLMResponseCache(mode="record", cache_dir=str(self.cache_dir), max_bytes=1000)
+        recounts = []
+        count_bytes = cache._count_bytes
+        monkeypatch.setattr(cache, "_count_bytes", lambda: recounts.append(1) or count_bytes())
+        for i in range(4):
+            cache.store(f"k{i}", "m", ["x" * 200])
+        assert recounts == []
+        # Replacing a response overcounts the running total, the recount finds nothing to evict
+        cache.store("k0", "m", ["x" * 200])
+        assert len(recounts) == 1 and cache.stats()['evicted'] == 0
+        assert cache._stored_bytes == 4 * len('["' + "x" * 200 + '"]')
+
+    def test_pooled_client_is_cached_and_not_retried(self):
+        recorder = self._client("record", PooledLLMClient, add_time_prefix=False)
+        assert recorder.invoke("sys", "user", temperature=0.7) == "回答"
+        assert recorder.invoke("sys", "user", temperature=0.7) == "回答"
+        [request] = recorder.pool.requests
+        assert request["messages"][1]["content"] == "user"
+
+        failing = self._client("record", PooledLLMClient)
+        failing.pool = FakePool(fail=True)
+        with pytest.raises(ConnectionError):
+            failing.invoke("sys", "new prompt")
+        assert len(failing.pool.requests) == 1
@@ -0,0 +1,88 @@
+"""Test the shared LLM connection pool in utils/llm_client.py
+
+Covers provider keys, the token bucket and the per-provider concurrency limit of the sync facades."""
+
+import sys
+import time
+import asyncio
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.llm_client import LLMConnectionPool, TokenBucket, provider_key
+
+
+class FakeCompletions:
+    """chat.completions stand-in recording the peak number of requests in flight"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    async def create(self, stream=False, **params):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        if stream:
+            return self._stream(["舆", "情"])
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=params["model"]))])
+
+    async def _stream(self, parts):
+        for part in parts:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=part))])
+
+
+class TestLLMConnectionPool:
+    """Test limits and facades of LLMConnectionPool"""
+
+    def setup_method(self, method):
+        self.completions = FakeCompletions()
+        self.pool = LLMConnectionPool(provider_concurrency=2)
+        self.pool._client = lambda api_key, base_url: SimpleNamespace(chat=SimpleNamespace(completions=self.completions))
+
+    def test_provider_key(self):
+        assert provider_key(None) == "api.openai.com"
+        assert provider_key("https://api.siliconflow.cn/v1") == provider_key("https://api.siliconflow.cn/v2")
+
+    def test_token_bucket_spaces_requests(self):
+        bucket = TokenBucket(rate=2, capacity=2)
+        delays = [bucket.reserve() for _ in range(4)]
+        assert delays[:2] == [0.0, 0.0]
+        assert 0.4 < delays[2] < 0.6 and 0.9 < delays[3] < 1.1
+
+    def test_concurrency_limited_per_provider(self):
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            responses = list(executor.map(lambda i: self.pool.create("key", "https://llm.example.com/v1", model=f"m{i}"), range(6)))
+        assert [response.choices[0].message.content for response in responses] == [f"m{i}" for i in range(6)]
+        assert self.completions.peak == 2
+
+    def test_stream_and_async_facades(self):
+        assert list(self.pool.stream("key", None, model="m")) == ["舆", "情"]
+
+        async def collect():
+            chunks = [chunk async for chunk in self.pool.astream("key", None, model="m")]
+            response = await self.pool.acreate("key", None, model="async")
+            return chunks, response.choices[0].message.content
+
+        assert asyncio.run(collect()) == (["舆", "情"], "async")
+
+    def test_closed_stream_releases_slot(self):
+        stream = self.pool.stream("key", None, model="m")
+        assert next(stream) == "舆"
+        stream.close()
+        start = time.monotonic()
+        self.pool.create("key", None, model="m")
+        self.pool.create("key", None, model="m")
+        assert self.pool._semaphores["api.openai.com"]._value == 2
+        assert time.monotonic() - start < 1
@@ -0,0 +1,101 @@
+"""Test the incremental log tailer in utils/log_tailer.py
+
+Covers appends, partial lines, in-place truncation and unlink+recreate rotation."""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.log_tailer import LogTailer, read_tail_lines
+
+
+class TestLogTailer:
+    """Test offset tracking of LogTailer"""
+
+    def setup_method(self, method):
+        self.log_dir = project_root / "tests" / "test_logs"
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.log_file = self.log_dir / f"tailer_{method.__name__}.log"
+        self.log_file.write_text("old line\n", encoding='utf-8')
+        self.batches = []
+
+    def teardown_method(self, method):
+        if self.log_file.exists():
+            self.log_file.unlink()
+
+    def _append(self, text):
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_start_at_end_skips_existing_content(self):
+        tailer = LogTailer(self.log_file, self.batches.append)
+        assert tailer.read_available() == []
+        self._append("new line\n")
+        assert tailer.read_available() == ["new line"]
+        assert tailer.read_available() == []
+
+    def test_partial_line_is_held_back(self):
+        tailer = LogTailer(self.log_file, self.batches.append, start_at_end=False)
+        assert tailer.read_available() == ["old line"]
+        self._append("half")
+        assert tailer.read_available() == []
+        self._append(" done\n")
+        assert tailer.read_available() == ["half done"]
+
+    def test_truncation_restarts_from_beginning(self):
+        tailer = LogTailer(self.log_file, self.batches.append)
+        tailer.read_available()
+        with open(self.log_file, 'w', encoding='utf-8') as f:
+            f.write("x\n")
+        assert tailer.read_available() == ["x"]
+
+    def test_rotation_reads_new_file(self):
+        tailer = LogTailer(self.log_file, self.batches.append)
+        tailer.read_available()
+        self._append("last of old file\n")
+        os.unlink(self.log_file)
+        self.log_file.write_text("first of new file\n", encoding='utf-8')
+        assert tailer.read_available() == ["last of old file", "first of new file"]
+
+    def test_background_thread_delivers_batches(self):
+        tailer = LogTailer(self.log_file, self.batches.append, poll_interval=0.02)
+        tailer.start()
+        try:
+            time.sleep(0.1)
+            self._append("a\nb\nc\n")
+            deadline = time.time() + 2
+            while not self.batches and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            tailer.stop()
+        assert [line for batch in self.batches for line in batch] == ["a", "b", "c"]
+
+
+class TestReadTailLines:
+    """Test the backward tail reader"""
+
+    def setup_method(self, method):
+        self.log_dir = project_root / "tests" / "test_logs"
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.log_file = self.log_dir / f"tail_{method.__name__}.log"
+
+    def teardown_method(self, method):
+        if self.log_file.exists():
+            self.log_file.unlink()
+
+    def test_matches_full_read_across_chunks(self):
+        lines = [f"[12:00:{i % 60:02d}] 第{i}行 " + "x" * (i % 37) for i in range(500)]
+        self.log_file.write_text("\n".join(lines) + "\n\n", encoding='utf-8')
+        for count in (1, 7, 100, 500, 900):
+            assert read_tail_lines(self.log_file, count, chunk_size=64) == lines[-count:]
+
+    def test_skips_empty_lines_and_keeps_unterminated_last_line(self):
+        self.log_file.write_text("a\r\n\n\nb\n   \nc", encoding='utf-8')
+        assert read_tail_lines(self.log_file, 2, chunk_size=3) == ["b", "c"]
+        assert read_tail_lines(self.log_file, 10) == ["a", "b", "c"]
+        assert read_tail_lines(self.log_file, 0) == []
@@ -0,0 +1,76 @@
+"""Test the search tool result cache in InsightEngine/utils/query_cache.py
+
+Covers key normalization, LRU eviction, version/TTL invalidation and the on-disk tier and its cleanup."""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from InsightEngine.utils.query_cache import QueryResultCache, make_cache_key
+
+
+class TestQueryResultCache:
+    """Test lookups and invalidation of QueryResultCache"""
+
+    @pytest.fixture(autouse=True)
+    def use_tmp_path(self, tmp_path):
+        self.cache_dir = tmp_path
+        self.versions = {'weibo_note': 100, 'weibo_note_comment': 7}
+
+    def test_key_normalizes_whitespace(self):
+        assert make_cache_key("db", "search", {'topic': ' 武汉  大学 ', 'limit': 5}) == make_cache_key("db", "search", {'limit': 5, 'topic': '武汉 大学'})
+        assert make_cache_key("db", "search", {'topic': 'a'}) != make_cache_key("db", "other", {'topic': 'a'})
+
+    def test_hit_returns_copy(self):
+        cache = QueryResultCache()
+        cache.set("k", self.versions, {'results': [1, 2]})
+        first = cache.get("k", self.versions)
+        first['results'].append(3)
+        assert cache.get("k", self.versions) == {'results': [1, 2]}
+        assert cache.stats()['hits'] == 2
+
+    def test_new_data_invalidates(self):
+        cache = QueryResultCache()
+        cache.set("k", self.versions, "value")
+        assert cache.get("k", dict(self.versions, weibo_note=101)) is None
+        stats = cache.stats()
+        assert stats['stale'] == 1 and stats['misses'] == 1
+
+    def test_ttl_and_lru_eviction(self):
+        cache = QueryResultCache(max_entries=2, ttl=0)
+        cache.set("k", self.versions, "value")
+        assert cache.get("k", self.versions) is None
+
+        cache = QueryResultCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, self.versions, key)
+        assert cache.get("a", self.versions) is None
+        assert cache.get("c", self.versions) == "c"
+
+    def test_disk_tier_shared_between_instances(self):
+        QueryResultCache(disk_dir=str(self.cache_dir)).set("k", self.versions, "value")
+        other = QueryResultCache(disk_dir=str(self.cache_dir))
+        assert other.get("k", self.versions) == "value"
+        assert other.stats()['shared_hits'] == 1
+
+    def test_stale_disk_entry_is_deleted_and_counted_once(self):
+        cache = QueryResultCache(disk_dir=str(self.cache_dir))
+        cache.set("k", self.versions, "value")
+        assert cache.get("k", dict(self.versions, weibo_note=101)) is None
+        assert cache.stats()['stale'] == 1
+        assert not (self.cache_dir / "k.pkl").exists()
+
+    def test_disk_sweep_removes_expired_files(self):
+        QueryResultCache(disk_dir=str(self.cache_dir)).set("old", self.versions, "value")
+        expired = time.time() - 3600
+        os.utime(self.cache_dir / "old.pkl", (expired, expired))
+        (self.cache_dir / "fresh.pkl").write_bytes(b"")
+        QueryResultCache(ttl=600, disk_dir=str(self.cache_dir))
+        assert sorted(path.name for path in self.cache_dir.iterdir()) == ["fresh.pkl"]
@@ -0,0 +1,63 @@
+"""Test batched inference of WeiboMultilingualSentimentAnalyzer.analyze_batch
+
+Uses a character tokenizer and a tiny model whose prediction depends on the text length, so no model download is needed."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests.char_tokenizer import CharTokenizer
+from InsightEngine.tools.sentiment_analyzer import WeiboMultilingualSentimentAnalyzer
+
+
+class LengthModel(torch.nn.Module):
+    """Predicts class (text length % 5) and records the padded batch shapes"""
+
+    def __init__(self):
+        super().__init__()
+        self.shapes = []
+
+    def forward(self, input_ids, attention_mask):
+        self.shapes.append(tuple(input_ids.shape))
+        lengths = attention_mask.sum(dim=1)
+        return type("Output", (), {"logits": torch.nn.functional.one_hot(lengths % 5, 5).float() * 4})()
+
+
+class TestAnalyzeBatch:
+    """Test ordering, bucketing and input handling of analyze_batch"""
+
+    def setup_method(self):
+        self.analyzer = WeiboMultilingualSentimentAnalyzer(batch_size=4)
+        self.analyzer.enable()
+        self.analyzer.tokenizer = CharTokenizer()
+        self.analyzer.model = LengthModel()
+        self.analyzer.device = torch.device("cpu")
+        self.analyzer.is_initialized = True
+
+    def test_results_keep_input_order(self):
+        texts = ["x" * length for length in (9, 1, 7, 3, 12, 2, 5, 8, 4, 6)]
+        batch = self.analyzer.analyze_batch(texts, show_progress=False)
+        assert [result.text for result in batch.results] == texts
+        labels = list(self.analyzer.sentiment_map.values())
+        assert [result.sentiment_label for result in batch.results] == [labels[len(text) % 5] for text in texts]
+        assert batch.success_count == len(texts)
+
+    def test_batches_are_length_bucketed(self):
+        texts = ["x" * length for length in (20, 1, 19, 2, 18, 3, 17, 4)]
+        self.analyzer.analyze_batch(texts, show_progress=False)
+        # Short and long texts are not padded to each other
+        assert self.analyzer.model.shapes == [(4, 4), (4, 20)]
+
+    def test_empty_texts_fail_without_breaking_the_batch(self):
+        batch = self.analyzer.analyze_batch(["good", "   ", "bad!"], show_progress=False, batch_size=8)
+        assert [result.success for result in batch.results] == [True, False, True]
+        assert batch.results[1].sentiment_label == "Input error"
+        assert batch.failed_count == 1
+        assert self.analyzer.analyze_single_text("good").sentiment_label == batch.results[0].sentiment_label
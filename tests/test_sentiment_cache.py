@@ -0,0 +1,66 @@
+"""Test the sentiment result cache in InsightEngine/tools/sentiment_analyzer.py
+
+Inference is replaced by a counting stub, so only the cache paths of analyze_batch are exercised."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from InsightEngine.tools.sentiment_analyzer import (
+    SentimentCache,
+    SentimentResult,
+    WeiboMultilingualSentimentAnalyzer,
+)
+
+
+class TestSentimentCache:
+    """Test lookups of SentimentCache and cache use in analyze_batch"""
+
+    @pytest.fixture(autouse=True)
+    def use_tmp_path(self, tmp_path):
+        self.cache_dir = tmp_path
+        self.predicted = []
+
+    def make_analyzer(self, cache: SentimentCache) -> WeiboMultilingualSentimentAnalyzer:
+        analyzer = WeiboMultilingualSentimentAnalyzer(cache=cache)
+        analyzer.is_disabled = False
+        analyzer.is_initialized = True
+
+        def fake_predict(texts, processed_texts, batch_size=None, show_progress=False):
+            self.predicted.extend(processed_texts)
+            return [
+                SentimentResult(text=text, sentiment_label="neutral", confidence=0.9, probability_distribution={"neutral": 0.9})
+                for text in texts
+            ]
+
+        analyzer._predict = fake_predict
+        return analyzer
+
+    def test_lru_eviction(self):
+        cache = SentimentCache(max_entries=2)
+        cache.set_many({key: ("neutral", 0.5, {}) for key in ("a", "b", "c")})
+        assert set(cache.get_many(["a", "b", "c"])) == {"b", "c"}
+        assert cache.stats()["misses"] == 1
+
+    def test_only_misses_are_predicted(self):
+        analyzer = self.make_analyzer(SentimentCache())
+        analyzer.analyze_batch(["好评", "差评"], show_progress=False)
+        batch = analyzer.analyze_batch(["  好评 ", "差评", "一般", "一般"], show_progress=False)
+        # Whitespace is normalized before hashing, duplicates in a batch are scored once
+        assert self.predicted == ["好评", "差评", "一般"]
+        assert [result.text for result in batch.results] == ["  好评 ", "差评", "一般", "一般"]
+        assert batch.success_count == 4
+
+    def test_sqlite_tier_persists(self):
+        db_path = str(self.cache_dir / "sentiment.db")
+        self.make_analyzer(SentimentCache(db_path=db_path)).analyze_batch(["好评"], show_progress=False)
+        other = self.make_analyzer(SentimentCache(db_path=db_path))
+        result = other.analyze_single_text("好评")
+        assert result.success and result.confidence == 0.9
+        assert self.predicted == ["好评"]
+        assert other.cache.stats()["db_hits"] == 1
@@ -0,0 +1,70 @@
+"""Parity test of the ONNX Runtime sentiment backend against PyTorch
+
+Exports a tiny randomly initialized DistilBERT classifier (same architecture as
+tabularisai/multilingual-sentiment-analysis) and compares the probabilities of both backends."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+torch = pytest.importorskip("torch")
+np = pytest.importorskip("numpy")
+pytest.importorskip("onnxruntime")
+pytest.importorskip("onnx")
+transformers = pytest.importorskip("transformers")
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tests.char_tokenizer import CharTokenizer
+from InsightEngine.tools.sentiment_analyzer import (
+    WeiboMultilingualSentimentAnalyzer,
+    create_onnx_session,
+    export_onnx_model,
+    quantize_onnx_model,
+)
+
+TEXTS = ["今天天气真好", "服务太差了，非常失望", "I absolutely love this product!", "一般般吧", "x", "再也不来了" * 10]
+
+
+def make_analyzer(backend: str, **components) -> WeiboMultilingualSentimentAnalyzer:
+    analyzer = WeiboMultilingualSentimentAnalyzer(batch_size=4, backend=backend)
+    analyzer.enable()
+    analyzer.tokenizer = CharTokenizer()
+    for name, value in components.items():
+        setattr(analyzer, name, value)
+    analyzer.device = torch.device("cpu") if backend == "torch" else "cpu"
+    analyzer.is_initialized = True
+    return analyzer
+
+
+class TestOnnxBackend:
+    """Compare the onnx backend with the torch backend on the same weights"""
+
+    @pytest.fixture(autouse=True)
+    def export_model(self, tmp_path):
+        self.export_dir = tmp_path
+        torch.manual_seed(0)
+        config = transformers.DistilBertConfig(
+            vocab_size=1001, dim=32, hidden_dim=64, n_layers=2, n_heads=2, num_labels=5, max_position_embeddings=128
+        )
+        self.model = transformers.DistilBertForSequenceClassification(config).eval()
+        self.fp32_path = export_onnx_model(self.model, CharTokenizer.model_input_names, str(self.export_dir / "model.onnx"))
+
+    def _probabilities(self, analyzer):
+        batch = analyzer.analyze_batch(TEXTS, show_progress=False)
+        assert batch.success_count == len(TEXTS)
+        return np.array([list(result.probability_distribution.values()) for result in batch.results])
+
+    def test_fp32_export_matches_torch(self):
+        expected = self._probabilities(make_analyzer("torch", model=self.model))
+        actual = self._probabilities(make_analyzer("onnx", session=create_onnx_session(self.fp32_path, num_threads=1)))
+        np.testing.assert_allclose(actual, expected, atol=1e-4)
+
+    def test_int8_export_stays_close(self):
+        int8_path = quantize_onnx_model(self.fp32_path, str(self.export_dir / "model.int8.onnx"))
+        expected = self._probabilities(make_analyzer("torch", model=self.model))
+        actual = self._probabilities(make_analyzer("onnx", session=create_onnx_session(int8_path)))
+        np.testing.assert_allclose(actual, expected, atol=0.05)
@@ -0,0 +1,65 @@
+"""Test the research checkpoints written by State.save_to_file
+
+Covers the pending search round trip and the atomic replacement of the checkpoint file."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from QueryEngine.state import State
+
+
+class TestStateCheckpoint:
+    """Test saving and restoring an unfinished research state"""
+
+    @pytest.fixture(autouse=True)
+    def use_tmp_path(self, tmp_path):
+        self.checkpoint_dir = tmp_path
+        self.checkpoint_path = str(self.checkpoint_dir / "checkpoint.json")
+
+        self.state = State(query="武汉大学樱花季")
+        self.state.add_paragraph("背景", "活动概况")
+        self.state.add_paragraph("舆情", "网友评价")
+
+    def test_pending_search_round_trip(self):
+        research = self.state.paragraphs[0].research
+        results = [{'title': 't', 'url': 'u', 'content': 'c', 'score': 0.5, 'published_date': None}]
+        research.add_search_results("樱花 预约", results)
+        research.set_pending_search("樱花 预约", results)
+        self.state.save_to_file(self.checkpoint_path)
+
+        restored = State.load_from_file(self.checkpoint_path).paragraphs[0].research
+        assert restored.pending_search == {"query": "樱花 预约", "results": results}
+        assert restored.get_search_count() == 1
+
+        restored.clear_pending_search()
+        assert restored.to_dict()["pending_search"] is None
+
+    def test_save_replaces_file_without_leftovers(self):
+        self.state.save_to_file(self.checkpoint_path)
+        self.state.paragraphs[0].research.latest_summary = "summary"
+        self.state.save_to_file(self.checkpoint_path)
+
+        assert State.load_from_file(self.checkpoint_path).paragraphs[0].research.latest_summary == "summary"
+        assert os.listdir(self.checkpoint_dir) == ["checkpoint.json"]
+
+    def test_failed_save_keeps_previous_checkpoint(self, monkeypatch):
+        self.state.save_to_file(self.checkpoint_path)
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        self.state.paragraphs[0].research.latest_summary = "lost"
+        with pytest.raises(OSError):
+            self.state.save_to_file(self.checkpoint_path)
+        monkeypatch.undo()
+
+        assert State.load_from_file(self.checkpoint_path).paragraphs[0].research.latest_summary == ""
+        assert os.listdir(self.checkpoint_dir) == ["checkpoint.json"]
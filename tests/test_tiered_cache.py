@@ -0,0 +1,66 @@
+"""Test the shared cache tiers in InsightEngine/utils/tiered_cache.py"""
+
+import sys
+import pickle
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+# Add project root directory to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from InsightEngine.utils.tiered_cache import LRUCache, TieredCache
+
+
+class TestTieredCache:
+    """Test LRU eviction and the SQLite tier"""
+
+    @pytest.fixture(autouse=True)
+    def use_tmp_path(self, tmp_path):
+        self.cache_dir = tmp_path
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = LRUCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get_many(["a", "c"]) == {"a": 1, "c": 3}
+
+    def test_sqlite_tier_survives_restart(self):
+        db_path = str(self.cache_dir / "cache.db")
+        cache = TieredCache("values", max_entries=1, db_path=db_path)
+        cache.set_many({"a": {"x": 1}, "b": [2]})
+        assert len(cache.memory) == 1
+
+        other = TieredCache("values", max_entries=10, db_path=db_path)
+        assert other.get_many(["a", "b", "c"]) == {"a": {"x": 1}, "b": [2]}
+        assert other.get_many(["a"]) == {"a": {"x": 1}}
+        stats = other.stats()
+        assert (stats['db_hits'], stats['hits'], stats['misses']) == (2, 1, 1)
+
+    def test_sqlite_tier_evicts_least_recently_used(self):
+        db_path = str(self.cache_dir / "cache.db")
+        cache = TieredCache("values", max_entries=1, db_path=db_path, dumps=bytes, loads=bytes, max_db_bytes=1000)
+        for i in range(4):
+            cache.set_many({f"k{i}": b"x" * 200})
+        # Reading k0 back from the file makes it the most recently used entry
+        assert cache.get_many(["k0"]) == {"k0": b"x" * 200}
+        for i in range(4, 6):
+            cache.set_many({f"k{i}": b"x" * 200})
+        assert cache.stats()['evicted'] == 2
+
+        other = TieredCache("values", max_entries=10, db_path=db_path, dumps=bytes, loads=bytes)
+        assert sorted(other.get_many([f"k{i}" for i in range(6)])) == ["k0", "k3", "k4", "k5"]
+
+    def test_file_without_last_used_column_is_upgraded(self):
+        db_path = self.cache_dir / "cache.db"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute('CREATE TABLE "values" (cache_key TEXT PRIMARY KEY, value BLOB NOT NULL, add_ts INTEGER NOT NULL)')
+            conn.execute('INSERT INTO "values" VALUES (?, ?, ?)', ("a", pickle.dumps(1), 0))
+        cache = TieredCache("values", max_entries=10, db_path=str(db_path))
+        cache.set_many({"b": 2})
+        assert cache.get_many(["a", "b"]) == {"a": 1, "b": 2}
@@ -0,0 +1,116 @@
+"""Test the MindSpider topic rollup job (MindSpider/schema/topic_rollup.py) and the search_topic_overview tool reading it
+
+Both run against one SQLite database."""
+
+import sys
+import json
+import sqlite3
+import subprocess
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("greenlet")
+pytest.importorskip("aiosqlite")
+
+# Add project root directory and the MindSpider schema directory to path
+project_root = Path(__file__).parent.parent
+schema_dir = project_root / "MindSpider" / "schema"
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(schema_dir))
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import topic_rollup
+from topic_rollup import ROLLUP_TABLE, TopicRollupBuilder
+from InsightEngine.tools import search
+from InsightEngine.tools.search import MediaCrawlerDB
+from InsightEngine.utils import db
+from InsightEngine.utils.db import run_sync
+
+DAY = date(2025, 8, 22)
+WEIBO_COLUMNS = ['id', 'content', 'nickname', 'create_date_time', 'liked_count', 'comments_count', 'shared_count',
+                 'note_url', 'source_keyword', 'topic_id']
+WEIBO_ROWS = [
+    (1, 'iPhone 17 发布', 'a', '2025-08-22 09:00:00', '100', '10', '1', 'u1', 'iPhone', 't1'),
+    (2, 'iphone 涨价', 'b', '2025-08-22 12:00:00', '1.2万', '5', '0', 'u2', 'iphone', 't1'),
+    (3, 'iPhone 排队', 'c', '2025-08-22 18:00:00', '10', '0', '0', 'u3', 'iPhone', 't1'),
+    (4, '樱花季', 'd', '2025-08-22 10:00:00', '5', '1', '0', 'u4', '樱花', 't2'),
+    (5, 'iPhone 旧闻', 'e', '2025-08-21 10:00:00', '999', '0', '0', 'u5', 'iPhone', 't1'),
+]
+
+
+class TestTopicRollup:
+    """Test building the daily rollups and reading them back as a topic overview"""
+
+    @pytest.fixture(autouse=True)
+    def database(self, tmp_path, monkeypatch):
+        path = tmp_path / "mindspider.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute(f"CREATE TABLE weibo_note ({', '.join(WEIBO_COLUMNS)})")
+            conn.executemany(f"INSERT INTO weibo_note VALUES ({', '.join('?' for _ in WEIBO_COLUMNS)})", WEIBO_ROWS)
+        self.engine = create_engine(f"sqlite:///{path}")
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        monkeypatch.setattr(db, "get_async_engine", lambda: async_engine)
+        monkeypatch.setattr(search.settings, "DB_QUERY_CACHE_ENABLED", False)
+        monkeypatch.setattr(MediaCrawlerDB, "_schema_snapshot", None)
+        monkeypatch.setattr(MediaCrawlerDB, "_schema_checked_at", 0.0)
+        yield
+        run_sync(async_engine.dispose())
+        self.engine.dispose()
+
+    def _rollup_rows(self):
+        with sqlite3.connect(self.engine.url.database) as conn:
+            conn.row_factory = sqlite3.Row
+            return [dict(row) for row in conn.execute(f"SELECT * FROM {ROLLUP_TABLE} ORDER BY source_keyword")]
+
+    def test_keywords_differing_in_case_share_a_row(self):
+        TopicRollupBuilder(self.engine, top_n=2).build([DAY])
+        rows = self._rollup_rows()
+        assert [(row['source_keyword'], row['content_count']) for row in rows] == [('iPhone', 3), ('樱花', 1)]
+        iphone = rows[0]
+        assert iphone['liked_total'] == 100 + 12000 + 10 and iphone['topic_id'] == 't1'
+        assert [post['id'] for post in json.loads(iphone['top_posts'])] == [2, 1]
+
+    def test_sentiment_analyzer_imports_without_the_agent(self):
+        # A fresh interpreter, as when topic_rollup.py runs as a script
+        code = ("import sys; sys.path.insert(0, sys.argv[1]); import topic_rollup; "
+                "module = topic_rollup._import_sentiment_module(); "
+                "print(hasattr(module, 'multilingual_sentiment_analyzer'), 'InsightEngine.agent' in sys.modules)")
+        completed = subprocess.run([sys.executable, "-c", code, str(schema_dir)], capture_output=True, text=True, check=True)
+        assert completed.stdout.splitlines()[-1].split() == ["True", "False"]
+
+    def test_sentiment_distribution_of_the_hottest_posts(self, monkeypatch):
+        analyzer = topic_rollup._import_sentiment_module().multilingual_sentiment_analyzer
+        monkeypatch.setattr(analyzer, "initialize", lambda: True)
+        monkeypatch.setattr(analyzer, "analyze_batch", lambda texts, show_progress=False: SimpleNamespace(
+            results=[SimpleNamespace(success=True, sentiment_label="正面" if "iPhone" in text else "中性") for text in texts]
+        ))
+        TopicRollupBuilder(self.engine, sentiment_sample=2).build([DAY])
+        iphone = self._rollup_rows()[0]
+        # The two hottest iPhone posts are ids 2 ("iphone 涨价") and 1 ("iPhone 17 发布")
+        assert json.loads(iphone['sentiment_distribution']) == {"中性": 1, "正面": 1}
+
+    def test_rebuild_replaces_the_day(self):
+        builder = TopicRollupBuilder(self.engine)
+        builder.build([DAY])
+        builder.build([DAY])
+        assert len(self._rollup_rows()) == 2
+
+    def test_overview_reads_the_rollups(self):
+        TopicRollupBuilder(self.engine, top_n=2).build([DAY])
+        schema = {'weibo_note': WEIBO_COLUMNS, ROLLUP_TABLE: ['id', 'source_keyword']}
+        MediaCrawlerDB._schema_snapshot = schema
+        response = MediaCrawlerDB(load_schema=False).search_topic_overview("iphone", start_date="2025-08-22", end_date="2025-08-22")
+        assert response.error_message is None
+        assert response.metadata['totals']['content_count'] == 3
+        assert list(response.metadata['platforms']) == ['weibo']
+        assert [result.title_or_content for result in response.results] == ['iphone 涨价', 'iPhone 17 发布']
+
+    def test_overview_without_rollups(self):
+        MediaCrawlerDB._schema_snapshot = {'weibo_note': WEIBO_COLUMNS}
+        response = MediaCrawlerDB(load_schema=False).search_topic_overview("iphone")
+        assert response.error_message and "topic_rollup.py" in response.error_message
@@ -0,0 +1,229 @@
+"""Forum event bus
+Structured channel between the engine processes and ForumEngine.
+
+FirstSummaryNode / ReflectionSummaryNode publish typed summary events as JSON datagrams on a local
+Unix socket (logs/forum_events.sock); LogMonitor binds the socket and keeps received events in a
+bounded in-memory ring buffer. Publishing never raises: when the socket is missing or the platform
+has no AF_UNIX datagram support the call simply returns False and ForumEngine keeps scraping the logs.
+
+Once an engine has delivered over the bus, ForumEngine stops reassembling its JSON log output. An event
+that cannot be delivered while ForumEngine is listening (too large for a datagram, send failure) is
+written to the engine log as one FALLBACK_LOG_MARKER line instead, which the monitor reads cheaply."""
+
+import os
+import json
+import time
+import socket
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+FORUM_EVENT_SOCKET_NAME = "forum_events.sock"
+SUMMARY_EVENT = "summary"
+MAX_DATAGRAM_SIZE = 200 * 1024  # Stay below the default Linux unix datagram limit
+FALLBACK_LOG_MARKER = "ForumEvent fallback:"
+BUS_SUPPORTED = hasattr(socket, 'AF_UNIX') and os.name != 'nt'
+
+
+def get_socket_path(log_dir: str = "logs") -> Path:
+    """Get the event bus socket path for a log directory"""
+    return Path(log_dir) / FORUM_EVENT_SOCKET_NAME
+
+
+class ForumEventPublisher:
+    """Publishing side, one instance per engine process"""
+
+    def __init__(self, log_dir: str = "logs", send_timeout: float = 0.5):
+        self.socket_path = get_socket_path(log_dir)
+        self.send_timeout = send_timeout
+        self._sock = None
+        self._lock = threading.Lock()
+
+    def publish(self, event: Dict[str, Any]) -> bool:
+        """Send one event
+
+        Returns:
+            Whether the event was handed to a subscriber"""
+        if not BUS_SUPPORTED or not self.socket_path.exists():
+            return False
+
+        payload = json.dumps(event, ensure_ascii=False).encode('utf-8')
+        if len(payload) > MAX_DATAGRAM_SIZE:
+            logger.debug(f"Forum event too large for the bus ({len(payload)} bytes), writing it to the log")
+            return False
+
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                    self._sock.settimeout(self.send_timeout)
+                self._sock.sendto(payload, str(self.socket_path))
+                return True
+            except OSError as e:
+                # No subscriber bound (ForumEngine not running) or buffer full
+                logger.debug(f"Forum event was not delivered: {e}")
+                self._close()
+                return False
+
+    def _close(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
+
+
+_publisher: Optional[ForumEventPublisher] = None
+_publisher_lock = threading.Lock()
+
+
+def get_publisher() -> ForumEventPublisher:
+    """Get the process-wide publisher"""
+    global _publisher
+    with _publisher_lock:
+        if _publisher is None:
+            _publisher = ForumEventPublisher()
+        return _publisher
+
+
+def publish_summary_event(engine: str, node: str, content: str) -> bool:
+    """Publish a paragraph summary produced by an engine
+
+    Args:
+        engine: engine name (insight/media/query)
+        node: node name (FirstSummaryNode/ReflectionSummaryNode)
+        content: paragraph content
+
+    Returns:
+        Whether the event was delivered"""
+    if not content:
+        return False
+    event = {
+        'type': SUMMARY_EVENT,
+        'engine': engine.lower(),
+        'node': node,
+        'content': content,
+        'ts': time.time(),
+        'pid': os.getpid()
+    }
+    publisher = get_publisher()
+    if publisher.publish(event):
+        return True
+    if BUS_SUPPORTED and publisher.socket_path.exists():
+        # ForumEngine is listening but no longer parses this engine's JSON output: hand the event over in the log
+        logger.info(f"{FALLBACK_LOG_MARKER} {json.dumps(event, ensure_ascii=False)}")
+    return False
+
+
+def parse_fallback_line(line: str) -> Optional[Dict[str, Any]]:
+    """Extract the event of a FALLBACK_LOG_MARKER log line, None for any other line"""
+    position = line.find(FALLBACK_LOG_MARKER)
+    if position == -1:
+        return None
+    try:
+        event = json.loads(line[position + len(FALLBACK_LOG_MARKER):].strip())
+    except json.JSONDecodeError:
+        return None
+    return event if isinstance(event, dict) else None
+
+
+class ForumEventSubscriber:
+    """Receiving side, owned by LogMonitor
+
+    A background thread receives datagrams into a ring buffer; the monitor loop drains it and can
+    block on wait() so it wakes up as soon as an event arrives."""
+
+    def __init__(self, log_dir: str = "logs", max_events: int = 1000):
+        self.socket_path = get_socket_path(log_dir)
+        self._events = deque(maxlen=max_events)
+        self._condition = threading.Condition()
+        self._sock = None
+        self._thread = None
+        self._running = False
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self) -> bool:
+        """Bind the socket and start receiving
+
+        Returns:
+            Whether the bus is available"""
+        if self._running:
+            return True
+        if not BUS_SUPPORTED:
+            logger.info("ForumEngine: event bus is not supported on this platform, using log scraping only")
+            return False
+        try:
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            sock.bind(str(self.socket_path))
+            sock.settimeout(0.5)
+        except OSError as e:
+            logger.warning(f"ForumEngine: failed to bind event bus, using log scraping only: {e}")
+            return False
+
+        self._sock = sock
+        self._running = True
+        self._thread = threading.Thread(target=self._receive_loop, name="ForumEventBus", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """Stop receiving and remove the socket file"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        try:
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+        except OSError:
+            pass
+        with self._condition:
+            self._events.clear()
+            self._condition.notify_all()
+
+    def _receive_loop(self):
+        while self._running:
+            try:
+                data = self._sock.recv(MAX_DATAGRAM_SIZE + 1024)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            try:
+                event = json.loads(data.decode('utf-8'))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                logger.warning("ForumEngine: dropped malformed event from bus")
+                continue
+            if not isinstance(event, dict):
+                continue
+            with self._condition:
+                if len(self._events) == self._events.maxlen:
+                    logger.warning("ForumEngine: event bus ring buffer full, dropping oldest event")
+                self._events.append(event)
+                self._condition.notify_all()
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Take all buffered events in arrival order"""
+        with self._condition:
+            events = list(self._events)
+            self._events.clear()
+        return events
+
+    def wait(self, timeout: float) -> bool:
+        """Wait until an event is buffered or timeout elapses, without consuming it"""
+        with self._condition:
+            if not self._events:
+                self._condition.wait(timeout)
+            return bool(self._events)
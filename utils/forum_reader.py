@@ -1,11 +1,215 @@
 """Forum log reading tool
 Used to read the latest HOST statements in forum.log"""
 
+import os
 import re
+import bisect
+import threading
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 from loguru import logger
 
+# Match format: [time] [source] content
+FORUM_LINE_PATTERN = re.compile(r'\[(\d{2}:\d{2}:\d{2})\]\s*\[([^\]]+)\]\s*(.+)')
+AGENT_SOURCES = ('INSIGHT', 'MEDIA', 'QUERY')
+
+
+class ForumLogIndex:
+    """Incremental index of forum.log
+    
+    Every non-empty line is recorded as (byte offset, byte length, timestamp, source) so content
+    can be read back with a single seek; timestamp and source are None for lines that are not
+    forum messages. The index is refreshed from the file's (inode, size, mtime):
+    an unchanged file costs one stat call, an appended file only parses the new bytes, and a
+    truncated or replaced file is re-indexed from the beginning. The latest HOST speech is cached."""
+
+    def __init__(self, forum_log_path: Path):
+        self.forum_log_path = Path(forum_log_path)
+        self.entries: List[Tuple[int, int, Optional[str], Optional[str]]] = []
+        self.offsets: List[int] = []  # Byte offset of each entry, kept separately for bisect
+        self._signature = None
+        self._identity = None
+        self._indexed_size = 0
+        self._latest_host: Optional[Dict[str, str]] = None
+        self._head = b''
+        self.lock = threading.RLock()
+
+    def refresh(self) -> bool:
+        """Bring the index up to date with the file
+        
+        Returns:
+            Whether forum.log exists"""
+        with self.lock:
+            try:
+                stat = os.stat(self.forum_log_path)
+            except FileNotFoundError:
+                self._reset()
+                return False
+
+            signature = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            if signature == self._signature:
+                return True
+
+            identity = (stat.st_dev, stat.st_ino)
+            if (identity != self._identity or stat.st_size < self._indexed_size
+                    or not self._head_unchanged()):
+                # forum.log is recreated for every forum session (or truncated in place at startup)
+                self._reset()
+                self._identity = identity
+
+            if stat.st_size > self._indexed_size:
+                self._index_from(self._indexed_size, stat.st_size)
+            self._signature = signature
+            return True
+
+    def _head_unchanged(self) -> bool:
+        """Check the first bytes of the file, catching a truncate-and-rewrite that kept the inode"""
+        if not self._head:
+            return True
+        with open(self.forum_log_path, 'rb') as f:
+            return f.read(len(self._head)) == self._head
+
+    def _reset(self):
+        self._head = b''
+        self.entries = []
+        self.offsets = []
+        self._signature = None
+        self._identity = None
+        self._indexed_size = 0
+        self._latest_host = None
+
+    def _index_from(self, start: int, end: int):
+        with open(self.forum_log_path, 'rb') as f:
+            f.seek(start)
+            data = f.read(end - start)
+
+        # Only complete lines are indexed, a partially written line is picked up next time
+        last_newline = data.rfind(b'\n')
+        if last_newline == -1:
+            return
+        data = data[:last_newline + 1]
+        if start == 0:
+            self._head = data[:64]
+
+        offset = start
+        for raw_line in data.splitlines(keepends=True):
+            line_offset = offset
+            offset += len(raw_line)
+            if not raw_line.strip():
+                continue
+            match = FORUM_LINE_PATTERN.match(raw_line.decode('utf-8', errors='ignore'))
+            if not match:
+                self.entries.append((line_offset, len(raw_line), None, None))
+                self.offsets.append(line_offset)
+                continue
+            timestamp, source, content = match.groups()
+            source = source.strip().upper()
+            self.entries.append((line_offset, len(raw_line), timestamp, source))
+            self.offsets.append(line_offset)
+            if source == 'HOST':
+                self._latest_host = {
+                    'timestamp': timestamp,
+                    'content': _decode_content(content)
+                }
+        self._indexed_size = offset
+
+    def read_messages(self, entries: List[Tuple[int, int, str, str]]) -> List[Dict[str, str]]:
+        """Read the content of indexed entries from forum.log"""
+        messages = []
+        if not entries:
+            return messages
+        with open(self.forum_log_path, 'rb') as f:
+            for offset, length, timestamp, source in entries:
+                f.seek(offset)
+                match = FORUM_LINE_PATTERN.match(f.read(length).decode('utf-8', errors='ignore'))
+                if match:
+                    messages.append({
+                        'timestamp': timestamp,
+                        'source': source,
+                        'content': _decode_content(match.group(3))
+                    })
+        return messages
+
+    @property
+    def signature(self) -> Optional[tuple]:
+        """(device, inode, size, mtime) of the file at the last refresh"""
+        return self._signature
+
+    def read_lines(self, start: int, end: int) -> List[str]:
+        """Read indexed lines [start, end) as one contiguous block, without line endings"""
+        with self.lock:
+            entries = self.entries[start:end]
+            if not entries:
+                return []
+            first_offset = entries[0][0]
+            last_offset, last_length = entries[-1][0], entries[-1][1]
+            with open(self.forum_log_path, 'rb') as f:
+                f.seek(first_offset)
+                block = f.read(last_offset + last_length - first_offset)
+            lines = []
+            for offset, length, _, _ in entries:
+                relative = offset - first_offset
+                lines.append(block[relative:relative + length].decode('utf-8', errors='ignore').rstrip('\r\n'))
+            return lines
+
+    def line_at_offset(self, byte_offset: int) -> int:
+        """Index of the first line starting at or after a byte offset"""
+        with self.lock:
+            return bisect.bisect_left(self.offsets, byte_offset)
+
+    def end_offset(self, line_index: int) -> int:
+        """Byte offset just past a line, or the indexed size when the index is past the end"""
+        with self.lock:
+            if 0 <= line_index < len(self.entries):
+                offset, length, _, _ = self.entries[line_index]
+                return offset + length
+            return self._indexed_size
+
+    def latest_host_speech(self) -> Optional[Dict[str, str]]:
+        """Latest HOST speech (cached while indexing)"""
+        with self.lock:
+            self.refresh()
+            return self._latest_host
+
+    def messages_by_source(self, sources, limit: Optional[int] = None) -> List[Dict[str, str]]:
+        """Messages from the given sources in file order, the latest `limit` ones if limit is set"""
+        with self.lock:
+            if not self.refresh():
+                return []
+            if limit is None:
+                selected = [entry for entry in self.entries if entry[3] in sources]
+            else:
+                selected = []
+                for entry in reversed(self.entries):
+                    if entry[3] in sources:
+                        selected.append(entry)
+                        if len(selected) >= limit:
+                            break
+                selected.reverse()
+            return self.read_messages(selected)
+
+
+def _decode_content(content: str) -> str:
+    """Handle escaped newlines, reverting to actual newlines"""
+    return content.replace('\\n', '\n').strip()
+
+
+_indexes: Dict[str, ForumLogIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_forum_log_index(log_dir: str = "logs") -> ForumLogIndex:
+    """Get the shared index of forum.log in a log directory"""
+    forum_log_path = Path(log_dir) / "forum.log"
+    key = str(forum_log_path.resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = ForumLogIndex(forum_log_path)
+            _indexes[key] = index
+        return index
+
+
 def get_latest_host_speech(log_dir: str = "logs") -> Optional[str]:
     """Get the latest HOST statement in forum.log
     
@@ -15,25 +219,13 @@ def get_latest_host_speech(log_dir: str = "logs") -> Optional[str]:
     Returns:
         The latest HOST speech content, if there is none, return None"""
     try:
-        forum_log_path = Path(log_dir) / "forum.log"
-        
-        if not forum_log_path.exists():
+        index = get_forum_log_index(log_dir)
+        if not index.forum_log_path.exists():
             logger.debug("forum.log file does not exist")
             return None
-            
-        with open(forum_log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
         
-        # Find the latest HOST statements from back to front
-        host_speech = None
-        for line in reversed(lines):
-            # Match format: [time] [HOST] content
-            match = re.match(r'\[(\d{2}:\d{2}:\d{2})\]\s*\[HOST\]\s*(.+)', line)
-            if match:
-                _, content = match.groups()
-                # Handle escaped newlines, reverting to actual newlines
-                host_speech = content.replace('\\n', '\n').strip()
-                break
+        latest = index.latest_host_speech()
+        host_speech = latest['content'] if latest else None
         
         if host_speech:
             logger.info(f"Find the latest HOST speech, length: {len(host_speech)} characters")
@@ -56,27 +248,15 @@ def get_all_host_speeches(log_dir: str = "logs") -> List[Dict[str, str]]:
     Returns:
         A list containing all HOST statements, each element is a dictionary containing timestamp and content"""
     try:
-        forum_log_path = Path(log_dir) / "forum.log"
-        
-        if not forum_log_path.exists():
+        index = get_forum_log_index(log_dir)
+        if not index.forum_log_path.exists():
             logger.debug("forum.log file does not exist")
             return []
-            
-        with open(forum_log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
         
-        host_speeches = []
-        for line in lines:
-            # Match format: [time] [HOST] content
-            match = re.match(r'\[(\d{2}:\d{2}:\d{2})\]\s*\[HOST\]\s*(.+)', line)
-            if match:
-                timestamp, content = match.groups()
-                # Handling escaped newlines
-                content = content.replace('\\n', '\n').strip()
-                host_speeches.append({
-                    'timestamp': timestamp,
-                    'content': content
-                })
+        host_speeches = [
+            {'timestamp': message['timestamp'], 'content': message['content']}
+            for message in index.messages_by_source(('HOST',))
+        ]
         
         logger.info(f"Found {len(host_speeches)} HOST speeches")
         return host_speeches
@@ -96,32 +276,14 @@ def get_recent_agent_speeches(log_dir: str = "logs", limit: int = 5) -> List[Dic
     Returns:
         Contains a list of recent Agent statements"""
     try:
-        forum_log_path = Path(log_dir) / "forum.log"
-        
-        if not forum_log_path.exists():
+        index = get_forum_log_index(log_dir)
+        if not index.forum_log_path.exists():
             return []
-            
-        with open(forum_log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-        
-        agent_speeches = []
-        for line in reversed(lines):  # Read from back to front
-            # Match format: [time] [AGENT_NAME] content
-            match = re.match(r'\[(\d{2}:\d{2}:\d{2})\]\s*\[(INSIGHT|MEDIA|QUERY)\]\s*(.+)', line)
-            if match:
-                timestamp, agent, content = match.groups()
-                # Handling escaped newlines
-                content = content.replace('\\n', '\n').strip()
-                agent_speeches.append({
-                    'timestamp': timestamp,
-                    'agent': agent,
-                    'content': content
-                })
-                if len(agent_speeches) >= limit:
-                    break
         
-        agent_speeches.reverse()  # Restoration time sequence
-        return agent_speeches
+        return [
+            {'timestamp': message['timestamp'], 'agent': message['source'], 'content': message['content']}
+            for message in index.messages_by_source(AGENT_SOURCES, limit=limit)
+        ]
         
     except Exception as e:
         logger.error(f"Failed to read forum.log: {str(e)}")
@@ -0,0 +1,193 @@
+"""LLM response cache for development and replay
+Re-running a research query or regenerating a report after a renderer fix repeats the same LLM calls. With the
+cache on, responses are stored under a content hash of (model, system prompt, user prompt, sampling parameters)
+and served from disk the next time, chunk by chunk for streaming calls so SSE paths behave the same.
+
+The time prefix BaseLLMClient puts in front of the user prompt is not part of the key, otherwise no entry would
+outlive the minute it was recorded in.
+
+Settings are read from the environment:
+    LLM_CACHE_MODE: off (default) | record: serve hits, call the provider on a miss and store the response |
+                    replay: serve hits only, a miss raises LLMCacheMiss
+    LLM_CACHE_DIR: directory of the SQLite store, default llm_cache
+    LLM_CACHE_MAX_MB: stored responses above this size are evicted least recently used first, default 512"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+CACHE_MODES = ("off", "record", "replay")
+CACHE_DB_NAME = "llm_cache.db"
+
+
+class LLMCacheMiss(RuntimeError):
+    """Replay mode found no recorded response for a request"""
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256((text or "").encode('utf-8')).hexdigest()
+
+
+def make_llm_cache_key(model: str, system_prompt: str, user_prompt: str, params: Dict[str, Any]) -> str:
+    """Content address of a chat request
+
+    Args:
+        model: model name
+        system_prompt: system prompt word
+        user_prompt: user prompt word, without the time prefix
+        params: sampling parameters (temperature, top_p, etc.)
+
+    Returns:
+        Hex digest key"""
+    payload = json.dumps(
+        {"model": model, "system": _sha256(system_prompt), "user": _sha256(user_prompt), "params": params},
+        sort_keys=True, default=str,
+    )
+    return _sha256(payload)
+
+
+class LLMResponseCache:
+    """Recorded responses in a SQLite file, each stored as its list of streamed chunks"""
+
+    def __init__(self, mode: str = "off", cache_dir: str = "llm_cache", max_bytes: int = 512 * 1024 * 1024):
+        """
+        Args:
+            mode: off, record or replay
+            cache_dir: directory of the SQLite store
+            max_bytes: size of the stored responses above which the least recently used ones are evicted"""
+        if mode not in CACHE_MODES:
+            logger.warning(f"Unknown LLM cache mode {mode!r}, the cache is off")
+            mode = "off"
+        self.mode = mode
+        self.max_bytes = max_bytes
+        self.db_path = os.path.join(cache_dir, CACHE_DB_NAME)
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+        self._db: Optional[sqlite3.Connection] = None
+        self._stored_bytes = 0  # Running total of the response sizes, recounted when it crosses max_bytes
+        if mode == "off":
+            return
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "cache_key TEXT PRIMARY KEY, model TEXT NOT NULL, chunks TEXT NOT NULL, "
+                "size INTEGER NOT NULL, add_ts INTEGER NOT NULL, last_used_ts REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used_ts)")
+            self._db.commit()
+            self._stored_bytes = self._count_bytes()
+            logger.info(f"LLM response cache in {mode} mode: {self.db_path}")
+        except sqlite3.Error as e:
+            logger.warning(f"LLM response cache database unavailable, the cache is off: {e}")
+            self.mode = "off"
+            self._db = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def lookup(self, key: str) -> Optional[List[str]]:
+        """Recorded chunks of a request
+
+        Returns:
+            The chunks, None on a miss in record mode
+
+        Raises:
+            LLMCacheMiss: on a miss in replay mode"""
+        chunks = None
+        with self._lock:
+            if self._db is not None:
+                try:
+                    row = self._db.execute("SELECT chunks FROM llm_cache WHERE cache_key = ?", (key,)).fetchone()
+                    if row is not None:
+                        chunks = json.loads(row[0])
+                        self._db.execute("UPDATE llm_cache SET last_used_ts = ? WHERE cache_key = ?", (time.time(), key))
+                        self._db.commit()
+                except (sqlite3.Error, ValueError) as e:
+                    logger.warning(f"LLM response cache read failed: {e}")
+            self._stats['hits' if chunks is not None else 'misses'] += 1
+        if chunks is None and self.mode == "replay":
+            raise LLMCacheMiss(f"No recorded LLM response for request {key[:12]}, record it with LLM_CACHE_MODE=record first")
+        return chunks
+
+    def store(self, key: str, model: str, chunks: List[str]):
+        """Record the response of a request, then evict down to max_bytes"""
+        if self.mode != "record" or self._db is None:
+            return
+        data = json.dumps(chunks, ensure_ascii=False)
+        size = len(data.encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO llm_cache (cache_key, model, chunks, size, add_ts, last_used_ts) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, data, size, int(now), now),
+                )
+                self._stats['stored'] += 1
+                self._stored_bytes += size
+                if self._stored_bytes > self.max_bytes:
+                    self._evict()
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM response cache write failed: {e}")
+
+    def _count_bytes(self) -> int:
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM llm_cache").fetchone()[0]
+
+    def _evict(self):
+        # Caller holds the lock. The running total overcounts replaced responses and misses other processes'
+        # writes, so the exact size is recounted first; trims to 90% of the limit so this does not run on every write
+        total = self._count_bytes()
+        if total <= self.max_bytes:
+            self._stored_bytes = total
+            return
+        target = total - int(self.max_bytes * 0.9)
+        freed = 0
+        keys = []
+        for cache_key, size in self._db.execute("SELECT cache_key, size FROM llm_cache ORDER BY last_used_ts"):
+            keys.append(cache_key)
+            freed += size
+            if freed >= target:
+                break
+        self._db.executemany("DELETE FROM llm_cache WHERE cache_key = ?", [(cache_key,) for cache_key in keys])
+        self._stored_bytes = total - freed
+        self._stats['evicted'] += len(keys)
+        logger.info(f"LLM response cache evicted {len(keys)} responses ({freed / 1024 / 1024:.1f} MB)")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and hit rate"""
+        with self._lock:
+            stats = dict(self._stats, mode=self.mode)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get the process-wide cache, configured from the environment on first use"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            try:
+                max_mb = float(os.getenv("LLM_CACHE_MAX_MB", "512"))
+            except ValueError:
+                max_mb = 512.0
+            _cache = LLMResponseCache(
+                mode=os.getenv("LLM_CACHE_MODE", "off").strip().lower(),
+                cache_dir=os.getenv("LLM_CACHE_DIR", "llm_cache"),
+                max_bytes=int(max_mb * 1024 * 1024),
+            )
+        return _cache
@@ -0,0 +1,476 @@
+"""Shared LLM client
+One connection pool for every OpenAI-compatible LLM call of the process: the engines' LLMClient, ForumEngine's
+host and the keyword optimizer.
+
+All requests run on one background asyncio loop through AsyncOpenAI clients (one per api_key/base_url) that share
+a single httpx.AsyncClient, so sockets are kept alive and reused (HTTP/2 when the h2 package is installed).
+Requests to the same provider (base URL host) share a concurrency limit and a token bucket, so paragraphs
+researched in parallel wait for a slot instead of opening more connections or drawing 429 responses.
+Blocking callers use the sync facades (invoke / stream_invoke), asyncio callers await ainvoke / astream_invoke.
+BaseLLMClient answers from the opt-in response cache of utils/llm_cache.py before going to the pool, PooledLLMClient
+does the same for the callers that retry on their own.
+
+Pool settings are read from the environment like LLM_REQUEST_TIMEOUT:
+    LLM_MAX_CONNECTIONS: open connections of the whole pool, default 64
+    LLM_MAX_KEEPALIVE_CONNECTIONS: idle connections kept alive, default 32
+    LLM_HTTP2: negotiate HTTP/2 when h2 is installed, default true
+    LLM_PROVIDER_CONCURRENCY: in-flight requests per provider, default 8
+    LLM_PROVIDER_RPM: requests per minute per provider, 0 means unlimited, default 0"""
+
+import os
+import sys
+import asyncio
+import threading
+import importlib.util
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Generator, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+from loguru import logger
+
+import httpx
+from openai import AsyncOpenAI
+
+from utils.llm_cache import get_llm_cache, make_llm_cache_key
+
+# Make sure the project-level retry helper is importable
+utils_dir = os.path.dirname(os.path.abspath(__file__))
+if utils_dir not in sys.path:
+    sys.path.append(utils_dir)
+
+try:
+    from retry_helper import with_retry, LLM_RETRY_CONFIG
+except ImportError:
+    def with_retry(config=None):
+        def decorator(func):
+            return func
+        return decorator
+
+    LLM_RETRY_CONFIG = None
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+CONNECT_TIMEOUT = 10.0
+DEFAULT_REQUEST_TIMEOUT = 600.0  # Callers without a timeout of their own, the engines pass theirs per request
+DEFAULT_PROVIDER = "api.openai.com"
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def provider_key(base_url: Optional[str]) -> str:
+    """Provider of a base URL, requests to the same host share the concurrency and rate limits"""
+    if not base_url:
+        return DEFAULT_PROVIDER
+    return urlparse(base_url).netloc or base_url
+
+
+class TokenBucket:
+    """Token bucket rate limiter: rate tokens per second, bursts up to capacity
+
+    reserve() takes a token right away and returns how long the caller has to wait for it, so waiters are
+    served in arrival order without polling."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token
+
+        Returns:
+            Seconds until the token is available, 0 when it can be used immediately"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class LLMConnectionPool:
+    """Process-wide AsyncOpenAI clients on a shared httpx pool, driven by one background event loop"""
+
+    def __init__(
+        self,
+        max_connections: int = 64,
+        max_keepalive_connections: int = 32,
+        http2: bool = True,
+        provider_concurrency: int = 8,
+        provider_rpm: int = 0,
+    ):
+        """
+        Args:
+            max_connections: open connections of the whole pool
+            max_keepalive_connections: idle connections kept alive
+            http2: negotiate HTTP/2 when the h2 package is installed
+            provider_concurrency: in-flight requests per provider
+            provider_rpm: requests per minute per provider, 0 means unlimited"""
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.provider_concurrency = max(1, provider_concurrency)
+        self.provider_rpm = provider_rpm
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pid: Optional[int] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._clients: Dict[Tuple[str, Optional[str]], AsyncOpenAI] = {}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background loop on first use, and again in a forked child"""
+        with self._lock:
+            if self._loop is None or self._pid != os.getpid():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="llm-pool", daemon=True).start()
+                self._loop = loop
+                self._pid = os.getpid()
+                self._http_client = None
+                self._clients = {}
+                self._semaphores = {}
+            return self._loop
+
+    def _client(self, api_key: str, base_url: Optional[str]) -> AsyncOpenAI:
+        # Only called on the pool loop
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+            )
+            logger.info(
+                f"LLM connection pool started: {self.max_connections} connections, "
+                f"HTTP/{'2' if self.http2 else '1.1'}, {self.provider_concurrency} requests per provider"
+            )
+        client = self._clients.get((api_key, base_url))
+        if client is None:
+            client_kwargs: Dict[str, Any] = {
+                "api_key": api_key,
+                "max_retries": 0,
+                "timeout": httpx.Timeout(DEFAULT_REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+                "http_client": self._http_client,
+            }
+            if base_url:
+                client_kwargs["base_url"] = base_url
+            client = self._clients[(api_key, base_url)] = AsyncOpenAI(**client_kwargs)
+        return client
+
+    async def _acquire_slot(self, base_url: Optional[str]) -> asyncio.Semaphore:
+        provider = provider_key(base_url)
+        semaphore = self._semaphores.get(provider)
+        if semaphore is None:
+            semaphore = self._semaphores[provider] = asyncio.Semaphore(self.provider_concurrency)
+        await semaphore.acquire()
+        if self.provider_rpm > 0:
+            with self._lock:
+                bucket = self._buckets.get(provider)
+                if bucket is None:
+                    rate = self.provider_rpm / 60.0
+                    bucket = self._buckets[provider] = TokenBucket(rate, max(1.0, min(self.provider_concurrency, self.provider_rpm)))
+            try:
+                await bucket.acquire()
+            except BaseException:
+                semaphore.release()
+                raise
+        return semaphore
+
+    async def _create(self, api_key: str, base_url: Optional[str], params: Dict[str, Any]):
+        semaphore = await self._acquire_slot(base_url)
+        try:
+            return await self._client(api_key, base_url).chat.completions.create(**params)
+        finally:
+            semaphore.release()
+
+    async def _stream(self, api_key: str, base_url: Optional[str], params: Dict[str, Any]) -> AsyncIterator[str]:
+        # The provider slot is held until the stream is exhausted or closed
+        semaphore = await self._acquire_slot(base_url)
+        try:
+            stream = await self._client(api_key, base_url).chat.completions.create(stream=True, **params)
+            async for chunk in stream:
+                if chunk.choices and len(chunk.choices) > 0:
+                    delta = chunk.choices[0].delta
+                    if delta and delta.content:
+                        yield delta.content
+        finally:
+            semaphore.release()
+
+    def create(self, api_key: str, base_url: Optional[str] = None, **params):
+        """Blocking chat completion
+
+        Args:
+            api_key: provider API key
+            base_url: OpenAI-compatible base URL, None for OpenAI
+            **params: chat.completions.create arguments (model, messages, timeout, sampling parameters)
+
+        Returns:
+            ChatCompletion"""
+        future = asyncio.run_coroutine_threadsafe(self._create(api_key, base_url, params), self._ensure_loop())
+        return future.result()
+
+    async def acreate(self, api_key: str, base_url: Optional[str] = None, **params):
+        """Chat completion awaitable from any event loop, see create"""
+        future = asyncio.run_coroutine_threadsafe(self._create(api_key, base_url, params), self._ensure_loop())
+        return await asyncio.wrap_future(future)
+
+    def stream(self, api_key: str, base_url: Optional[str] = None, **params) -> Iterator[str]:
+        """Blocking streaming chat completion, yields the content deltas"""
+        loop = self._ensure_loop()
+        agen = self._stream(api_key, base_url, params)
+        try:
+            while True:
+                try:
+                    yield asyncio.run_coroutine_threadsafe(agen.__anext__(), loop).result()
+                except StopAsyncIteration:
+                    return
+        finally:
+            asyncio.run_coroutine_threadsafe(agen.aclose(), loop).result()
+
+    async def astream(self, api_key: str, base_url: Optional[str] = None, **params) -> AsyncIterator[str]:
+        """Streaming chat completion iterable from any event loop, see stream"""
+        loop = self._ensure_loop()
+        agen = self._stream(api_key, base_url, params)
+        try:
+            while True:
+                try:
+                    yield await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(agen.__anext__(), loop))
+                except StopAsyncIteration:
+                    return
+        finally:
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(agen.aclose(), loop))
+
+
+_pool: Optional[LLMConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_llm_pool() -> LLMConnectionPool:
+    """Get the process-wide pool, configured from the environment on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = LLMConnectionPool(
+                max_connections=_env_int("LLM_MAX_CONNECTIONS", 64),
+                max_keepalive_connections=_env_int("LLM_MAX_KEEPALIVE_CONNECTIONS", 32),
+                http2=os.getenv("LLM_HTTP2", "true").lower() not in ("0", "false", "no"),
+                provider_concurrency=_env_int("LLM_PROVIDER_CONCURRENCY", 8),
+                provider_rpm=_env_int("LLM_PROVIDER_RPM", 0),
+            )
+        return _pool
+
+
+class BaseLLMClient:
+    """Chat completion facade shared by the engines' LLMClient classes
+
+    Subclasses set timeout_env and validate their own credentials."""
+
+    timeout_env = "LLM_REQUEST_TIMEOUT"
+    default_timeout = 1800.0
+    # Prefix the user prompt with the current time, the research engines rely on it for date reasoning
+    add_time_prefix = True
+
+    SAMPLING_KEYS = {"temperature", "top_p", "presence_penalty", "frequency_penalty"}
+
+    def __init__(self, api_key: str, model_name: str, base_url: Optional[str] = None):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.model_name = model_name
+        self.provider = model_name
+        timeout_fallback = os.getenv("LLM_REQUEST_TIMEOUT") or os.getenv(self.timeout_env) or str(self.default_timeout)
+        try:
+            self.timeout = float(timeout_fallback)
+        except ValueError:
+            self.timeout = self.default_timeout
+        self.pool = get_llm_pool()
+        self.cache = get_llm_cache()
+
+    def _build_request(self, system_prompt: str, user_prompt: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if self.add_time_prefix:
+            current_time = datetime.now().strftime("%Y year %m month %d day %H hour %M minute")
+            time_prefix = f"Today's actual time is {current_time}"
+            if user_prompt:
+                user_prompt = f"{time_prefix}\n{user_prompt}"
+            else:
+                user_prompt = time_prefix
+        request = {key: value for key, value in kwargs.items() if key in self.SAMPLING_KEYS and value is not None}
+        request.update(
+            model=self.model_name,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            timeout=kwargs.get("timeout", self.timeout),
+        )
+        return request
+
+    def _response_text(self, response) -> str:
+        if response.choices and response.choices[0].message:
+            return self.validate_response(response.choices[0].message.content)
+        return ""
+
+    def _cache_key(self, system_prompt: str, user_prompt: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        """Response cache key of a request, None when the cache is off"""
+        if not self.cache.enabled:
+            return None
+        params = {key: value for key, value in kwargs.items() if key in self.SAMPLING_KEYS and value is not None}
+        return make_llm_cache_key(self.model_name, system_prompt, user_prompt, params)
+
+    def invoke(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+        """Call the LLM and wait for the complete response
+
+        Args:
+            system_prompt: system prompt word
+            user_prompt: user prompt word
+            **kwargs: sampling parameters (temperature, top_p, etc.) and timeout
+
+        Returns:
+            Response text without leading and trailing whitespace"""
+        cache_key = self._cache_key(system_prompt, user_prompt, kwargs)
+        if cache_key:
+            chunks = self.cache.lookup(cache_key)
+            if chunks is not None:
+                return self.validate_response("".join(chunks))
+        text = self._invoke(system_prompt, user_prompt, kwargs)
+        if cache_key:
+            self.cache.store(cache_key, self.model_name, [text])
+        return text
+
+    @with_retry(LLM_RETRY_CONFIG)
+    def _invoke(self, system_prompt: str, user_prompt: str, kwargs: Dict[str, Any]) -> str:
+        response = self.pool.create(self.api_key, self.base_url, **self._build_request(system_prompt, user_prompt, kwargs))
+        return self._response_text(response)
+
+    async def ainvoke(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+        """Async version of invoke, without the retry wrapper"""
+        cache_key = self._cache_key(system_prompt, user_prompt, kwargs)
+        if cache_key:
+            chunks = self.cache.lookup(cache_key)
+            if chunks is not None:
+                return self.validate_response("".join(chunks))
+        response = await self.pool.acreate(self.api_key, self.base_url, **self._build_request(system_prompt, user_prompt, kwargs))
+        text = self._response_text(response)
+        if cache_key:
+            self.cache.store(cache_key, self.model_name, [text])
+        return text
+
+    def stream_invoke(self, system_prompt: str, user_prompt: str, **kwargs) -> Generator[str, None, None]:
+        """Streaming call to LLM, gradually returning the response content
+
+        A cached response is replayed chunk by chunk.
+
+        Args:
+            system_prompt: system prompt word
+            user_prompt: user prompt word
+            **kwargs: sampling parameters (temperature, top_p, etc.) and timeout
+
+        Yields:
+            response text block (str)"""
+        cache_key = self._cache_key(system_prompt, user_prompt, kwargs)
+        if cache_key:
+            chunks = self.cache.lookup(cache_key)
+            if chunks is not None:
+                yield from chunks
+                return
+        yield from self._stream(system_prompt, user_prompt, kwargs, cache_key)
+
+    def _stream(self, system_prompt: str, user_prompt: str, kwargs: Dict[str, Any], cache_key: Optional[str]) -> Generator[str, None, None]:
+        # Only a stream read to the end is recorded
+        recorded = []
+        try:
+            for chunk in self.pool.stream(self.api_key, self.base_url, **self._build_request(system_prompt, user_prompt, kwargs)):
+                recorded.append(chunk)
+                yield chunk
+        except Exception as e:
+            logger.error(f"Streaming request failed: {str(e)}")
+            raise e
+        if cache_key:
+            self.cache.store(cache_key, self.model_name, recorded)
+
+    async def astream_invoke(self, system_prompt: str, user_prompt: str, **kwargs) -> AsyncIterator[str]:
+        """Async version of stream_invoke"""
+        cache_key = self._cache_key(system_prompt, user_prompt, kwargs)
+        if cache_key:
+            chunks = self.cache.lookup(cache_key)
+            if chunks is not None:
+                for chunk in chunks:
+                    yield chunk
+                return
+        recorded = []
+        async for chunk in self.pool.astream(self.api_key, self.base_url, **self._build_request(system_prompt, user_prompt, kwargs)):
+            recorded.append(chunk)
+            yield chunk
+        if cache_key:
+            self.cache.store(cache_key, self.model_name, recorded)
+
+    def stream_invoke_to_string(self, system_prompt: str, user_prompt: str, **kwargs) -> str:
+        """Streaming calls to LLM and safely concatenating into complete strings (avoiding UTF-8 multibyte character truncation)
+
+        Args:
+            system_prompt: system prompt word
+            user_prompt: user prompt word
+            **kwargs: sampling parameters (temperature, top_p, etc.) and timeout
+
+        Returns:
+            Complete response string"""
+        # The cache lookup stays outside the retry wrapper, a replay miss is not retried
+        cache_key = self._cache_key(system_prompt, user_prompt, kwargs)
+        if cache_key:
+            chunks = self.cache.lookup(cache_key)
+            if chunks is not None:
+                return "".join(chunks)
+        return self._stream_to_string(system_prompt, user_prompt, kwargs, cache_key)
+
+    @with_retry(LLM_RETRY_CONFIG)
+    def _stream_to_string(self, system_prompt: str, user_prompt: str, kwargs: Dict[str, Any], cache_key: Optional[str]) -> str:
+        # Collect all blocks in bytes
+        byte_chunks = []
+        for chunk in self._stream(system_prompt, user_prompt, kwargs, cache_key):
+            byte_chunks.append(chunk.encode('utf-8'))
+
+        # Concatenate all bytes and decode them in one go
+        if byte_chunks:
+            return b''.join(byte_chunks).decode('utf-8', errors='replace')
+        return ""
+
+    @staticmethod
+    def validate_response(response: Optional[str]) -> str:
+        if response is None:
+            return ""
+        return response.strip()
+
+    def get_model_info(self) -> Dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "model": self.model_name,
+            "api_base": self.base_url or "default",
+        }
+
+
+class PooledLLMClient(BaseLLMClient):
+    """BaseLLMClient for callers with a retry policy of their own: ForumEngine's host and the keyword optimizer
+
+    invoke() still goes through the response cache, but makes a single request without the LLM_RETRY_CONFIG backoff."""
+
+    default_timeout = DEFAULT_REQUEST_TIMEOUT
+
+    def __init__(self, api_key: str, model_name: str, base_url: Optional[str] = None, add_time_prefix: bool = True):
+        super().__init__(api_key, model_name, base_url)
+        self.add_time_prefix = add_time_prefix
+
+    def _invoke(self, system_prompt: str, user_prompt: str, kwargs: Dict[str, Any]) -> str:
+        response = self.pool.create(self.api_key, self.base_url, **self._build_request(system_prompt, user_prompt, kwargs))
+        return self._response_text(response)
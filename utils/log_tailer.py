@@ -0,0 +1,279 @@
+"""Incremental log tailing tool
+Follows an append-only log file by byte offset and pushes newly written lines to a callback in batches.
+On Linux the file directory is watched through inotify; other platforms fall back to lightweight stat polling."""
+
+import os
+import sys
+import select
+import struct
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+from loguru import logger
+
+# inotify event masks (see <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+def _load_inotify():
+    """Load inotify functions from libc, return None if the platform does not support it"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except Exception as exc:  # pragma: no cover - depends on platform libc
+        logger.debug(f"inotify unavailable, falling back to polling: {exc}")
+        return None
+
+
+def read_tail_lines(file_path, count: int, chunk_size: int = 64 * 1024) -> List[str]:
+    """Read the last non-empty lines of a file by seeking backwards from the end
+
+    Cost depends on the size of the returned lines, not on the size of the file.
+
+    Args:
+        file_path: file to read
+        count: number of non-empty lines to return
+        chunk_size: bytes read per backward step
+
+    Returns:
+        Up to count lines in file order, without line endings"""
+    if count <= 0:
+        return []
+    found: List[bytes] = []
+    carry = b''
+    with open(file_path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        while position > 0 and len(found) < count:
+            step = min(chunk_size, position)
+            position -= step
+            f.seek(position)
+            # The first piece may start in the middle of a line, keep it for the next step
+            carry, *complete = (f.read(step) + carry).split(b'\n')
+            found.extend(line for line in reversed(complete) if line.strip())
+    if position == 0 and carry.strip() and len(found) < count:
+        found.append(carry)
+    return [line.decode('utf-8', errors='replace').rstrip('\r') for line in reversed(found[:count])]
+
+
+class LogTailer:
+    """Offset-based log follower with rotation and truncation detection
+
+    - Keeps one open handle instead of reopening the file on every check
+    - Tracks (st_dev, st_ino) so an unlink+recreate or rename is treated as a new file read from the beginning
+    - A file that becomes shorter than the current offset is treated as truncated and re-read from the beginning
+    - Incomplete trailing lines are held back until their newline arrives"""
+
+    def __init__(
+        self,
+        file_path,
+        on_lines: Callable[[List[str]], None],
+        batch_interval: float = 0.05,
+        poll_interval: float = 0.1,
+        max_batch_lines: int = 500,
+        start_at_end: bool = True,
+        use_inotify: bool = True
+    ):
+        """Initialize the tailer
+
+        Args:
+            file_path: log file to follow
+            on_lines: callback receiving a list of new lines (without line endings)
+            batch_interval: seconds to wait after a change notification so bursts are delivered as one batch
+            poll_interval: polling period when inotify is unavailable
+            max_batch_lines: maximum number of lines handed to the callback at once
+            start_at_end: skip the existing content of the file when tailing starts
+            use_inotify: whether to try inotify before falling back to polling"""
+        self.file_path = Path(file_path)
+        self.on_lines = on_lines
+        self.batch_interval = batch_interval
+        self.poll_interval = poll_interval
+        self.max_batch_lines = max_batch_lines
+        self.start_at_end = start_at_end
+        self.use_inotify = use_inotify
+
+        self._handle = None
+        self._identity: Optional[Tuple[int, int]] = None
+        self._offset = 0
+        self._partial = b''
+        self._first_open = True
+        self._read_lock = threading.Lock()
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify_fd: Optional[int] = None
+
+    @property
+    def offset(self) -> int:
+        """Byte offset of the next unread byte in the current file"""
+        return self._offset
+
+    def read_available(self) -> List[str]:
+        """Read all complete lines appended since the last call
+
+        Returns:
+            List of new lines, empty when nothing changed"""
+        with self._read_lock:
+            lines: List[str] = []
+            try:
+                stat = os.stat(self.file_path)
+            except FileNotFoundError:
+                # A file created later is new content and must be read from the beginning
+                self._first_open = False
+                # The file was removed; finish whatever is left in the old handle and wait for a new file
+                if self._handle is not None:
+                    lines.extend(self._drain())
+                    self._close()
+                return lines
+
+            identity = (stat.st_dev, stat.st_ino)
+            if self._handle is None or identity != self._identity:
+                if self._handle is not None:
+                    # Rotated: flush the tail of the previous file before switching
+                    lines.extend(self._drain())
+                    self._close()
+                self._open(identity, stat.st_size)
+            elif stat.st_size < self._offset:
+                # Truncated in place (e.g. opened with 'w'): restart from the beginning
+                self._handle.seek(0)
+                self._offset = 0
+                self._partial = b''
+
+            if stat.st_size > self._offset:
+                lines.extend(self._drain())
+            return lines
+
+    def _open(self, identity: Tuple[int, int], size: int):
+        self._handle = open(self.file_path, 'rb')
+        self._identity = identity
+        self._partial = b''
+        if self._first_open and self.start_at_end:
+            self._handle.seek(size)
+            self._offset = size
+        else:
+            self._offset = 0
+        self._first_open = False
+
+    def _close(self):
+        try:
+            if self._handle is not None:
+                self._handle.close()
+        finally:
+            self._handle = None
+            self._identity = None
+
+    def _drain(self) -> List[str]:
+        data = self._handle.read()
+        if not data:
+            return []
+        self._offset += len(data)
+        data = self._partial + data
+        last_newline = data.rfind(b'\n')
+        if last_newline == -1:
+            self._partial = data
+            return []
+        self._partial = data[last_newline + 1:]
+        text = data[:last_newline].decode('utf-8', errors='replace')
+        return [line.rstrip('\r') for line in text.split('\n')]
+
+    def _setup_inotify(self) -> bool:
+        if not self.use_inotify:
+            return False
+        libc = _load_inotify()
+        if libc is None:
+            return False
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return False
+        watch_dir = str(self.file_path.parent.resolve()).encode()
+        if libc.inotify_add_watch(fd, watch_dir, WATCH_MASK) < 0:
+            os.close(fd)
+            return False
+        self._inotify_fd = fd
+        return True
+
+    def _wait_for_change(self) -> bool:
+        """Block until the followed file may have changed; return False on a plain timeout"""
+        if self._inotify_fd is None:
+            self._stop_event.wait(self.poll_interval)
+            return True
+
+        # inotify delivers changes immediately; the timeout is only a safety re-check
+        ready, _, _ = select.select([self._inotify_fd], [], [], max(self.poll_interval, 1.0))
+        if not ready:
+            return False
+        try:
+            data = os.read(self._inotify_fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+
+        # Only events for the followed file matter; the directory also holds the engine logs
+        target = self.file_path.name.encode()
+        pos = 0
+        while pos + _EVENT_HEADER.size <= len(data):
+            _, mask, _, name_len = _EVENT_HEADER.unpack_from(data, pos)
+            name = data[pos + _EVENT_HEADER.size:pos + _EVENT_HEADER.size + name_len].rstrip(b'\0')
+            pos += _EVENT_HEADER.size + name_len
+            if mask & IN_Q_OVERFLOW or name == target:
+                return True
+        return False
+
+    def _run(self):
+        if self._setup_inotify():
+            logger.debug(f"Tailing {self.file_path} via inotify")
+        else:
+            logger.debug(f"Tailing {self.file_path} via polling every {self.poll_interval}s")
+
+        # Open the file once so start_at_end is anchored at start() time
+        try:
+            self.read_available()
+        except Exception as e:
+            logger.error(f"Log tailer failed to open {self.file_path}: {e}")
+
+        while not self._stop_event.is_set():
+            try:
+                changed = self._wait_for_change()
+                if changed and self._inotify_fd is not None and self.batch_interval > 0:
+                    # Coalesce a burst of writes into one batch
+                    self._stop_event.wait(self.batch_interval)
+                lines = self.read_available()
+                for start in range(0, len(lines), self.max_batch_lines):
+                    self.on_lines(lines[start:start + self.max_batch_lines])
+            except Exception as e:
+                logger.error(f"Log tailer error on {self.file_path}: {e}")
+                self._stop_event.wait(1)
+
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+        with self._read_lock:
+            self._close()
+
+    def start(self):
+        """Start following in a daemon thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=f"LogTailer-{self.file_path.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """Stop following and release the file handle"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None